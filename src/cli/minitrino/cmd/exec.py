@@ -1,13 +1,10 @@
 """Docker Exec wrapper."""
 
 import click
-from docker.errors import APIError, NotFound
 
 from minitrino import utils
-from minitrino.core.cluster.resource import MinitrinoContainer
 from minitrino.core.context import MinitrinoContext
 from minitrino.core.errors import MinitrinoError, UserError
-from minitrino.core.exec.utils import detect_container_shell
 
 
 @click.command(
@@ -61,6 +58,10 @@ def cli(
     interactive : bool
         If True, runs the command in interactive mode.
     """
+    from docker.errors import APIError, NotFound
+
+    from minitrino.core.docker.wrappers import MinitrinoContainer
+
     ctx.initialize()
     if ctx.all_clusters:
         raise UserError(
@@ -142,6 +143,8 @@ def build_cmd(
     list[str]
         The full docker exec command as a list of arguments.
     """
+    from minitrino.core.exec.utils import detect_container_shell
+
     shell = detect_container_shell(ctx, fqcn, user)
     base_cmd = ["docker", "exec", "-u", user]
     if interactive:
@@ -108,6 +108,9 @@ def cli(
         return
 
     if json_format:
+        # Compose YAML is parsed lazily, so load it for JSON consumers
+        for module in filtered_modules:
+            ctx.modules.module_yaml(module)
         all_metadata = dict(sorted(filtered_modules.items()))
         sys.stdout.write(json.dumps(all_metadata, indent=2) + "\n")
     else:
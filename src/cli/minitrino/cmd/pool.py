@@ -0,0 +1,171 @@
+"""Commands for managing the warm cluster pool."""
+
+import sys
+
+import click
+
+from minitrino import utils
+from minitrino.core.cluster.pool import ClusterPool
+from minitrino.core.context import MinitrinoContext
+from minitrino.core.errors import UserError
+from minitrino.core.logging.levels import LogLevel
+
+
+@click.group(
+    "pool",
+    help=(
+        "Manage a pool of warm, idle clusters that `provision --pool` can "
+        "claim.\n\n"
+        "Pool size and idle TTL (in seconds) default to the POOL_SIZE and "
+        "POOL_TTL environment variables, e.g.:\n\n"
+        "minitrino -e POOL_SIZE=4 pool fill"
+    ),
+)
+def cli() -> None:
+    """Manage the warm cluster pool."""
+
+
+@cli.command("fill", help="Start idle clusters until the pool is full.")
+@click.option(
+    "-i",
+    "--image",
+    default="",
+    type=str,
+    help="Cluster image type (trino or starburst). Defaults to trino.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Number of workers in each pooled cluster (default: 0).",
+)
+@click.option(
+    "-s",
+    "--size",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Number of idle clusters to keep (default: POOL_SIZE or 2).",
+)
+@utils.exception_handler
+@utils.pass_environment()
+def fill(ctx: MinitrinoContext, image: str, workers: int, size: int) -> None:
+    """Start idle clusters until the pool is full.
+
+    Parameters
+    ----------
+    image : str
+        Cluster image type (trino or starburst).
+    workers : int
+        Number of workers in each pooled cluster.
+    size : int
+        Number of idle clusters to keep. If 0, uses `POOL_SIZE`.
+    """
+    ctx.initialize()
+    utils.check_daemon(ctx.docker_client)
+    utils.check_lib(ctx)
+    started = ClusterPool(ctx).fill(image, workers, size)
+    if started:
+        ctx.logger.info(f"Started pooled cluster(s): {', '.join(started)}.")
+
+
+@cli.command(
+    "claim",
+    help=(
+        "Claim an idle cluster and print its name, e.g.:\n\n"
+        'minitrino -c "$(minitrino pool claim)" provision -m postgres'
+    ),
+)
+@click.option(
+    "-i",
+    "--image",
+    default="",
+    type=str,
+    help="Cluster image type (trino or starburst). Defaults to trino.",
+)
+@click.option(
+    "-w",
+    "--workers",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Number of workers the cluster must have (default: 0).",
+)
+@utils.exception_handler
+@utils.pass_environment()
+def claim(ctx: MinitrinoContext, image: str, workers: int) -> None:
+    """Claim an idle cluster from the pool and print its name.
+
+    Parameters
+    ----------
+    image : str
+        Cluster image type (trino or starburst).
+    workers : int
+        Number of workers the cluster must have.
+    """
+    ctx.initialize(log_level=LogLevel.ERROR)
+    utils.check_daemon(ctx.docker_client)
+    name = ClusterPool(ctx).claim(image, workers)
+    if not name:
+        raise UserError(
+            "No idle pooled cluster is available.",
+            "Start pooled clusters with `minitrino pool fill`.",
+        )
+    sys.stdout.write(name + "\n")
+
+
+@cli.command("status", help="Display the pool's clusters.")
+@utils.exception_handler
+@utils.pass_environment()
+def status(ctx: MinitrinoContext) -> None:
+    """Display the pool's clusters."""
+    ctx.initialize()
+    utils.check_daemon(ctx.docker_client)
+    members = ClusterPool(ctx).status()
+    if not members:
+        ctx.logger.info("The pool is empty.")
+        return
+    lines = ["Pooled clusters:"]
+    for m in members:
+        lines.append(
+            f"  {m['name']}: {m['state']} ({m['dist']} {m['ver']}, "
+            f"{m['workers']} workers, {m['age']}s old)"
+        )
+    ctx.logger.info("\n".join(lines))
+
+
+@cli.command(
+    "evict",
+    help="Remove expired, stopped, and surplus clusters from the pool.",
+)
+@click.option(
+    "-a",
+    "--all",
+    "evict_all",
+    is_flag=True,
+    default=False,
+    help="Evict all idle clusters.",
+)
+@click.option(
+    "--claimed",
+    is_flag=True,
+    default=False,
+    help="Also evict claimed clusters that are still running.",
+)
+@utils.exception_handler
+@utils.pass_environment()
+def evict(ctx: MinitrinoContext, evict_all: bool, claimed: bool) -> None:
+    """Remove expired, stopped, and surplus clusters from the pool.
+
+    Parameters
+    ----------
+    evict_all : bool
+        If True, evicts all idle clusters.
+    claimed : bool
+        If True, also evicts claimed clusters that are still running.
+    """
+    ctx.initialize()
+    utils.check_daemon(ctx.docker_client)
+    utils.check_lib(ctx)
+    evicted = ClusterPool(ctx).evict(evict_all, claimed)
+    if not evicted:
+        ctx.logger.info("No pooled clusters to evict.")
@@ -3,6 +3,7 @@
 import click
 
 from minitrino import utils
+from minitrino.core.cluster.pool import ClusterPool
 from minitrino.core.context import MinitrinoContext
 
 
@@ -34,6 +35,14 @@ from minitrino.core.context import MinitrinoContext
     type=int,
     help="Number of cluster workers to provision (default: 0).",
 )
+@click.option(
+    "-p",
+    "--parallelism",
+    "parallelism",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Maximum number of workers to provision concurrently (default: auto).",
+)
 @click.option(
     "-n",
     "--no-rollback",
@@ -41,6 +50,20 @@ from minitrino.core.context import MinitrinoContext
     default=False,
     help="Disables cluster rollback if provisioning fails.",
 )
+@click.option(
+    "--plan",
+    "plan_only",
+    is_flag=True,
+    default=False,
+    help="Print the services that would change without provisioning.",
+)
+@click.option(
+    "--pool",
+    "use_pool",
+    is_flag=True,
+    default=False,
+    help="Claim a warm cluster from the pool, if one is available.",
+)
 @utils.exception_handler
 @utils.pass_environment()
 def cli(
@@ -48,7 +71,10 @@ def cli(
     modules: tuple[str, ...],
     image: str,
     workers: int,
+    parallelism: int,
     no_rollback: bool,
+    plan_only: bool,
+    use_pool: bool,
 ) -> None:
     """Provision the cluster and environment dependencies.
 
@@ -60,16 +86,47 @@ def cli(
         Cluster image type (trino or starburst).
     workers : int
         Number of cluster workers to provision.
+    parallelism : int
+        Maximum number of workers to provision concurrently. If 0, uses
+        `PROVISION_PARALLELISM` or a default sized to the host and
+        Docker daemon CPUs.
     no_rollback : bool
         If True, disables rollback on failure.
+    plan_only : bool
+        If True, prints the services that would be created, recreated,
+        or left unchanged without provisioning anything.
+    use_pool : bool
+        If True, claims an idle cluster from the pool (see `minitrino
+        pool`) and provisions the modules into it.
 
     Notes
     -----
     If no options are provided, a standalone coordinator is provisioned.
     Supports Trino or Starburst distributions, and dynamic worker
     scaling. Dependent clusters are automatically provisioned after the
-    primary cluster is launched.
+    primary cluster is launched. When re-provisioning a running cluster,
+    only new or changed services are (re)created.
     """
     ctx.initialize()
+    if use_pool and not plan_only:
+        name = ClusterPool(ctx).claim(image, workers)
+        if name:
+            ctx.logger.info(
+                f"Claimed pooled cluster '{name}'. Use `minitrino -c {name}` "
+                "to interact with it."
+            )
+            ctx = ctx.fork(name)
+        else:
+            ctx.logger.warn(
+                "No idle pooled cluster is available. Provisioning cluster "
+                f"'{ctx.cluster_name}'..."
+            )
     modules_list = list(modules)
-    ctx.cluster.ops.provision(modules_list, image, workers, no_rollback)
+    ctx.cluster.ops.provision(
+        modules_list,
+        image,
+        workers,
+        no_rollback,
+        parallelism=parallelism,
+        plan_only=plan_only,
+    )
@@ -1,21 +1,22 @@
 """Resource management commands for Minitrino CLI."""
 
+from __future__ import annotations
+
 import sys
 import textwrap
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
-import humanize
-from dateutil.parser import parse as parse_date
-from tabulate import tabulate
 
 from minitrino import utils
 from minitrino.core.context import MinitrinoContext
-from minitrino.core.docker.wrappers import MinitrinoContainer
 from minitrino.shutdown import shutdown_event
 
+if TYPE_CHECKING:
+    from minitrino.core.docker.wrappers import MinitrinoContainer
+
 
 @click.command(
     "resources",
@@ -55,15 +56,28 @@ def cli(
     show_image : bool
         If True, shows only images.
     """
+    import humanize
+    from dateutil.parser import parse as parse_date
+
     ctx.initialize()
     utils.check_daemon(ctx.docker_client)
 
-    resources = ctx.cluster.resource.resources()
     show_any = show_container or show_network or show_volume or show_image
     fetch_containers = show_container or not show_any
     fetch_images = show_image or not show_any
     fetch_volumes = show_volume or not show_any
     fetch_networks = show_network or not show_any
+    kinds = [
+        kind
+        for kind, fetch in (
+            ("containers", fetch_containers),
+            ("volumes", fetch_volumes),
+            ("images", fetch_images),
+            ("networks", fetch_networks),
+        )
+        if fetch
+    ]
+    resources = ctx.cluster.resource.resources(kinds=kinds)
 
     containers = []
     container_rows = []
@@ -221,6 +235,8 @@ def render_table(rows: list[list[Any]] | None, headers: list[str]):
     tuple[str, int]
         Rendered table string and the length of its longest line.
     """
+    from tabulate import tabulate
+
     if rows is None:
         rows = []
     rendered = tabulate(rows, headers=headers, stralign="left", tablefmt="github")
@@ -240,6 +256,8 @@ def format_bytes(val: int | float):
     str
         Human-readable memory string or 'N/A'.
     """
+    import humanize
+
     return (
         humanize.naturalsize(val)
         if isinstance(val, (int, float)) and val > 0
@@ -295,6 +313,8 @@ def get_container_stats(container: MinitrinoContainer) -> dict:
         Dictionary with keys 'memory' and 'cpu' representing usage
         stats.
     """
+    import humanize
+
     try:
         stats: dict = container.stats(stream=False)
         mem: int = stats.get("memory_stats", {}).get("usage", 0)
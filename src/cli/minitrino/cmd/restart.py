@@ -13,14 +13,28 @@ from minitrino.core.context import MinitrinoContext
         "default, applies to 'default' cluster.\n\n"
         "Restart containers in a specific cluster by using the CLUSTER_NAME "
         "environment variable or the --cluster / -c option, e.g.:\n\n"
-        "minitrino -c my-cluster restart"
+        "minitrino -c my-cluster restart\n\n"
+        "Bootstrap scripts that already completed are skipped on restart "
+        "unless they changed. Use --rebootstrap to run them again."
     ),
 )
+@click.option(
+    "--rebootstrap",
+    is_flag=True,
+    default=False,
+    help="Run all module bootstrap scripts again after restarting.",
+)
 @utils.exception_handler
 @utils.pass_environment()
-def cli(ctx: MinitrinoContext):
-    """Restart cluster containers."""
+def cli(ctx: MinitrinoContext, rebootstrap: bool):
+    """Restart cluster containers.
+
+    Parameters
+    ----------
+    rebootstrap : bool
+        If True, bootstrap scripts that already completed are run again.
+    """
     ctx.initialize()
     utils.check_daemon(ctx.docker_client)
     with ctx.logger.spinner("Restarting containers..."):
-        ctx.cluster.ops.restart()
+        ctx.cluster.ops.restart(rebootstrap=rebootstrap)
@@ -0,0 +1,132 @@
+"""Host artifact cache for Minitrino cluster image builds.
+
+The image's `tarball` stage downloads a 1+ GB Trino or Starburst server
+tarball whenever its layer cache misses. The CLI keeps verified copies
+of these tarballs in `~/.minitrino/artifacts/<dist>/<version>/<arch>`
+and passes the matching directory to the build as the `artifacts` build
+context, which `downloader.py` prefers over downloading. Rebuilds and
+recoveries from `docker builder prune` therefore do not download the
+tarball again, and cached versions can be rebuilt offline.
+
+The library's `downloader.py` is loaded to resolve tarball names and
+URLs, so the CLI and the image always agree on them.
+"""
+
+from __future__ import annotations
+
+import os
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+from minitrino import utils
+from minitrino.core.errors import MinitrinoError
+from minitrino.settings import ARTIFACT_DIR
+
+if TYPE_CHECKING:
+    from minitrino.core.context import MinitrinoContext
+
+
+class ArtifactCache:
+    """Cache cluster distribution tarballs on the host.
+
+    Parameters
+    ----------
+    ctx : MinitrinoContext
+        An instantiated and initialized MinitrinoContext object.
+
+    Methods
+    -------
+    directory()
+        Returns the cache directory for the current distribution,
+        version, and Docker daemon architecture.
+    prefetch()
+        Downloads and verifies the current distribution's tarball if it
+        is not already cached.
+    """
+
+    def __init__(self, ctx: MinitrinoContext):
+        self._ctx = ctx
+        self._arch = ""
+        self._module: ModuleType | None = None
+
+    def directory(self) -> str:
+        """Return the cache directory for the current cluster image.
+
+        The directory is created if it does not exist, since it is
+        always passed to the build as a context.
+
+        Returns
+        -------
+        str
+            `~/.minitrino/artifacts/<dist>/<version>/<arch>`.
+        """
+        directory = os.path.join(
+            self._ctx.minitrino_user_dir,
+            ARTIFACT_DIR,
+            self._ctx.env.get("CLUSTER_DIST", ""),
+            self._ctx.env.get("CLUSTER_VER", ""),
+            self._downloader().get_arch(self._daemon_arch())[0],
+        )
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def prefetch(self) -> None:
+        """Download the current cluster image's tarball into the cache.
+
+        Skipped if a tarball matching its recorded checksum is already
+        cached. `download_tarball()` verifies downloads against the
+        checksum published alongside the tarball, when there is one, and
+        resumes interrupted downloads. A `.sha256` file is written next to
+        the tarball for the build to verify.
+
+        Raises
+        ------
+        MinitrinoError
+            If the download fails or does not match its published
+            checksum.
+        """
+        downloader = self._downloader()
+        dist = self._ctx.env.get("CLUSTER_DIST", "")
+        ver = self._ctx.env.get("CLUSTER_VER", "")
+        url, tar_name, _, _ = downloader.resolve_tarball_info(
+            dist, ver, self._daemon_arch()
+        )
+        directory = self.directory()
+        if downloader.cached_tarball(tar_name, directory, self._ctx.logger.debug):
+            return
+
+        tar_path = os.path.join(directory, tar_name)
+        self._ctx.logger.info(
+            f"Downloading {tar_name} to the artifact cache. This may take a "
+            "few minutes..."
+        )
+        try:
+            # Interrupted downloads resume from their `.part` file
+            downloader.download_tarball(url, tar_path, log=self._ctx.logger.debug)
+            digest = downloader.file_digest(tar_path)
+            with open(f"{tar_path}.sha256", "w") as f:
+                f.write(f"{digest}  {tar_name}\n")
+        except Exception as e:
+            raise MinitrinoError(f"Failed to download {url}: {e}") from e
+        self._ctx.logger.debug(f"Cached {tar_name} in {directory}.")
+
+    def _daemon_arch(self) -> str:
+        """Return the Docker daemon's architecture, e.g. `x86_64`."""
+        if not self._arch:
+            assert self._ctx.docker_client is not None
+            self._arch = self._ctx.docker_client.info().get("Architecture", "")
+        return self._arch
+
+    def _downloader(self) -> ModuleType:
+        """Load the library's `downloader.py` script.
+
+        Its output is redirected to the debug log.
+
+        Returns
+        -------
+        ModuleType
+            The loaded script.
+        """
+        if self._module is None:
+            self._module = utils.load_image_script(self._ctx, "downloader")
+        return self._module
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from minitrino.core.cluster.configs import ClusterConfigRenderer
 from minitrino.core.cluster.ops import ClusterOperations
 from minitrino.core.cluster.ports import ClusterPortManager
 from minitrino.core.cluster.resource import ClusterResourceManager
@@ -24,6 +25,8 @@ class Cluster:
 
     Attributes
     ----------
+    configs : ClusterConfigRenderer
+        A config renderer for the current cluster.
     ops : ClusterOperations
         A cluster operations manager for the current cluster.
     ports : ClusterPortManager
@@ -36,6 +39,7 @@ class Cluster:
 
     def __init__(self, ctx: MinitrinoContext):
         self._ctx = ctx
+        self.configs = ClusterConfigRenderer(ctx)
         self.ops = ClusterOperations(ctx, self)
         self.ports = ClusterPortManager(ctx, self)
         self.resource = ClusterResourceManager(ctx)
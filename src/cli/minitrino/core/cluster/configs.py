@@ -0,0 +1,152 @@
+"""Host-side rendering of cluster config files.
+
+Cluster containers generate `config.properties` and `jvm.config` at
+startup with the image's `gen_config.py`, merging user and module
+overrides from their environment over the base files. The CLI loads the
+same script to render these files from a service's effective compose
+environment, so duplicates and conflicting overrides are reported before
+containers start rather than read back from running containers.
+
+The base `jvm.config` is downloaded when the image is built and is not
+available on the host, so rendered JVM configs only contain overrides.
+"""
+
+from __future__ import annotations
+
+import os
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+from minitrino import utils
+from minitrino.settings import CLUSTER_CONFIG, CLUSTER_JVM_CONFIG
+
+if TYPE_CHECKING:
+    from minitrino.core.context import MinitrinoContext
+
+
+class ClusterConfigRenderer:
+    """Render cluster config files on the host.
+
+    Parameters
+    ----------
+    ctx : MinitrinoContext
+        An instantiated MinitrinoContext object with user input and
+        context.
+
+    Methods
+    -------
+    render(environment: dict, worker: bool = False)
+        Render a node's config files.
+    conflicts(environment: dict, worker: bool = False)
+        Return the config keys set by more than one override.
+    """
+
+    def __init__(self, ctx: MinitrinoContext):
+        self._ctx = ctx
+        self._module: ModuleType | None = None
+
+    def render(
+        self, environment: dict[str, str | None], worker: bool = False
+    ) -> dict[str, list[tuple]]:
+        """Render a node's config files.
+
+        Parameters
+        ----------
+        environment : dict[str, str | None]
+            The coordinator service's effective environment.
+        worker : bool
+            If True, render a worker's configs.
+
+        Returns
+        -------
+        dict[str, list[tuple]]
+            Parsed config entries keyed by config file name.
+        """
+        gen_config = self._gen_config()
+        env = self._env(environment)
+        log = self._ctx.logger.debug
+        modules, workers, _, _ = gen_config.get_modules_and_roles(env, log)
+        if worker:
+            cfgs, jvm_cfgs = gen_config.render_worker_config(
+                gen_config.split_config(gen_config.WORKER_CONFIG_PROPS),
+                [],
+                modules,
+                env,
+                log,
+            )
+        else:
+            cfgs, jvm_cfgs = gen_config.render_coordinator_config(
+                self._base_config(), [], modules, workers, env, log
+            )
+        return {CLUSTER_CONFIG: cfgs, CLUSTER_JVM_CONFIG: jvm_cfgs}
+
+    def conflicts(
+        self, environment: dict[str, str | None], worker: bool = False
+    ) -> dict[str, dict[str, tuple[list[tuple[str, tuple]], tuple | None]]]:
+        """Return the config keys set by more than one override.
+
+        Parameters
+        ----------
+        environment : dict[str, str | None]
+            The coordinator service's effective environment.
+        worker : bool
+            If True, check a worker's overrides.
+
+        Returns
+        -------
+        dict[str, dict[str, tuple[list[tuple[str, tuple]], tuple | None]]]
+            For each config file name, each repeated key's `(env_var,
+            entry)` settings in merge order, along with the rendered
+            entry that is used (None if the key was filtered out).
+        """
+        gen_config = self._gen_config()
+        env = self._env(environment)
+        log = self._ctx.logger.debug
+        modules, _, _, _ = gen_config.get_modules_and_roles(env, log)
+        rendered = self.render(environment, worker)
+        sources = dict(
+            zip(
+                (CLUSTER_CONFIG, CLUSTER_JVM_CONFIG),
+                gen_config.config_sources(modules, worker, env, log),
+                strict=True,
+            )
+        )
+        conflicts = {}
+        for filename, file_sources in sources.items():
+            is_jvm = filename == CLUSTER_JVM_CONFIG
+            key_fn = gen_config.extract_jvm_flag_key if is_jvm else str
+            used = {
+                key_fn(entry[1]): entry
+                for entry in rendered[filename]
+                if entry[0] == "key_value"
+            }
+            conflicts[filename] = {
+                key: (settings, used.get(key))
+                for key, settings in gen_config.find_conflicts(
+                    file_sources, is_jvm
+                ).items()
+            }
+        return conflicts
+
+    def _env(self, environment: dict[str, str | None]) -> dict[str, str]:
+        """Return the environment a cluster container renders from."""
+        env = {
+            "CLUSTER_DIST": self._ctx.env.get("CLUSTER_DIST", ""),
+            "CLUSTER_VER": self._ctx.env.get("CLUSTER_VER", ""),
+        }
+        env.update({k: v or "" for k, v in environment.items()})
+        return env
+
+    def _base_config(self) -> list[tuple]:
+        """Return the image's base coordinator `config.properties`."""
+        path = os.path.join(
+            self._ctx.lib_dir, "image", "src", "etc", "app-config", CLUSTER_CONFIG
+        )
+        with open(path) as f:
+            return self._gen_config().split_config(f.read())
+
+    def _gen_config(self) -> ModuleType:
+        """Load the library's `gen_config.py` script."""
+        if self._module is None:
+            self._module = utils.load_image_script(self._ctx, "gen_config")
+        return self._module
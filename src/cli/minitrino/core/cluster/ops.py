@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import concurrent.futures
+import contextlib
+import hashlib
+import io
+import os
 import re
+import tarfile
+import tempfile
+import time
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from docker.errors import APIError, NotFound
 
@@ -18,13 +26,22 @@ from minitrino.core.docker.wrappers import (
     MinitrinoNetwork,
 )
 from minitrino.core.errors import MinitrinoError, UserError
-from minitrino.settings import ETC_DIR
+from minitrino.settings import (
+    ETC_DIR,
+    PROVISION_PARALLELISM_MAX,
+    PROVISION_PARALLELISM_MIN,
+)
 from minitrino.shutdown import shutdown_event
 
 if TYPE_CHECKING:
     from minitrino.core.cluster.cluster import Cluster
     from minitrino.core.context import MinitrinoContext
 
+# Coordinator directory for catalog statements run by `update_catalogs()`
+CATALOG_SQL_DIR = "/tmp/minitrino-catalogs"
+# Prefix of the temporary catalogs that validate a replacement definition
+CATALOG_VALIDATE_PREFIX = "minitrino_validate_"
+
 
 class ClusterOperations:
     """Cluster operations manager for the current cluster.
@@ -41,19 +58,28 @@ class ClusterOperations:
     -------
     provision()
         Provisions the cluster.
-    reconcile_workers(workers: int)
+    reconcile_workers(workers: int, parallelism: int = 0, cached_image:
+    Optional[str] = None)
         Provisions or adjusts worker containers based on the specified
         number.
     down(sig_kill: bool = False, keep: bool = False)
         Stops and optionally removes all containers for the current
         cluster.
-    restart()
+    restart(rebootstrap: bool = False)
         Restarts all cluster containers (coordinator and workers).
     restart_containers(c_restart: Optional[list[str]] = None, log_level:
     LogLevel = LogLevel.DEBUG)
         Restarts all the containers in the provided list. Can apply to
         any container in the environment, not just the coordinator and
         workers.
+    push_config(files: dict[str, str])
+        Pushes config files into the running coordinator and workers and
+        restarts them.
+    dynamic_catalogs()
+        Returns True if the running cluster manages catalogs
+        dynamically.
+    update_catalogs(catalogs: dict[str, str], dropped: list[str])
+        Creates, replaces, and drops catalogs in the running cluster.
     remove(obj_type: str, force: bool, labels: Optional[list[str]] =
     None)
         Removes Docker objects (images, volumes, or networks) associated
@@ -73,6 +99,8 @@ class ClusterOperations:
         image: str,
         workers: int,
         no_rollback: bool,
+        parallelism: int = 0,
+        plan_only: bool = False,
     ) -> None:
         """Provision the cluster and environment dependencies.
 
@@ -89,6 +117,13 @@ class ClusterOperations:
             Number of cluster workers to provision.
         no_rollback : bool
             If True, disables rollback on failure.
+        parallelism : int
+            Maximum number of workers to provision concurrently. If 0,
+            uses `PROVISION_PARALLELISM` or a default sized to the host
+            and Docker daemon CPUs.
+        plan_only : bool
+            If True, logs the services that would be created, recreated,
+            or left unchanged without provisioning anything.
 
         Notes
         -----
@@ -99,11 +134,32 @@ class ClusterOperations:
         - Dependent clusters are automatically provisioned after the
           primary cluster is launched.
         """
-        self._provisioner.provision(modules, image, workers, no_rollback)
+        self._provisioner.provision(
+            modules,
+            image,
+            workers,
+            no_rollback,
+            parallelism=parallelism,
+            plan_only=plan_only,
+        )
 
-    def reconcile_workers(self, workers: int = 0) -> None:
+    def reconcile_workers(
+        self, workers: int = 0, parallelism: int = 0, cached_image: str | None = None
+    ) -> None:
         """Reconcile the number of workers in the cluster.
 
+        Parameters
+        ----------
+        workers : int
+            Number of cluster workers to reconcile to.
+        parallelism : int
+            Maximum number of workers to provision concurrently. If 0,
+            uses `PROVISION_PARALLELISM` or a default sized to the host
+            and Docker daemon CPUs.
+        cached_image : str, optional
+            The result of `cached_worker_image()`, if the caller has
+            already looked it up. If None, it is looked up here.
+
         Notes
         -----
         Handles five scenarios:
@@ -119,17 +175,12 @@ class ClusterOperations:
          5. Provided `workers` value is less than running workers —
             removes excess workers.
 
-        Parallelism is set to 4 for worker provisioning.
+        Worker provisioning runs as a pipeline of three stages —
+        container creation, shared network attachment, and config copy
+        — so that one worker's config copy overlaps with the creation of
+        the next. Per-stage timings are logged at the debug level.
         """
-        pattern = rf"minitrino-worker-\d+-{self._ctx.cluster_name}"
-        worker_containers = [
-            c.name
-            for c in self._cluster.resource.resources().containers()
-            if c.name
-            and re.match(pattern, c.name)
-            and c.name.startswith("minitrino-worker-")
-            and c.labels.get("org.minitrino.root") == "true"
-        ]
+        worker_containers = [c.name for c in self._worker_containers()]
         running_workers = len(worker_containers)
 
         # Scenario 1
@@ -157,7 +208,9 @@ class ClusterOperations:
                     {"ID": container_obj.short_id, "Name": container_obj.name}
                 )
                 self._ctx.logger.warn(f"Removed excess worker: {identifier}")
+            self._cluster.resource.invalidate("containers")
 
+        parallelism = self._worker_parallelism(workers, parallelism)
         ver = self._ctx.env.get("CLUSTER_VER")
         dist = self._ctx.env.get("CLUSTER_DIST")
         worker_img = f"minitrino/cluster:{ver}-{dist}"
@@ -167,79 +220,94 @@ class ClusterOperations:
         fq_container_name = self._cluster.resource.fq_container_name("minitrino")
         coordinator = self._cluster.resource.container(fq_container_name)
 
-        # Create tar archive of coordinator's /etc/${CLUSTER_DIST};
         user = self._ctx.env.get("SERVICE_USER")
         tar_path = "/tmp/${CLUSTER_DIST}.tar.gz"
-        self._ctx.cmd_executor.execute(
-            ["rm -rf /tmp/${CLUSTER_DIST}_copy"],
-            ["rm /tmp/${CLUSTER_DIST}.tar.gz"],
-            ["cp -a /etc/${CLUSTER_DIST} /tmp/${CLUSTER_DIST}_copy"],
-            ["rm /tmp/${CLUSTER_DIST}_copy/config.properties"],
-            ["rm /tmp/${CLUSTER_DIST}_copy/jvm.config"],
-            [f"tar czf {tar_path} -C /tmp/${{CLUSTER_DIST}}_copy ."],
-            ["rm -rf /tmp/${CLUSTER_DIST}_copy"],
-            container=coordinator,
-            user=user,
-        )
+        if cached_image is None:
+            cached_image = self.cached_worker_image()
+        archive_path = ""
+        if cached_image:
+            # The cached image already contains the coordinator's config,
+            # so workers start from it without a tar round-trip.
+            worker_img = cached_image
+            self._ctx.logger.debug(
+                f"Starting workers from cached config image '{cached_image}'."
+            )
+        else:
+            # Create tar archive of coordinator's /etc/${CLUSTER_DIST};
+            self._ctx.cmd_executor.execute(
+                ["rm -rf /tmp/${CLUSTER_DIST}_copy"],
+                ["rm /tmp/${CLUSTER_DIST}.tar.gz"],
+                ["cp -a /etc/${CLUSTER_DIST} /tmp/${CLUSTER_DIST}_copy"],
+                ["rm /tmp/${CLUSTER_DIST}_copy/config.properties"],
+                ["rm /tmp/${CLUSTER_DIST}_copy/jvm.config"],
+                [f"tar czf {tar_path} -C /tmp/${{CLUSTER_DIST}}_copy ."],
+                ["rm -rf /tmp/${CLUSTER_DIST}_copy"],
+                container=coordinator,
+                user=user,
+            )
 
-        def _provision_worker(i: int) -> None:
-            if shutdown_event.is_set():
-                self._ctx.logger.warn(f"Shutdown signal detected. Skipping worker {i}.")
-                return
+            # Fetch the archive from the coordinator once. Each worker
+            # streams it from a local file through its own file handle.
+            archive_path = self._fetch_archive(coordinator, f"/tmp/{dist}.tar.gz")
+            self._ctx.logger.debug(
+                f"Fetched worker config archive from coordinator "
+                f"({os.path.getsize(archive_path)} bytes)."
+            )
+
+        env_list = coordinator.attrs["Config"]["Env"]
+        env_dict = dict(item.split("=", 1) for item in env_list if "=" in item)
+        env_dict["WORKER"] = "true"
+        env_dict["COORDINATOR"] = "false"
+
+        # Extract extra_hosts from coordinator to ensure workers have same
+        # network capabilities (e.g., host.docker.internal resolution)
+        extra_hosts_list = coordinator.attrs.get("HostConfig", {}).get("ExtraHosts", [])
+        extra_hosts_dict = {}
+        if extra_hosts_list:
+            for entry in extra_hosts_list:
+                if ":" in entry:
+                    hostname, ip = entry.split(":", 1)
+                    extra_hosts_dict[hostname] = ip
+
+        def _create_worker(i: int) -> tuple[MinitrinoContainer, bool]:
             fq_worker_name = self._cluster.resource.fq_container_name(
                 f"minitrino-worker-{i}",
             )
             try:
-                worker = self._cluster.resource.container(fq_worker_name)
+                return self._cluster.resource.container(fq_worker_name), False
             except NotFound:
-                env_list = coordinator.attrs["Config"]["Env"]
-                env_dict = dict(item.split("=", 1) for item in env_list if "=" in item)
-                env_dict["WORKER"] = "true"
-                env_dict["COORDINATOR"] = "false"
-
-                # Extract extra_hosts from coordinator to ensure workers have same
-                # network capabilities (e.g., host.docker.internal resolution)
-                extra_hosts_list = coordinator.attrs.get("HostConfig", {}).get(
-                    "ExtraHosts", []
-                )
-                extra_hosts_dict = {}
-                if extra_hosts_list:
-                    for entry in extra_hosts_list:
-                        if ":" in entry:
-                            hostname, ip = entry.split(":", 1)
-                            extra_hosts_dict[hostname] = ip
-
-                worker_base = self._ctx.docker_client.containers.run(
-                    worker_img,
-                    name=fq_worker_name,
-                    environment=env_dict,
-                    detach=True,
-                    hostname=fq_worker_name,
-                    network=network_name,
-                    extra_hosts=extra_hosts_dict if extra_hosts_dict else None,
-                    labels={
-                        "org.minitrino.root": "true",
-                        "org.minitrino.module.minitrino": "true",
-                        "com.docker.compose.project": compose_project_name,
-                        "com.docker.compose.service": f"minitrino-worker-{i}",
-                    },
-                )
-                shared_network = self._ctx.docker_client.networks.get("cluster_shared")
-                shared_network.connect(worker_base)
-
-                worker = MinitrinoContainer(worker_base, self._ctx.cluster_name)
-                self._ctx.logger.debug(
-                    f"Created and started worker container: '{fq_worker_name}' "
-                    f"in network '{network_name}'."
-                )
-
-            # Copy the tar archive from the coordinator container
-            bits, _ = coordinator.get_archive(
-                f"/tmp/{self._ctx.env.get('CLUSTER_DIST')}.tar.gz"
+                pass
+            worker_base = self._ctx.docker_client.containers.run(
+                worker_img,
+                name=fq_worker_name,
+                environment=env_dict,
+                detach=True,
+                hostname=fq_worker_name,
+                network=network_name,
+                extra_hosts=extra_hosts_dict if extra_hosts_dict else None,
+                labels={
+                    "org.minitrino.root": "true",
+                    "org.minitrino.module.minitrino": "true",
+                    "com.docker.compose.project": compose_project_name,
+                    "com.docker.compose.service": f"minitrino-worker-{i}",
+                },
             )
-            tar_stream = b"".join(bits)
+            self._ctx.logger.debug(
+                f"Created and started worker container: '{fq_worker_name}' "
+                f"in network '{network_name}'."
+            )
+            return MinitrinoContainer(worker_base, self._ctx.cluster_name), True
 
-            worker.put_archive("/tmp", tar_stream)
+        def _attach_worker(worker: MinitrinoContainer, created: bool) -> None:
+            if created:
+                shared_network.connect(worker)
+
+        def _copy_config(worker: MinitrinoContainer) -> None:
+            if not archive_path:
+                return
+            # Copy the coordinator's tar archive into the worker
+            with open(archive_path, "rb") as f:
+                worker.put_archive("/tmp", f)
 
             # Extract the tar archive into the new worker container
             self._ctx.cmd_executor.execute(
@@ -247,22 +315,34 @@ class ClusterOperations:
                 container=worker,
                 user=user,
             )
-            self._ctx.logger.debug(f"Copied {ETC_DIR} to '{fq_worker_name}'")
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            futures = [
-                executor.submit(_provision_worker, i) for i in range(1, workers + 1)
-            ]
-            for future in concurrent.futures.as_completed(futures):
-                if shutdown_event.is_set():
-                    self._ctx.logger.warn(
-                        "Shutdown detected. Aborting remaining worker provisioning."
-                    )
-                    break
-                try:
-                    future.result()
-                except Exception as exc:
-                    raise MinitrinoError("Worker provisioning failed") from exc
+            self._ctx.logger.debug(f"Copied {ETC_DIR} to '{worker.name}'")
+
+        try:
+            shared_network = self._ctx.docker_client.networks.get("cluster_shared")
+            start = time.perf_counter()
+            timings = self._run_worker_pipeline(
+                workers, parallelism, _create_worker, _attach_worker, _copy_config
+            )
+            elapsed = time.perf_counter() - start
+            if archive_path and self._worker_config_cache_enabled():
+                self._build_worker_config_image(coordinator, archive_path)
+        finally:
+            if archive_path:
+                os.remove(archive_path)
+
+        self._ctx.logger.debug(
+            f"Provisioned {workers} workers in {elapsed:.2f}s "
+            f"(parallelism: {parallelism}). Stage timings: "
+            + ", ".join(
+                f"{stage} {sum(durations):.2f}s total, "
+                f"{max(durations, default=0):.2f}s max"
+                for stage, durations in timings.items()
+            )
+        )
+
+        self._cluster.resource.invalidate("containers")
+        if cached_image:
+            return
 
         # Remove the tar archive
         self._ctx.cmd_executor.execute(
@@ -271,6 +351,332 @@ class ClusterOperations:
             user=user,
         )
 
+    def cached_worker_image(self) -> str:
+        """Return the cached worker config image, if one can be used.
+
+        Returns
+        -------
+        str
+            The tag of the cached worker config image matching the
+            running coordinator. Empty if `WORKER_CONFIG_CACHE` is not
+            enabled, the image does not exist, or existing workers were
+            started from a different image.
+
+        Notes
+        -----
+        The coordinator container must exist. The image is built the
+        first time workers are provisioned with caching enabled. See
+        `_worker_config_key()` for the inputs that identify it.
+        """
+        if not self._worker_config_cache_enabled():
+            return ""
+        fq_container_name = self._cluster.resource.fq_container_name("minitrino")
+        coordinator = self._cluster.resource.container(fq_container_name)
+        tag = self._worker_config_image(coordinator)
+        assert self._ctx.docker_client is not None
+        try:
+            self._ctx.docker_client.images.get(tag)
+        except NotFound:
+            self._ctx.logger.debug(f"Worker config image '{tag}' not found.")
+            return ""
+        for worker in self._worker_containers():
+            if worker.attrs.get("Config", {}).get("Image") != tag:
+                self._ctx.logger.debug(
+                    f"Worker '{worker.name}' was not started from '{tag}'. "
+                    "Copying config from the coordinator."
+                )
+                return ""
+        return tag
+
+    def _worker_containers(self) -> list[MinitrinoContainer]:
+        """Return the current cluster's worker containers."""
+        pattern = rf"minitrino-worker-\d+-{self._ctx.cluster_name}"
+        return [
+            c
+            for c in self._cluster.resource.resources(kinds=["containers"]).containers()
+            if c.name
+            and re.match(pattern, c.name)
+            and c.name.startswith("minitrino-worker-")
+            and c.labels.get("org.minitrino.root") == "true"
+        ]
+
+    def _worker_config_cache_enabled(self) -> bool:
+        """Return True if `WORKER_CONFIG_CACHE` is enabled."""
+        value = str(self._ctx.env.get("WORKER_CONFIG_CACHE") or "")
+        return value.strip().lower() == "true"
+
+    def _worker_config_key(self, coordinator: MinitrinoContainer) -> str:
+        """Return a hash identifying the coordinator's worker config.
+
+        Parameters
+        ----------
+        coordinator : MinitrinoContainer
+            The coordinator container.
+
+        Returns
+        -------
+        str
+            SHA-256 hex digest of the coordinator's image ID, its
+            environment (excluding `WORKERS`, which does not affect
+            worker config), and the path, size, and modification time of
+            every file in its modules' directories.
+        """
+        hashobj = hashlib.new("sha256")
+        hashobj.update(str(coordinator.attrs.get("Image", "")).encode())
+        env_list = sorted(coordinator.attrs.get("Config", {}).get("Env") or [])
+        modules: list[str] = []
+        for item in env_list:
+            key, _, value = item.partition("=")
+            if key == "WORKERS":
+                continue
+            if key == "MINITRINO_MODULES":
+                modules = [m for m in value.split(",") if m]
+            hashobj.update(f"{item}\0".encode())
+        for module in sorted(modules):
+            module_dir = self._ctx.modules.data.get(module, {}).get("module_dir", "")
+            for root, dirs, files in os.walk(module_dir):
+                dirs.sort()
+                for fname in sorted(files):
+                    fpath = os.path.join(root, fname)
+                    with contextlib.suppress(OSError):
+                        stat = os.stat(fpath)
+                        relpath = os.path.relpath(fpath, module_dir)
+                        hashobj.update(
+                            f"{module}/{relpath}:{stat.st_size}:{stat.st_mtime_ns}\0".encode()
+                        )
+        return hashobj.hexdigest()
+
+    def _worker_config_image(self, coordinator: MinitrinoContainer) -> str:
+        """Return the worker config image tag for a coordinator.
+
+        Parameters
+        ----------
+        coordinator : MinitrinoContainer
+            The coordinator container.
+
+        Returns
+        -------
+        str
+            The image tag, derived from the cluster image tag and the
+            worker config key.
+        """
+        ver = self._ctx.env.get("CLUSTER_VER")
+        dist = self._ctx.env.get("CLUSTER_DIST")
+        key = self._worker_config_key(coordinator)
+        return f"minitrino/cluster:{ver}-{dist}-worker-{key[:16]}"
+
+    def _build_worker_config_image(
+        self, coordinator: MinitrinoContainer, archive_path: str
+    ) -> None:
+        """Build the cached worker config image.
+
+        The image adds the coordinator's config archive on top of the
+        cluster image. Failures are logged and ignored since the cache
+        is only an optimization.
+
+        Parameters
+        ----------
+        coordinator : MinitrinoContainer
+            The coordinator container the archive was fetched from.
+        archive_path : str
+            Path to the archive returned by `_fetch_archive()`.
+        """
+        ver = self._ctx.env.get("CLUSTER_VER")
+        dist = self._ctx.env.get("CLUSTER_DIST")
+        tag = self._worker_config_image(coordinator)
+        dockerfile = (
+            f"FROM minitrino/cluster:{ver}-{dist}\nADD {dist}.tar.gz /etc/{dist}/\n"
+        ).encode()
+        try:
+            with tempfile.TemporaryFile() as context:
+                with (
+                    tarfile.open(fileobj=context, mode="w") as tar,
+                    tarfile.open(archive_path) as archive,
+                ):
+                    info = tarfile.TarInfo("Dockerfile")
+                    info.size = len(dockerfile)
+                    tar.addfile(info, io.BytesIO(dockerfile))
+                    member = archive.getmember(f"{dist}.tar.gz")
+                    tar.addfile(member, archive.extractfile(member))
+                context.seek(0)
+                assert self._ctx.docker_client is not None
+                self._ctx.docker_client.images.build(
+                    fileobj=context,
+                    custom_context=True,
+                    tag=tag,
+                    rm=True,
+                    labels={
+                        "org.minitrino.root": "true",
+                        "org.minitrino.module.minitrino": "true",
+                    },
+                )
+            self._ctx.logger.debug(f"Cached worker config image '{tag}'.")
+        except Exception as e:
+            self._ctx.logger.warn(f"Failed to cache worker config image '{tag}': {e}")
+
+    def _worker_parallelism(self, workers: int, parallelism: int = 0) -> int:
+        """Return the number of workers to provision concurrently.
+
+        Parameters
+        ----------
+        workers : int
+            Number of workers being provisioned.
+        parallelism : int
+            Requested parallelism. If 0, falls back to the
+            `PROVISION_PARALLELISM` environment variable, then to the
+            lesser of the host and Docker daemon CPU counts, bounded by
+            `PROVISION_PARALLELISM_MIN` and `PROVISION_PARALLELISM_MAX`.
+
+        Returns
+        -------
+        int
+            The parallelism, capped at `workers`.
+
+        Raises
+        ------
+        UserError
+            If `PROVISION_PARALLELISM` is not a positive integer.
+        """
+        if parallelism <= 0:
+            value = str(self._ctx.env.get("PROVISION_PARALLELISM") or "").strip()
+            if value:
+                try:
+                    parallelism = int(value)
+                except ValueError:
+                    parallelism = 0
+                if parallelism <= 0:
+                    raise UserError(
+                        f"Invalid PROVISION_PARALLELISM value: '{value}'",
+                        "PROVISION_PARALLELISM must be a positive integer.",
+                    )
+        if parallelism <= 0:
+            host_cpus = os.cpu_count() or 1
+            daemon_cpus = host_cpus
+            with contextlib.suppress(Exception):
+                if self._ctx.docker_client is not None:
+                    # Daemons that do not report NCPU are sized to the host
+                    ncpu = self._ctx.docker_client.info().get("NCPU") or host_cpus
+                    daemon_cpus = int(ncpu)
+            parallelism = max(
+                PROVISION_PARALLELISM_MIN,
+                min(host_cpus, daemon_cpus, PROVISION_PARALLELISM_MAX),
+            )
+        return max(1, min(parallelism, workers))
+
+    def _run_worker_pipeline(
+        self,
+        workers: int,
+        parallelism: int,
+        create: Callable[[int], tuple[MinitrinoContainer, bool]],
+        attach: Callable[[MinitrinoContainer, bool], None],
+        copy: Callable[[MinitrinoContainer], None],
+    ) -> dict[str, list[float]]:
+        """Provision workers through overlapping create, attach, and copy stages.
+
+        Each stage has its own thread pool of size `parallelism`. As
+        soon as a worker completes a stage, it is submitted to the next
+        one.
+
+        Parameters
+        ----------
+        workers : int
+            Number of workers to provision, numbered from 1.
+        parallelism : int
+            Thread pool size for each stage.
+        create : Callable[[int], tuple[MinitrinoContainer, bool]]
+            Returns the worker container for a worker number and whether
+            it was newly created.
+        attach : Callable[[MinitrinoContainer, bool], None]
+            Attaches a worker to its networks.
+        copy : Callable[[MinitrinoContainer], None]
+            Copies the cluster config into a worker.
+
+        Returns
+        -------
+        dict[str, list[float]]
+            Durations in seconds of each completed task, keyed by stage.
+
+        Raises
+        ------
+        MinitrinoError
+            If any stage fails for any worker.
+        """
+        timings: dict[str, list[float]] = {"create": [], "attach": [], "copy": []}
+
+        def _timed(stage: str, fn: Callable, *args):
+            start = time.perf_counter()
+            result = fn(*args)
+            timings[stage].append(time.perf_counter() - start)
+            return result
+
+        with (
+            ThreadPoolExecutor(parallelism, "minitrino-create") as create_pool,
+            ThreadPoolExecutor(parallelism, "minitrino-attach") as attach_pool,
+            ThreadPoolExecutor(parallelism, "minitrino-copy") as copy_pool,
+        ):
+            pending: dict[concurrent.futures.Future, tuple[str, Any]] = {
+                create_pool.submit(_timed, "create", create, i): ("create", i)
+                for i in range(1, workers + 1)
+            }
+            try:
+                while pending:
+                    done, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        stage, _arg = pending.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as exc:
+                            raise MinitrinoError("Worker provisioning failed") from exc
+                        if shutdown_event.is_set():
+                            self._ctx.logger.warn(
+                                "Shutdown detected. Aborting remaining worker "
+                                "provisioning."
+                            )
+                            return timings
+                        if stage == "create":
+                            worker, created = result
+                            future = attach_pool.submit(
+                                _timed, "attach", attach, worker, created
+                            )
+                            pending[future] = ("attach", worker)
+                        elif stage == "attach":
+                            worker = _arg
+                            future = copy_pool.submit(_timed, "copy", copy, worker)
+                            pending[future] = ("copy", worker)
+            finally:
+                for future in pending:
+                    future.cancel()
+        return timings
+
+    def _fetch_archive(self, container: MinitrinoContainer, path: str) -> str:
+        """Copy a path out of a container into a local temporary file.
+
+        Parameters
+        ----------
+        container : MinitrinoContainer
+            The container to copy from.
+        path : str
+            Path inside the container.
+
+        Returns
+        -------
+        str
+            Path to the local tar archive returned by `get_archive()`.
+            The caller is responsible for removing it.
+        """
+        fd, archive_path = tempfile.mkstemp(prefix="minitrino-", suffix=".tar")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                bits, _ = container.get_archive(path)
+                for chunk in bits:
+                    f.write(chunk)
+        except Exception:
+            os.remove(archive_path)
+            raise
+        return archive_path
+
     def down(self, sig_kill: bool = False, keep: bool = False) -> None:
         """Stop and optionally remove all containers from the cluster.
 
@@ -282,7 +688,7 @@ class ClusterOperations:
         keep : bool, optional
             If True, containers will be stopped but not removed.
         """
-        resources = self._cluster.resource.resources()
+        resources = self._cluster.resource.resources(kinds=["containers"])
         containers = resources.containers()
 
         if len(containers) == 0:
@@ -308,6 +714,7 @@ class ClusterOperations:
             container.remove()
             self._ctx.logger.info(f"Removed container: {identifier}")
 
+        self._cluster.resource.invalidate("containers")
         with ThreadPoolExecutor() as executor:
             stop_futures = {
                 executor.submit(stop_container, container): container
@@ -339,15 +746,39 @@ class ClusterOperations:
 
         self._ctx.logger.info("Brought down all Minitrino containers.")
 
-    def restart(self) -> None:
-        """Restart all cluster containers (coordinator and workers)."""
-        cluster_resources = self._cluster.resource.resources()
+    def restart(self, rebootstrap: bool = False) -> None:
+        """Restart all cluster containers (coordinator and workers).
+
+        Bootstrap hooks and SQL files that completed before the restart
+        are skipped unless their file or the container's environment
+        changed.
+
+        Parameters
+        ----------
+        rebootstrap : bool, optional
+            If True, removes the bootstrap completion markers of running
+            containers first, so all bootstrap work runs again. By
+            default False.
+        """
+        cluster_resources = self._cluster.resource.resources(kinds=["containers"])
         containers = cluster_resources.containers()
 
         if len(containers) == 0:
             self._ctx.logger.info("No cluster containers to restart.")
             return
 
+        if rebootstrap:
+            for container in containers:
+                if container.status != "running":
+                    continue
+                self._ctx.cmd_executor.execute(
+                    [f"rm -f {ETC_DIR}/.minitrino/bootstrap_checksums.json"],
+                    container=container,
+                )
+                self._ctx.logger.debug(
+                    f"Cleared bootstrap markers in '{container.name}'."
+                )
+
         cluster_containers = [c.name for c in containers if c.name]
         self.restart_containers(cluster_containers)
         self._ctx.logger.info(
@@ -408,6 +839,183 @@ class ClusterOperations:
                         f"Error while restarting container '{container_name}'"
                     ) from e
 
+        self._cluster.resource.invalidate("containers")
+
+    def push_config(self, files: dict[str, str]) -> None:
+        """Push config files into the running coordinator and workers.
+
+        Files are staged in each container's `/tmp/etc` and the
+        containers are restarted. On start, the image's `copy-config.sh`
+        copies staged files over `/etc/${CLUSTER_DIST}` when
+        `push-config-status.txt` is `ACTIVE`.
+
+        Parameters
+        ----------
+        files : dict[str, str]
+            Host paths keyed by their target path under `/mnt/etc`.
+        """
+        fq_container_name = self._cluster.resource.fq_container_name("minitrino")
+        containers = [self._cluster.resource.container(fq_container_name)]
+        containers.extend(self._worker_containers())
+
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w") as tar:
+            for target, source in sorted(files.items()):
+                tar.add(
+                    source,
+                    arcname=os.path.relpath(target, "/mnt/etc"),
+                    filter=_root_owned,
+                )
+        archive = buf.getvalue()
+
+        user = self._ctx.env.get("SERVICE_USER")
+        for container in containers:
+            self._ctx.cmd_executor.execute(
+                ["mkdir -p /tmp/etc"], container=container, user=user
+            )
+            container.put_archive("/tmp/etc", archive)
+            self._ctx.cmd_executor.execute(
+                [
+                    "echo ACTIVE > "
+                    "/etc/${CLUSTER_DIST}/.minitrino/push-config-status.txt"
+                ],
+                container=container,
+                user=user,
+            )
+            self._ctx.logger.debug(
+                f"Pushed {len(files)} config file(s) to '{container.name}'."
+            )
+        self.restart_containers([c.name for c in containers])
+
+    def dynamic_catalogs(self) -> bool:
+        """Return True if the running cluster manages catalogs dynamically.
+
+        Catalogs can only be created and dropped with SQL when every
+        node's `config.properties` sets `catalog.management=dynamic`.
+
+        Returns
+        -------
+        bool
+            True if the coordinator is running and all nodes use dynamic
+            catalog management.
+        """
+        fq_container_name = self._cluster.resource.fq_container_name("minitrino")
+        try:
+            coordinator = self._cluster.resource.container(fq_container_name)
+        except NotFound:
+            return False
+        if coordinator.status != "running":
+            return False
+        for container in [coordinator, *self._worker_containers()]:
+            result = self._ctx.cmd_executor.execute(
+                [
+                    r"grep -Eq '^\s*catalog\.management\s*=\s*dynamic\s*$' "
+                    f"{ETC_DIR}/config.properties"
+                ],
+                container=container,
+                trigger_error=False,
+                suppress_output=True,
+            )[0]
+            if result.exit_code != 0:
+                self._ctx.logger.debug(
+                    f"Dynamic catalog management is not enabled on '{container.name}'."
+                )
+                return False
+        return True
+
+    def update_catalogs(self, catalogs: dict[str, str], dropped: list[str]) -> None:
+        """Create, replace, and drop catalogs in the running cluster.
+
+        Requires dynamic catalog management (see `dynamic_catalogs()`).
+        The coordinator persists the catalogs and distributes them to
+        workers, so no container is restarted.
+
+        Each catalog's statements run together with the image's
+        `run_sql.py`, one catalog at a time, so a catalog that fails to
+        be created does not affect the others. A new definition is first
+        created under a temporary name and dropped again, so a definition
+        the connector rejects leaves the existing catalog in place.
+
+        Parameters
+        ----------
+        catalogs : dict[str, str]
+            Host paths of catalog properties files keyed by catalog
+            name. Existing catalogs with the same name are replaced.
+        dropped : list[str]
+            Names of catalogs to drop.
+
+        Raises
+        ------
+        MinitrinoError
+            If a catalog's statements fail. Catalogs after it are not
+            changed.
+        """
+        names = sorted({*catalogs, *dropped})
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w") as tar:
+            for name in names:
+                statements = []
+                if name in catalogs:
+                    temp = _quote_identifier(f"{CATALOG_VALIDATE_PREFIX}{name}")
+                    statements += [
+                        f"DROP CATALOG IF EXISTS {temp}",
+                        _create_catalog_sql(
+                            f"{CATALOG_VALIDATE_PREFIX}{name}", catalogs[name]
+                        ),
+                        f"DROP CATALOG {temp}",
+                    ]
+                statements.append(f"DROP CATALOG IF EXISTS {_quote_identifier(name)}")
+                if name in catalogs:
+                    statements.append(_create_catalog_sql(name, catalogs[name]))
+                data = (";\n".join(statements) + ";\n").encode()
+                info = _root_owned(tarfile.TarInfo(f"{name}.sql"))
+                info.size = len(data)
+                info.mode = 0o644
+                tar.addfile(info, io.BytesIO(data))
+
+        fq_container_name = self._cluster.resource.fq_container_name("minitrino")
+        container = self._cluster.resource.container(fq_container_name)
+        user = self._ctx.env.get("SERVICE_USER")
+        self._ctx.cmd_executor.execute(
+            [f"rm -rf {CATALOG_SQL_DIR} && mkdir -p {CATALOG_SQL_DIR}"],
+            container=container,
+            user=user,
+        )
+        container.put_archive(CATALOG_SQL_DIR, buf.getvalue())
+        files = " ".join(f"'{CATALOG_SQL_DIR}/{name}.sql'" for name in names)
+        result = self._ctx.cmd_executor.execute(
+            [
+                "python3 /usr/lib/${CLUSTER_DIST}/bin/run_sql.py --parallel 1 "
+                f"{files}; status=$?; rm -rf {CATALOG_SQL_DIR}; exit $status"
+            ],
+            container=container,
+            user=user,
+            trigger_error=False,
+            suppress_output=True,
+        )[0]
+
+        failed = ""
+        if result.exit_code != 0:
+            failed = next(
+                (
+                    name
+                    for name in names
+                    if f"{CATALOG_SQL_DIR}/{name}.sql:" in result.output
+                ),
+                "",
+            )
+        for name in names:
+            if name == failed:
+                break
+            if name in catalogs:
+                self._ctx.logger.info(f"Created catalog '{name}'.")
+            else:
+                self._ctx.logger.info(f"Dropped catalog '{name}'.")
+        if result.exit_code != 0:
+            action = "create" if failed in catalogs else "drop"
+            target = f"{action} catalog '{failed}'" if failed else "update catalogs"
+            raise MinitrinoError(f"Failed to {target}:\n{result.output.strip()}")
+
     def remove(
         self, obj_type: str, force: bool, modules: list[str] | None = None
     ) -> None:
@@ -472,7 +1080,8 @@ class ClusterOperations:
         self._ctx.logger.warn(
             f"Rolling back cluster '{self._ctx.cluster_name}'...",
         )
-        resources = self._cluster.resource.resources()
+        self._cluster.resource.invalidate("containers")
+        resources = self._cluster.resource.resources(kinds=["containers"])
         containers = resources.containers()
         for c in containers:
             try:
@@ -485,18 +1094,23 @@ class ClusterOperations:
                 self._ctx.logger.debug(f"Rolled back {repr(c)}")
             except Exception:
                 pass
+        self._cluster.resource.invalidate("containers")
 
     def _remove(self, obj_type: str, label: str | None, force: bool) -> None:
-        resources = self._cluster.resource.resources([label] if label else None)
+        if obj_type not in ("image", "volume", "network"):
+            raise MinitrinoError(f"Invalid object type: {obj_type}")
+        resources = self._cluster.resource.resources(
+            [label] if label else None, kinds=[f"{obj_type}s"]
+        )
         items: list[MinitrinoDockerObject]
         if obj_type == "image":
             items = list(resources.images())
         elif obj_type == "volume":
             items = list(resources.volumes())
-        elif obj_type == "network":
-            items = list(resources.networks())
         else:
-            raise MinitrinoError(f"Invalid object type: {obj_type}")
+            items = list(resources.networks())
+        if items:
+            self._cluster.resource.invalidate(f"{obj_type}s")
         for obj in items:
             identifier = "<unknown>"
             try:
@@ -554,3 +1168,74 @@ class ClusterOperations:
             return image.tags[0]
         except Exception:
             return ""
+
+
+def _root_owned(info: tarfile.TarInfo) -> tarfile.TarInfo:
+    """Return a tar member owned by root."""
+    info.uid = info.gid = 0
+    info.uname = info.gname = "root"
+    return info
+
+
+def _quote_identifier(name: str) -> str:
+    """Return a quoted SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _create_catalog_sql(name: str, path: str) -> str:
+    """Return a `CREATE CATALOG` statement for a catalog properties file.
+
+    Parameters
+    ----------
+    name : str
+        The catalog name.
+    path : str
+        Host path of the catalog's properties file.
+
+    Returns
+    -------
+    str
+        The `CREATE CATALOG` statement.
+
+    Raises
+    ------
+    UserError
+        If the file does not set `connector.name`, or uses properties
+        syntax other than `key=value` lines.
+    """
+    properties = {}
+    with open(path) as f:
+        for number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith(("#", "!")):
+                continue
+            key, sep, value = line.partition("=")
+            continued = (len(line) - len(line.rstrip("\\"))) % 2 == 1
+            if not sep or ":" in key or continued:
+                raise UserError(
+                    f"Unsupported syntax on line {number} of catalog file "
+                    f"'{path}': {line}",
+                    "Write each catalog property on its own line as `key=value`.",
+                )
+            properties[key.strip()] = value.strip()
+    connector = properties.pop("connector.name", "")
+    if not connector:
+        raise UserError(
+            f"Catalog file '{path}' does not set 'connector.name'.",
+            "Add a `connector.name` property to the catalog file.",
+        )
+    sql = (
+        f"CREATE CATALOG {_quote_identifier(name)} USING {_quote_identifier(connector)}"
+    )
+    if properties:
+        props = ", ".join(
+            f"{_quote_identifier(key)} = '{_escape_literal(value)}'"
+            for key, value in properties.items()
+        )
+        sql += f" WITH ({props})"
+    return sql
+
+
+def _escape_literal(value: str) -> str:
+    """Escape a value for use in a SQL string literal."""
+    return value.replace("'", "''")
@@ -0,0 +1,506 @@
+"""Incremental provisioning plans for Minitrino clusters.
+
+Re-provisioning a running cluster compares each Compose service against
+the state recorded by the last successful provision. A service's hash
+covers its effective definition, as resolved by `docker compose config`
+(which interpolates the environment and merges `env_file` entries), and
+the contents of the host files it bind-mounts. Only services that are
+new, changed, or not running are brought up; the rest are left alone.
+
+When the only changes to a running coordinator are files mounted under
+`/mnt/etc` (e.g. a catalog module's `.properties` file), the files can
+instead be pushed into the running coordinator, which is restarted in
+place rather than recreated. If the cluster runs with dynamic catalog
+management and the only changes are catalog `.properties` files, the
+catalogs are created or dropped with SQL and nothing is restarted.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import subprocess
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from minitrino.core.compose import parse_yaml
+from minitrino.core.errors import MinitrinoError
+from minitrino.settings import (
+    COMPOSE_LABEL_KEY,
+    COMPOSE_SERVICE_LABEL_KEY,
+    PROVISION_STATE_DIR,
+)
+
+if TYPE_CHECKING:
+    from minitrino.core.cluster.cluster import Cluster
+    from minitrino.core.context import MinitrinoContext
+    from minitrino.core.docker.wrappers import MinitrinoContainer
+
+COORDINATOR_SERVICE = "minitrino"
+ETC_MOUNT_ROOT = "/mnt/etc/"
+CATALOG_MOUNT_RE = re.compile(r"^/mnt/etc/catalog/([^/]+)\.properties$")
+
+
+@dataclass
+class ProvisionPlan:
+    """Services to bring up for a cluster.
+
+    Attributes
+    ----------
+    create : list[str]
+        Services without a container.
+    recreate : list[str]
+        Services whose container is stopped, out of date, or built
+        from an image that is being rebuilt.
+    unchanged : list[str]
+        Services whose running container matches the recorded state.
+    hot : list[str]
+        Running services updated in place by pushing `push` into them.
+    push : dict[str, str]
+        Files to push into hot services, keyed by their `/mnt/etc`
+        target path, with the host path as the value.
+    updated : list[str]
+        Running services updated in place with `catalogs` and
+        `dropped`, without a restart.
+    catalogs : dict[str, str]
+        Catalogs to create or replace in updated services, keyed by
+        catalog name, with the host path of their properties file as the
+        value.
+    dropped : list[str]
+        Catalogs to drop from updated services.
+    hashes : dict[str, str]
+        The hash of each service's effective definition and mounts.
+    bases : dict[str, str]
+        The hash of each service's definition excluding module labels,
+        `MINITRINO_MODULES`, and mounts under `/mnt/etc`.
+    mounts : dict[str, dict[str, str]]
+        The hash of each service's mounts under `/mnt/etc`, keyed by
+        target path.
+    environment : dict[str, str | None]
+        The coordinator service's effective environment, which cluster
+        containers render their config files from.
+    definitions : dict[str, dict]
+        Each service's effective definition, used to rehash its mounts
+        when the plan is recorded.
+    """
+
+    create: list[str] = field(default_factory=list)
+    recreate: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    hot: list[str] = field(default_factory=list)
+    push: dict[str, str] = field(default_factory=dict)
+    updated: list[str] = field(default_factory=list)
+    catalogs: dict[str, str] = field(default_factory=dict)
+    dropped: list[str] = field(default_factory=list)
+    hashes: dict[str, str] = field(default_factory=dict)
+    bases: dict[str, str] = field(default_factory=dict)
+    mounts: dict[str, dict[str, str]] = field(default_factory=dict)
+    environment: dict[str, str | None] = field(default_factory=dict)
+    definitions: dict[str, dict] = field(default_factory=dict)
+
+    @property
+    def changed(self) -> list[str]:
+        """Return the services to create or recreate."""
+        return sorted(self.create + self.recreate)
+
+    @property
+    def full(self) -> bool:
+        """Return True if every service is created or recreated."""
+        return not self.unchanged and not self.hot and not self.updated
+
+
+class ProvisionPlanner:
+    """Compute and record incremental provisioning plans.
+
+    Parameters
+    ----------
+    ctx : MinitrinoContext
+        An instantiated MinitrinoContext object with user input and
+        context.
+    cluster : Cluster
+        An instantiated `Cluster` object.
+    """
+
+    def __init__(self, ctx: MinitrinoContext, cluster: Cluster):
+        self._ctx = ctx
+        self._cluster = cluster
+
+    def plan(
+        self,
+        compose_cmd: list[str],
+        env: dict[str, str],
+        rebuild: bool = False,
+        push: bool = False,
+        dynamic_catalogs: Callable[[], bool] | None = None,
+    ) -> ProvisionPlan:
+        """Return the plan for bringing up the cluster's services.
+
+        Parameters
+        ----------
+        compose_cmd : list[str]
+            The Docker Compose executable and `-f` arguments for the
+            cluster's Compose files.
+        env : dict[str, str]
+            Environment used to interpolate the Compose files.
+        rebuild : bool, optional
+            If True, services built from the library image are
+            recreated. Defaults to False.
+        push : bool, optional
+            If True, a running coordinator whose only changes are files
+            mounted under `/mnt/etc` is updated in place. Defaults to
+            False.
+        dynamic_catalogs : Callable[[], bool], optional
+            Returns True if the running cluster supports dynamic catalog
+            management. Only called when a running coordinator's changes
+            are limited to catalog files, which are then created or
+            dropped without a restart.
+
+        Returns
+        -------
+        ProvisionPlan
+            The services to create, recreate, update in place, and leave
+            unchanged.
+        """
+        services = self._effective_services(compose_cmd, env)
+        containers = self._service_containers()
+        state = self._read_state()
+        plan = ProvisionPlan()
+        environment = services.get(COORDINATOR_SERVICE, {}).get("environment")
+        if isinstance(environment, dict):
+            plan.environment = environment
+        for name in sorted(services):
+            definition = services[name]
+            digest = self._service_hash(definition)
+            base, mounts = self._base_hash(definition)
+            plan.definitions[name] = definition
+            plan.hashes[name] = digest
+            plan.bases[name] = base
+            plan.mounts[name] = {t: d for t, (_, d) in mounts.items()}
+            container = containers.get(name)
+            recorded = state.get(name, {})
+            if container is None:
+                plan.create.append(name)
+                continue
+            if (rebuild and "build" in definition) or not self._is_current(
+                container, recorded
+            ):
+                plan.recreate.append(name)
+                continue
+            if recorded.get("hash") == digest:
+                plan.unchanged.append(name)
+                continue
+            delta = None
+            if name == COORDINATOR_SERVICE and (push or dynamic_catalogs):
+                delta = self._mount_delta(recorded, base, mounts)
+            if delta is None:
+                plan.recreate.append(name)
+                continue
+            files, removed = delta
+            if not files and not removed:
+                plan.unchanged.append(name)
+            elif (
+                dynamic_catalogs
+                and all(CATALOG_MOUNT_RE.match(t) for t in [*files, *removed])
+                and dynamic_catalogs()
+            ):
+                plan.updated.append(name)
+                for target, source in files.items():
+                    plan.catalogs[self._catalog_name(target)] = source
+                plan.dropped.extend(self._catalog_name(t) for t in removed)
+            elif push and not removed:
+                plan.hot.append(name)
+                plan.push.update(files)
+            else:
+                plan.recreate.append(name)
+        self._ctx.logger.debug(
+            f"Provisioning plan for cluster '{self._ctx.cluster_name}': "
+            f"create={plan.create}, recreate={plan.recreate}, "
+            f"hot={plan.hot}, updated={plan.updated}, "
+            f"unchanged={plan.unchanged}"
+        )
+        return plan
+
+    def recorded_modules(self) -> list[str]:
+        """Return the modules recorded for the running coordinator.
+
+        Modules attached by pushing files into the coordinator do not
+        appear in its labels, so they are recorded with the cluster's
+        state.
+
+        Returns
+        -------
+        list[str]
+            The modules recorded by the last successful provision, or an
+            empty list if the coordinator has since been replaced.
+        """
+        try:
+            with open(self._state_file()) as f:
+                payload = json.load(f)
+        except Exception:
+            return []
+        container = self._service_containers().get(COORDINATOR_SERVICE)
+        recorded = payload.get("services", {}).get(COORDINATOR_SERVICE, {})
+        if container is None or not self._is_current(container, recorded):
+            return []
+        return list(payload.get("modules", []))
+
+    def record(self, plan: ProvisionPlan, modules: list[str] | None = None) -> None:
+        """Record the state of a successfully provisioned cluster.
+
+        Skipped if the Minitrino user directory does not exist. Failures
+        are ignored since a missing state only causes a full provision.
+
+        Mounts are rehashed rather than taken from the plan, since
+        containers may write into bind-mounted directories on startup
+        (e.g. the TLS module's keystore), which would otherwise be seen
+        as a change by the next provision.
+
+        Parameters
+        ----------
+        plan : ProvisionPlan
+            The plan that was applied.
+        modules : list[str], optional
+            The modules provisioned in the cluster.
+        """
+        state_file = self._state_file()
+        if not os.path.isdir(self._ctx.minitrino_user_dir):
+            return
+        self._cluster.resource.invalidate("containers")
+        containers = self._service_containers()
+        state = {}
+        for name, digest in plan.hashes.items():
+            if name not in containers:
+                continue
+            base = plan.bases.get(name, "")
+            mounts = plan.mounts.get(name, {})
+            definition = plan.definitions.get(name)
+            if definition is not None:
+                digest = self._service_hash(definition)
+                base, current = self._base_hash(definition)
+                mounts = {t: d for t, (_, d) in current.items()}
+            state[name] = {
+                "hash": digest,
+                "container": containers[name].id,
+                "base": base,
+                "mounts": mounts,
+            }
+        tmp_file = f"{state_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(state_file), exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump({"services": state, "modules": sorted(modules or [])}, f)
+            os.replace(tmp_file, state_file)
+        except Exception as e:
+            self._ctx.logger.debug(f"Failed to record provisioning state: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_file)
+
+    def _effective_services(
+        self, compose_cmd: list[str], env: dict[str, str]
+    ) -> dict[str, dict]:
+        """Return the cluster's services as resolved by Docker Compose.
+
+        Parameters
+        ----------
+        compose_cmd : list[str]
+            The Docker Compose executable and `-f` arguments.
+        env : dict[str, str]
+            Environment used to interpolate the Compose files.
+
+        Returns
+        -------
+        dict[str, dict]
+            Effective service definitions keyed by service name.
+
+        Raises
+        ------
+        MinitrinoError
+            If `docker compose config` fails.
+        """
+        cmd = compose_cmd + ["config"]
+        self._ctx.logger.debug(f"Resolving Compose configuration:\n{cmd}")
+        # Only stdout is parsed; Compose writes warnings to stderr.
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            env={**os.environ, **env},
+            check=False,
+        )
+        if result.returncode != 0:
+            raise MinitrinoError(
+                f"Failed to resolve Docker Compose configuration.\n"
+                f"Command: {' '.join(cmd)}\nOutput:\n{result.stderr}"
+            )
+        services = parse_yaml(result.stdout).get("services") or {}
+        # The artifact cache is only passed to the build when the image
+        # is built, and its location does not affect the container
+        for definition in services.values():
+            contexts = (definition.get("build") or {}).get("additional_contexts")
+            if isinstance(contexts, dict):
+                contexts.pop("artifacts", None)
+        return services
+
+    def _service_hash(self, definition: dict) -> str:
+        """Return the hash of a service definition and its bind mounts.
+
+        Parameters
+        ----------
+        definition : dict
+            An effective service definition.
+
+        Returns
+        -------
+        str
+            Hex digest of the definition and mounted file contents.
+        """
+        h = hashlib.sha256()
+        h.update(json.dumps(definition, sort_keys=True, default=str).encode())
+        for volume in definition.get("volumes") or []:
+            if isinstance(volume, dict) and volume.get("type") == "bind":
+                self._hash_mount(h, str(volume.get("source", "")))
+        return h.hexdigest()
+
+    def _base_hash(self, definition: dict) -> tuple[str, dict[str, tuple[str, str]]]:
+        """Split a service definition into its base and `/mnt/etc` mounts.
+
+        Parameters
+        ----------
+        definition : dict
+            An effective service definition.
+
+        Returns
+        -------
+        tuple[str, dict[str, tuple[str, str]]]
+            The hash of the definition without labels,
+            `MINITRINO_MODULES`, and bind mounts under `/mnt/etc`; and
+            those mounts' host paths and hashes, keyed by target path.
+        """
+        base = dict(definition)
+        base.pop("labels", None)
+        environment = base.get("environment")
+        if isinstance(environment, dict):
+            base["environment"] = {
+                k: v for k, v in environment.items() if k != "MINITRINO_MODULES"
+            }
+        mounts: dict[str, tuple[str, str]] = {}
+        volumes = []
+        for volume in definition.get("volumes") or []:
+            target = str(volume.get("target", "")) if isinstance(volume, dict) else ""
+            if target.startswith(ETC_MOUNT_ROOT) and volume.get("type") == "bind":
+                source = str(volume.get("source", ""))
+                h = hashlib.sha256()
+                self._hash_mount(h, source)
+                mounts[target] = (source, h.hexdigest())
+            else:
+                volumes.append(volume)
+        base["volumes"] = volumes
+        return self._service_hash(base), mounts
+
+    def _mount_delta(
+        self, recorded: dict, base: str, mounts: dict[str, tuple[str, str]]
+    ) -> tuple[dict[str, str], list[str]] | None:
+        """Return the `/mnt/etc` changes to update a service in place.
+
+        Parameters
+        ----------
+        recorded : dict
+            The service's recorded state.
+        base : str
+            The service's current base hash.
+        mounts : dict[str, tuple[str, str]]
+            The service's current `/mnt/etc` mounts.
+
+        Returns
+        -------
+        tuple[dict[str, str], list[str]] or None
+            Host paths keyed by target path for new or changed mounts,
+            and the target paths of removed mounts; or None if the
+            service must be recreated because anything else changed.
+        """
+        recorded_mounts = recorded.get("mounts")
+        if recorded.get("base") != base or not isinstance(recorded_mounts, dict):
+            return None
+        files = {
+            target: source
+            for target, (source, digest) in mounts.items()
+            if recorded_mounts.get(target) != digest
+        }
+        return files, sorted(set(recorded_mounts) - set(mounts))
+
+    def _catalog_name(self, target: str) -> str:
+        """Return the catalog name for a catalog file's mount target."""
+        match = CATALOG_MOUNT_RE.match(target)
+        return match.group(1) if match else ""
+
+    def _is_current(self, container: MinitrinoContainer, recorded: dict) -> bool:
+        """Return True if a running container matches its recorded state."""
+        return container.status == "running" and recorded.get("container") == (
+            container.id
+        )
+
+    def _hash_mount(self, h, source: str) -> None:
+        """Update a hash with the contents of a bind-mounted path.
+
+        Parameters
+        ----------
+        h : hashlib._Hash
+            The hash to update.
+        source : str
+            Host path of the bind mount. Directories are walked in
+            sorted order; only regular files are read.
+        """
+        h.update(f"\0{source}\0".encode())
+        if os.path.isfile(source):
+            self._hash_file(h, source)
+            return
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                if os.path.isfile(path):
+                    h.update(f"\0{os.path.relpath(path, source)}\0".encode())
+                    self._hash_file(h, path)
+
+    def _hash_file(self, h, path: str) -> None:
+        """Update a hash with a file's contents."""
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+        except OSError:
+            h.update(b"\0unreadable\0")
+
+    def _service_containers(self) -> dict[str, MinitrinoContainer]:
+        """Return the cluster's Compose containers keyed by service."""
+        project = self._cluster.resource.compose_project_name()
+        containers = {}
+        resources = self._cluster.resource.resources(kinds=["containers"])
+        for container in resources.containers():
+            labels = container.labels or {}
+            if labels.get(COMPOSE_LABEL_KEY) != project:
+                continue
+            service = labels.get(COMPOSE_SERVICE_LABEL_KEY)
+            if service:
+                containers[service] = container
+        return containers
+
+    def _state_file(self) -> str:
+        """Return the path to the cluster's provisioning state file."""
+        return os.path.join(
+            self._ctx.minitrino_user_dir,
+            PROVISION_STATE_DIR,
+            f"{self._ctx.cluster_name}.json",
+        )
+
+    def _read_state(self) -> dict[str, dict]:
+        """Return the recorded service state, if any."""
+        try:
+            with open(self._state_file()) as f:
+                return json.load(f).get("services", {})
+        except Exception:
+            return {}
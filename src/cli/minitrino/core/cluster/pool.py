@@ -0,0 +1,399 @@
+"""Warm cluster pool for Minitrino.
+
+The pool keeps idle, pre-started clusters for a distribution, version,
+and worker count so `provision --pool` can claim one instead of paying
+for image checks, `docker compose up`, and coordinator startup. Modules
+requested at claim time are attached to the running coordinator by
+pushing their config files (see `ClusterOperations.push_config()`).
+
+Pool members are regular clusters named
+`pool-<dist>-<version>-<id>`. Their state is tracked in
+`~/.minitrino/.clusterpool.json` under an exclusive file lock, so
+concurrent processes never claim the same cluster.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
+from minitrino.core.errors import MinitrinoError, UserError
+from minitrino.settings import (
+    DEFAULT_POOL_SIZE,
+    DEFAULT_POOL_TTL,
+    POOL_CLUSTER_PREFIX,
+    POOL_STATE_FILE,
+)
+
+if TYPE_CHECKING:
+    from minitrino.core.context import MinitrinoContext
+
+_pool_lock = threading.Lock()
+
+
+class ClusterPool:
+    """Manage a pool of warm, idle clusters.
+
+    Parameters
+    ----------
+    ctx : MinitrinoContext
+        An instantiated and initialized MinitrinoContext object.
+
+    Notes
+    -----
+    Each member is in one of the following states:
+
+    - `starting`: being provisioned by `fill()`.
+    - `idle`: running and available to `claim()`.
+    - `claimed`: handed out by `claim()`. Claimed clusters belong to
+      the claimant and are only evicted once they stop running or when
+      explicitly requested.
+
+    Pool size (`POOL_SIZE`) and idle TTL in seconds (`POOL_TTL`) are
+    read from the environment when not passed explicitly.
+    """
+
+    def __init__(self, ctx: MinitrinoContext):
+        self._ctx = ctx
+
+    def fill(self, image: str = "", workers: int = 0, size: int = 0) -> list[str]:
+        """Start idle clusters until the pool reaches its size.
+
+        Parameters
+        ----------
+        image : str, optional
+            Cluster image type (trino or starburst). Defaults to the
+            `IMAGE` environment variable or trino.
+        workers : int, optional
+            Number of workers in each pooled cluster. Defaults to 0.
+        size : int, optional
+            Number of idle clusters to keep. If 0, uses `POOL_SIZE` or
+            `DEFAULT_POOL_SIZE`.
+
+        Returns
+        -------
+        list[str]
+            Names of the clusters that were started.
+
+        Raises
+        ------
+        MinitrinoError
+            If any pooled cluster fails to start. Clusters that did
+            start remain in the pool.
+        """
+        size = self._setting("POOL_SIZE", size, DEFAULT_POOL_SIZE)
+        dist, ver = self._dist(image), self._ctx.env.get("CLUSTER_VER", "")
+        self.evict(size=size)
+
+        now = time.time()
+        with self._members() as members:
+            idle = [
+                name
+                for name, member in members.items()
+                if self._matches(member, dist, ver, workers)
+                and not member.get("claimed")
+            ]
+            names = [self._member_name(dist, ver) for _ in range(size - len(idle))]
+            for name in names:
+                members[name] = {
+                    "dist": dist,
+                    "ver": ver,
+                    "workers": workers,
+                    "created": now,
+                    "ready": False,
+                    "claimed": 0,
+                }
+
+        if not names:
+            self._ctx.logger.info(
+                f"Pool already has {len(idle)} idle {dist} {ver} cluster(s)."
+            )
+            return []
+
+        self._ctx.logger.info(
+            f"Starting {len(names)} pooled {dist} {ver} cluster(s): "
+            f"{', '.join(names)}..."
+        )
+        started, failed = [], []
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {
+                executor.submit(self._start, name, dist, workers): name
+                for name in names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                    started.append(name)
+                except Exception as e:
+                    self._ctx.logger.warn(
+                        f"Failed to start pooled cluster '{name}': {e}"
+                    )
+                    failed.append(name)
+
+        with self._members() as members:
+            for name in started:
+                if name in members:
+                    members[name]["ready"] = True
+            for name in failed:
+                members.pop(name, None)
+        if failed:
+            raise MinitrinoError(
+                f"Failed to start pooled cluster(s): {', '.join(sorted(failed))}."
+            )
+        return sorted(started)
+
+    def claim(self, image: str = "", workers: int = 0) -> str:
+        """Claim an idle cluster from the pool.
+
+        Parameters
+        ----------
+        image : str, optional
+            Cluster image type (trino or starburst). Defaults to the
+            `IMAGE` environment variable or trino.
+        workers : int, optional
+            Number of workers the cluster must have. Defaults to 0.
+
+        Returns
+        -------
+        str
+            The claimed cluster's name, or an empty string if no idle,
+            running cluster matches.
+        """
+        dist, ver = self._dist(image), self._ctx.env.get("CLUSTER_VER", "")
+        ttl = self._setting("POOL_TTL", 0, DEFAULT_POOL_TTL)
+        now = time.time()
+        with self._members() as members:
+            for name, member in sorted(
+                members.items(), key=lambda m: m[1].get("created", 0)
+            ):
+                if (
+                    self._matches(member, dist, ver, workers)
+                    and member.get("ready")
+                    and not member.get("claimed")
+                    and now - member.get("created", 0) < ttl
+                    and self._running(name)
+                ):
+                    member["claimed"] = now
+                    self._ctx.logger.debug(f"Claimed pooled cluster '{name}'.")
+                    return name
+        return ""
+
+    def evict(
+        self, evict_all: bool = False, claimed: bool = False, size: int = 0
+    ) -> list[str]:
+        """Remove expired, stopped, and surplus clusters from the pool.
+
+        Idle clusters older than the TTL, members that are no longer
+        running, and the oldest idle clusters beyond the pool size are
+        stopped and their containers, volumes, and networks removed.
+
+        Parameters
+        ----------
+        evict_all : bool, optional
+            If True, evicts all idle clusters. Defaults to False.
+        claimed : bool, optional
+            If True, also evicts claimed clusters that are still
+            running. Defaults to False.
+        size : int, optional
+            Number of idle clusters to keep. If 0, uses `POOL_SIZE` or
+            `DEFAULT_POOL_SIZE`.
+
+        Returns
+        -------
+        list[str]
+            Names of the evicted clusters.
+        """
+        size = self._setting("POOL_SIZE", size, DEFAULT_POOL_SIZE)
+        ttl = self._setting("POOL_TTL", 0, DEFAULT_POOL_TTL)
+        now = time.time()
+        evicted = []
+        with self._members() as members:
+            idle: dict[tuple, list[str]] = {}
+            for name, member in sorted(
+                members.items(), key=lambda m: m[1].get("created", 0), reverse=True
+            ):
+                expired = now - member.get("created", 0) >= ttl
+                if member.get("claimed"):
+                    if claimed or not self._running(name):
+                        evicted.append(name)
+                elif not member.get("ready"):
+                    # Still starting, unless its fill never finished
+                    if evict_all or expired:
+                        evicted.append(name)
+                elif evict_all or expired or not self._running(name):
+                    evicted.append(name)
+                else:
+                    key = (member["dist"], member["ver"], member["workers"])
+                    idle.setdefault(key, []).append(name)
+            for names in idle.values():
+                evicted.extend(names[size:])
+            for name in evicted:
+                members.pop(name, None)
+
+        if evicted:
+            self._ctx.logger.info(
+                f"Evicting pooled cluster(s): {', '.join(sorted(evicted))}..."
+            )
+            with ThreadPoolExecutor(max_workers=len(evicted)) as executor:
+                for future in as_completed(
+                    executor.submit(self._teardown, name) for name in evicted
+                ):
+                    future.result()
+        return sorted(evicted)
+
+    def status(self) -> list[dict]:
+        """Return the pool's members.
+
+        Returns
+        -------
+        list[dict]
+            Each member's `name`, `dist`, `ver`, `workers`, `age` in
+            seconds, and `state` (starting, idle, expired, or claimed),
+            oldest first.
+        """
+        ttl = self._setting("POOL_TTL", 0, DEFAULT_POOL_TTL)
+        now = time.time()
+        with self._members() as members:
+            snapshot = dict(members)
+        result = []
+        for name, member in sorted(
+            snapshot.items(), key=lambda m: m[1].get("created", 0)
+        ):
+            age = now - member.get("created", 0)
+            if member.get("claimed"):
+                state = "claimed"
+            elif not member.get("ready"):
+                state = "starting"
+            elif age >= ttl:
+                state = "expired"
+            else:
+                state = "idle"
+            result.append(
+                {
+                    "name": name,
+                    "dist": member.get("dist", ""),
+                    "ver": member.get("ver", ""),
+                    "workers": member.get("workers", 0),
+                    "age": int(age),
+                    "state": state,
+                }
+            )
+        return result
+
+    def _start(self, name: str, dist: str, workers: int) -> None:
+        """Provision a standalone pooled cluster."""
+        ctx = self._ctx.fork(name)
+        # Roll back only this cluster if it fails
+        ctx.provisioned_clusters = []
+        ctx.cluster.ops.provision([], dist, workers, no_rollback=False)
+
+    def _teardown(self, name: str) -> None:
+        """Remove a pooled cluster's containers, volumes, and networks."""
+        ctx = self._ctx.fork(name)
+        ctx.cluster.ops.down(sig_kill=True)
+        ctx.cluster.ops.remove("volume", True)
+        ctx.cluster.ops.remove("network", True)
+
+    def _running(self, name: str) -> bool:
+        """Return True if a pooled cluster's coordinator is running."""
+        from docker.errors import NotFound
+
+        assert self._ctx.docker_client is not None
+        try:
+            container = self._ctx.docker_client.containers.get(f"minitrino-{name}")
+        except NotFound:
+            return False
+        return container.status == "running"
+
+    def _matches(self, member: dict, dist: str, ver: str, workers: int) -> bool:
+        """Return True if a member has the given distribution and size."""
+        return (
+            member.get("dist") == dist
+            and member.get("ver") == ver
+            and member.get("workers") == workers
+        )
+
+    def _dist(self, image: str) -> str:
+        """Return the distribution for an image type."""
+        dist = image or self._ctx.env.get("IMAGE", "trino") or "trino"
+        if dist not in ("trino", "starburst"):
+            raise UserError(
+                f"Invalid image type '{dist}'. Please specify either 'trino' "
+                "or 'starburst'.",
+            )
+        return dist
+
+    def _member_name(self, dist: str, ver: str) -> str:
+        """Return a unique cluster name for a new pool member."""
+        ver = re.sub(r"[^A-Za-z0-9_-]", "-", ver)
+        return f"{POOL_CLUSTER_PREFIX}-{dist}-{ver}-{uuid.uuid4().hex[:6]}"
+
+    def _setting(self, env_var: str, value: int, default: int) -> int:
+        """Return a positive integer setting.
+
+        Parameters
+        ----------
+        env_var : str
+            Environment variable to read if `value` is not positive.
+        value : int
+            Explicitly provided value, or 0.
+        default : int
+            Value to use if neither `value` nor `env_var` is set.
+
+        Returns
+        -------
+        int
+            The setting's value.
+
+        Raises
+        ------
+        UserError
+            If `env_var` is set but is not a positive integer.
+        """
+        if value > 0:
+            return value
+        raw = str(self._ctx.env.get(env_var) or "").strip()
+        if not raw:
+            return default
+        try:
+            value = int(raw)
+        except ValueError:
+            value = 0
+        if value <= 0:
+            raise UserError(
+                f"Invalid {env_var} value: '{raw}'",
+                f"{env_var} must be a positive integer.",
+            )
+        return value
+
+    @contextlib.contextmanager
+    def _members(self) -> Iterator[dict[str, dict]]:
+        """Hold the pool lock and yield its members for update.
+
+        Yields
+        ------
+        dict[str, dict]
+            Pool members keyed by cluster name. Changes are written back
+            when the context exits.
+        """
+        state_file = os.path.join(self._ctx.minitrino_user_dir, POOL_STATE_FILE)
+        with _pool_lock, open(state_file, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            members: dict[str, dict] = {}
+            with contextlib.suppress(ValueError):
+                members = json.load(f)
+            yield members
+            f.seek(0)
+            f.truncate()
+            json.dump(members, f)
@@ -2,20 +2,47 @@
 
 This module provides classes and functions to manage port assignments for Minitrino
 clusters, including dynamic port assignment and handling user overrides.
+
+Host ports in use are collected once per `set_external_ports()` call,
+from a single Docker container listing and the kernel's TCP socket
+tables, and candidates are checked against that set. Assigned ports are
+reserved per cluster, in-process and in `~/.minitrino`, so concurrent
+provisions do not assign the same port before Docker binds it. Ports
+published by the cluster's own containers remain assignable to it.
 """
 
 from __future__ import annotations
 
+import contextlib
+import fcntl
+import json
+import os
 import re
 import socket
+import threading
+import time
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 from minitrino.core.errors import UserError
+from minitrino.settings import (
+    COMPOSE_LABEL_KEY,
+    PORT_RESERVATION_FILE,
+    PORT_RESERVATION_TTL,
+)
 
 if TYPE_CHECKING:
     from minitrino.core.cluster.cluster import Cluster
     from minitrino.core.context import MinitrinoContext
 
+# Kernel TCP socket tables and the hex state code of listening sockets
+PROC_NET_TCP = ("/proc/net/tcp", "/proc/net/tcp6")
+TCP_LISTEN = "0A"
+
+# Ports reserved by clusters provisioned in this process
+_reserved_ports: dict[int, str] = {}
+_reservation_lock = threading.Lock()
+
 
 class ClusterPortManager:
     """Manage cluster ports for the current cluster.
@@ -32,10 +59,30 @@ class ClusterPortManager:
     def __init__(self, ctx: MinitrinoContext, cluster: Cluster):
         self._ctx = ctx
         self._cluster = cluster
+        self._used_ports: set[int] | None = None
+        self._session_ports: dict[int, str] = {}
+        self._assigned: dict[str, int] = {}
+        self._own_ports: set[int] = set()
+        self._probe_bind = True
 
     def set_external_ports(self, modules: list[str] | None = None) -> None:
         """Dynamically assign host ports to containers.
 
+        Parameters
+        ----------
+        modules : list[str], optional
+            A list of module names to scan for port mappings.
+        """
+        with self._reservations() as reserved:
+            self._load_used_ports(reserved)
+            try:
+                self._assign_ports(modules)
+            finally:
+                self._used_ports = None
+
+    def _assign_ports(self, modules: list[str] | None = None) -> None:
+        """Assign host ports to the coordinator and module services.
+
         Parameters
         ----------
         modules : list[str], optional
@@ -79,27 +126,104 @@ class ClusterPortManager:
             except OSError:
                 return True
 
-    def _is_docker_port_in_use(self, port: int) -> bool:
-        """Check if a port is in use by any running Docker container."""
-        containers = self._ctx.docker_client.containers.list()
-        for container in containers:
-            ports = container.attrs.get("NetworkSettings", {}).get("Ports", {})
-            for binding in ports.values():
-                if binding:
-                    for b in binding:
-                        if str(port) == b.get("HostPort"):
-                            return True
-        return False
+    def _docker_host_ports(self) -> tuple[set[int], set[int]]:
+        """Return host ports published by running Docker containers.
+
+        Returns
+        -------
+        tuple[set[int], set[int]]
+            Ports published by other containers, and ports published by
+            the current cluster's containers. Re-provisioning a cluster
+            may reuse its own ports, which keeps the definitions of
+            unchanged services stable.
+        """
+        project = self._cluster.resource.compose_project_name()
+        ports: set[int] = set()
+        own_ports: set[int] = set()
+        for container in self._ctx.docker_client.containers.list():
+            own = container.labels.get(COMPOSE_LABEL_KEY) == project
+            target = own_ports if own else ports
+            bindings = container.attrs.get("NetworkSettings", {}).get("Ports", {})
+            for binding in (bindings or {}).values():
+                for b in binding or []:
+                    host_port = b.get("HostPort")
+                    if host_port and str(host_port).isdigit():
+                        target.add(int(host_port))
+        return ports, own_ports
+
+    def _listening_ports(self) -> set[int] | None:
+        """Return ports with listening TCP sockets on the local machine.
+
+        Returns
+        -------
+        set[int] or None
+            Listening ports read from the kernel's TCP socket tables, or
+            None if the tables are unavailable (e.g. on macOS).
+        """
+        ports: set[int] = set()
+        found = False
+        for path in PROC_NET_TCP:
+            try:
+                with open(path) as f:
+                    lines = f.readlines()[1:]
+            except OSError:
+                continue
+            found = True
+            for line in lines:
+                fields = line.split()
+                if len(fields) > 3 and fields[3] == TCP_LISTEN:
+                    ports.add(int(fields[1].rsplit(":", 1)[1], 16))
+        return ports if found else None
+
+    def _load_used_ports(self, reserved: set[int]) -> None:
+        """Collect the host ports that cannot be assigned.
+
+        Parameters
+        ----------
+        reserved : set[int]
+            Ports reserved by other clusters.
+        """
+        docker_ports, own_ports = self._docker_host_ports()
+        listening = self._listening_ports()
+        self._probe_bind = listening is None
+        self._own_ports = own_ports
+        self._used_ports = docker_ports | ((listening or set()) - own_ports) | reserved
+        self._session_ports = {
+            int(v): k
+            for k, v in self._ctx.env.items()
+            if k.startswith("__PORT_") and str(v).isdigit()
+        }
 
     def _find_next_available_port(
         self, default_port: int, exclude_var: str | None = None
     ) -> int:
-        """Find the next available port on the host."""
+        """Find the next available port on the host.
+
+        Parameters
+        ----------
+        default_port : int
+            The first port to try.
+        exclude_var : str, optional
+            The environment variable being assigned. Its current value
+            is not treated as taken.
+
+        Returns
+        -------
+        int
+            The lowest available port at or above `default_port`.
+        """
+        if self._used_ports is None:
+            self._load_used_ports(set())
+        used = self._used_ports or set()
         candidate_port = default_port
         while (
-            self._is_port_in_use(candidate_port)
-            or self._is_docker_port_in_use(candidate_port)
-            or self._is_port_assigned_in_session(candidate_port, exclude_var)
+            candidate_port in used
+            or self._session_ports.get(candidate_port, exclude_var) != exclude_var
+            or (
+                self._probe_bind
+                and candidate_port not in self._own_ports
+                and self._is_port_in_use(candidate_port)
+            )
         ):
             self._ctx.logger.debug(
                 f"Port {candidate_port} is already in use. "
@@ -108,16 +232,63 @@ class ClusterPortManager:
             candidate_port += 1
         return candidate_port
 
-    def _is_port_assigned_in_session(
-        self, port: int, exclude_var: str | None = None
-    ) -> bool:
-        """Check if a port has been assigned in the current session."""
-        for env_var, env_value in self._ctx.env.items():
-            if env_var.startswith("__PORT_") and env_value == str(port):
-                if exclude_var and env_var == exclude_var:
-                    continue  # Skip the variable we're currently assigning
-                return True
-        return False
+    @contextlib.contextmanager
+    def _reservations(self) -> Iterator[set[int]]:
+        """Hold the port reservation lock for the current cluster.
+
+        Yields the ports reserved by other clusters. On exit, ports
+        assigned to the current cluster are reserved in-process and, if
+        the `~/.minitrino` directory exists, on disk. On-disk
+        reservations lapse when the reserving process exits or after
+        `PORT_RESERVATION_TTL` seconds, by which time Docker holds the
+        ports.
+
+        Yields
+        ------
+        set[int]
+            Ports reserved by other clusters.
+        """
+        cluster_name = self._ctx.cluster_name
+        reservation_file = _reservation_file()
+        with _reservation_lock, contextlib.ExitStack() as stack:
+            entries: dict[str, dict] = {}
+            f = None
+            if os.path.isdir(os.path.dirname(reservation_file)):
+                f = stack.enter_context(open(reservation_file, "a+"))
+                fcntl.flock(f, fcntl.LOCK_EX)
+                f.seek(0)
+                with contextlib.suppress(ValueError):
+                    entries = json.load(f)
+            now = time.time()
+            entries = {
+                port: entry
+                for port, entry in entries.items()
+                if entry.get("cluster") != cluster_name
+                and entry.get("expires", 0) > now
+                and _pid_alive(entry.get("pid", 0))
+            }
+            reserved = {int(port) for port in entries}
+            reserved.update(
+                port for port, name in _reserved_ports.items() if name != cluster_name
+            )
+            self._assigned = {}
+
+            yield reserved
+
+            for port, name in list(_reserved_ports.items()):
+                if name == cluster_name:
+                    del _reserved_ports[port]
+            for port in self._assigned.values():
+                _reserved_ports[port] = cluster_name
+                entries[str(port)] = {
+                    "cluster": cluster_name,
+                    "pid": os.getpid(),
+                    "expires": now + PORT_RESERVATION_TTL,
+                }
+            if f is not None:
+                f.seek(0)
+                f.truncate()
+                json.dump(entries, f)
 
     def _assign_port(
         self, container_name: str, host_port_var: str, default_port: int
@@ -134,3 +305,26 @@ class ClusterPortManager:
             f"Setting environment variable {host_port_var} to {candidate_port}"
         )
         self._ctx.env.update({host_port_var: str(candidate_port)})
+        for port, var in list(self._session_ports.items()):
+            if var == host_port_var:
+                del self._session_ports[port]
+        self._session_ports[candidate_port] = host_port_var
+        self._assigned[host_port_var] = candidate_port
+
+
+def _reservation_file() -> str:
+    """Return the path to the on-disk port reservation file."""
+    return os.path.join(os.path.expanduser("~"), ".minitrino", PORT_RESERVATION_FILE)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Return True if a process with the given PID exists."""
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
@@ -2,18 +2,39 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import json
 import os
 import shutil
+import subprocess
 import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
 from typing import TYPE_CHECKING
 
 from docker.errors import NotFound
 
 from minitrino import utils
+from minitrino.core.cluster.artifacts import ArtifactCache
+from minitrino.core.cluster.plan import (
+    COORDINATOR_SERVICE,
+    ProvisionPlan,
+    ProvisionPlanner,
+)
+from minitrino.core.cluster.readiness import CoordinatorLogWatcher
 from minitrino.core.errors import MinitrinoError, UserError
+from minitrino.settings import (
+    BUILD_CACHE_DIR,
+    DEFAULT_BUILD_CACHE_SIZE,
+    DEFAULT_UBUNTU_VER,
+    IMAGE_CHECKSUM_DIR,
+    IMAGE_CHECKSUM_MANIFEST,
+    JAVA_VERSIONS,
+    PRIMARY_CLUSTER,
+)
 from minitrino.shutdown import shutdown_event
 
 if TYPE_CHECKING:
@@ -45,11 +66,18 @@ class ClusterProvisioner:
         self.modules: list[str] = []
         self.image: str = "trino"
         self.workers: int = 0
+        self.parallelism: int = 0
         self.no_rollback: bool = False
+        self.plan_only: bool = False
         self.build: bool = False
         self._captured_container_logs: str = ""  # Store container logs before rollback
 
         self._worker_safe_event: threading.Event = threading.Event()
+        self._coordinator_started_event: threading.Event = threading.Event()
+        self._compose_failed: threading.Event = threading.Event()
+        self._provision_aborted: threading.Event = threading.Event()
+        self._coordinator_watcher: CoordinatorLogWatcher | None = None
+        self._coordinator_logs_since: int | None = None
         self._dep_cluster_env: dict[str, str] = {}
 
     def provision(
@@ -58,6 +86,8 @@ class ClusterProvisioner:
         image: str,
         workers: int,
         no_rollback: bool,
+        parallelism: int = 0,
+        plan_only: bool = False,
     ) -> None:
         """Provision the cluster and provided modules.
 
@@ -66,6 +96,8 @@ class ClusterProvisioner:
         - Should always be invoked from `ClusterOperations.provision()`.
         - Writes a crashdump log to the user directory if an exception
           is raised.
+        - If `plan_only` is True, logs the services each cluster would
+          create, recreate, or leave unchanged without changing them.
         """
 
         def _orchestrate():
@@ -79,7 +111,9 @@ class ClusterProvisioner:
             self.modules = modules
             self.image = image
             self.workers = workers
+            self.parallelism = parallelism
             self.no_rollback = no_rollback
+            self.plan_only = plan_only
             self._set_license()
             self._set_distribution()
             self.build = self._determine_build()
@@ -103,14 +137,16 @@ class ClusterProvisioner:
                 self.modules
             )
 
-            clusters_to_provision = [None]  # None represents main cluster
-            clusters_to_provision.extend(dependent_clusters)
+            if self.plan_only:
+                self._provision_clusters(dependent_clusters)
+                return
+
+            if self.build:
+                self._prefetch_artifacts()
 
             try:
                 self._ensure_shared_network()
-                self._runner()  # Provisions main cluster
-                for cluster in dependent_clusters:
-                    self._runner(cluster=cluster)
+                self._provision_clusters(dependent_clusters)
                 self._record_image_src_checksum()
                 self._ctx.logger.info("Environment provisioning complete.")
             except Exception as e:
@@ -153,6 +189,149 @@ class ClusterProvisioner:
                 f"{str(e)}\nFull provision log written to {crashdump}"
             ) from e
 
+    def _provision_clusters(self, dependent_clusters: list[dict]) -> None:
+        """Provision the primary cluster and its dependent clusters.
+
+        Each cluster starts as soon as the clusters it depends on are
+        provisioned (see `_cluster_dependencies()`), so independent
+        clusters are provisioned concurrently. Dependent clusters are
+        provisioned by their own `ClusterProvisioner` with a context
+        forked from this one, which isolates each cluster's name,
+        modules, workers, and environment variables.
+
+        Parameters
+        ----------
+        dependent_clusters : list[dict]
+            Dependent cluster definitions returned by
+            `ClusterValidator.check_dependent_clusters()`.
+
+        Raises
+        ------
+        Exception
+            The first error raised while provisioning a cluster. No
+            further clusters are started after a failure, and clusters
+            already provisioning are allowed to finish so that the
+            caller can roll back all provisioned clusters together.
+        """
+        dependencies = self._cluster_dependencies(dependent_clusters)
+        runners: dict[str, Callable[[], None]] = {PRIMARY_CLUSTER: self._runner}
+        for cluster in dependent_clusters:
+            provisioner = self._fork(cluster["name"])
+            runners[cluster["name"]] = partial(provisioner._runner, cluster=cluster)
+
+        done: set[str] = set()
+        started: set[str] = set()
+        errors: list[BaseException] = []
+        with ThreadPoolExecutor(
+            max_workers=len(runners), thread_name_prefix="ProvisionClusterThread"
+        ) as pool:
+            pending: dict[Future, str] = {}
+
+            def _start_ready() -> None:
+                for name, runner in runners.items():
+                    if name not in started and dependencies[name] <= done:
+                        started.add(name)
+                        pending[pool.submit(runner)] = name
+
+            _start_ready()
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = pending.pop(future)
+                    try:
+                        future.result()
+                        done.add(name)
+                    except Exception as e:
+                        errors.append(e)
+                if not errors and not shutdown_event.is_set():
+                    _start_ready()
+        if errors:
+            raise errors[0]
+
+    def _cluster_dependencies(
+        self, dependent_clusters: list[dict]
+    ) -> dict[str, set[str]]:
+        """Resolve which clusters each cluster must wait for.
+
+        A dependent cluster's optional `dependsOn` metadata lists other
+        dependent clusters by name, or `PRIMARY_CLUSTER` for the primary
+        cluster. If it is omitted, the cluster depends on the primary
+        cluster. When the cluster image is being built, every dependent
+        cluster depends on the primary cluster so the image is built
+        once.
+
+        Parameters
+        ----------
+        dependent_clusters : list[dict]
+            Dependent cluster definitions.
+
+        Returns
+        -------
+        dict[str, set[str]]
+            The names of the clusters each cluster depends on, keyed by
+            cluster name. The primary cluster is keyed by
+            `PRIMARY_CLUSTER`.
+
+        Raises
+        ------
+        UserError
+            If a cluster depends on an unknown cluster or the
+            dependencies are circular.
+        """
+        prefix = f"{self._ctx.cluster_name}-dep-"
+        names = {cluster["name"] for cluster in dependent_clusters}
+        dependencies: dict[str, set[str]] = {PRIMARY_CLUSTER: set()}
+        for cluster in dependent_clusters:
+            resolved = set()
+            for dep in cluster.get("dependsOn", [PRIMARY_CLUSTER]):
+                name = dep if dep == PRIMARY_CLUSTER else f"{prefix}{dep}"
+                if name != PRIMARY_CLUSTER and name not in names:
+                    raise UserError(
+                        f"Dependent cluster '{cluster['name']}' depends on unknown "
+                        f"cluster '{dep}'.",
+                        f"Valid values are '{PRIMARY_CLUSTER}' or the name of "
+                        "another dependent cluster.",
+                    )
+                resolved.add(name)
+            if self.build:
+                resolved.add(PRIMARY_CLUSTER)
+            dependencies[cluster["name"]] = resolved
+
+        remaining = dict(dependencies)
+        while remaining:
+            ready = [n for n, deps in remaining.items() if not deps & remaining.keys()]
+            if not ready:
+                raise UserError(
+                    f"Circular dependency between clusters: "
+                    f"{', '.join(sorted(remaining))}"
+                )
+            for name in ready:
+                del remaining[name]
+        return dependencies
+
+    def _fork(self, cluster_name: str) -> ClusterProvisioner:
+        """Return a provisioner for a cluster with a forked context.
+
+        Parameters
+        ----------
+        cluster_name : str
+            The cluster to provision.
+
+        Returns
+        -------
+        ClusterProvisioner
+            A provisioner sharing this provisioner's image, build,
+            rollback, plan, and parallelism settings.
+        """
+        ctx = self._ctx.fork(cluster_name)
+        provisioner = ClusterProvisioner(ctx, ctx.cluster)
+        provisioner.image = self.image
+        provisioner.build = self.build
+        provisioner.no_rollback = self.no_rollback
+        provisioner.plan_only = self.plan_only
+        provisioner.parallelism = self.parallelism
+        return provisioner
+
     def _runner(self, cluster: dict | None = None) -> None:
         """Execute the provisioning sequence for a cluster and modules.
 
@@ -170,6 +349,10 @@ class ClusterProvisioner:
             cluster = {}
 
         self._worker_safe_event.clear()
+        self._coordinator_started_event.clear()
+        self._compose_failed.clear()
+        self._provision_aborted.clear()
+        self._coordinator_logs_since = None
 
         log_dist = self._ctx.env.get("CLUSTER_DIST")
         self._ctx.logger.info(f"Starting {log_dist.title()} cluster provisioning...")
@@ -204,7 +387,21 @@ class ClusterProvisioner:
 
         try:
             module_yaml_paths = self._module_yaml_paths()
-            compose_cmd = self._build_compose_command(module_yaml_paths)
+            planner = ProvisionPlanner(self._ctx, self._ctx.cluster)
+            plan = planner.plan(
+                self._compose_base_command(module_yaml_paths),
+                self._compose_env(),
+                rebuild=self.build,
+                push=self._push_config_enabled(),
+                dynamic_catalogs=self._ctx.cluster.ops.dynamic_catalogs,
+            )
+            self._ctx.cluster.validator.check_dup_config(environment=plan.environment)
+            if self.plan_only:
+                self._log_plan(plan)
+                return
+            compose_cmd = self._build_compose_command(module_yaml_paths, plan)
+            if plan.push:
+                self._push_config(plan)
 
             worker_thread = None
             if self.workers > 0:
@@ -215,16 +412,30 @@ class ClusterProvisioner:
                 )
                 worker_thread.start()
 
-            self._run_compose_and_wait(compose_cmd)
+            try:
+                self._run_compose_and_wait(
+                    compose_cmd,
+                    replace_coordinator=COORDINATOR_SERVICE in plan.recreate,
+                )
+            except BaseException:
+                # Release the worker thread if it is still waiting
+                self._provision_aborted.set()
+                if worker_thread:
+                    worker_thread.join()
+                raise
 
             if worker_thread:
                 worker_thread.join()
 
-            self._ctx.cluster.validator.check_dup_config()
+            if plan.catalogs or plan.dropped:
+                self._ctx.cluster.ops.update_catalogs(plan.catalogs, plan.dropped)
+
+            planner.record(plan, self.modules)
 
         except Exception as e:
-            self._rollback()
-            raise MinitrinoError("Failed to provision cluster.") from e
+            raise MinitrinoError(
+                f"Failed to provision cluster '{self._ctx.cluster_name}'."
+            ) from e
 
     def _capture_container_logs_for_crashdump(self) -> None:
         """Capture container logs before rollback destroys them.
@@ -248,6 +459,7 @@ class ClusterProvisioner:
             f"Provisioned clusters: {self._ctx.provisioned_clusters}\n\n"
         )
 
+        self._ctx.cluster.resource.invalidate("containers")
         try:
             # Iterate through all provisioned clusters
             for cluster_name in self._ctx.provisioned_clusters:
@@ -258,7 +470,9 @@ class ClusterProvisioner:
 
                 try:
                     # Get all containers for this cluster
-                    resources = self._ctx.cluster.resource.resources()
+                    resources = self._ctx.cluster.resource.resources(
+                        kinds=["containers"]
+                    )
                     containers = list(resources.containers())
 
                     if containers:
@@ -311,18 +525,64 @@ class ClusterProvisioner:
         waits until the coordinator container signals that workers can
         be safely provisioned, then provisions the requested number of
         workers.
+
+        If a cached worker config image matches the running coordinator
+        (see `ClusterOperations.cached_worker_image()`), workers are
+        provisioned as soon as the coordinator is running, in parallel
+        with its pre-start bootstraps.
+
+        Returns early without provisioning workers if Compose fails or
+        the coordinator does not start.
         """
-        self._ctx.logger.debug(
-            "Waiting for worker-safe signal before provisioning workers..."
-        )
-        self._worker_safe_event.wait()
-        self._ctx.logger.debug(
-            "Worker-safe signal received. Proceeding to provision workers."
-        )
+        if not self._wait_unless_aborted(self._coordinator_started_event):
+            return
+        cached_image = self._ctx.cluster.ops.cached_worker_image()
+        if cached_image:
+            self._ctx.logger.debug(
+                "Cached worker config image found. Provisioning workers "
+                "without waiting for the worker-safe signal."
+            )
+        else:
+            self._ctx.logger.debug(
+                "Waiting for worker-safe signal before provisioning workers..."
+            )
+            if not self._wait_unless_aborted(self._worker_safe_event):
+                return
+            self._ctx.logger.debug(
+                "Worker-safe signal received. Proceeding to provision workers."
+            )
         with self._ctx.logger.spinner(f"Provisioning {self.workers} workers..."):
-            self._ctx.cluster.ops.reconcile_workers(self.workers)
+            self._ctx.cluster.ops.reconcile_workers(
+                self.workers, self.parallelism, cached_image=cached_image
+            )
             self._ctx.logger.info(f"{self.workers} workers provisioned successfully.")
 
+    def _wait_unless_aborted(self, event: threading.Event) -> bool:
+        """Wait for an event unless provisioning fails first.
+
+        Parameters
+        ----------
+        event : threading.Event
+            The event to wait for.
+
+        Returns
+        -------
+        bool
+            True if the event was set, False if Compose failed,
+            provisioning was aborted, or a shutdown was requested.
+        """
+        while not event.wait(0.5):
+            if (
+                self._compose_failed.is_set()
+                or self._provision_aborted.is_set()
+                or shutdown_event.is_set()
+            ):
+                self._ctx.logger.debug(
+                    "Provisioning failed or was aborted. Skipping worker provisioning."
+                )
+                return False
+        return True
+
     def _set_distribution(self) -> None:
         """Determine the cluster distribution.
 
@@ -358,6 +618,7 @@ class ClusterProvisioner:
                     "com.docker.compose.project": "minitrino-system",
                 },
             )
+            self._ctx.cluster.resource.invalidate("networks")
 
     def _append_running_modules(self, modules: list[str] | None = None) -> list[str]:
         """Add running modules to the modules list.
@@ -384,8 +645,14 @@ class ClusterProvisioner:
                 "of modules to provision.",
             )
 
+        # Modules attached by pushing config files are not in labels
+        attached = ProvisionPlanner(self._ctx, self._ctx.cluster).recorded_modules()
+        if attached:
+            self._ctx.logger.debug(f"Identified recorded modules: {attached}.")
+
         modules = modules if modules is not None else []
         modules.extend(running_modules.keys())
+        modules.extend(attached)
         return list(set(modules))
 
     def _module_yaml_paths(self) -> list[str]:
@@ -430,10 +697,10 @@ class ClusterProvisioner:
                 "Neither 'docker' nor 'docker-compose' was found in PATH."
             )
 
-    def _build_compose_command(
+    def _compose_base_command(
         self, module_yaml_paths: list[str] | None = None
     ) -> list[str]:
-        """Build the Docker Compose command as a list of arguments.
+        """Return the Docker Compose executable and `-f` arguments.
 
         Parameters
         ----------
@@ -443,18 +710,228 @@ class ClusterProvisioner:
         Returns
         -------
         list[str]
-            The Docker Compose command as a list of arguments.
+            The Docker Compose command prefix as a list of arguments.
         """
         compose_bin, base_args = self._resolve_compose_bin()
         cmd = [compose_bin] + base_args
         if module_yaml_paths:
             for yaml_path in module_yaml_paths:
                 cmd += ["-f", yaml_path]
-        cmd += ["up", "-d", "--force-recreate"]
+        return cmd
+
+    def _build_compose_command(
+        self,
+        module_yaml_paths: list[str] | None = None,
+        plan: ProvisionPlan | None = None,
+    ) -> list[str]:
+        """Build the Docker Compose command as a list of arguments.
+
+        Parameters
+        ----------
+        module_yaml_paths : Optional[list[str]], optional
+            List of module YAML file paths to include with -f flags.
+        plan : ProvisionPlan, optional
+            The provisioning plan. If some services are unchanged, only
+            the changed services are brought up, without their
+            dependencies. If omitted, all services are recreated.
+
+        Returns
+        -------
+        list[str]
+            The Docker Compose command as a list of arguments.
+        """
+        cmd = self._compose_base_command(module_yaml_paths)
+        if plan is None or plan.full:
+            cmd += ["up", "-d", "--force-recreate"]
+        elif plan.changed:
+            cmd += ["up", "-d", "--force-recreate", "--no-deps"] + plan.changed
+        else:
+            cmd += ["up", "-d", "--no-recreate"]
         if self.build:
+            cache_file = self._build_cache_file()
+            if cache_file:
+                cmd[cmd.index("up") : cmd.index("up")] = ["-f", cache_file]
             cmd.append("--build")
         return cmd
 
+    def _build_cache_file(self) -> str:
+        """Write a Compose file that imports and exports the build cache.
+
+        BuildKit caches are stored under `~/.minitrino/.buildcache` in a
+        directory per Ubuntu and Java version, with one cache per
+        cluster version and distribution. A build imports every cache in
+        its directory, so the `base` and `java-builder` stages are
+        shared by cluster versions that use the same Java, and exports
+        its own. Caches are pruned to `BUILD_CACHE_SIZE` GB beforehand
+        (see `_prune_build_cache()`).
+
+        Returns
+        -------
+        str
+            Path to the Compose file, or an empty string if the active
+            builder cannot export a cache (e.g. the default `docker`
+            driver).
+        """
+        driver = self._buildx_driver()
+        if driver in ("", "docker"):
+            self._ctx.logger.debug(
+                f"Build cache export is not supported by the '{driver or 'unknown'}' "
+                "builder driver. Using the Docker build cache."
+            )
+            return ""
+        ver = self._ctx.env.get("CLUSTER_VER")
+        dist = self._ctx.env.get("CLUSTER_DIST")
+        ubuntu_ver = self._ctx.env.get("UBUNTU_VER") or DEFAULT_UBUNTU_VER
+        stage_dir = os.path.join(
+            self._ctx.minitrino_user_dir,
+            BUILD_CACHE_DIR,
+            f"ubuntu-{ubuntu_ver}-java-{self._ctx.env.get('JAVA_VER')}",
+        )
+        cache_dir = os.path.join(stage_dir, f"{ver}-{dist}")
+        os.makedirs(stage_dir, exist_ok=True)
+        if os.path.isdir(cache_dir):
+            # Mark the cache as recently used
+            os.utime(cache_dir)
+        self._prune_build_cache(cache_dir)
+        sources = [cache_dir] + sorted(
+            os.path.join(stage_dir, d)
+            for d in os.listdir(stage_dir)
+            if os.path.isfile(os.path.join(stage_dir, d, "index.json"))
+            and os.path.join(stage_dir, d) != cache_dir
+        )
+        override = {
+            "services": {
+                "minitrino": {
+                    "build": {
+                        "cache_from": [f"type=local,src={s}" for s in sources],
+                        "cache_to": [f"type=local,dest={cache_dir},mode=max"],
+                    }
+                }
+            }
+        }
+        cache_file = f"{cache_dir}.compose.json"
+        # JSON is valid YAML
+        with open(cache_file, "w") as f:
+            json.dump(override, f, indent=2)
+        self._ctx.logger.debug(
+            f"Using build cache {cache_dir} with sources: {', '.join(sources)}"
+        )
+        return cache_file
+
+    def _prune_build_cache(self, keep: str) -> None:
+        """Remove the least recently used build caches over the size cap.
+
+        Caches are removed oldest first, by modification time, until all
+        caches under `~/.minitrino/.buildcache` fit in `BUILD_CACHE_SIZE`
+        GB (default: `DEFAULT_BUILD_CACHE_SIZE`).
+
+        Parameters
+        ----------
+        keep : str
+            Path of the cache used by the current build, which is never
+            removed.
+
+        Raises
+        ------
+        UserError
+            If `BUILD_CACHE_SIZE` is not a non-negative integer.
+        """
+        raw = str(self._ctx.env.get("BUILD_CACHE_SIZE") or "").strip()
+        try:
+            limit = int(raw) if raw else DEFAULT_BUILD_CACHE_SIZE
+        except ValueError:
+            limit = -1
+        if limit < 0:
+            raise UserError(
+                f"Invalid BUILD_CACHE_SIZE value: '{raw}'",
+                "BUILD_CACHE_SIZE must be a non-negative integer (GB).",
+            )
+
+        root = os.path.join(self._ctx.minitrino_user_dir, BUILD_CACHE_DIR)
+        caches = []
+        for stage in os.listdir(root):
+            stage_dir = os.path.join(root, stage)
+            if not os.path.isdir(stage_dir):
+                continue
+            for name in os.listdir(stage_dir):
+                path = os.path.join(stage_dir, name)
+                if not os.path.isdir(path):
+                    continue
+                size = sum(
+                    os.path.getsize(os.path.join(d, f))
+                    for d, _, files in os.walk(path)
+                    for f in files
+                )
+                caches.append((os.path.getmtime(path), path, size))
+
+        total = sum(size for _, _, size in caches)
+        for _, path, size in sorted(caches):
+            if total <= limit * 1024**3:
+                break
+            if path == keep:
+                continue
+            self._ctx.logger.debug(f"Removing least recently used build cache {path}")
+            shutil.rmtree(path, ignore_errors=True)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(f"{path}.compose.json")
+            total -= size
+
+    def _buildx_driver(self) -> str:
+        """Return the driver of the active BuildKit builder.
+
+        Returns
+        -------
+        str
+            The driver name, or an empty string if it cannot be
+            determined.
+        """
+        docker_bin = shutil.which("docker")
+        if docker_bin is None:
+            return ""
+        try:
+            result = subprocess.run(
+                [docker_bin, "buildx", "inspect"],
+                capture_output=True,
+                text=True,
+                env=self._compose_env(),
+                timeout=30,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self._ctx.logger.debug(f"Failed to inspect the buildx builder: {e}")
+            return ""
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(":")
+            if key.strip() == "Driver":
+                return value.strip()
+        return ""
+
+    def _log_plan(self, plan: ProvisionPlan) -> None:
+        """Log the services a provisioning plan would change.
+
+        Parameters
+        ----------
+        plan : ProvisionPlan
+            The provisioning plan.
+        """
+        lines = [f"Provisioning plan for cluster '{self._ctx.cluster_name}':"]
+        for action, services in [
+            ("create", plan.create),
+            ("recreate", plan.recreate),
+            ("restart", plan.hot),
+            ("update", plan.updated),
+            ("unchanged", plan.unchanged),
+        ]:
+            lines.append(f"  {action}: {', '.join(services) or '-'}")
+        for target in sorted(plan.push):
+            lines.append(f"  push: {target}")
+        for name in sorted(plan.catalogs):
+            lines.append(f"  create catalog: {name}")
+        for name in sorted(plan.dropped):
+            lines.append(f"  drop catalog: {name}")
+        if self.workers:
+            lines.append(f"  workers: {self.workers}")
+        self._ctx.logger.info("\n".join(lines))
+
     def _module_string(self) -> str:
         """Return a comma-separated string of modules."""
         return ",".join(self.modules)
@@ -464,10 +941,99 @@ class ClusterProvisioner:
         self._ctx.env.update({"WORKERS": str(self.workers)})
         self._ctx.env.update({"CLUSTER_NAME": self._ctx.cluster_name})
         self._ctx.env.update({"MINITRINO_MODULES": self._module_string()})
+        self._ctx.env.update({"JAVA_VER": self._java_version()})
+        if self.build:
+            self._ctx.env.update({"__ARTIFACT_DIR": self._artifacts.directory()})
         compose_project_name = self._ctx.cluster.resource.compose_project_name()
         self._ctx.env.update({"COMPOSE_PROJECT_NAME": compose_project_name})
 
-    def _run_compose_and_wait(self, compose_cmd: list[str]) -> None:
+    @property
+    def _artifacts(self) -> ArtifactCache:
+        """The host artifact cache for the cluster image."""
+        if not hasattr(self, "_artifact_cache"):
+            self._artifact_cache = ArtifactCache(self._ctx)
+        return self._artifact_cache
+
+    def _prefetch_artifacts(self) -> None:
+        """Populate the host artifact cache before building the image.
+
+        Failures are logged and otherwise ignored; the build downloads
+        the tarball itself if it is not cached.
+        """
+        try:
+            self._artifacts.prefetch()
+        except Exception as e:
+            self._ctx.logger.warn(
+                f"Failed to cache the cluster tarball on the host: {e}. "
+                "The image build will download it instead."
+            )
+
+    def _java_version(self) -> str:
+        """Return the Java version to install for the cluster version.
+
+        Returns
+        -------
+        str
+            The Java version from `JAVA_VERSIONS`, or the newest one if
+            the cluster version cannot be parsed.
+
+        Raises
+        ------
+        UserError
+            If the cluster version is older than every version in
+            `JAVA_VERSIONS`.
+        """
+        cluster_ver = str(self._ctx.env.get("CLUSTER_VER", ""))
+        try:
+            ver = int(cluster_ver[:3])
+        except ValueError:
+            return JAVA_VERSIONS[max(JAVA_VERSIONS)]
+        for min_ver in sorted(JAVA_VERSIONS, reverse=True):
+            if ver >= min_ver:
+                return JAVA_VERSIONS[min_ver]
+        raise UserError(
+            f"Unsupported cluster version '{cluster_ver}'. No Java version is "
+            "defined for it.",
+            f"The version must be {min(JAVA_VERSIONS)} or higher.",
+        )
+
+    def _push_config_enabled(self) -> bool:
+        """Return True if config can be pushed into a running coordinator.
+
+        Pushed files are not part of the coordinator's environment, so
+        they would be missing from a cached worker config image (see
+        `ClusterOperations.cached_worker_image()`).
+        """
+        return (
+            not self.build
+            and str(self._ctx.env.get("WORKER_CONFIG_CACHE", "")).lower() != "true"
+        )
+
+    def _push_config(self, plan: ProvisionPlan) -> None:
+        """Push changed config files into the running cluster.
+
+        Parameters
+        ----------
+        plan : ProvisionPlan
+            The provisioning plan with files to push.
+        """
+        self._ctx.logger.info(
+            f"Pushing {len(plan.push)} config file(s) into the running "
+            "cluster and restarting it..."
+        )
+        # Ignore readiness markers logged before the restart
+        self._coordinator_logs_since = int(time.time())
+        self._ctx.cluster.ops.push_config(plan.push)
+
+    def _compose_env(self) -> dict[str, str]:
+        """Return the environment for Docker Compose commands."""
+        env = self._ctx.env.copy()
+        env.update(self._dep_cluster_env)
+        return env
+
+    def _run_compose_and_wait(
+        self, compose_cmd: list[str], replace_coordinator: bool = True
+    ) -> None:
         """Run the compose command asynchronously.
 
         Parameters
@@ -475,12 +1041,15 @@ class ClusterProvisioner:
         compose_cmd : list[str]
             The docker compose command to execute (as a list of
             arguments).
+        replace_coordinator : bool, optional
+            If True, a running coordinator container is expected to be
+            replaced. If False, readiness is read from the running
+            container. Defaults to True.
         """
         if "COMPOSE_BAKE" not in self._ctx.env:
             self._ctx.env["COMPOSE_BAKE"] = "true"
 
-        env = self._ctx.env.copy()
-        env.update(self._dep_cluster_env)
+        env = self._compose_env()
 
         # Use the new stream_execute_with_result API for fast failure detection
         output_iterator, completion_event, get_result = (
@@ -517,14 +1086,16 @@ class ClusterProvisioner:
                 self._compose_error = exc
 
         fq_container_name = self._ctx.cluster.resource.fq_container_name("minitrino")
-        try:
-            orig_container = self._ctx.cluster.resource.container(fq_container_name)
-            orig_container_id = orig_container.id
-            self._ctx.logger.debug(
-                f"Original coordinator container ID: {orig_container_id}"
-            )
-        except NotFound:
-            orig_container_id = None
+        orig_container_id = None
+        if replace_coordinator:
+            try:
+                orig_container = self._ctx.cluster.resource.container(fq_container_name)
+                orig_container_id = orig_container.id
+                self._ctx.logger.debug(
+                    f"Original coordinator container ID: {orig_container_id}"
+                )
+            except NotFound:
+                pass
 
         compose_thread = threading.Thread(target=_run_compose)
         compose_thread.start()
@@ -544,7 +1115,11 @@ class ClusterProvisioner:
                     get_result,
                 )
             finally:
+                if self._coordinator_watcher:
+                    self._coordinator_watcher.stop()
+                    self._coordinator_watcher = None
                 compose_thread.join()
+                self._ctx.cluster.resource.invalidate()
 
         # Final check after thread completion
         if self._compose_failed.is_set():
@@ -571,7 +1146,7 @@ class ClusterProvisioner:
         get_result: Callable,
         timeout: int = 180,
     ) -> None:
-        """Wait for the coordinator container to be running.
+        """Wait for the coordinator container to be ready.
 
         Parameters
         ----------
@@ -583,6 +1158,15 @@ class ClusterProvisioner:
             Event signaling compose command completion.
         get_result : Callable
             Function to get the final command result.
+
+        Notes
+        -----
+        Once a new coordinator container is running, a
+        `CoordinatorLogWatcher` follows its log stream and sets the
+        worker-safe and ready events as soon as the markers are logged.
+        The container is only re-inspected while no watcher is following
+        it (e.g. before it starts or after its log stream ends). The
+        caller stops the watcher.
         """
         timeout = (
             int(self._ctx.env.get("PROVISION_BUILD_TIMEOUT", 1200))
@@ -632,74 +1216,81 @@ class ClusterProvisioner:
                 except NotFound:
                     pass
                 return
-            try:
-                fqcn = self._ctx.cluster.resource.fq_container_name("minitrino")
-                container = self._ctx.cluster.resource.container(fqcn)
-                # Refresh container state to avoid checking stale/old containers
-                container.reload()
-                self._ctx.logger.debug(
-                    f"Polling coordinator container: "
-                    f"id={container.id[:12]}, status={container.status}"
-                )
-
-                # If we're expecting a container replacement (build/recreate),
-                # skip checks on the old container
-                if orig_container_id and container.id == orig_container_id:
+            watcher = self._coordinator_watcher
+            if watcher and watcher.ready_event.is_set():
+                if orig_container_id and watcher.container_id != orig_container_id:
                     self._ctx.logger.debug(
-                        f"Still seeing old container (id={container.id[:12]}), "
-                        "waiting for replacement..."
+                        f"Coordinator container replaced: "
+                        f"old id={orig_container_id[:12]}, "
+                        f"new id={watcher.container_id[:12]}"
+                    )
+                break
+            if watcher is None or watcher.stopped_event.is_set():
+                try:
+                    fqcn = self._ctx.cluster.resource.fq_container_name("minitrino")
+                    container = self._ctx.cluster.resource.container(fqcn)
+                    # Refresh container state to avoid checking stale/old containers
+                    container.reload()
+                    self._ctx.logger.debug(
+                        f"Polling coordinator container: "
+                        f"id={container.id[:12]}, status={container.status}"
                     )
-                    # Don't check logs on old container, wait for new one
-                    time.sleep(0.5)
-                    continue
 
-                # If pre-start bootstraps complete, signal to workers
-                # that they can safely provision
-                if (
-                    container.status == "running"
-                    and b"- PRE START BOOTSTRAPS COMPLETED -" in container.logs()
-                ):
-                    self._worker_safe_event.set()
-                # If any running container for fqcn, treat as success;
-                # Wait for coordinator to actually be ready.
-                if (
-                    container.status == "running"
-                    and b"- CLUSTER IS READY -" in container.logs()
-                ):
-                    if orig_container_id and container.id != orig_container_id:
+                    # If we're expecting a container replacement (build/recreate),
+                    # skip checks on the old container
+                    if orig_container_id and container.id == orig_container_id:
                         self._ctx.logger.debug(
-                            f"Coordinator container replaced: "
-                            f"old id={orig_container_id[:12]}, "
-                            f"new id={container.id[:12]}"
+                            f"Still seeing old container (id={container.id[:12]}), "
+                            "waiting for replacement..."
                         )
-                    break
-                # If current container is exited with nonzero exit code,
-                # check if any newer running container exists
-                if container.status == "exited":
-                    exit_code = int(container.attrs.get("State", {}).get("ExitCode", 0))
-                    if exit_code != 0:
-                        # Check if a newer running container exists for fqcn
-                        try:
-                            container = self._ctx.cluster.resource.container(fqcn)
-                            container.reload()
-                            running_found = False
-                            if container.status == "running":
-                                self._ctx.logger.debug(
-                                    f"Found newer running coordinator container: "
-                                    f"id={container.id[:12]}"
-                                )
-                                running_found = True
-                            if not running_found:
+                        # Don't watch logs on old container, wait for new one
+                        time.sleep(0.5)
+                        continue
+
+                    # Follow the running coordinator's log stream. The
+                    # watcher signals workers once pre-start bootstraps
+                    # complete and sets the ready event once the cluster is
+                    # ready.
+                    if container.status == "running":
+                        self._ctx.logger.debug(
+                            f"Watching coordinator logs: id={container.id[:12]}"
+                        )
+                        self._coordinator_watcher = CoordinatorLogWatcher(
+                            container,
+                            self._worker_safe_event,
+                            since=self._coordinator_logs_since,
+                        ).start()
+                        self._coordinator_started_event.set()
+                    # If current container is exited with nonzero exit code,
+                    # check if any newer running container exists
+                    if container.status == "exited":
+                        exit_code = int(
+                            container.attrs.get("State", {}).get("ExitCode", 0)
+                        )
+                        if exit_code != 0:
+                            # Check if a newer running container exists for fqcn
+                            try:
+                                container = self._ctx.cluster.resource.container(fqcn)
+                                container.reload()
+                                running_found = False
+                                if container.status == "running":
+                                    self._ctx.logger.debug(
+                                        f"Found newer running coordinator container: "
+                                        f"id={container.id[:12]}"
+                                    )
+                                    running_found = True
+                                if not running_found:
+                                    raise MinitrinoError(
+                                        f"Coordinator container exited with code "
+                                        f"{exit_code}."
+                                    )
+                            except NotFound:
                                 raise MinitrinoError(
                                     f"Coordinator container exited with code "
                                     f"{exit_code}."
-                                )
-                        except NotFound:
-                            raise MinitrinoError(
-                                f"Coordinator container exited with code {exit_code}."
-                            ) from None
-            except NotFound:
-                pass
+                                ) from None
+                except NotFound:
+                    pass
 
             if not compose_thread.is_alive() and not reset_timeout:
                 try:
@@ -739,7 +1330,12 @@ class ClusterProvisioner:
                     f"Timed out after {timeout} seconds waiting for "
                     "coordinator container to start."
                 )
-            time.sleep(1)
+            watcher = self._coordinator_watcher
+            if watcher and not watcher.stopped_event.is_set():
+                # Wake as soon as the ready marker is logged
+                watcher.ready_event.wait(1)
+            else:
+                time.sleep(1)
 
     def _set_license(self) -> None:
         """Set the license for the cluster."""
@@ -792,25 +1388,106 @@ class ClusterProvisioner:
         return self._checksum
 
     def _get_image_src_checksum(self) -> str:
-        """Return the checksum of the image source directory."""
-        hashobj = hashlib.new("sha256")
+        """Return the checksum of the image source directory.
+
+        Each file's digest is cached in a manifest keyed by its path and
+        `(size, mtime_ns, inode)`, so only new or modified files are
+        read. Files are stat'd and hashed concurrently.
+
+        Returns
+        -------
+        str
+            A digest of every file's relative path and contents.
+        """
         directory = os.path.join(self._ctx.lib_dir, "image")
-        for root, _, files in os.walk(directory):
+        paths = []
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
             for fname in sorted(files):
                 fpath = os.path.join(root, fname)
-                if not os.path.isfile(fpath) or os.path.islink(fpath):
-                    continue
-                # Include relative path in hash for uniqueness
-                relpath = os.path.relpath(fpath, directory)
-                hashobj.update(relpath.encode())
-                with open(fpath, "rb") as f:
-                    while chunk := f.read(8192):
-                        hashobj.update(chunk)
+                if os.path.isfile(fpath) and not os.path.islink(fpath):
+                    paths.append(fpath)
+
+        manifest = self._read_checksum_manifest()
+
+        def _digest(fpath: str) -> tuple[str, dict]:
+            st = os.stat(fpath)
+            stat = [st.st_size, st.st_mtime_ns, st.st_ino]
+            entry = manifest.get(fpath)
+            if entry and entry.get("stat") == stat:
+                return fpath, entry
+            h = hashlib.blake2b(digest_size=32)
+            with open(fpath, "rb") as f:
+                while chunk := f.read(1024 * 1024):
+                    h.update(chunk)
+            return fpath, {"stat": stat, "digest": h.hexdigest()}
+
+        with ThreadPoolExecutor() as executor:
+            entries = dict(executor.map(_digest, paths))
+
+        hashobj = hashlib.blake2b(digest_size=32)
+        for fpath in paths:
+            # Include relative path in hash for uniqueness
+            relpath = os.path.relpath(fpath, directory)
+            hashobj.update(relpath.encode() + b"\0")
+            hashobj.update(entries[fpath]["digest"].encode())
+        if entries != manifest:
+            self._write_checksum_manifest(entries)
         self._ctx.logger.debug(
             f"Minitrino image source current checksum: {hashobj.hexdigest()}"
         )
         return hashobj.hexdigest()
 
+    def _checksum_manifest_file(self) -> str:
+        """Return the path to the image source checksum manifest."""
+        return os.path.join(
+            self._ctx.minitrino_user_dir, IMAGE_CHECKSUM_DIR, IMAGE_CHECKSUM_MANIFEST
+        )
+
+    def _read_checksum_manifest(self) -> dict[str, dict]:
+        """Read the image source checksum manifest.
+
+        Returns
+        -------
+        dict[str, dict]
+            Entries keyed by file path, each holding the file's `stat`
+            (`[size, mtime_ns, inode]`) and `digest`. An empty
+            dictionary is returned if the manifest is missing or
+            unreadable.
+        """
+        try:
+            with open(self._checksum_manifest_file()) as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except Exception as e:
+            self._ctx.logger.debug(f"Image checksum manifest not loaded: {e}")
+            return {}
+
+    def _write_checksum_manifest(self, entries: dict[str, dict]) -> None:
+        """Atomically write the image source checksum manifest.
+
+        Parameters
+        ----------
+        entries : dict[str, dict]
+            Entries keyed by file path.
+
+        Notes
+        -----
+        Failures are logged and otherwise ignored; a missing manifest
+        only causes all files to be hashed again.
+        """
+        manifest_file = self._checksum_manifest_file()
+        tmp_file = f"{manifest_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_file, manifest_file)
+        except Exception as e:
+            self._ctx.logger.debug(f"Failed to write image checksum manifest: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_file)
+
     def _image_src_changed(self) -> bool:
         """Compare current image source checksum to recorded checksum.
 
@@ -831,7 +1508,7 @@ class ClusterProvisioner:
         )
 
         self.checksum_dir = os.path.join(
-            self._ctx.minitrino_user_dir, ".imagechecksums"
+            self._ctx.minitrino_user_dir, IMAGE_CHECKSUM_DIR
         )
         if not os.path.isdir(self.checksum_dir):
             os.makedirs(self.checksum_dir)
@@ -0,0 +1,122 @@
+"""Coordinator readiness detection for Minitrino clusters.
+
+The coordinator's entrypoint writes marker lines to its log once
+pre-start bootstraps finish and once the cluster is ready. This module
+follows the container's log stream in a background thread and signals
+as soon as each marker appears, so callers do not have to poll and
+re-read the full log.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from typing import TYPE_CHECKING, Any
+
+from minitrino.settings import CLUSTER_READY_LOG_MARKER, WORKER_SAFE_LOG_MARKER
+
+if TYPE_CHECKING:
+    from minitrino.core.docker.wrappers import MinitrinoContainer
+
+
+class CoordinatorLogWatcher:
+    """Follow a coordinator's log stream and signal readiness markers.
+
+    Parameters
+    ----------
+    container : MinitrinoContainer
+        The coordinator container to watch.
+    worker_safe_event : threading.Event
+        Set when the coordinator logs that pre-start bootstraps have
+        completed and workers can be provisioned.
+    since : int, optional
+        Unix timestamp to start the log stream from, e.g. to ignore
+        markers logged before the container was restarted. Defaults to
+        the beginning of the container's log.
+
+    Attributes
+    ----------
+    ready_event : threading.Event
+        Set when the coordinator logs that the cluster is ready.
+    stopped_event : threading.Event
+        Set when the log stream ends, e.g. because the container
+        stopped, the stream failed, or `stop()` was called.
+
+    Notes
+    -----
+    Unless `since` is given, the stream starts from the beginning of the
+    container's log, so markers written before the watcher attached are
+    still detected.
+    Each log byte is read exactly once.
+    """
+
+    def __init__(
+        self,
+        container: MinitrinoContainer,
+        worker_safe_event: threading.Event,
+        since: int | None = None,
+    ):
+        self.container_id = container.id
+        self.worker_safe_event = worker_safe_event
+        self.ready_event = threading.Event()
+        self.stopped_event = threading.Event()
+        self._container = container
+        self._since = since
+        self._stream: Any = None
+        self._stop_requested = False
+        self._thread = threading.Thread(
+            target=self._watch, name="CoordinatorLogWatcher", daemon=True
+        )
+
+    def start(self) -> CoordinatorLogWatcher:
+        """Start following the log stream in a background thread.
+
+        Returns
+        -------
+        CoordinatorLogWatcher
+            This watcher.
+        """
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop following the log stream."""
+        self._stop_requested = True
+        stream = self._stream
+        if stream is not None and hasattr(stream, "close"):
+            with contextlib.suppress(Exception):
+                stream.close()
+        self.stopped_event.set()
+
+    def _watch(self) -> None:
+        """Scan streamed log chunks for readiness markers."""
+        markers = [
+            (WORKER_SAFE_LOG_MARKER, self.worker_safe_event),
+            (CLUSTER_READY_LOG_MARKER, self.ready_event),
+        ]
+        # Retain enough of the previous chunk to match markers split
+        # across chunk boundaries.
+        overlap = max(len(marker) for marker, _ in markers) - 1
+        tail = b""
+        try:
+            kwargs: dict[str, Any] = {"stream": True, "follow": True}
+            if self._since is not None:
+                kwargs["since"] = self._since
+            self._stream = self._container.logs(**kwargs)
+            for chunk in self._stream:
+                if self._stop_requested:
+                    break
+                window = tail + chunk
+                for marker, event in markers:
+                    if not event.is_set() and marker in window:
+                        event.set()
+                if self.ready_event.is_set():
+                    # The ready marker is always written after the
+                    # worker-safe marker.
+                    self.worker_safe_event.set()
+                    break
+                tail = window[-overlap:]
+        except Exception:
+            pass
+        finally:
+            self.stop()
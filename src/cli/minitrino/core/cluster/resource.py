@@ -3,11 +3,20 @@
 This module provides classes and functions to manage Docker resources (containers,
 volumes, images, networks). All Docker objects are associated with a cluster name
 **except** for images, which are global.
+
+Docker list calls are shared through a short-lived snapshot so that the
+many lookups made during a single command do not each query the daemon.
+Operations that create, stop, or remove Docker objects invalidate the
+snapshot.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from minitrino.core.docker.wrappers import (
     MinitrinoContainer,
@@ -16,11 +25,14 @@ from minitrino.core.docker.wrappers import (
     MinitrinoNetwork,
     MinitrinoVolume,
 )
-from minitrino.settings import COMPOSE_LABEL_KEY, ROOT_LABEL
+from minitrino.core.errors import MinitrinoError
+from minitrino.settings import COMPOSE_LABEL_KEY, RESOURCE_SNAPSHOT_TTL, ROOT_LABEL
 
 if TYPE_CHECKING:
     from minitrino.core.context import MinitrinoContext
 
+RESOURCE_KINDS = ("containers", "volumes", "images", "networks")
+
 
 class ClusterResourceManager:
     """Expose cluster resources operations.
@@ -33,14 +45,17 @@ class ClusterResourceManager:
 
     Methods
     -------
-    resources(addl_labels: Optional[list[str]] = None)
+    resources(addl_labels: Optional[list[str]] = None, kinds=None)
         Collects Docker objects (containers, volumes, images, networks)
         for the current cluster or all clusters if the context's cluster
         name is `"all"`.
-    unfiltered_resources()
+    unfiltered_resources(kinds=None)
         Collects all Docker objects associated with Minitrino. Unlike
         the `resources()` method, this method does not group resources
         by cluster or take additional labels to filter by.
+    invalidate(*kinds: str)
+        Discards the resource snapshot so the next lookup queries the
+        Docker daemon.
     compose_project_name(cluster_name: str = "")
         Computes the Docker Compose project name for a cluster.
     fq_container_name(container_name: str)
@@ -53,8 +68,14 @@ class ClusterResourceManager:
     def __init__(self, ctx: MinitrinoContext):
         self._ctx = ctx
         self._logged_cluster_resource_msg = False
+        self._snapshot: dict[str, tuple[float, list[Any]]] = {}
+        self._snapshot_lock = threading.Lock()
 
-    def resources(self, addl_labels: list[str] | None = None) -> MinitrinoResourcesView:
+    def resources(
+        self,
+        addl_labels: list[str] | None = None,
+        kinds: Iterable[str] | None = None,
+    ) -> MinitrinoResourcesView:
         """Fetch Docker objects for the current context.
 
         Parameters
@@ -65,6 +86,10 @@ class ClusterResourceManager:
             included in the result. If not provided, resource retrieval
             is limited only to the root label `ROOT_LABEL`
             (`org.minitrino.root=true`).
+        kinds : Iterable[str], optional
+            Resource types to fetch (any of `containers`, `volumes`,
+            `images`, `networks`). Defaults to all types. Types that are
+            not fetched are empty in the returned view.
 
         Returns
         -------
@@ -79,7 +104,7 @@ class ClusterResourceManager:
         clusters are returned.
         """
         addl_labels = addl_labels or []
-        unfiltered = self.unfiltered_resources()
+        unfiltered = self.unfiltered_resources(kinds)
 
         clusters = (
             self._list_clusters(unfiltered)
@@ -113,15 +138,27 @@ class ClusterResourceManager:
 
     def unfiltered_resources(
         self,
+        kinds: Iterable[str] | None = None,
     ) -> dict[str, list[MinitrinoDockerObject]]:
         """Collect all Docker objects associated with Minitrino.
 
+        Parameters
+        ----------
+        kinds : Iterable[str], optional
+            Resource types to fetch (any of `containers`, `volumes`,
+            `images`, `networks`). Defaults to all types.
+
         Returns
         -------
         dict[str, list[MinitrinoDockerObject]]
-            Dictionary containing the following keys and corresponding
+            Dictionary containing the requested keys and corresponding
             Docker objects.
 
+        Raises
+        ------
+        MinitrinoError
+            If an unknown resource type is requested.
+
         Examples
         --------
         >>> {
@@ -137,29 +174,60 @@ class ClusterResourceManager:
         resources by cluster or take additional labels to filter by.
         Fetch containers, volumes, images, and networks that are tagged
         with the global label `ROOT_LABEL` (`org.minitrino.root=true`).
+
+        Results are served from a snapshot shared by all callers until
+        it is older than `RESOURCE_SNAPSHOT_TTL` seconds or is
+        invalidated with `invalidate()`. Missing types are listed
+        concurrently.
         """
-        filters = {"label": [ROOT_LABEL]}
+        kinds = list(kinds) if kinds is not None else list(RESOURCE_KINDS)
+        unknown = [k for k in kinds if k not in RESOURCE_KINDS]
+        if unknown:
+            raise MinitrinoError(f"Invalid resource type(s): {unknown}")
+
+        now = time.monotonic()
+        raw: dict[str, list[Any]] = {}
+        with self._snapshot_lock:
+            for kind in kinds:
+                cached = self._snapshot.get(kind)
+                if cached and now - cached[0] < RESOURCE_SNAPSHOT_TTL:
+                    raw[kind] = cached[1]
+        missing = [k for k in kinds if k not in raw]
+        if len(missing) == 1:
+            raw[missing[0]] = self._list(missing[0])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                futures = {k: executor.submit(self._list, k) for k in missing}
+                for kind, future in futures.items():
+                    raw[kind] = future.result()
+        if missing:
+            with self._snapshot_lock:
+                for kind in missing:
+                    self._snapshot[kind] = (now, raw[kind])
+
         cluster = self._ctx.cluster_name
-        return {
-            "containers": [
-                MinitrinoContainer(c, cluster)
-                for c in self._ctx.docker_client.containers.list(
-                    filters=filters, all=True
-                )
-            ],
-            "volumes": [
-                MinitrinoVolume(v, cluster)
-                for v in self._ctx.docker_client.volumes.list(filters=filters)
-            ],
-            "images": [
-                MinitrinoImage(i)
-                for i in self._ctx.docker_client.images.list(filters=filters, all=True)
-            ],
-            "networks": [
-                MinitrinoNetwork(n, cluster)
-                for n in self._ctx.docker_client.networks.list(filters=filters)
-            ],
+        wrappers: dict[str, Callable[[Any], MinitrinoDockerObject]] = {
+            "containers": lambda o: MinitrinoContainer(o, cluster),
+            "volumes": lambda o: MinitrinoVolume(o, cluster),
+            "images": MinitrinoImage,
+            "networks": lambda o: MinitrinoNetwork(o, cluster),
         }
+        return {kind: [wrappers[kind](o) for o in raw[kind]] for kind in kinds}
+
+    def invalidate(self, *kinds: str) -> None:
+        """Discard snapshotted resources.
+
+        Parameters
+        ----------
+        *kinds : str
+            Resource types to discard. If omitted, all types are
+            discarded.
+        """
+        with self._snapshot_lock:
+            if not kinds:
+                self._snapshot.clear()
+            for kind in kinds:
+                self._snapshot.pop(kind, None)
 
     def cluster_containers(self) -> list[MinitrinoContainer]:
         """Fetch coordinator and workers for the active cluster.
@@ -169,7 +237,9 @@ class ClusterResourceManager:
         list[MinitrinoContainer]
             List of cluster containers.
         """
-        containers: list[MinitrinoContainer] = self.resources().containers()
+        containers: list[MinitrinoContainer] = self.resources(
+            kinds=["containers"]
+        ).containers()
         cluster_containers = []
         for c in containers:
             if c.name == self.fq_container_name("minitrino") or c.name.startswith(
@@ -235,6 +305,30 @@ class ClusterResourceManager:
         base = self._ctx.docker_client.containers.get(fq_container_name)
         return MinitrinoContainer(base, self._ctx.cluster_name)
 
+    def _list(self, kind: str) -> list[Any]:
+        """List Minitrino Docker objects of one type from the daemon.
+
+        Parameters
+        ----------
+        kind : str
+            Resource type (`containers`, `volumes`, `images`, or
+            `networks`).
+
+        Returns
+        -------
+        list[Any]
+            Unwrapped Docker SDK objects tagged with `ROOT_LABEL`.
+        """
+        filters = {"label": [ROOT_LABEL]}
+        client = self._ctx.docker_client
+        if kind == "containers":
+            return client.containers.list(filters=filters, all=True)
+        if kind == "volumes":
+            return client.volumes.list(filters=filters)
+        if kind == "images":
+            return client.images.list(filters=filters, all=True)
+        return client.networks.list(filters=filters)
+
     def _list_clusters(
         self,
         resources: dict[str, list[MinitrinoDockerObject]],
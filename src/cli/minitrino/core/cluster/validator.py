@@ -5,15 +5,8 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
-from minitrino import utils
-from minitrino.core.docker.wrappers import MinitrinoContainer
-from minitrino.core.errors import UserError
-from minitrino.settings import (
-    CLUSTER_CONFIG,
-    CLUSTER_JVM_CONFIG,
-    ETC_DIR,
-    MIN_CLUSTER_VER,
-)
+from minitrino.core.errors import MinitrinoError, UserError
+from minitrino.settings import CLUSTER_CONFIG, CLUSTER_JVM_CONFIG, MIN_CLUSTER_VER
 
 if TYPE_CHECKING:
     from minitrino.core.cluster.cluster import Cluster
@@ -41,9 +34,9 @@ class ClusterValidator:
         or Starburst distributions.
     check_dependent_clusters(modules: Optional[list[str]] = None)
         Identify dependent clusters for the specified modules.
-    check_dup_config()
-        Check for duplicate entries in `config.properties` and
-        `jvm.config` and log warnings if duplicates are found.
+    check_dup_config(cluster_cfgs=None, jvm_cfgs=None, environment=None)
+        Check `config.properties` and `jvm.config` for duplicate entries
+        and conflicting overrides and log warnings if any are found.
     """
 
     def __init__(self, ctx: MinitrinoContext, cluster: Cluster):
@@ -181,10 +174,29 @@ class ClusterValidator:
 
         return list(dependent_clusters)
 
-    def check_dup_config(self, cluster_cfgs=None, jvm_cfgs=None) -> None:
-        """Check for duplicate entries in cluster config files."""
+    def check_dup_config(
+        self,
+        cluster_cfgs: list[tuple] | None = None,
+        jvm_cfgs: list[tuple] | None = None,
+        environment: dict[str, str | None] | None = None,
+    ) -> None:
+        """Check cluster config files for duplicates and conflicts.
 
-        def log_duplicates(cfgs, filename):
+        Parameters
+        ----------
+        cluster_cfgs : list[tuple], optional
+            Parsed `config.properties` entries to check.
+        jvm_cfgs : list[tuple], optional
+            Parsed `jvm.config` entries to check.
+        environment : dict[str, str | None], optional
+            The coordinator service's effective environment. If configs
+            are not provided, the coordinator's (and, if the cluster has
+            workers, a worker's) config files are rendered from it on the
+            host, and overrides that set the same key are reported along
+            with the value that is used.
+        """
+
+        def log_duplicates(cfgs, filename, role=""):
             self._ctx.logger.debug(
                 f"Checking '{filename}' file for duplicate configs...",
             )
@@ -205,78 +217,57 @@ class ClusterValidator:
             duplicates = {k: v for k, v in unique.items() if len(v) > 1}
             if duplicates:
                 msg = [
-                    f"Duplicate configuration properties detected in '{filename}' file:"
+                    f"Duplicate configuration properties detected in '{filename}' "
+                    f"file{role}:"
                 ]
                 for key, entries in duplicates.items():
                     msg.append(f"  {key}:")
                     for entry in entries:
-                        if entry[0] == "key_value":
-                            msg.append(f"    - {entry[1]}={entry[2]}")
-                        elif entry[0] == "unified":
-                            msg.append(f"    - {entry[1]}")
-                        else:
-                            msg.append(f"    - {entry}")
+                        msg.append(f"    - {format_entry(entry)}")
                 self._ctx.logger.warn("\n".join(msg))
 
-        # If configs are provided, just check them without needing containers
+        def log_conflicts(conflicts, filename, role=""):
+            if not conflicts:
+                return
+            msg = [
+                f"Configuration properties set by more than one override in "
+                f"'{filename}' file{role}:"
+            ]
+            for key, (settings, used) in conflicts.items():
+                msg.append(f"  {key}:")
+                for env_var, entry in settings:
+                    msg.append(f"    - {env_var}: {format_entry(entry)}")
+                used = format_entry(used) if used else "(removed)"
+                msg.append(f"    Using: {used}")
+            self._ctx.logger.warn("\n".join(msg))
+
+        def format_entry(entry):
+            if entry[0] == "key_value":
+                return f"{entry[1]}={entry[2]}" if entry[2] else entry[1]
+            if entry[0] == "unified":
+                return entry[1]
+            return str(entry)
+
+        # If configs are provided, just check them
         if cluster_cfgs is not None and jvm_cfgs is not None:
             log_duplicates(cluster_cfgs, CLUSTER_CONFIG)
             log_duplicates(jvm_cfgs, CLUSTER_JVM_CONFIG)
-        else:
-            # Need to fetch configs from containers
-            containers = self._cluster.resource.cluster_containers()
-            for container in containers:
-                if cluster_cfgs is None or jvm_cfgs is None:
-                    current_cluster_cfgs, current_jvm_cfg = self._current_config(
-                        container
-                    )
-                    cluster_cfgs = cluster_cfgs or current_cluster_cfgs
-                    jvm_cfgs = jvm_cfgs or current_jvm_cfg
-                log_duplicates(cluster_cfgs, CLUSTER_CONFIG)
-                log_duplicates(jvm_cfgs, CLUSTER_JVM_CONFIG)
-
-    def _current_config(
-        self, container: MinitrinoContainer
-    ) -> tuple[list[tuple], list[tuple]]:
-        """Fetch current cluster configs from a cluster container.
-
-        Parameters
-        ----------
-        container : MinitrinoContainer
-            The container to fetch configs from.
-
-        Returns
-        -------
-        tuple[list[tuple], list[tuple]]
-            A tuple of parsed config tuples for both files.
-        """
-        _, uid = utils.container_user_and_id(self._ctx, container)
-        current_cfgs = self._ctx.cmd_executor.execute(
-            [f"cat {ETC_DIR}/{CLUSTER_CONFIG}"],
-            [f"cat {ETC_DIR}/{CLUSTER_JVM_CONFIG}"],
-            container=container,
-            suppress_output=True,
-            user=uid,
-        )
-
-        current_cluster_cfgs = self._split_config(current_cfgs[0].output)
-        current_jvm_cfg = self._split_config(current_cfgs[1].output)
-
-        return current_cluster_cfgs, current_jvm_cfg
-
-    def _split_config(self, cfgs: str = "") -> list[tuple]:
-        """Split raw config strings into an ordered list of tuples.
-
-        Each tuple is either ('key_value', key, value) or ('unified', line). Preserves
-        the original ordering and comments.
-        """
-        cfgs_list = cfgs.strip().split("\n")
-        parsed = []
-        for cfg in cfgs_list:
-            cfg = re.sub(r"\s*=\s*", "=", cfg)
-            parts = cfg.split("=", 1)
-            if len(parts) == 2:
-                parsed.append(("key_value", parts[0], parts[1]))
-            else:
-                parsed.append(("unified", cfg, ""))
-        return parsed
+            return
+        if not environment:
+            return
+
+        roles = [False]
+        if int(environment.get("WORKERS") or 0) > 0:
+            roles.append(True)
+        for worker in roles:
+            role = " for workers" if worker else ""
+            try:
+                rendered = self._cluster.configs.render(environment, worker)
+                conflicts = self._cluster.configs.conflicts(environment, worker)
+            except (MinitrinoError, AttributeError, OSError) as e:
+                # The library may predate host-side rendering
+                self._ctx.logger.debug(f"Skipping cluster config checks: {e}")
+                return
+            for filename in (CLUSTER_CONFIG, CLUSTER_JVM_CONFIG):
+                log_duplicates(rendered[filename], filename, role)
+                log_conflicts(conflicts[filename], filename, role)
@@ -0,0 +1,81 @@
+"""Docker Compose YAML loading for Minitrino CLI.
+
+All Compose files (the library's root `docker-compose.yaml` and module
+YAML files) are parsed through this module. The C-accelerated libyaml
+loader is used when PyYAML was built with it, otherwise the pure-Python
+loader is used. Parsed files are memoized for the life of the process.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+HAS_LIBYAML = YamlLoader is not yaml.SafeLoader
+
+_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+_cache_lock = threading.Lock()
+
+
+def parse_yaml(content: str, loader: type | None = None) -> dict:
+    """Parse a YAML string.
+
+    Parameters
+    ----------
+    content : str
+        YAML content to parse.
+    loader : type, optional
+        PyYAML loader class to use. Defaults to `YamlLoader`.
+
+    Returns
+    -------
+    dict
+        The parsed YAML, or an empty dictionary if the content is empty.
+    """
+    return yaml.load(content, Loader=loader or YamlLoader) or {}  # nosec B506
+
+
+def load_yaml(path: str) -> dict:
+    """Load and memoize a YAML file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the YAML file.
+
+    Returns
+    -------
+    dict
+        The parsed YAML, or an empty dictionary if the file is empty.
+
+    Notes
+    -----
+    Results are memoized per absolute path and invalidated if the
+    file's modification time or size changes. The returned dictionary
+    is shared between callers and must not be mutated.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        cached = _cache.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    with open(path) as f:
+        data = parse_yaml(f.read())
+    with _cache_lock:
+        _cache[path] = (stamp, data)
+    return data
+
+
+def clear_yaml_cache() -> None:
+    """Clear all memoized YAML files."""
+    with _cache_lock:
+        _cache.clear()
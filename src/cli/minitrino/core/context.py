@@ -1,23 +1,33 @@
-"""Core context and controls for Minitrino CLI."""
+"""Core context and controls for Minitrino CLI.
+
+This module is imported by every command, including `--help` and
+`--version`. Components that pull in Docker, HTTP, or schema libraries
+are imported when `initialize()` needs them rather than at import time.
+"""
+
+from __future__ import annotations
 
 import contextlib
+import copy
 import logging
 import os
 from pathlib import Path
-from typing import cast
-
-import docker
+from typing import TYPE_CHECKING, cast
 
 from minitrino import utils
-from minitrino.core.cluster.cluster import Cluster
-from minitrino.core.docker.socket import resolve_docker_socket
+from minitrino.core.docker.socket import docker_clients, resolve_docker_socket
 from minitrino.core.envvars import EnvironmentVariables
 from minitrino.core.errors import MinitrinoError, UserError
-from minitrino.core.exec.cmd import CommandExecutor
 from minitrino.core.library import LibraryManager
 from minitrino.core.logging.levels import LogLevel
 from minitrino.core.logging.logger import MinitrinoLogger
-from minitrino.core.modules import Modules
+
+if TYPE_CHECKING:
+    import docker
+
+    from minitrino.core.cluster.cluster import Cluster
+    from minitrino.core.exec.cmd import CommandExecutor
+    from minitrino.core.modules import Modules
 
 
 class MinitrinoContext:
@@ -157,6 +167,10 @@ class MinitrinoContext:
             return
         self._try_parse_library_env()
         self._try_compare_versions()
+
+        from minitrino.core.exec.cmd import CommandExecutor
+        from minitrino.core.modules import Modules
+
         self.modules = Modules(self)
         self.cmd_executor = CommandExecutor(self)
         if cluster_name:
@@ -169,6 +183,47 @@ class MinitrinoContext:
             self.logger.set_level(log_level)
         self._initialized = True
 
+    def fork(self, cluster_name: str) -> MinitrinoContext:
+        """Return a copy of the context scoped to another cluster.
+
+        The copy shares the logger, Docker clients, command executor,
+        module metadata, and `provisioned_clusters` list with this
+        context. It has its own cluster name, cluster interface, and
+        environment variables, so it can provision a cluster in
+        parallel with this context.
+
+        Parameters
+        ----------
+        cluster_name : str
+            The cluster name to scope the copy to.
+
+        Returns
+        -------
+        MinitrinoContext
+            The forked context.
+        """
+        if not self._initialized:
+            raise MinitrinoError("Cannot fork an uninitialized context.")
+
+        from minitrino.core.cluster.cluster import Cluster
+
+        forked = copy.copy(self)
+        forked.env = copy.copy(self.env)
+        forked.env._ctx = forked
+        forked.modules = copy.copy(self.modules)
+        forked.modules._ctx = forked
+        forked.cluster = Cluster(forked)
+        forked.cluster_name = cluster_name
+        forked.env.update(
+            {
+                "CLUSTER_NAME": cluster_name,
+                "COMPOSE_PROJECT_NAME": forked.cluster.resource.compose_project_name(
+                    cluster_name
+                ),
+            }
+        )
+        return forked
+
     @property
     def user_log_level(self) -> LogLevel:
         """The user-configured log level for this context.
@@ -352,6 +407,8 @@ class MinitrinoContext:
         cluster_name : str
             The name of the cluster to set.
         """
+        from minitrino.core.cluster.cluster import Cluster
+
         self.cluster = Cluster(self)
         self._set_cluster_name(cluster_name)
         self.env.update(
@@ -399,15 +456,15 @@ class MinitrinoContext:
         MinitrinoError
             If the Docker socket file cannot be determined.
         """
+        import docker
+
         self.logger.debug(
             "Attempting to locate Docker socket file for current Docker context..."
         )
         try:
             socket = resolve_docker_socket(self, env)
             self.logger.debug(f"Docker socket path: {socket}")
-            docker_client = docker.DockerClient(base_url=socket)
-            api_client = docker.APIClient(base_url=socket)
-            self.docker_client, self.api_client = docker_client, api_client
+            self.docker_client, self.api_client = docker_clients(socket)
         except Exception:
             self.docker_client = cast(docker.DockerClient, object())
             self.api_client = cast(docker.APIClient, object())
@@ -1,20 +1,35 @@
 """Resolve the Docker socket to use.
 
 For internal and external use (e.g. CLI and tests).
+
+Resolving the socket requires a `docker context inspect` subprocess, so
+the result is cached for the life of the process and, when the
+`~/.minitrino` directory exists, on disk. Both caches are keyed by the
+active Docker context selection and the modification times of the
+Docker CLI config, so switching or editing contexts invalidates them.
 """
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
 import subprocess
+import threading
 from typing import TYPE_CHECKING
 
 from minitrino.core.errors import MinitrinoError
+from minitrino.settings import DOCKER_CONTEXT_CACHE_FILE
 
 if TYPE_CHECKING:
+    import docker
+
     from minitrino.core.context import MinitrinoContext
 
+_context_cache: dict[tuple, dict[str, str]] = {}
+_client_cache: dict[str, tuple[docker.DockerClient, docker.APIClient]] = {}
+_cache_lock = threading.Lock()
+
 
 def get_docker_context_name(ctx: MinitrinoContext | None = None, env=None) -> str:
     """Return the name of the active Docker context.
@@ -38,29 +53,7 @@ def get_docker_context_name(ctx: MinitrinoContext | None = None, env=None) -> st
     if env is None:
         env = os.environ
     try:
-        if ctx is None:
-            subproc_result = subprocess.run(
-                ["docker", "context", "inspect"],
-                capture_output=True,
-                check=True,
-                text=True,
-                env=env,
-            )
-            stdout = subproc_result.stdout
-        else:
-            try:
-                cmd_results = ctx.cmd_executor.execute(
-                    ["docker", "context", "inspect"],
-                    environment=env,
-                    suppress_output=True,
-                )
-                if not cmd_results:
-                    return ""
-                stdout = cmd_results[0].output
-            except Exception:
-                return ""
-        context = json.loads(stdout)[0]
-        return context.get("Name", "")
+        return _inspect_docker_context(ctx, env)["name"]
     except Exception:
         return ""
 
@@ -93,30 +86,197 @@ def resolve_docker_socket(ctx: MinitrinoContext | None = None, env=None) -> str:
     if socket_path:
         return socket_path
     try:
-        if ctx is None:
-            subproc_result = subprocess.run(
-                ["docker", "context", "inspect"],
-                capture_output=True,
-                check=True,
-                text=True,
-                env=env,
-            )
-            stdout = subproc_result.stdout
-        else:
-            try:
-                cmd_results = ctx.cmd_executor.execute(
-                    ["docker", "context", "inspect"],
-                    environment=env,
-                    suppress_output=True,
-                )
-                if not cmd_results:
-                    raise MinitrinoError("No results from docker context inspect")
-                stdout = cmd_results[0].output
-            except Exception as e:
-                raise MinitrinoError(
-                    "Error raised trying to resolve Docker socket."
-                ) from e
-        context = json.loads(stdout)[0]
-        return context["Endpoints"]["docker"].get("Host", "")
+        return _inspect_docker_context(ctx, env)["host"]
     except Exception as e:
         raise MinitrinoError("Failed to determine Docker socket.") from e
+
+
+def docker_clients(base_url: str) -> tuple[docker.DockerClient, docker.APIClient]:
+    """Return Docker clients for a socket, reusing them per process.
+
+    Parameters
+    ----------
+    base_url : str
+        The Docker socket to connect to.
+
+    Returns
+    -------
+    tuple[docker.DockerClient, docker.APIClient]
+        High-level and low-level Docker clients for `base_url`.
+    """
+    with _cache_lock:
+        clients = _client_cache.get(base_url)
+        if clients is None:
+            import docker
+
+            clients = (
+                docker.DockerClient(base_url=base_url),
+                docker.APIClient(base_url=base_url),
+            )
+            _client_cache[base_url] = clients
+    return clients
+
+
+def clear_docker_socket_cache() -> None:
+    """Clear the in-process Docker context and client caches."""
+    with _cache_lock:
+        _context_cache.clear()
+        _client_cache.clear()
+
+
+def _inspect_docker_context(ctx: MinitrinoContext | None, env) -> dict[str, str]:
+    """Return the name and host of the active Docker context.
+
+    Parameters
+    ----------
+    ctx : MinitrinoContext, optional
+        The MinitrinoContext object to use for executing commands.
+    env : dict
+        Dictionary of environment variables to use when resolving the
+        Docker context.
+
+    Returns
+    -------
+    dict[str, str]
+        Dictionary with `name` and `host` keys.
+
+    Raises
+    ------
+    MinitrinoError
+        If `docker context inspect` fails or returns no results.
+    """
+    key = _context_cache_key(env)
+    with _cache_lock:
+        cached = _context_cache.get(key)
+    if cached is None:
+        cached = _read_context_cache(key)
+    if cached is not None:
+        with _cache_lock:
+            _context_cache[key] = cached
+        return cached
+
+    if ctx is None:
+        subproc_result = subprocess.run(
+            ["docker", "context", "inspect"],
+            capture_output=True,
+            check=True,
+            text=True,
+            env=env,
+        )
+        stdout = subproc_result.stdout
+    else:
+        try:
+            cmd_results = ctx.cmd_executor.execute(
+                ["docker", "context", "inspect"],
+                environment=env,
+                suppress_output=True,
+            )
+            if not cmd_results:
+                raise MinitrinoError("No results from docker context inspect")
+            stdout = cmd_results[0].output
+        except Exception as e:
+            raise MinitrinoError("Error raised trying to resolve Docker socket.") from e
+    context = json.loads(stdout)[0]
+    inspected = {
+        "name": context.get("Name", ""),
+        "host": context["Endpoints"]["docker"].get("Host", ""),
+    }
+    with _cache_lock:
+        _context_cache[key] = inspected
+    _write_context_cache(key, inspected)
+    return inspected
+
+
+def _context_cache_key(env) -> tuple:
+    """Return a key identifying the active Docker context selection.
+
+    Parameters
+    ----------
+    env : dict
+        Dictionary of environment variables used to resolve the Docker
+        context.
+
+    Returns
+    -------
+    tuple
+        The `DOCKER_CONTEXT` override, the Docker config directory, the
+        modification time of its `config.json` (which records the
+        current context), and the latest modification time within its
+        context metadata store.
+    """
+    config_dir = env.get("DOCKER_CONFIG") or os.path.join(
+        os.path.expanduser("~"), ".docker"
+    )
+    try:
+        config_mtime = os.stat(os.path.join(config_dir, "config.json")).st_mtime_ns
+    except OSError:
+        config_mtime = 0
+    meta_mtime = 0
+    for root, _dirs, files in os.walk(os.path.join(config_dir, "contexts", "meta")):
+        for path in [root] + [os.path.join(root, f) for f in files]:
+            with contextlib.suppress(OSError):
+                meta_mtime = max(meta_mtime, os.stat(path).st_mtime_ns)
+    return (env.get("DOCKER_CONTEXT", ""), config_dir, config_mtime, meta_mtime)
+
+
+def _context_cache_file() -> str:
+    """Return the path to the on-disk Docker context cache.
+
+    Returns
+    -------
+    str
+        Path to the cache file in the user's `~/.minitrino` directory.
+    """
+    return os.path.join(
+        os.path.expanduser("~"), ".minitrino", DOCKER_CONTEXT_CACHE_FILE
+    )
+
+
+def _read_context_cache(key: tuple) -> dict[str, str] | None:
+    """Read the on-disk Docker context cache.
+
+    Parameters
+    ----------
+    key : tuple
+        The current Docker context cache key.
+
+    Returns
+    -------
+    dict[str, str] or None
+        The cached context if the file exists and matches `key`,
+        otherwise None.
+    """
+    try:
+        with open(_context_cache_file()) as f:
+            payload = json.load(f)
+        if payload.get("key") == list(key):
+            return {"name": payload["name"], "host": payload["host"]}
+    except Exception:
+        pass
+    return None
+
+
+def _write_context_cache(key: tuple, inspected: dict[str, str]) -> None:
+    """Write the on-disk Docker context cache.
+
+    Skipped if the `~/.minitrino` directory does not exist. Failures are
+    ignored since the cache only saves a subprocess call.
+
+    Parameters
+    ----------
+    key : tuple
+        The current Docker context cache key.
+    inspected : dict[str, str]
+        The context name and host to cache.
+    """
+    cache_file = _context_cache_file()
+    if not os.path.isdir(os.path.dirname(cache_file)):
+        return
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump({"key": list(key), **inspected}, f)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
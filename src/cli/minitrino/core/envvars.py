@@ -137,6 +137,7 @@ class EnvironmentVariables(dict):
         """
         shell_source = [
             "CLUSTER_NAME",
+            "BUILD_CACHE_SIZE",
             "CLUSTER_VER",
             "COMPOSE_BAKE",
             "CONFIG_PROPERTIES",
@@ -148,9 +149,13 @@ class EnvironmentVariables(dict):
             "KEEP_PLUGINS",
             "LIB_PATH",
             "LIC_PATH",
+            "POOL_SIZE",
+            "POOL_TTL",
             "PROVISION_BUILD_TIMEOUT",
+            "PROVISION_PARALLELISM",
             "STARTUP_SELECT_RETRIES",
             "TEXT_EDITOR",
+            "WORKER_CONFIG_CACHE",
         ]
         for k, v in os.environ.items():
             k = k.upper()
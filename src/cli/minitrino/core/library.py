@@ -6,8 +6,6 @@ import shutil
 import tarfile
 from typing import TYPE_CHECKING
 
-import requests
-
 from minitrino import utils
 from minitrino.core.errors import MinitrinoError, UserError
 
@@ -62,6 +60,8 @@ class LibraryManager:
 
     def list_releases(self) -> list[str]:
         """List all available releases from GitHub."""
+        import requests
+
         releases = []
         page = 1
         headers = self._get_github_headers()
@@ -112,6 +112,8 @@ class LibraryManager:
 
     def _download_file(self, url: str, dest_path: str) -> None:
         """Download a file from URL to destination path."""
+        import requests
+
         response = requests.get(url, stream=True)
         response.raise_for_status()
         with open(dest_path, "wb") as f:
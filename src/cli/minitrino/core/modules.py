@@ -4,18 +4,21 @@ from __future__ import annotations
 
 import json
 import os
+import pickle
 from typing import TYPE_CHECKING
 
 import jsonschema
-import yaml
 
 from minitrino import utils
+from minitrino.core.compose import load_yaml
 from minitrino.core.errors import MinitrinoError, UserError
 from minitrino.settings import (
     COMPOSE_LABEL_KEY,
     LIC_MOUNT_PATH,
     LIC_VOLUME_MOUNT,
     MODULE_ADMIN,
+    MODULE_CACHE_DIR,
+    MODULE_CACHE_VERSION,
     MODULE_CATALOG,
     MODULE_LABEL_KEY,
     MODULE_ROOT,
@@ -47,6 +50,7 @@ MODULE_METADATA_SPEC = {
                     "modules": {"type": "array", "items": {"type": "string"}},
                     "workers": {"type": "number"},
                     "env": {"type": "object"},
+                    "dependsOn": {"type": "array", "items": {"type": "string"}},
                 },
                 "required": ["name", "modules", "workers", "env"],
             },
@@ -68,7 +72,9 @@ class Modules:
     Attributes
     ----------
     data : dict
-        A dictionary of loaded module metadata keyed by module name.
+        A dictionary of loaded module metadata keyed by module name. A
+        module's `yaml_dict` is only present once it has been parsed via
+        `module_yaml()`.
 
     Methods
     -------
@@ -92,6 +98,9 @@ class Modules:
     check_volumes(modules: Optional[list[str]] = None) :
         Check if any of the provided modules have persistent volumes and
         warn the user.
+    module_yaml(module: str) :
+        Return the parsed Docker Compose YAML for a module, parsing it
+        on first access.
     """
 
     def __init__(self, ctx: MinitrinoContext) -> None:
@@ -122,7 +131,9 @@ class Modules:
         labels are considered modules.
         """
         utils.check_daemon(self._ctx.docker_client)
-        containers = self._ctx.cluster.resource.resources().containers()
+        containers = self._ctx.cluster.resource.resources(
+            kinds=["containers"]
+        ).containers()
         if not containers:
             return {}
         modules = {}
@@ -337,8 +348,7 @@ class Modules:
         )
 
         yaml_path = os.path.join(self._ctx.lib_dir, "docker-compose.yaml")
-        with open(yaml_path) as f:
-            yaml_file = yaml.load(f, Loader=yaml.FullLoader)
+        yaml_file = load_yaml(yaml_path)
         volumes = yaml_file.get("services", {}).get("minitrino", {}).get("volumes", [])
 
         if LIC_VOLUME_MOUNT not in volumes:
@@ -408,9 +418,7 @@ class Modules:
         for module in modules:
             self._ctx.logger.debug(f"Checking for services in module '{module}'...")
             yaml_file = self.data.get(module, {}).get("yaml_file", "")
-            module_services = (
-                self.data.get(module, {}).get("yaml_dict", {}).get("services", {})
-            )
+            module_services = self.module_yaml(module).get("services", {})
             if not module_services:
                 raise MinitrinoError(
                     f"Invalid Docker Compose YAML file for module '{module}' "
@@ -438,13 +446,39 @@ class Modules:
         )
 
         for module in modules:
-            if self.data.get(module, {}).get("yaml_dict", {}).get("volumes", {}):
+            if self.module_yaml(module).get("volumes", {}):
                 self._ctx.logger.warn(
                     f"Module '{module}' has persistent volumes associated "
                     f"with it. To delete these volumes, remember to run "
                     f"minitrino remove --volumes --module {module}.",
                 )
 
+    def module_yaml(self, module: str) -> dict:
+        """Return the parsed Docker Compose YAML for a module.
+
+        The module's YAML file is parsed on first access and memoized in
+        the module's `yaml_dict` key for the rest of the process.
+
+        Parameters
+        ----------
+        module : str
+            Name of the module.
+
+        Returns
+        -------
+        dict
+            The parsed Docker Compose YAML, or an empty dictionary if
+            the module is unknown.
+        """
+        module_data = self.data.get(module)
+        if not module_data:
+            return {}
+        if "yaml_dict" not in module_data:
+            yaml_file = module_data.get("yaml_file", "")
+            self._ctx.logger.debug(f"Parsing Docker Compose file: {yaml_file}")
+            module_data["yaml_dict"] = load_yaml(yaml_file)
+        return module_data["yaml_dict"]
+
     def _load_modules(self) -> None:
         """Load module data during class instantiation.
 
@@ -460,9 +494,15 @@ class Modules:
         -----
         This method scans the Minitrino library for valid module
         directories under the `admin`, `catalog`, and `security`
-        sections. Each module must include a matching `.yaml` file, and
-        may optionally include a `metadata.json` file. Parsed module
-        information is stored in the `data` attribute.
+        sections. Each module must include a matching `.yaml` file and a
+        `metadata.json` file. Module information is stored in the `data`
+        attribute. Compose YAML files are not parsed here; see
+        `module_yaml()`.
+
+        Parsed modules are persisted to an on-disk catalog cache in the
+        user's `~/.minitrino` directory (one file per library version).
+        A module is only re-parsed if the modification time or size of
+        its `metadata.json` file has changed since it was cached.
         """
         self._ctx.logger.debug("Loading modules...")
 
@@ -480,6 +520,10 @@ class Modules:
             os.path.join(modules_dir, MODULE_SECURITY),
         ]
 
+        cache = self._read_module_cache()
+        cache_entries: dict[str, dict] = {}
+        cache_stale = False
+
         for section_dir in sections:
             for _dir in os.listdir(section_dir):
                 module_dir = os.path.join(section_dir, _dir)
@@ -503,45 +547,172 @@ class Modules:
                         "properly constructed.",
                     )
 
-                # Module dir and YAML exist, add to modules
                 module_name = os.path.basename(module_dir)
-                self.data[module_name] = {}
-                self.data[module_name]["type"] = os.path.basename(section_dir)
-                self.data[module_name]["module_dir"] = module_dir
-
-                # Add YAML file path
                 yaml_file = os.path.join(module_dir, yaml_basename)
-                self.data[module_name]["yaml_file"] = yaml_file
-
-                # Add YAML dict
-                with open(yaml_file) as f:
-                    self.data[module_name]["yaml_dict"] = yaml.load(
-                        f, Loader=yaml.FullLoader
-                    )
-
-                json_basename = "metadata.json"
-                json_file = os.path.join(module_dir, json_basename)
-                metadata = {}
+                json_file = os.path.join(module_dir, "metadata.json")
                 if not os.path.isfile(json_file):
                     raise MinitrinoError(
                         f"Missing required metadata.json file for "
                         f"module '{module_name}'."
                     )
-                with open(json_file) as f:
-                    metadata = json.load(f)
-                try:
-                    jsonschema.validate(metadata, MODULE_METADATA_SPEC)
-                except jsonschema.ValidationError as e:
-                    raise UserError(
-                        f"Invalid metadata.json in module '{module_name}': {e.message}",
-                        f"File: {json_file}",
-                    ) from e
-                for k, v in metadata.items():
-                    self.data[module_name][k] = v
-
-                # Add module label
-                self.data[module_name]["label"] = (
-                    f"{MODULE_LABEL_KEY}."
-                    f"{self.data[module_name]['type']}."
-                    f"{module_name}=true"
-                )
+
+                stamp = self._file_stamp(json_file)
+                cached = cache.get(module_dir)
+                if cached and cached.get("stamp") == stamp:
+                    self.data[module_name] = cached["data"]
+                else:
+                    self._ctx.logger.debug(
+                        f"Module '{module_name}' not found in module cache or "
+                        f"changed since it was cached. Parsing module files..."
+                    )
+                    self.data[module_name] = self._parse_module(
+                        module_name, section_dir, module_dir, yaml_file, json_file
+                    )
+                    cache_stale = True
+                cache_entries[module_dir] = {
+                    "stamp": stamp,
+                    "data": self.data[module_name],
+                }
+
+        # Modules removed from the library also invalidate the cache
+        lib_entries = [k for k in cache if k.startswith(modules_dir + os.sep)]
+        if cache_stale or len(lib_entries) != len(cache_entries):
+            # Preserve entries belonging to other libraries of the same
+            # version (e.g. a repository library and an installed one)
+            for k, v in cache.items():
+                if not k.startswith(modules_dir + os.sep):
+                    cache_entries.setdefault(k, v)
+            self._write_module_cache(cache_entries)
+
+    def _parse_module(
+        self,
+        module_name: str,
+        section_dir: str,
+        module_dir: str,
+        yaml_file: str,
+        json_file: str,
+    ) -> dict:
+        """Parse and validate a module's metadata file.
+
+        Parameters
+        ----------
+        module_name : str
+            Name of the module.
+        section_dir : str
+            Path to the module's section directory (e.g. `admin`).
+        module_dir : str
+            Path to the module directory.
+        yaml_file : str
+            Path to the module's Docker Compose YAML file.
+        json_file : str
+            Path to the module's `metadata.json` file.
+
+        Returns
+        -------
+        dict
+            The module's data.
+
+        Raises
+        ------
+        UserError
+            If the module's `metadata.json` file is invalid.
+        """
+        module: dict = {}
+        module["type"] = os.path.basename(section_dir)
+        module["module_dir"] = module_dir
+        module["yaml_file"] = yaml_file
+
+        with open(json_file) as f:
+            metadata = json.load(f)
+        try:
+            jsonschema.validate(metadata, MODULE_METADATA_SPEC)
+        except jsonschema.ValidationError as e:
+            raise UserError(
+                f"Invalid metadata.json in module '{module_name}': {e.message}",
+                f"File: {json_file}",
+            ) from e
+        for k, v in metadata.items():
+            module[k] = v
+
+        # Add module label
+        module["label"] = f"{MODULE_LABEL_KEY}.{module['type']}.{module_name}=true"
+        return module
+
+    def _file_stamp(self, *paths: str) -> tuple:
+        """Return a `(mtime_ns, size)` stamp for each of the given files.
+
+        Parameters
+        ----------
+        *paths : str
+            Paths of the files to stamp.
+
+        Returns
+        -------
+        tuple
+            A tuple of `(mtime_ns, size)` tuples, one per path.
+        """
+        stamps = []
+        for path in paths:
+            st = os.stat(path)
+            stamps.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamps)
+
+    def _module_cache_file(self) -> str:
+        """Return the path to the module cache file for the library.
+
+        Returns
+        -------
+        str
+            Path to the cache file. There is one cache file per library
+            version.
+        """
+        lib_ver = utils.lib_ver(lib_path=self._ctx.lib_dir)
+        return os.path.join(
+            self._ctx.minitrino_user_dir, MODULE_CACHE_DIR, f"{lib_ver}.pickle"
+        )
+
+    def _read_module_cache(self) -> dict[str, dict]:
+        """Read the module cache for the current library version.
+
+        Returns
+        -------
+        dict[str, dict]
+            Cached module entries keyed by module directory path. Each
+            entry holds a file `stamp` and the module `data`. An empty
+            dictionary is returned if the cache is missing, unreadable,
+            or was written by an incompatible cache version.
+        """
+        try:
+            with open(self._module_cache_file(), "rb") as f:
+                payload = pickle.load(f)  # nosec B301 - user-owned cache file
+            if payload.get("version") != MODULE_CACHE_VERSION:
+                return {}
+            return payload.get("modules", {})
+        except Exception as e:
+            self._ctx.logger.debug(f"Module cache not loaded: {e}")
+            return {}
+
+    def _write_module_cache(self, entries: dict[str, dict]) -> None:
+        """Atomically write module cache entries to disk.
+
+        Parameters
+        ----------
+        entries : dict[str, dict]
+            Module entries keyed by module directory path.
+
+        Notes
+        -----
+        Failures are logged and otherwise ignored; the cache is an
+        optimization and is never required for module loading.
+        """
+        try:
+            cache_file = self._module_cache_file()
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            payload = {"version": MODULE_CACHE_VERSION, "modules": entries}
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+            self._ctx.logger.debug(f"Module cache written to {cache_file}")
+        except Exception as e:
+            self._ctx.logger.debug(f"Failed to write module cache: {e}")
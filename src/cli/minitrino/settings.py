@@ -4,6 +4,7 @@
 ROOT_LABEL = "org.minitrino.root=true"
 MODULE_LABEL_KEY = "org.minitrino.module"
 COMPOSE_LABEL_KEY = "com.docker.compose.project"
+COMPOSE_SERVICE_LABEL_KEY = "com.docker.compose.service"
 
 # Generic Constants
 LIB = "lib"
@@ -23,6 +24,43 @@ LIC_MOUNT_PATH = "/mnt/etc/starburstdata.license:ro"
 CLUSTER_CONFIG = "config.properties"
 CLUSTER_JVM_CONFIG = "jvm.config"
 
+# Java version installed in the cluster image, keyed by the minimum
+# cluster version that uses it
+JAVA_VERSIONS = {468: "24.0.2", 464: "23.0.2", 447: "22.0.2", 436: "21.0.5"}
+DEFAULT_UBUNTU_VER = "22.04"
+
+# Name that dependent clusters use to depend on the primary cluster
+PRIMARY_CLUSTER = "primary"
+
+# Worker provisioning parallelism bounds (when not set by the user)
+PROVISION_PARALLELISM_MIN = 4
+PROVISION_PARALLELISM_MAX = 32
+
+# Warm cluster pool (when not set by the user)
+POOL_CLUSTER_PREFIX = "pool"
+DEFAULT_POOL_SIZE = 2
+DEFAULT_POOL_TTL = 3600  # seconds
+
+# Coordinator log markers (written by the image's run-minitrino.sh)
+WORKER_SAFE_LOG_MARKER = b"- PRE START BOOTSTRAPS COMPLETED -"
+CLUSTER_READY_LOG_MARKER = b"- CLUSTER IS READY -"
+
+# Caches
+MODULE_CACHE_DIR = ".modulecache"
+MODULE_CACHE_VERSION = 2
+DOCKER_CONTEXT_CACHE_FILE = ".dockercontext.json"
+RESOURCE_SNAPSHOT_TTL = 5.0  # seconds
+PORT_RESERVATION_FILE = ".portreservations.json"
+PORT_RESERVATION_TTL = 600.0  # seconds
+PROVISION_STATE_DIR = ".provisionstate"
+POOL_STATE_FILE = ".clusterpool.json"
+IMAGE_CHECKSUM_DIR = ".imagechecksums"
+IMAGE_CHECKSUM_MANIFEST = ".manifest.json"
+BUILD_CACHE_DIR = ".buildcache"
+# Size in GB above which the least recently used build caches are removed
+DEFAULT_BUILD_CACHE_SIZE = 20
+ARTIFACT_DIR = "artifacts"
+
 # Snapshots
 SNAPSHOT_ROOT_FILES = [
     "docker-compose.yaml",
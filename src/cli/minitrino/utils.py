@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import difflib
+import importlib.util
 import logging
 import os
 import sys
@@ -10,21 +11,22 @@ import traceback
 from functools import wraps
 from importlib.metadata import version
 from inspect import signature
+from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
-import docker
 from click import echo, make_pass_decorator
-from docker.models.containers import Container
 
-from minitrino.core.docker.socket import resolve_docker_socket
-from minitrino.core.docker.wrappers import MinitrinoContainer
+from minitrino.core.docker.socket import docker_clients, resolve_docker_socket
 from minitrino.core.errors import MinitrinoError, UserError
 from minitrino.core.logging.levels import LogLevel
 from minitrino.core.logging.utils import configure_logging
 from minitrino.shutdown import shutdown_event
 
 if TYPE_CHECKING:
+    from docker.models.containers import Container
+
     from minitrino.core.context import MinitrinoContext
+    from minitrino.core.docker.wrappers import MinitrinoContainer
 
 
 # ----------------------------------------------------------------------
@@ -150,7 +152,9 @@ def check_daemon(docker_client: Any) -> None:
     Parameters
     ----------
     docker_client : Any
-        Docker client instance.
+        Docker client instance. If it is not a usable client (e.g. the
+        context failed to connect), the shared client for the resolved
+        Docker socket is pinged instead.
 
     Raises
     ------
@@ -158,7 +162,9 @@ def check_daemon(docker_client: Any) -> None:
         If the Docker daemon is not running or cannot be pinged.
     """
     try:
-        docker.DockerClient(base_url=resolve_docker_socket()).ping()
+        if not hasattr(docker_client, "ping"):
+            docker_client, _ = docker_clients(resolve_docker_socket())
+        docker_client.ping()
     except Exception as e:
         raise UserError(
             f"Error when pinging the Docker server. Is the Docker daemon running?\n"
@@ -185,6 +191,43 @@ def check_lib(ctx: MinitrinoContext) -> None:
         ctx.library_manager.auto_install_or_update()
 
 
+def load_image_script(ctx: MinitrinoContext, name: str) -> ModuleType:
+    """Load a Python script from the library's cluster image.
+
+    Scripts run in cluster containers are also used by the CLI, so the
+    host and the image agree on shared logic (e.g., tarball names and
+    config merging). Script functions used by the CLI take a `log`
+    callback, which callers set to the debug log.
+
+    Parameters
+    ----------
+    ctx : MinitrinoContext
+        Context object containing library directory information.
+    name : str
+        The script's module name, e.g. `gen_config`.
+
+    Returns
+    -------
+    ModuleType
+        The loaded script.
+
+    Raises
+    ------
+    MinitrinoError
+        If the script cannot be loaded.
+    """
+    path = os.path.join(ctx.lib_dir, "image", "src", "scripts", f"{name}.py")
+    spec = importlib.util.spec_from_file_location(f"_minitrino_{name}", path)
+    if spec is None or spec.loader is None:
+        raise MinitrinoError(f"Failed to load {path}.")
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except (OSError, SyntaxError) as e:
+        raise MinitrinoError(f"Failed to load {path}: {e}") from e
+    return module
+
+
 def container_user_and_id(
     ctx: MinitrinoContext | None = None,
     container: Container | MinitrinoContainer | str = "",
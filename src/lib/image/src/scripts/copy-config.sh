@@ -9,6 +9,8 @@ if [ "${push_status}" == "ACTIVE" ]; then
     echo "Copying pushed configs..."
     cp -R /tmp/etc/* /etc/"${CLUSTER_DIST}"/
     echo "INACTIVE" > /etc/"${CLUSTER_DIST}"/.minitrino/push-config-status.txt
+    # Pushed files may replace config that bootstrap hooks modified
+    rm -f /etc/"${CLUSTER_DIST}"/.minitrino/bootstrap_checksums.json
 else
     if [ "${cp_mnt_status}" == "FINISHED" ]; then
         echo "Configs were previously copied. Not overwriting with mounted (default) configs."
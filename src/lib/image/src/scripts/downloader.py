@@ -47,24 +47,63 @@ Variables
 
 The script dynamically constructs these names and paths based on the
 provided distribution, version, and detected architecture.
+
+Artifact Cache
+--------------
+
+If the tarball is present in `/mnt/artifacts` (the CLI's host artifact
+cache, bind-mounted into the build) with a matching `.sha256` file, it
+is used instead of downloading. Otherwise, the tarball is extracted as
+it downloads. Either way, members are extracted directly into
+`/usr/lib/{CLUSTER_DIST}`, skipping binaries for other platforms and
+plugins pruned by `prune_plugins.py`. The CLI loads this script to
+populate the cache with the same naming rules.
+
+Downloads
+---------
+
+Tarballs are downloaded in concurrent byte ranges when the server
+supports them. Progress is kept in `<tarball>.part` and
+`<tarball>.part.json`, so an interrupted download resumes, and the
+result is verified against the published `.sha512`, `.sha256`, or
+`.sha1` checksum.
 """
 
+import hashlib
+import http.client
+import json
 import os
 import platform
 import shutil
 import sys
 import tarfile
+import threading
 import time
+import urllib.error
 import urllib.request
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
 
 LOG_PREFIX = "[downloader]"
+ARTIFACT_DIR = "/mnt/artifacts"
+CHECKSUM_ALGORITHMS = ("sha512", "sha256", "sha1")
+CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_CONNECTIONS = 4
+DOWNLOAD_RETRIES = 5
+DOWNLOAD_TIMEOUT = 60
+MIN_SEGMENT_SIZE = 32 * 1024 * 1024
 TRINO_URL = "https://repo1.maven.org/maven2/io/trino/trino-server"
 STARBURST_URL = "https://s3.us-east-2.amazonaws.com/software.starburstdata.net"
 
 
-def get_arch() -> tuple[str, str]:
+def get_arch(raw_arch: str | None = None) -> tuple[str, str]:
     """Detect the current system architecture.
 
+    Parameters
+    ----------
+    raw_arch : str, optional
+        Architecture to normalize. Defaults to the current machine's.
+
     Returns
     -------
     tuple of str
@@ -76,7 +115,7 @@ def get_arch() -> tuple[str, str]:
     RuntimeError
         If the architecture is not supported.
     """
-    raw_arch = platform.machine()
+    raw_arch = raw_arch or platform.machine()
     if raw_arch in ("x86_64", "amd64"):
         return "x86_64", "amd64"
     elif raw_arch in ("arm64", "aarch64"):
@@ -86,7 +125,7 @@ def get_arch() -> tuple[str, str]:
 
 
 def resolve_tarball_info(
-    cluster_dist: str, cluster_ver: str
+    cluster_dist: str, cluster_ver: str, raw_arch: str | None = None
 ) -> tuple[str, str, str, str]:
     """Resolve the tarball info.
 
@@ -96,13 +135,15 @@ def resolve_tarball_info(
         Cluster distribution ("trino" or "starburst").
     cluster_ver : str
         Cluster version string.
+    raw_arch : str, optional
+        Target architecture. Defaults to the current machine's.
 
     Returns
     -------
     tuple
         (url, tar_name, unpack_dir, arch_bin)
     """
-    arch_sep_s3, arch_bin = get_arch()
+    arch_sep_s3, arch_bin = get_arch(raw_arch)
     if cluster_dist == "trino":
         trino_ver = cluster_ver
         tar_name = f"trino-server-{trino_ver}.tar.gz"
@@ -122,107 +163,608 @@ def resolve_tarball_info(
     return url, tar_name, unpack_dir, arch_bin
 
 
-def download_tarball(url: str, tar_path: str) -> None:
+def download_tarball(
+    url: str,
+    tar_path: str,
+    connections: int = DOWNLOAD_CONNECTIONS,
+    log: Callable[[str], None] = print,
+) -> None:
     """Download a tarball from a URL to a local file.
 
+    If the server accepts range requests, the tarball is split into
+    segments that are downloaded concurrently. Data is written to
+    `<tar_path>.part` and each segment's progress is recorded in
+    `<tar_path>.part.json`, so failed segments are retried from where
+    they stopped and an interrupted download resumes when called again.
+    Otherwise, the tarball is downloaded over a single connection.
+
+    The download is verified against the checksum published alongside
+    it, when there is one, before it is moved to `tar_path`.
+
     Parameters
     ----------
     url : str
         The URL to download from.
     tar_path : str
         Path to save the downloaded tarball.
+    connections : int, optional
+        Maximum number of concurrent connections. Defaults to
+        `DOWNLOAD_CONNECTIONS`.
+    log : Callable[[str], None], optional
+        Called with each log message. Defaults to `print`.
+
+    Raises
+    ------
+    RuntimeError
+        If a segment still fails after `DOWNLOAD_RETRIES` attempts or the
+        download does not match its published checksum.
     """
-    print(f"{LOG_PREFIX} Downloading {url} ...")
-    with urllib.request.urlopen(url) as response, open(tar_path, "wb") as out_file:
-        total_size = response.getheader("Content-Length")
-        total_size = int(total_size) if total_size is not None else None
-        chunk_size = 8192
+    log(f"{LOG_PREFIX} Downloading {url} ...")
+    part_path = f"{tar_path}.part"
+    total_size, ranged = probe_download(url)
+    if ranged and total_size:
+        download_segments(url, part_path, total_size, connections, log)
+    else:
+        download_stream(url, part_path, total_size, log)
+    verify_download(url, part_path, log)
+    os.replace(part_path, tar_path)
+    log(f"{LOG_PREFIX} Downloaded to {tar_path}")
+
+
+def probe_download(url: str) -> tuple[int | None, bool]:
+    """Return a download's size and whether it accepts range requests.
+
+    Parameters
+    ----------
+    url : str
+        The download URL.
+
+    Returns
+    -------
+    tuple
+        (total_size, ranged). `total_size` is None if the server does
+        not report it.
+    """
+    request = urllib.request.Request(url, headers={"Range": "bytes=0-0"})
+    with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response:
+        if response.status == 206:
+            total = response.headers.get("Content-Range", "").rpartition("/")[2]
+            if total.isdigit():
+                return int(total), True
+        length = response.headers.get("Content-Length")
+        return (int(length) if length and length.isdigit() else None), False
+
+
+def download_segments(
+    url: str,
+    part_path: str,
+    total_size: int,
+    connections: int,
+    log: Callable[[str], None] = print,
+) -> None:
+    """Download a file in concurrent byte ranges.
+
+    Parameters
+    ----------
+    url : str
+        The download URL.
+    part_path : str
+        Path of the partial file to write.
+    total_size : int
+        The file's size in bytes.
+    connections : int
+        Maximum number of concurrent connections.
+    log : Callable[[str], None], optional
+        Called with each log message. Defaults to `print`.
+
+    Raises
+    ------
+    RuntimeError
+        If a segment still fails after `DOWNLOAD_RETRIES` attempts.
+    """
+    state_path = f"{part_path}.json"
+    segments = load_segments(url, part_path, total_size)
+    if segments:
+        done = sum(pos - start for start, pos, _ in segments)
+        log(f"{LOG_PREFIX} Resuming download at {done // 1024} KB")
+    else:
+        count = max(1, min(connections, -(-total_size // MIN_SEGMENT_SIZE)))
+        bounds = [total_size * i // count for i in range(count + 1)]
+        # [start, next byte to write, end (exclusive)]
+        segments = [[bounds[i], bounds[i], bounds[i + 1]] for i in range(count)]
+        with open(part_path, "wb") as f:
+            f.truncate(total_size)
+    lock = threading.Lock()
+
+    def save_segments() -> None:
+        with lock:
+            state = {"url": url, "size": total_size, "segments": segments}
+        with open(state_path, "w") as f:
+            json.dump(state, f)
+
+    def fetch(segment: list[int]) -> None:
+        for attempt in range(DOWNLOAD_RETRIES):
+            if segment[1] >= segment[2]:
+                return
+            if attempt:
+                time.sleep(min(2**attempt, 30))
+            headers = {"Range": f"bytes={segment[1]}-{segment[2] - 1}"}
+            request = urllib.request.Request(url, headers=headers)
+            try:
+                with (
+                    urllib.request.urlopen(
+                        request, timeout=DOWNLOAD_TIMEOUT
+                    ) as response,
+                    open(part_path, "r+b", buffering=0) as f,
+                ):
+                    if response.status != 206:
+                        raise RuntimeError(f"Range request ignored by {url}")
+                    f.seek(segment[1])
+                    while segment[1] < segment[2]:
+                        chunk = response.read(min(CHUNK_SIZE, segment[2] - segment[1]))
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        with lock:
+                            segment[1] += len(chunk)
+            except (urllib.error.URLError, OSError, http.client.HTTPException) as e:
+                log(f"{LOG_PREFIX} Retrying bytes {segment[1]}-{segment[2] - 1}: {e}")
+        if segment[1] < segment[2]:
+            raise RuntimeError(
+                f"Failed to download bytes {segment[1]}-{segment[2] - 1} of {url}"
+            )
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            futures = [executor.submit(fetch, segment) for segment in segments]
+            while wait(futures, timeout=2).not_done:
+                with lock:
+                    done = sum(pos - start for start, pos, _ in segments)
+                print_progress(done, total_size, log)
+                save_segments()
+            for future in futures:
+                future.result()
+    finally:
+        save_segments()
+    os.remove(state_path)
+    print_progress(total_size, total_size, log)
+
+
+def load_segments(url: str, part_path: str, total_size: int) -> list[list[int]]:
+    """Return the recorded segments of an interrupted download.
+
+    Parameters
+    ----------
+    url : str
+        The download URL.
+    part_path : str
+        Path of the partial file.
+    total_size : int
+        The file's size in bytes.
+
+    Returns
+    -------
+    list of list of int
+        Each segment's start, next byte to write, and end (exclusive), or
+        an empty list if there is no matching partial download.
+    """
+    try:
+        with open(f"{part_path}.json") as f:
+            state = json.load(f)
+        if (
+            state["url"] == url
+            and state["size"] == total_size
+            and os.path.getsize(part_path) == total_size
+        ):
+            return state["segments"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return []
+
+
+def download_stream(
+    url: str,
+    part_path: str,
+    total_size: int | None,
+    log: Callable[[str], None] = print,
+) -> None:
+    """Download a file over a single connection.
+
+    Parameters
+    ----------
+    url : str
+        The download URL.
+    part_path : str
+        Path of the partial file to write.
+    total_size : int or None
+        The file's size in bytes, if known.
+    log : Callable[[str], None], optional
+        Called with each log message. Defaults to `print`.
+    """
+    with (
+        urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response,
+        open(part_path, "wb") as out_file,
+    ):
         downloaded = 0
         last_print_time = time.time()
-        while True:
-            chunk = response.read(chunk_size)
-            if not chunk:
-                break
+        while chunk := response.read(CHUNK_SIZE):
             out_file.write(chunk)
             downloaded += len(chunk)
             now = time.time()
-            if total_size:
-                percent = (downloaded / total_size) * 100
-                status = f"Downloading tarball... {percent:.1f}% complete"
-            else:
-                status = f"Downloading tarball... {downloaded // 1024} KB"
             if now - last_print_time >= 2:
-                print(f"{LOG_PREFIX} {status}")
-                sys.stdout.flush()
+                print_progress(downloaded, total_size, log)
                 last_print_time = now
-        if total_size:
-            print(f"{LOG_PREFIX} Downloading tarball... 100.0% complete")
-        print(f"{LOG_PREFIX} Downloaded to {tar_path}")
+    if total_size:
+        print_progress(total_size, total_size, log)
 
 
-def unpack_tarball(tar_path: str, dest_dir: str) -> None:
-    """Extract a gzipped tarball to a destination directory.
+def print_progress(
+    downloaded: int, total_size: int | None, log: Callable[[str], None] = print
+) -> None:
+    """Print a download's progress.
 
     Parameters
     ----------
-    tar_path : str
-        Path to the tarball file.
+    downloaded : int
+        Number of bytes downloaded.
+    total_size : int or None
+        The file's size in bytes, if known.
+    log : Callable[[str], None], optional
+        Called with each log message. Defaults to `print`.
+    """
+    if total_size:
+        percent = (downloaded / total_size) * 100
+        status = f"Downloading tarball... {percent:.1f}% complete"
+    else:
+        status = f"Downloading tarball... {downloaded // 1024} KB"
+    log(f"{LOG_PREFIX} {status}")
+    sys.stdout.flush()
+
+
+def verify_download(url: str, path: str, log: Callable[[str], None] = print) -> None:
+    """Verify a download against its published checksum.
+
+    Parameters
+    ----------
+    url : str
+        The download URL.
+    path : str
+        Path of the downloaded file.
+    log : Callable[[str], None], optional
+        Called with each log message. Defaults to `print`.
+
+    Raises
+    ------
+    RuntimeError
+        If the file does not match the published checksum. The file is
+        removed.
+    """
+    published = fetch_checksum(url)
+    if not published:
+        log(f"{LOG_PREFIX} No published checksum for {url}")
+        return
+    algorithm, expected = published
+    actual = file_digest(path, algorithm)
+    if actual != expected:
+        os.remove(path)
+        raise RuntimeError(
+            f"Checksum mismatch for {url}: expected {algorithm} {expected}, "
+            f"got {actual}"
+        )
+    log(f"{LOG_PREFIX} Verified {algorithm} checksum")
+
+
+def file_digest(path: str, algorithm: str = "sha256") -> str:
+    """Return the hex digest of a file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+    algorithm : str, optional
+        Hash algorithm name. Defaults to "sha256".
+
+    Returns
+    -------
+    str
+        The file's hex digest.
+    """
+    h = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def fetch_checksum(url: str) -> tuple[str, str] | None:
+    """Fetch the published checksum of a download.
+
+    Tries `<url>.sha512`, `<url>.sha256`, and `<url>.sha1` in order.
+
+    Parameters
+    ----------
+    url : str
+        The download URL.
+
+    Returns
+    -------
+    tuple of str or None
+        (algorithm, hex digest), or None if no checksum is published.
+    """
+    for algorithm in CHECKSUM_ALGORITHMS:
+        try:
+            with urllib.request.urlopen(f"{url}.{algorithm}", timeout=30) as resp:
+                digest = resp.read().decode().split()
+        except (urllib.error.URLError, OSError, UnicodeDecodeError):
+            continue
+        if digest:
+            return algorithm, digest[0].lower()
+    return None
+
+
+def cached_tarball(
+    tar_name: str, artifact_dir: str = ARTIFACT_DIR, log: Callable[[str], None] = print
+) -> str:
+    """Return the path to a verified tarball in the artifact cache.
+
+    Parameters
+    ----------
+    tar_name : str
+        The tarball file name.
+    artifact_dir : str, optional
+        The artifact cache directory. Defaults to `ARTIFACT_DIR`.
+    log : Callable[[str], None], optional
+        Called with each log message. Defaults to `print`.
+
+    Returns
+    -------
+    str
+        The tarball's path, or an empty string if it is not cached or
+        does not match its recorded `.sha256` checksum.
+    """
+    tar_path = os.path.join(artifact_dir, tar_name)
+    checksum_path = f"{tar_path}.sha256"
+    if not (os.path.isfile(tar_path) and os.path.isfile(checksum_path)):
+        return ""
+    with open(checksum_path) as f:
+        expected = f.read().split()
+    if not expected or file_digest(tar_path) != expected[0]:
+        log(f"{LOG_PREFIX} Ignoring cached {tar_path}: checksum mismatch")
+        return ""
+    log(f"{LOG_PREFIX} Using cached {tar_path}")
+    return tar_path
+
+
+class DigestReader:
+    """Hash a stream and report its progress as it is read.
+
+    Parameters
+    ----------
+    stream : file-like
+        The stream to read.
+    algorithm : str
+        Hash algorithm name.
+    total_size : int or None
+        The stream's size in bytes, if known.
+    """
+
+    def __init__(self, stream, algorithm: str, total_size: int | None) -> None:
+        self._stream = stream
+        self._hash = hashlib.new(algorithm)
+        self._total_size = total_size
+        self._read = 0
+        self._last_print_time = time.time()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read, hash, and return up to `size` bytes."""
+        data = self._stream.read(size)
+        self._hash.update(data)
+        self._read += len(data)
+        now = time.time()
+        if now - self._last_print_time >= 2:
+            print_progress(self._read, self._total_size)
+            self._last_print_time = now
+        return data
+
+    def hexdigest(self) -> str:
+        """Return the hex digest of the data read so far."""
+        return self._hash.hexdigest()
+
+
+def skipped_member(rel_path: str, arch_bin: str, keep_plugins: set[str] | None) -> str:
+    """Return why a tarball member is skipped during extraction.
+
+    Parameters
+    ----------
+    rel_path : str
+        The member's path relative to the unpack directory.
+    arch_bin : str
+        Architecture string for binaries (e.g. "amd64").
+    keep_plugins : set of str or None
+        Plugins to extract, or None to extract all plugins.
+
+    Returns
+    -------
+    str
+        A description of the skipped binary or plugin directory, e.g.
+        "bin: darwin-amd64", or an empty string if the member is
+        extracted.
+    """
+    parts = rel_path.split("/")
+    if len(parts) < 2:
+        return ""
+    if parts[0] == "bin" and (
+        parts[1].startswith("darwin-")
+        or (parts[1].startswith("linux-") and parts[1] != f"linux-{arch_bin}")
+    ):
+        return f"bin: {parts[1]}"
+    if (
+        parts[0] == "plugin"
+        and keep_plugins is not None
+        and parts[1] not in keep_plugins
+    ):
+        return f"plugin: {parts[1]}"
+    return ""
+
+
+def extract_tarball(
+    fileobj,
+    unpack_dir: str,
+    dest_dir: str,
+    arch_bin: str,
+    keep_plugins: set[str] | None,
+) -> None:
+    """Stream-extract a gzipped tarball into a destination directory.
+
+    Members are read in order and written directly to `dest_dir` with
+    the leading `unpack_dir` removed. Binaries for other platforms and
+    plugins not in `keep_plugins` are skipped rather than extracted.
+
+    Parameters
+    ----------
+    fileobj : file-like
+        The gzipped tarball, read sequentially.
+    unpack_dir : str
+        The tarball's top-level directory.
     dest_dir : str
         Directory to extract contents into.
+    arch_bin : str
+        Architecture string for binaries (e.g. "amd64").
+    keep_plugins : set of str or None
+        Plugins to extract, or None to extract all plugins.
     """
-    print(f"{LOG_PREFIX} Extracting {tar_path} ...")
-    with tarfile.open(tar_path, "r:gz") as tar:
-        tar.extractall(path=dest_dir)
+    print(f"{LOG_PREFIX} Extracting to {dest_dir} ...")
+    os.makedirs(dest_dir, exist_ok=True)
+    # Python versions with extraction filters warn when none is given
+    use_filter = hasattr(tarfile, "tar_filter")
+    skipped = set()
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+        for member in tar:
+            rel_path = strip_unpack_dir(member.name, unpack_dir)
+            if not rel_path:
+                continue
+            reason = skipped_member(rel_path, arch_bin, keep_plugins)
+            if reason:
+                if reason not in skipped:
+                    print(f"{LOG_PREFIX} Skipping {reason}")
+                    skipped.add(reason)
+                continue
+            member.name = rel_path
+            if member.islnk():
+                member.linkname = strip_unpack_dir(member.linkname, unpack_dir)
+            if use_filter:
+                tar.extract(member, dest_dir, filter="tar")
+            else:
+                tar.extract(member, dest_dir)
     print(f"{LOG_PREFIX} Extracted to {dest_dir}")
 
 
-def unpack_and_copy(cluster_dist: str, unpack_dir: str, arch_bin: str) -> None:
-    """Copy files from the unpacked tarball to the destination.
+def strip_unpack_dir(name: str, unpack_dir: str) -> str:
+    """Return a member path relative to the tarball's top-level directory.
 
     Parameters
     ----------
-    cluster_dist : str
-        Cluster distribution name.
+    name : str
+        The member's path in the tarball.
     unpack_dir : str
-        Directory of the unpacked tarball.
+        The tarball's top-level directory.
+
+    Returns
+    -------
+    str
+        The relative path, or an empty string for the top-level
+        directory itself and members outside of it.
+    """
+    head, _, rel_path = name.removeprefix("./").partition("/")
+    return rel_path.rstrip("/") if head == unpack_dir else ""
+
+
+def stream_tarball(
+    url: str,
+    unpack_dir: str,
+    dest_dir: str,
+    arch_bin: str,
+    keep_plugins: set[str] | None,
+) -> None:
+    """Download and extract a tarball in a single pass.
+
+    The tarball is extracted as it downloads and is never written to
+    disk. It is verified against its published checksum, when there is
+    one, once the download completes. A download that is interrupted is
+    restarted from the beginning, up to `DOWNLOAD_RETRIES` times, after
+    removing what was extracted.
+
+    Parameters
+    ----------
+    url : str
+        The URL to download from.
+    unpack_dir : str
+        The tarball's top-level directory.
+    dest_dir : str
+        Directory to extract contents into.
     arch_bin : str
         Architecture string for binaries (e.g. "amd64").
+    keep_plugins : set of str or None
+        Plugins to extract, or None to extract all plugins.
+
+    Raises
+    ------
+    RuntimeError
+        If the download does not match its published checksum or still
+        fails after `DOWNLOAD_RETRIES` attempts. The destination
+        directory is removed.
     """
-    dest_dir = f"/usr/lib/{cluster_dist}"
-    os.makedirs(dest_dir, exist_ok=True)
-    # Copy all files from unpack_dir to dest_dir
-    for item in os.listdir(unpack_dir):
-        s = os.path.join(unpack_dir, item)
-        d = os.path.join(dest_dir, item)
-        if os.path.isdir(s):
-            if os.path.exists(d):
-                shutil.rmtree(d)
-            shutil.copytree(s, d)
-        else:
-            shutil.copy2(s, d)
-    # Remove non-linux and non-arch-specific bins
-    bin_dir = os.path.join(dest_dir, "bin")
-    for name in os.listdir(bin_dir):
-        if name.startswith("darwin-") or (
-            name.startswith("linux-") and name != f"linux-{arch_bin}"
-        ):
-            path = os.path.join(bin_dir, name)
-            print(f"{LOG_PREFIX} Removing bin: {name}")
-            if os.path.isdir(path):
-                shutil.rmtree(path, ignore_errors=True)
-            else:
-                os.remove(path)
-    # Copy linux-arch_bin if present
-    src_arch_bin = os.path.join(unpack_dir, "bin", f"linux-{arch_bin}")
-    if os.path.isdir(src_arch_bin):
-        dest_arch_bin = os.path.join(bin_dir, f"linux-{arch_bin}")
-        if os.path.exists(dest_arch_bin):
-            shutil.rmtree(dest_arch_bin)
-        shutil.copytree(src_arch_bin, dest_arch_bin)
+    print(f"{LOG_PREFIX} Downloading {url} ...")
+    published = fetch_checksum(url)
+    algorithm = published[0] if published else "sha256"
+    for attempt in range(DOWNLOAD_RETRIES):
+        if attempt:
+            time.sleep(min(2**attempt, 30))
+            shutil.rmtree(dest_dir, ignore_errors=True)
+        try:
+            with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+                length = response.headers.get("Content-Length")
+                total_size = int(length) if length and length.isdigit() else None
+                reader = DigestReader(response, algorithm, total_size)
+                extract_tarball(reader, unpack_dir, dest_dir, arch_bin, keep_plugins)
+                # Read past the end-of-archive padding so the whole
+                # download is hashed
+                while reader.read(CHUNK_SIZE):
+                    pass
+            break
+        except (
+            urllib.error.URLError,
+            OSError,
+            EOFError,
+            http.client.HTTPException,
+            tarfile.TarError,
+        ) as e:
+            print(f"{LOG_PREFIX} Download interrupted, restarting: {e}")
+    else:
+        shutil.rmtree(dest_dir, ignore_errors=True)
+        raise RuntimeError(
+            f"Failed to download {url} after {DOWNLOAD_RETRIES} attempts"
+        )
+    if total_size:
+        print_progress(total_size, total_size)
+    if not published:
+        print(f"{LOG_PREFIX} No published checksum for {url}")
+        return
+    actual = reader.hexdigest()
+    if actual != published[1]:
+        shutil.rmtree(dest_dir, ignore_errors=True)
+        raise RuntimeError(
+            f"Checksum mismatch for {url}: expected {algorithm} {published[1]}, "
+            f"got {actual}"
+        )
+    print(f"{LOG_PREFIX} Verified {algorithm} checksum")
 
 
 def main(cluster_ver: str, cluster_dist: str) -> None:
-    """Download, extract, and copy distro tarball.
+    """Download and extract the distro tarball.
+
+    A tarball in the artifact cache is extracted from disk. Otherwise,
+    it is extracted while it downloads.
 
     Parameters
     ----------
@@ -231,15 +773,20 @@ def main(cluster_ver: str, cluster_dist: str) -> None:
     cluster_dist : str
         Cluster distribution string ("trino" or "starburst").
     """
+    # Copied next to this script in the image; not needed by the CLI
+    from prune_plugins import plugins_to_keep
+
     url, tar_name, unpack_dir, arch_bin = resolve_tarball_info(
         cluster_dist, cluster_ver
     )
-    tmp_dir = "/tmp"
-    tar_path = os.path.join(tmp_dir, tar_name)
-    download_tarball(url, tar_path)
-    os.chdir(tmp_dir)
-    unpack_tarball(tar_path, tmp_dir)
-    unpack_and_copy(cluster_dist, unpack_dir, arch_bin)
+    dest_dir = f"/usr/lib/{cluster_dist}"
+    keep_plugins = plugins_to_keep(os.environ.get("KEEP_PLUGINS"))
+    tar_path = cached_tarball(tar_name)
+    if tar_path:
+        with open(tar_path, "rb") as f:
+            extract_tarball(f, unpack_dir, dest_dir, arch_bin, keep_plugins)
+    else:
+        stream_tarball(url, unpack_dir, dest_dir, arch_bin, keep_plugins)
 
 
 if __name__ == "__main__":
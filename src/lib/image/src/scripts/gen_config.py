@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
-"""Generate cluster config files from environment variables."""
+"""Generate cluster config files from environment variables.
+
+The merge functions take the environment to render from, so the CLI
+loads this script to render and check configs on the host before
+containers start. Run as a script, it renders from the container's
+environment and writes the files to `/etc/${CLUSTER_DIST}`.
+"""
 
 import os
 import re
+from collections.abc import Callable, Mapping
 from pathlib import Path
 
 LOG_PREFIX = "[gen_config]"
@@ -12,23 +19,32 @@ WORKER_CONFIG_PROPS = """coordinator=false
 http-server.http.port=8080
 discovery.uri=http://minitrino-${ENV:CLUSTER_NAME}:8080
 internal-communication.shared-secret=bWluaXRyaW5vUm9ja3MxNQo="""
+# Properties whose values from several sources are combined, not replaced
+COMBINED_PROPERTIES = ("http-server.authentication.type",)
 
 
-def get_java_version() -> int:
+def get_java_version(cluster_ver: str | None = None) -> int:
     """Get the Java major version based on the Trino/Starburst version.
 
-    Uses the same version mapping as install-java.sh:
+    Uses the same version mapping as JAVA_VERSIONS in the CLI settings:
     - >= 436 <= 446: Java 21
     - >= 447 <= 463: Java 22
     - >= 464 <= 467: Java 23
     - >= 468: Java 24
 
+    Parameters
+    ----------
+    cluster_ver : str, optional
+        The cluster version. Defaults to the `CLUSTER_VER` environment
+        variable.
+
     Returns
     -------
     int
         Java major version number (e.g., 21, 22, 23, 24).
     """
-    cluster_ver = os.environ.get("CLUSTER_VER", "")
+    if cluster_ver is None:
+        cluster_ver = os.environ.get("CLUSTER_VER", "")
     if not cluster_ver:
         return 21  # Default to Java 21 if version not available
     trino_ver = int(cluster_ver[:3])
@@ -126,7 +142,9 @@ def extract_jvm_flag_key(line: str) -> str:
     return line
 
 
-def merge_password_authenticators(cfgs: list[tuple]) -> list[tuple]:
+def merge_password_authenticators(
+    cfgs: list[tuple], log: Callable[[str], None] = print
+) -> list[tuple]:
     """Merge multiple password authenticators."""
     merge = [
         i
@@ -139,9 +157,7 @@ def merge_password_authenticators(cfgs: list[tuple]) -> list[tuple]:
     auth_property = ("key_value", "http-server.authentication.type", ",".join(values))
     new_cfgs = [x for i, x in enumerate(cfgs) if i not in merge]
     new_cfgs.append(auth_property)
-    print(
-        f"{LOG_PREFIX} Merged password authenticators: {values} -> {auth_property[2]}"
-    )
+    log(f"{LOG_PREFIX} Merged password authenticators: {values} -> {auth_property[2]}")
     return new_cfgs
 
 
@@ -154,7 +170,11 @@ def read_existing_config(filename: str) -> list[tuple]:
 
 
 def merge_configs(
-    base_cfgs: list[tuple], user_cfgs: list[tuple], is_jvm: bool = False
+    base_cfgs: list[tuple],
+    user_cfgs: list[tuple],
+    is_jvm: bool = False,
+    java_version: int | None = None,
+    log: Callable[[str], None] = print,
 ) -> list[tuple]:
     """Merge default and user configs.
 
@@ -176,6 +196,11 @@ def merge_configs(
         Parsed config tuples from user/module/environment overrides.
     is_jvm : bool
         If True, use JVM flag key extraction for deduplication.
+    java_version : int, optional
+        The cluster's Java version, used to filter JVM options. Defaults
+        to `get_java_version()`.
+    log : Callable[[str], None], optional
+        Called with each log message. Defaults to `print`.
 
     Returns
     -------
@@ -184,7 +209,8 @@ def merge_configs(
     """
     # Filter out Security Manager options for Java 21+ when processing JVM configs
     if is_jvm:
-        java_version = get_java_version()
+        if java_version is None:
+            java_version = get_java_version()
         if java_version >= 21:
             # Filter base configs
             filtered_base = []
@@ -192,7 +218,7 @@ def merge_configs(
                 if entry[0] == "key_value":
                     flag = entry[1]
                     if is_security_manager_option(flag):
-                        print(
+                        log(
                             f"{LOG_PREFIX} Filtering Security Manager option "
                             f"(incompatible with Java {java_version}): {flag}"
                         )
@@ -206,7 +232,7 @@ def merge_configs(
                 if entry[0] == "key_value":
                     flag = entry[1]
                     if is_security_manager_option(flag):
-                        print(
+                        log(
                             f"{LOG_PREFIX} Filtering Security Manager option "
                             f"(incompatible with Java {java_version}): {flag}"
                         )
@@ -248,19 +274,36 @@ def merge_configs(
     return merged
 
 
-def collect_configs(
-    modules: list[str], worker: bool = False
-) -> tuple[list[tuple], list[tuple]]:
-    """Collect config and JVM config fragments from env.
+def config_sources(
+    modules: list[str],
+    worker: bool = False,
+    env: Mapping[str, str] | None = None,
+    log: Callable[[str], None] = print,
+) -> tuple[list[tuple[str, list[tuple]]], list[tuple[str, list[tuple]]]]:
+    """Return the config fragments supplied by environment variables.
 
-    For each module, if a config env var exists, use it; otherwise, skip. Modules that
-    do not supply config envs (e.g., POSTGRES) are ignored.
-    """
-    role = "worker" if worker else "coordinator"
-    print(f"{LOG_PREFIX} Collecting configs for role: {role}")
-    cfgs = []
-    jvm_cfg = []
+    The user's overrides come first, followed by each module's, in merge
+    order. Modules that do not supply config envs (e.g., POSTGRES) are
+    ignored.
 
+    Parameters
+    ----------
+    modules : list[str]
+        The cluster's modules.
+    worker : bool
+        If True, collect worker configs instead of coordinator configs.
+    env : Mapping[str, str], optional
+        The environment to read. Defaults to `os.environ`.
+    log : Callable[[str], None], optional
+        Called with each log message. Defaults to `print`.
+
+    Returns
+    -------
+    tuple[list, list]
+        `(env_var, entries)` pairs for `config.properties` and for
+        `jvm.config`.
+    """
+    env = os.environ if env is None else env
     if worker:
         jvm_env_var = "WORKER_JVM_CONFIG"
         config_env_var = "WORKER_CONFIG_PROPERTIES"
@@ -268,40 +311,91 @@ def collect_configs(
         jvm_env_var = "JVM_CONFIG"
         config_env_var = "CONFIG_PROPERTIES"
 
+    cfg_sources = []
+    jvm_sources = []
+
     # User-supplied overrides
-    env_usr_cfgs = os.environ.get(config_env_var, "")
-    env_user_jvm_cfg = os.environ.get(jvm_env_var, "")
-    if env_usr_cfgs:
-        print(f"{LOG_PREFIX} Found user {config_env_var} override.")
-        cfgs.extend(split_config(env_usr_cfgs))
-    if env_user_jvm_cfg:
-        print(f"{LOG_PREFIX} Found user {jvm_env_var} override.")
-        jvm_cfg.extend(split_config(env_user_jvm_cfg))
+    if env.get(config_env_var):
+        log(f"{LOG_PREFIX} Found user {config_env_var} override.")
+        cfg_sources.append((config_env_var, split_config(env[config_env_var])))
+    if env.get(jvm_env_var):
+        log(f"{LOG_PREFIX} Found user {jvm_env_var} override.")
+        jvm_sources.append((jvm_env_var, split_config(env[jvm_env_var])))
 
     for module in modules:
         mod_env_prefix = module.replace("-", "_").upper()
         mod_cfg_env = f"{mod_env_prefix}_{config_env_var}"
         mod_jvm_env = f"{mod_env_prefix}_{jvm_env_var}"
-        mod_cfg = os.environ.get(mod_cfg_env)
-        mod_jvm = os.environ.get(mod_jvm_env)
+        mod_cfg = env.get(mod_cfg_env)
+        mod_jvm = env.get(mod_jvm_env)
         if mod_cfg:
-            print(f"{LOG_PREFIX} Found {mod_cfg_env} for module {module}.")
-            cfgs.extend(split_config(mod_cfg))
+            log(f"{LOG_PREFIX} Found {mod_cfg_env} for module {module}.")
+            cfg_sources.append((mod_cfg_env, split_config(mod_cfg)))
         if mod_jvm:
-            print(f"{LOG_PREFIX} Found {mod_jvm_env} for module {module}.")
-            jvm_cfg.extend(split_config(mod_jvm))
+            log(f"{LOG_PREFIX} Found {mod_jvm_env} for module {module}.")
+            jvm_sources.append((mod_jvm_env, split_config(mod_jvm)))
         if not (mod_cfg or mod_jvm):
-            print(f"{LOG_PREFIX} No config envs for module {module}, skipping.")
-    print(
+            log(f"{LOG_PREFIX} No config envs for module {module}, skipping.")
+    return cfg_sources, jvm_sources
+
+
+def collect_configs(
+    modules: list[str],
+    worker: bool = False,
+    env: Mapping[str, str] | None = None,
+    log: Callable[[str], None] = print,
+) -> tuple[list[tuple], list[tuple]]:
+    """Collect config and JVM config fragments from env.
+
+    See `config_sources()`. Fragments are concatenated in merge order.
+    """
+    role = "worker" if worker else "coordinator"
+    log(f"{LOG_PREFIX} Collecting configs for role: {role}")
+    cfg_sources, jvm_sources = config_sources(modules, worker, env, log)
+    cfgs = [entry for _, entries in cfg_sources for entry in entries]
+    jvm_cfg = [entry for _, entries in jvm_sources for entry in entries]
+    log(
         f"{LOG_PREFIX} Collected {len(cfgs)} config "
         f"and {len(jvm_cfg)} JVM entries for {role}."
     )
     return cfgs, jvm_cfg
 
 
-def write_config_file(filename: str, cfgs: list[tuple]) -> None:
-    """Write config lines to a file."""
-    print(f"{LOG_PREFIX} Writing {len(cfgs)} entries to {filename}...")
+def find_conflicts(
+    sources: list[tuple[str, list[tuple]]], is_jvm: bool = False
+) -> dict[str, list[tuple[str, tuple]]]:
+    """Return properties or flags set more than once across sources.
+
+    Only one value of a repeated key is used when configs are merged,
+    so repeats are either redundant (same value) or conflicts (different
+    values). `COMBINED_PROPERTIES` are combined rather than replaced and
+    are not reported.
+
+    Parameters
+    ----------
+    sources : list[tuple[str, list[tuple]]]
+        `(env_var, entries)` pairs, as returned by `config_sources()`.
+    is_jvm : bool
+        If True, use JVM flag key extraction.
+
+    Returns
+    -------
+    dict[str, list[tuple[str, tuple]]]
+        `(env_var, entry)` settings for each repeated key, in merge
+        order.
+    """
+    key_fn = extract_jvm_flag_key if is_jvm else (lambda k: k)
+    settings: dict[str, list[tuple[str, tuple]]] = {}
+    for env_var, entries in sources:
+        for entry in entries:
+            if entry[0] != "key_value" or entry[1] in COMBINED_PROPERTIES:
+                continue
+            settings.setdefault(key_fn(entry[1]), []).append((env_var, entry))
+    return {key: found for key, found in settings.items() if len(found) > 1}
+
+
+def format_config(cfgs: list[tuple]) -> list[str]:
+    """Return the lines of a config file."""
     lines = []
     for entry in cfgs:
         if entry[0] == "key_value":
@@ -317,6 +411,13 @@ def write_config_file(filename: str, cfgs: list[tuple]) -> None:
         elif entry[0] == "unified":
             _, unified_line, _ = entry
             lines.append(unified_line)
+    return lines
+
+
+def write_config_file(filename: str, cfgs: list[tuple]) -> None:
+    """Write config lines to a file."""
+    print(f"{LOG_PREFIX} Writing {len(cfgs)} entries to {filename}...")
+    lines = format_config(cfgs)
     Path(filename).write_text("\n".join(lines) + "\n")
     preview = "\n".join(lines[:5])
     print(
@@ -325,42 +426,72 @@ def write_config_file(filename: str, cfgs: list[tuple]) -> None:
     )
 
 
-def get_modules_and_roles() -> tuple[list[str], int, bool, bool]:
+def get_modules_and_roles(
+    env: Mapping[str, str] | None = None,
+    log: Callable[[str], None] = print,
+) -> tuple[list[str], int, bool, bool]:
     """Parse modules and determine node roles from environment variables.
 
     Returns: modules, workers, is_coordinator, is_worker
     """
-    modules_env = os.environ.get("MINITRINO_MODULES", "")
+    env = os.environ if env is None else env
+    modules_env = env.get("MINITRINO_MODULES", "")
     modules = [m.strip() for m in modules_env.split(",") if m.strip()]
-    print(f"{LOG_PREFIX} MINITRINO_MODULES: {modules}")
+    log(f"{LOG_PREFIX} MINITRINO_MODULES: {modules}")
     if "minitrino" not in modules:
         modules.append("minitrino")
-        print(f"{LOG_PREFIX} Added 'minitrino' to modules list.")
-    workers = int(os.environ.get("WORKERS", "0"))
-    is_coordinator = os.environ.get("COORDINATOR", "false").lower() == "true"
-    is_worker = os.environ.get("WORKER", "false").lower() == "true"
-    print(
+        log(f"{LOG_PREFIX} Added 'minitrino' to modules list.")
+    workers = int(env.get("WORKERS") or "0")
+    is_coordinator = str(env.get("COORDINATOR", "false")).lower() == "true"
+    is_worker = str(env.get("WORKER", "false")).lower() == "true"
+    log(
         f"{LOG_PREFIX} COORDINATOR={is_coordinator}, "
         f"WORKER={is_worker}, WORKERS={workers}"
     )
     return modules, workers, is_coordinator, is_worker
 
 
-def generate_coordinator_config(modules: list[str], workers: int) -> None:
-    """Generate coordinator configs."""
-    print(f"{LOG_PREFIX} Generating coordinator configs...")
-    base_cfgs = read_existing_config(f"{ETC_DIR}/config.properties")
-    base_jvm_cfgs = read_existing_config(f"{ETC_DIR}/jvm.config")
-    user_cfgs, user_jvm_cfg = collect_configs(modules, worker=False)
+def render_coordinator_config(
+    base_cfgs: list[tuple],
+    base_jvm_cfgs: list[tuple],
+    modules: list[str],
+    workers: int,
+    env: Mapping[str, str] | None = None,
+    log: Callable[[str], None] = print,
+) -> tuple[list[tuple], list[tuple]]:
+    """Merge coordinator configs over the base files.
+
+    Parameters
+    ----------
+    base_cfgs : list[tuple]
+        Parsed entries of the base `config.properties`.
+    base_jvm_cfgs : list[tuple]
+        Parsed entries of the base `jvm.config`.
+    modules : list[str]
+        The cluster's modules.
+    workers : int
+        The number of workers.
+    env : Mapping[str, str], optional
+        The environment to render from. Defaults to `os.environ`.
+    log : Callable[[str], None], optional
+        Called with each log message. Defaults to `print`.
+
+    Returns
+    -------
+    tuple[list[tuple], list[tuple]]
+        The merged `config.properties` and `jvm.config` entries.
+    """
+    env = os.environ if env is None else env
+    user_cfgs, user_jvm_cfg = collect_configs(modules, worker=False, env=env, log=log)
     # Special-case: node-scheduler.include-coordinator
     if workers > 0:
-        user_env_cfg = os.environ.get("CONFIG_PROPERTIES", "")
+        user_env_cfg = env.get("CONFIG_PROPERTIES") or ""
         user_explicit_true = any(
             line.strip() == "node-scheduler.include-coordinator=true"
             for line in user_env_cfg.splitlines()
         )
         if not user_explicit_true:
-            print(
+            log(
                 f"{LOG_PREFIX} Setting node-scheduler.include-coordinator=false "
                 f"(workers present, not overridden by user)"
             )
@@ -374,9 +505,70 @@ def generate_coordinator_config(modules: list[str], workers: int) -> None:
             user_cfgs.append(
                 ("key_value", "node-scheduler.include-coordinator", "false")
             )
-    user_cfgs = merge_password_authenticators(user_cfgs)
-    final_cfgs = merge_configs(base_cfgs, user_cfgs)
-    final_jvm_cfgs = merge_configs(base_jvm_cfgs, user_jvm_cfg, is_jvm=True)
+    user_cfgs = merge_password_authenticators(user_cfgs, log)
+    java_version = get_java_version(env.get("CLUSTER_VER") or "")
+    final_cfgs = merge_configs(base_cfgs, user_cfgs, log=log)
+    final_jvm_cfgs = merge_configs(
+        base_jvm_cfgs,
+        user_jvm_cfg,
+        is_jvm=True,
+        java_version=java_version,
+        log=log,
+    )
+    return final_cfgs, final_jvm_cfgs
+
+
+def render_worker_config(
+    base_cfgs: list[tuple],
+    base_jvm_cfgs: list[tuple],
+    modules: list[str],
+    env: Mapping[str, str] | None = None,
+    log: Callable[[str], None] = print,
+) -> tuple[list[tuple], list[tuple]]:
+    """Merge worker configs over the base files.
+
+    Parameters
+    ----------
+    base_cfgs : list[tuple]
+        Parsed entries of the base `config.properties`, normally
+        `WORKER_CONFIG_PROPS`.
+    base_jvm_cfgs : list[tuple]
+        Parsed entries of the base `jvm.config`.
+    modules : list[str]
+        The cluster's modules.
+    env : Mapping[str, str], optional
+        The environment to render from. Defaults to `os.environ`.
+    log : Callable[[str], None], optional
+        Called with each log message. Defaults to `print`.
+
+    Returns
+    -------
+    tuple[list[tuple], list[tuple]]
+        The merged `config.properties` and `jvm.config` entries.
+    """
+    env = os.environ if env is None else env
+    user_cfgs, user_jvm_cfg = collect_configs(modules, worker=True, env=env, log=log)
+    user_cfgs = merge_password_authenticators(user_cfgs, log)
+    java_version = get_java_version(env.get("CLUSTER_VER") or "")
+    final_cfgs = merge_configs(base_cfgs, user_cfgs, log=log)
+    final_jvm_cfgs = merge_configs(
+        base_jvm_cfgs,
+        user_jvm_cfg,
+        is_jvm=True,
+        java_version=java_version,
+        log=log,
+    )
+    return final_cfgs, final_jvm_cfgs
+
+
+def generate_coordinator_config(modules: list[str], workers: int) -> None:
+    """Generate coordinator configs."""
+    print(f"{LOG_PREFIX} Generating coordinator configs...")
+    base_cfgs = read_existing_config(f"{ETC_DIR}/config.properties")
+    base_jvm_cfgs = read_existing_config(f"{ETC_DIR}/jvm.config")
+    final_cfgs, final_jvm_cfgs = render_coordinator_config(
+        base_cfgs, base_jvm_cfgs, modules, workers
+    )
     write_config_file(f"{ETC_DIR}/config.properties", final_cfgs)
     write_config_file(f"{ETC_DIR}/jvm.config", final_jvm_cfgs)
     print(f"{LOG_PREFIX} Coordinator config generation complete.")
@@ -389,10 +581,7 @@ def generate_worker_config(modules: list[str]) -> None:
         f.write(WORKER_CONFIG_PROPS)
     base_cfgs = read_existing_config(f"{ETC_DIR}/config.properties")
     base_jvm_cfgs = read_existing_config(f"{ETC_DIR}/jvm.config")
-    user_cfgs, user_jvm_cfg = collect_configs(modules, worker=True)
-    user_cfgs = merge_password_authenticators(user_cfgs)
-    final_cfgs = merge_configs(base_cfgs, user_cfgs)
-    final_jvm_cfgs = merge_configs(base_jvm_cfgs, user_jvm_cfg, is_jvm=True)
+    final_cfgs, final_jvm_cfgs = render_worker_config(base_cfgs, base_jvm_cfgs, modules)
     write_config_file(f"{ETC_DIR}/config.properties", final_cfgs)
     write_config_file(f"{ETC_DIR}/jvm.config", final_jvm_cfgs)
     print(f"{LOG_PREFIX} Worker config generation complete.")
@@ -1,31 +1,15 @@
 #!/usr/bin/env bash
 
-# Trino versions and their corresponding Java versions:
-# >= 436 <= 446: Java 21
-# >= 447 <= 463: Java 22
-# >= 464 <= 467: Java 23
-# >= 468: Java 24
+# The Java version for each cluster version is selected by the CLI (see
+# JAVA_VERSIONS in minitrino/settings.py) and passed as a build arg.
 
 set -euxo pipefail
 
 SERVICE_USER="${1}"
-CLUSTER_VER="${2}"
-
-# Extract numeric version from version string (e.g., "474-e" -> "474")
-TRINO_VER=$(echo "${CLUSTER_VER}" | sed 's/-.*//' | head -c 3)
-
-echo "Detected Trino version: ${TRINO_VER}"
-
-if [ "${TRINO_VER}" -ge 436 ] && [ "${TRINO_VER}" -le 446 ]; then
-    JAVA_VER=21.0.5
-elif [ "${TRINO_VER}" -ge 447 ] && [ "${TRINO_VER}" -le 463 ]; then
-    JAVA_VER=22.0.2
-elif [ "${TRINO_VER}" -ge 464 ] && [ "${TRINO_VER}" -le 467 ]; then
-    JAVA_VER=23.0.2
-elif [ "${TRINO_VER}" -ge 468 ]; then
-    JAVA_VER=24.0.2
-else
-    echo "Unsupported Trino version: ${TRINO_VER}. Exiting..."
+JAVA_VER="${2}"
+
+if [ -z "${JAVA_VER}" ]; then
+    echo "No Java version provided. Exiting..."
     exit 1
 fi
 
@@ -32,8 +32,11 @@ copy_scripts() {
     echo "Copying entrypoint scripts..."
     cp /tmp/run-minitrino.sh /usr/lib/"${CLUSTER_DIST}"/bin/
     cp /tmp/gen_config.py /usr/lib/"${CLUSTER_DIST}"/bin/
+    cp /tmp/trino_client.py /usr/lib/"${CLUSTER_DIST}"/bin/
+    cp /tmp/wait_ready.py /usr/lib/"${CLUSTER_DIST}"/bin/
+    cp /tmp/run_sql.py /usr/lib/"${CLUSTER_DIST}"/bin/
     cp /tmp/copy-config.sh /usr/lib/"${CLUSTER_DIST}"/bin/
-    cp /tmp/run-bootstraps.sh /usr/lib/"${CLUSTER_DIST}"/bin/
+    cp /tmp/run_bootstraps.py /usr/lib/"${CLUSTER_DIST}"/bin/
 }
 
 set_ownership_and_perms() {
@@ -4,6 +4,9 @@
 Removes unused plugins from the plugin directory of a Trino/Starburst installation,
 keeping only those in a static allowlist and any specified by KEEP_PLUGINS (env var or
 argument).
+
+The image build skips pruned plugins while extracting the tarball (see
+`downloader.py`), so this script is only needed for existing installations.
 """
 
 import argparse
@@ -11,6 +14,77 @@ import os
 import shutil
 
 LOG_PREFIX = "[prune_plugins]"
+DEFAULT_PLUGINS = (
+    "audit-log",
+    "clickhouse",
+    "delta-lake",
+    "elasticsearch",
+    "exchange-filesystem",
+    "exchange-hdfs",
+    "faker",
+    "functions-python",
+    "generic-jdbc",
+    "geospatial",
+    "group-providers",
+    "hive",
+    "iceberg",
+    "jmx",
+    "mariadb",
+    "memory",
+    "mysql",
+    "mysql-event-listener",
+    "okta-authenticator",
+    "opensearch",
+    "oracle",
+    "password-authenticators",
+    "pinot",
+    "postgresql",
+    "resource-group-managers",
+    "sep-stargate",
+    "session-property-managers",
+    "sep-sqlserver",
+    "spooling-filesystem",
+    "sqlserver",
+    "starburst-functions",
+    "starburst-hive-based-ranger",
+    "starburst-ranger",
+    "stargate-parallel",
+    "thrift",
+    "tpcds",
+    "tpch",
+    "warp-speed",
+)
+
+
+def plugins_to_keep(keep_plugins_env: str | None = None) -> set[str] | None:
+    """Return the names of the plugins to keep.
+
+    Parameters
+    ----------
+    keep_plugins_env : str or None, optional
+        Comma- or space-separated list of additional plugins to keep,
+        or "ALL" to keep all plugins (default is None).
+
+    Returns
+    -------
+    set of str or None
+        `DEFAULT_PLUGINS` plus any additional plugins, or None if all
+        plugins are kept.
+    """
+    if keep_plugins_env and keep_plugins_env.strip().upper() == "ALL":
+        print(f"{LOG_PREFIX} KEEP_PLUGINS=ALL specified; keeping all plugins.")
+        return None
+    keep = set(DEFAULT_PLUGINS)
+    if keep_plugins_env:
+        extra = [
+            p.strip()
+            for chunk in keep_plugins_env.split(",")
+            for p in chunk.split()
+            if p.strip()
+        ]
+        keep.update(extra)
+        print(f"{LOG_PREFIX} Additional plugins to keep from KEEP_PLUGINS: {extra}")
+    return keep
 
 
 def prune_plugins(cluster_dist: str, keep_plugins_env: str | None = None) -> None:
@@ -32,60 +106,9 @@ def prune_plugins(cluster_dist: str, keep_plugins_env: str | None = None) -> Non
         print(f"{LOG_PREFIX} Plugin dir {plugin_dir} does not exist; skipping prune.")
         return
 
-    # Check if ALL is specified
-    if keep_plugins_env and keep_plugins_env.strip().upper() == "ALL":
-        print(f"{LOG_PREFIX} KEEP_PLUGINS=ALL specified; keeping all plugins.")
+    keep = plugins_to_keep(keep_plugins_env)
+    if keep is None:
         return
-
-    keep = [
-        "audit-log",
-        "clickhouse",
-        "delta-lake",
-        "elasticsearch",
-        "exchange-filesystem",
-        "exchange-hdfs",
-        "faker",
-        "functions-python",
-        "generic-jdbc",
-        "geospatial",
-        "group-providers",
-        "hive",
-        "iceberg",
-        "jmx",
-        "mariadb",
-        "memory",
-        "mysql",
-        "mysql-event-listener",
-        "okta-authenticator",
-        "opensearch",
-        "oracle",
-        "password-authenticators",
-        "pinot",
-        "postgresql",
-        "resource-group-managers",
-        "sep-stargate",
-        "session-property-managers",
-        "sep-sqlserver",
-        "spooling-filesystem",
-        "sqlserver",
-        "starburst-functions",
-        "starburst-hive-based-ranger",
-        "starburst-ranger",
-        "stargate-parallel",
-        "thrift",
-        "tpcds",
-        "tpch",
-        "warp-speed",
-    ]
-    if keep_plugins_env:
-        extra = [
-            p.strip()
-            for chunk in keep_plugins_env.split(",")
-            for p in chunk.split()
-            if p.strip()
-        ]
-        keep.extend(extra)
-        print(f"{LOG_PREFIX} Additional plugins to keep from KEEP_PLUGINS: {extra}")
     for name in os.listdir(plugin_dir):
         if name not in keep:
             path = os.path.join(plugin_dir, name)
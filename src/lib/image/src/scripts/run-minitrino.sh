@@ -13,7 +13,7 @@ main() {
     mkdir /etc/"${CLUSTER_DIST}"/.minitrino || true
     python3 /usr/lib/"${CLUSTER_DIST}"/bin/gen_config.py
     /usr/lib/"${CLUSTER_DIST}"/bin/copy-config.sh
-    /usr/lib/"${CLUSTER_DIST}"/bin/run-bootstraps.sh before_start
+    python3 /usr/lib/"${CLUSTER_DIST}"/bin/run_bootstraps.py before_start
     echo "---- PRE START BOOTSTRAPS COMPLETED ----"
 
     rm -f "${pipe}"
@@ -42,7 +42,7 @@ post_start() {
         if [[ ${found_started} -eq 0 && "${line}" == *"SERVER STARTED"* ]]; then
             found_started=1
             wait_for_query_ready
-            if ! /usr/lib/"${CLUSTER_DIST}"/bin/run-bootstraps.sh after_start; then
+            if ! python3 /usr/lib/"${CLUSTER_DIST}"/bin/run_bootstraps.py after_start; then
                 echo "---- ERROR: Post-start bootstraps failed. ----"
                 exit 1
             else
@@ -73,20 +73,15 @@ wait_for_query_ready() {
     fi
 
     local retries="${STARTUP_SELECT_RETRIES:-30}"
-    local elapsed=0
 
     echo "Waiting for cluster to accept queries..."
-    while [ "${elapsed}" -lt "${retries}" ]; do
-        if timeout 2 trino-cli --user admin --execute "SELECT 1"; then
-            echo "---- CLUSTER IS READY ----"
-            sleep 3 # Let plugins fully initialize
-            return 0
-        fi
-        sleep 1
-        elapsed=$((elapsed + 1))
-    done
-    echo "---- ERROR: Cluster could not accept queries after ${retries} retries. ----"
-    exit 1
+    # Each retry of the former trino-cli loop took up to 3 seconds
+    if ! python3 /usr/lib/"${CLUSTER_DIST}"/bin/wait_ready.py \
+        --timeout "$((retries * 3))" --since "${launch_time}"; then
+        echo "---- ERROR: Cluster could not accept queries after ${retries} retries. ----"
+        exit 1
+    fi
+    echo "---- CLUSTER IS READY ----"
 }
 
 start_service() {
@@ -98,6 +93,7 @@ start_service() {
     if ! grep -s -q 'node.id' "/etc/${CLUSTER_DIST}/node.properties"; then
         launcher_opts+=("-Dnode.id=${HOSTNAME}")
     fi
+    launch_time="$(date +%s.%N)"
     # Start the service with tee to /tmp/.server.log for early log capture
     gosu "${SERVICE_USER}" \
         "/usr/lib/${CLUSTER_DIST}/bin/launcher" \
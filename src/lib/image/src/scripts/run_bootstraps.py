@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+"""Run module bootstrap hooks.
+
+Every `*.sh` script in `/mnt/bootstrap` and its module subdirectories is
+sourced in its own shell and its `before_start` or `after_start` function
+is called. Hooks run in parallel, subject to ordering and shared-resource
+constraints declared in the script header:
+
+    # bootstrap: before=* uses=catalogs
+    # bootstrap: after=tls
+
+- `after=<module>[,...]` runs the hook after every hook of the named
+  modules.
+- `before=<module>[,...]` runs the hook before every hook of the named
+  modules. `before=*` runs it before all other modules.
+- `uses=<resource>[,...]` names shared files the hook modifies. Hooks that
+  share a resource never run at the same time. `uses=none` declares that
+  the hook modifies nothing shared. Hooks without `uses` run alone.
+
+Scripts in the same module directory run one after another in filename
+order. In `after_start`, `.sql` files in `/mnt/bootstrap` are then run on
+the coordinator with `run_sql.py`. Finally, ownership and permissions are
+fixed for any path under `/etc/${CLUSTER_DIST}` that needs it.
+
+Completed hooks and SQL files are recorded in
+`/etc/${CLUSTER_DIST}/.minitrino/bootstrap_checksums.json` with a digest
+of the file and the container's environment. When the container restarts,
+work whose digest is unchanged is skipped. `--rebootstrap` runs everything
+again.
+
+Usage: run_bootstraps.py [--rebootstrap] [before_start|after_start]
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import pwd
+import stat
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+LOG_PREFIX = "[run_bootstraps]"
+BOOTSTRAP_DIR = "/mnt/bootstrap"
+DEFAULT_PARALLELISM = 4
+DIRECTIVE = "# bootstrap:"
+DIRECTIVE_KEYS = ("after", "before", "uses")
+HOOKS = ("before_start", "after_start")
+MARKER_FILE = "bootstrap_checksums.json"
+# Set by the shell rather than the container, so they vary between starts
+VOLATILE_ENV = ("_", "OLDPWD", "PWD", "SHLVL")
+# Sources the script in $0 and calls the function in $1 if it is defined
+HOOK_RUNNER = (
+    'set -euxo pipefail; source "$0"; if declare -f "$1" > /dev/null; then "$1"; fi'
+)
+
+
+class BootstrapError(Exception):
+    """Raised when bootstrap hooks cannot be scheduled or a hook fails."""
+
+
+class Hook:
+    """A bootstrap script and its scheduling constraints.
+
+    Parameters
+    ----------
+    path : str
+        The script.
+    name : str
+        The script's path relative to the bootstrap directory.
+
+    Attributes
+    ----------
+    module : str
+        The module the script belongs to: its directory name, or its
+        filename without `.sh` for scripts at the top level.
+    after : set of str
+        Modules whose hooks must finish before this hook starts.
+    before : set of str
+        Modules whose hooks must not start until this hook finishes.
+    uses : set of str or None
+        Shared resources the hook modifies, or None if the hook must run
+        alone.
+
+    Raises
+    ------
+    BootstrapError
+        If the script's header has an unknown directive.
+    """
+
+    def __init__(self, path: str, name: str) -> None:
+        self.path = path
+        self.name = name
+        self.module = name.split("/")[0].removesuffix(".sh")
+        directives = parse_directives(path)
+        self.after = set(directives.get("after", []))
+        self.before = set(directives.get("before", []))
+        uses = directives.get("uses")
+        self.uses = None if uses is None else set(uses) - {"none"}
+
+    def __repr__(self) -> str:
+        """Return the hook's name for debugging."""
+        return f"Hook({self.name!r})"
+
+
+class Markers:
+    """Completion markers for bootstrap work.
+
+    Each completed hook or SQL file is recorded under a key with the
+    digest of its inputs (see `input_digest()`). Markers are written as
+    each piece of work completes, so a failed bootstrap keeps the
+    progress made before the failure.
+
+    Parameters
+    ----------
+    path : str
+        The JSON file markers are stored in.
+
+    Methods
+    -------
+    done(key, digest)
+        Returns True if `key` completed with the same digest.
+    record(key, digest)
+        Records that `key` completed.
+    clear()
+        Forgets all markers, so that all work runs again.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        try:
+            with open(path) as f:
+                self.digests: dict[str, str] = json.load(f)
+        except (OSError, ValueError):
+            self.digests = {}
+
+    def done(self, key: str, digest: str) -> bool:
+        """Return True if `key` completed with the same digest."""
+        return self.digests.get(key) == digest
+
+    def record(self, key: str, digest: str) -> None:
+        """Record that `key` completed and write the marker file."""
+        self.digests[key] = digest
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.digests, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """Forget all markers."""
+        self.digests = {}
+
+
+def input_digest(path: str, func: str = "") -> str:
+    """Return a digest of a bootstrap file and the environment it runs in.
+
+    Parameters
+    ----------
+    path : str
+        The script or SQL file.
+    func : str, optional
+        The hook function, for scripts.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest of the file, `func`, and the environment,
+        excluding `VOLATILE_ENV`.
+    """
+    hashobj = hashlib.sha256()
+    with open(path, "rb") as f:
+        hashobj.update(f.read())
+    env = {k: v for k, v in os.environ.items() if k not in VOLATILE_ENV}
+    hashobj.update(json.dumps([func, env], sort_keys=True).encode())
+    return hashobj.hexdigest()
+
+
+def parse_directives(path: str) -> dict[str, list[str]]:
+    """Return the `# bootstrap:` directives in a script's header.
+
+    The header is the script's leading run of comment and blank lines.
+
+    Parameters
+    ----------
+    path : str
+        The script.
+
+    Returns
+    -------
+    dict
+        Values for each directive key found, e.g. `{"before": ["*"]}`.
+
+    Raises
+    ------
+    BootstrapError
+        If a directive is malformed or has an unknown key.
+    """
+    directives: dict[str, list[str]] = {}
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                break
+            if not line.startswith(DIRECTIVE):
+                continue
+            for token in line[len(DIRECTIVE) :].split():
+                key, sep, value = token.partition("=")
+                if not sep or key not in DIRECTIVE_KEYS:
+                    raise BootstrapError(
+                        f"Invalid bootstrap directive '{token}' in {path}. "
+                        f"Expected one of: {', '.join(DIRECTIVE_KEYS)}"
+                    )
+                values = directives.setdefault(key, [])
+                values.extend(v for v in value.split(",") if v)
+    return directives
+
+
+def discover_hooks(bootstrap_dir: str = BOOTSTRAP_DIR) -> list[Hook]:
+    """Return the bootstrap scripts in a bootstrap directory.
+
+    Parameters
+    ----------
+    bootstrap_dir : str, optional
+        The directory modules mount their bootstrap scripts into.
+        Defaults to `BOOTSTRAP_DIR`.
+
+    Returns
+    -------
+    list of Hook
+        Top-level scripts followed by module scripts, in filename order.
+    """
+    paths = sorted(glob.glob(os.path.join(bootstrap_dir, "*.sh")))
+    paths += sorted(glob.glob(os.path.join(bootstrap_dir, "*", "*.sh")))
+    return [Hook(path, os.path.relpath(path, bootstrap_dir)) for path in paths]
+
+
+def resolve_order(hooks: list[Hook]) -> dict[Hook, set[Hook]]:
+    """Return the hooks each hook must wait for.
+
+    Parameters
+    ----------
+    hooks : list of Hook
+        The hooks to run.
+
+    Returns
+    -------
+    dict
+        The prerequisite hooks of each hook.
+
+    Raises
+    ------
+    BootstrapError
+        If the ordering constraints form a cycle.
+    """
+    modules: dict[str, list[Hook]] = {}
+    for hook in hooks:
+        modules.setdefault(hook.module, []).append(hook)
+    deps: dict[Hook, set[Hook]] = {hook: set() for hook in hooks}
+    for module_hooks in modules.values():
+        for prev, hook in zip(module_hooks, module_hooks[1:], strict=False):
+            deps[hook].add(prev)
+    for hook in hooks:
+        for module in hook.after:
+            deps[hook].update(modules.get(module, []))
+        for other in hooks:
+            if other.module == hook.module:
+                continue
+            if other.module in hook.before or (
+                "*" in hook.before and "*" not in other.before
+            ):
+                deps[other].add(hook)
+
+    # Kahn's algorithm: whatever cannot be ordered is part of a cycle
+    remaining = {hook: set(d) for hook, d in deps.items()}
+    while True:
+        ready = [hook for hook, d in remaining.items() if not d]
+        if not ready:
+            break
+        for hook in ready:
+            del remaining[hook]
+        for d in remaining.values():
+            d.difference_update(ready)
+    if remaining:
+        names = ", ".join(sorted(hook.name for hook in remaining))
+        raise BootstrapError(f"Bootstrap ordering constraints form a cycle: {names}")
+    return deps
+
+
+def run_hook(hook: Hook, func: str) -> float:
+    """Run one hook function and prefix its output with the hook's name.
+
+    Parameters
+    ----------
+    hook : Hook
+        The hook.
+    func : str
+        `before_start` or `after_start`.
+
+    Returns
+    -------
+    float
+        Seconds the hook took.
+
+    Raises
+    ------
+    BootstrapError
+        If the hook exits non-zero.
+    """
+    start = time.monotonic()
+    proc = subprocess.Popen(
+        ["bash", "-c", HOOK_RUNNER, hook.path, func],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+    )
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        print(f"[{hook.name}] {line.rstrip()}", flush=True)
+    returncode = proc.wait()
+    elapsed = time.monotonic() - start
+    if returncode:
+        raise BootstrapError(
+            f"{hook.name} {func} failed with exit code {returncode} "
+            f"after {elapsed:.1f}s"
+        )
+    print(f"{LOG_PREFIX} {hook.name} {func} finished in {elapsed:.1f}s", flush=True)
+    return elapsed
+
+
+def run_hooks(
+    hooks: list[Hook],
+    func: str,
+    parallel: int = DEFAULT_PARALLELISM,
+    on_success: Callable[[Hook], None] | None = None,
+) -> None:
+    """Run hooks in parallel, respecting their constraints.
+
+    Parameters
+    ----------
+    hooks : list of Hook
+        The hooks to run.
+    func : str
+        `before_start` or `after_start`.
+    parallel : int, optional
+        Maximum number of hooks to run at once. Defaults to
+        `DEFAULT_PARALLELISM`.
+    on_success : callable, optional
+        Called with each hook that succeeds, as it finishes.
+
+    Raises
+    ------
+    BootstrapError
+        If the hooks cannot be ordered or a hook fails. Hooks that have
+        not started when a hook fails are skipped; running hooks are
+        allowed to finish.
+    """
+    deps = resolve_order(hooks)
+    pending = list(hooks)
+    running: dict[Future, Hook] = {}
+    done: set[Hook] = set()
+    held: set[str] = set()
+    errors: list[BaseException] = []
+
+    def can_start(hook: Hook) -> bool:
+        if not deps[hook] <= done:
+            return False
+        if hook.uses is None:
+            return not running
+        exclusive = any(h.uses is None for h in running.values())
+        return not exclusive and not hook.uses & held
+
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+        while True:
+            for hook in list(pending):
+                if errors or len(running) >= max(1, parallel):
+                    break
+                if can_start(hook):
+                    pending.remove(hook)
+                    held.update(hook.uses or ())
+                    running[executor.submit(run_hook, hook, func)] = hook
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                hook = running.pop(future)
+                held.difference_update(hook.uses or ())
+                done.add(hook)
+                exc = future.exception()
+                if exc is not None:
+                    errors.append(exc)
+                elif on_success is not None:
+                    on_success(hook)
+    if errors:
+        raise errors[0]
+
+
+def fix_permissions(root: str, uid: int, gid: int = 0) -> int:
+    """Give the service user ownership of a directory tree.
+
+    Equivalent to `chown -R <uid>:<gid>` and `chmod -R g=u`, except that
+    only paths whose ownership or mode differ are changed.
+
+    Parameters
+    ----------
+    root : str
+        The directory.
+    uid : int
+        The owner's user ID.
+    gid : int, optional
+        The owner's group ID. Defaults to 0 (root).
+
+    Returns
+    -------
+    int
+        Number of paths changed.
+    """
+    changed = 0
+    paths = [root]
+    for dirpath, dirnames, filenames in os.walk(root):
+        paths.extend(os.path.join(dirpath, name) for name in dirnames + filenames)
+    for path in paths:
+        st = os.lstat(path)
+        fixed = False
+        if (st.st_uid, st.st_gid) != (uid, gid):
+            os.lchown(path, uid, gid)
+            fixed = True
+        if not stat.S_ISLNK(st.st_mode):
+            mode = stat.S_IMODE(os.lstat(path).st_mode if fixed else st.st_mode)
+            group_eq_user = (mode & ~stat.S_IRWXG) | ((mode & stat.S_IRWXU) >> 3)
+            if group_eq_user != mode:
+                os.chmod(path, group_eq_user)
+                fixed = True
+        changed += fixed
+    return changed
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run bootstrap hooks.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command-line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns
+    -------
+    int
+        0 if every hook succeeded, 1 otherwise.
+    """
+    etc_dir = f"/etc/{os.environ.get('CLUSTER_DIST', 'trino')}"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("func", nargs="?", choices=HOOKS, default="before_start")
+    parser.add_argument("--bootstrap-dir", default=BOOTSTRAP_DIR)
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLELISM,
+        help="Maximum number of hooks to run at once (default: 4)",
+    )
+    parser.add_argument(
+        "--marker-file",
+        default=os.path.join(etc_dir, ".minitrino", MARKER_FILE),
+        help="Where completed work is recorded",
+    )
+    parser.add_argument(
+        "--rebootstrap",
+        action="store_true",
+        help="Run hooks and SQL files even if they already completed",
+    )
+    args = parser.parse_args(argv)
+
+    markers = Markers(args.marker_file)
+    if args.rebootstrap:
+        markers.clear()
+
+    start = time.monotonic()
+    try:
+        hooks = discover_hooks(args.bootstrap_dir)
+        digests = {hook: input_digest(hook.path, args.func) for hook in hooks}
+        todo = []
+        for hook in hooks:
+            if markers.done(f"{hook.name}:{args.func}", digests[hook]):
+                print(f"{LOG_PREFIX} {hook.name} {args.func} already completed")
+            else:
+                todo.append(hook)
+        run_hooks(
+            todo,
+            args.func,
+            args.parallel,
+            lambda hook: markers.record(f"{hook.name}:{args.func}", digests[hook]),
+        )
+    except BootstrapError as e:
+        print(f"{LOG_PREFIX} {e}")
+        return 1
+    print(
+        f"{LOG_PREFIX} Ran {len(todo)} {args.func} hook(s) in "
+        f"{time.monotonic() - start:.1f}s ({len(hooks) - len(todo)} skipped)"
+    )
+
+    # SQL bootstraps run after the .sh hooks, on the coordinator only
+    if args.func == "after_start" and os.environ.get("COORDINATOR") == "true":
+        paths = sorted(glob.glob(os.path.join(args.bootstrap_dir, "*.sql")))
+        paths += sorted(glob.glob(os.path.join(args.bootstrap_dir, "*", "*.sql")))
+        sql_files = {os.path.relpath(p, args.bootstrap_dir): p for p in paths}
+        sql_digests = {key: input_digest(path) for key, path in sql_files.items()}
+        todo_sql = []
+        for key in sql_files:
+            if markers.done(key, sql_digests[key]):
+                print(f"{LOG_PREFIX} {key} already completed")
+            else:
+                todo_sql.append(key)
+        if todo_sql:
+            import run_sql
+
+            keys = {sql_files[key]: key for key in todo_sql}
+            if run_sql.main(
+                list(keys),
+                on_success=lambda path: markers.record(
+                    keys[path], sql_digests[keys[path]]
+                ),
+            ):
+                return 1
+
+    service_user = os.environ.get("SERVICE_USER")
+    if service_user:
+        changed = fix_permissions(etc_dir, pwd.getpwnam(service_user).pw_uid)
+        print(f"{LOG_PREFIX} Fixed ownership or mode of {changed} path(s) in {etc_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
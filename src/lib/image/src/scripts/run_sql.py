@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Run bootstrap SQL files against the local coordinator.
+
+Each file's statements run in order in a single Trino session over HTTP,
+so `USE` and `SET SESSION` apply to the statements that follow. Separate
+files are independent and run concurrently. The first failing statement
+stops all files and is reported with its file and line number.
+
+Usage: run_sql.py [--parallel N] FILE.sql [FILE.sql ...]
+"""
+
+import argparse
+import sys
+import threading
+import time
+import urllib.error
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from trino_client import DEFAULT_SERVER, DEFAULT_USER, TrinoClient, TrinoError
+
+LOG_PREFIX = "[run_sql]"
+DEFAULT_PARALLELISM = 4
+
+
+class StatementError(Exception):
+    """Raised when a bootstrap statement fails.
+
+    Parameters
+    ----------
+    path : str
+        The SQL file.
+    line : int
+        The statement's first line in the file.
+    statement : str
+        The failing statement.
+    error : Exception
+        The underlying error.
+    """
+
+    def __init__(self, path: str, line: int, statement: str, error: Exception):
+        super().__init__(f"{path}:{line}: {error}")
+        self.path = path
+        self.line = line
+        self.statement = statement
+
+
+def split_statements(sql: str) -> list[tuple[int, str]]:
+    """Split SQL text into statements.
+
+    Statements are separated by semicolons outside of quoted strings,
+    quoted identifiers, and comments. Statements that contain only
+    comments are dropped.
+
+    Parameters
+    ----------
+    sql : str
+        The SQL text.
+
+    Returns
+    -------
+    list of tuple
+        (line, statement) for each statement, where `line` is the
+        1-based line the statement starts on.
+    """
+    statements = []
+    start, i, n = 0, 0, len(sql)
+    has_code = False
+    while i < n:
+        c = sql[i]
+        if c in "'\"":
+            # Quotes are escaped by doubling, which this loop skips over
+            end = sql.find(c, i + 1)
+            i = n if end < 0 else end + 1
+            has_code = True
+            continue
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = n if end < 0 else end + 1
+            continue
+        if sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            i = n if end < 0 else end + 2
+            continue
+        if c == ";":
+            if has_code:
+                statements.append(_statement(sql, start, i))
+            start, has_code = i + 1, False
+        elif not c.isspace():
+            has_code = True
+        i += 1
+    if has_code:
+        statements.append(_statement(sql, start, n))
+    return statements
+
+
+def _statement(sql: str, start: int, end: int) -> tuple[int, str]:
+    """Return the starting line and stripped text of a statement."""
+    text = sql[start:end]
+    leading = len(text) - len(text.lstrip())
+    line = sql.count("\n", 0, start + leading) + 1
+    return line, text.strip()
+
+
+def run_file(
+    path: str, server: str, user: str, failed: threading.Event | None = None
+) -> int | None:
+    """Run a SQL file's statements in order in one session.
+
+    Parameters
+    ----------
+    path : str
+        The SQL file.
+    server : str
+        The coordinator's base URL.
+    user : str
+        The user to run statements as.
+    failed : threading.Event, optional
+        Set when any file fails. Remaining statements are skipped once
+        it is set.
+
+    Returns
+    -------
+    int or None
+        Number of statements run, or None if the file was stopped
+        because another file failed.
+
+    Raises
+    ------
+    StatementError
+        If a statement fails.
+    """
+    with open(path) as f:
+        statements = split_statements(f.read())
+    client = TrinoClient(server, user, source="minitrino-bootstrap")
+    for line, statement in statements:
+        if failed is not None and failed.is_set():
+            return None
+        try:
+            client.execute(statement)
+        except (TrinoError, urllib.error.URLError, OSError, ValueError) as e:
+            if failed is not None:
+                failed.set()
+            raise StatementError(path, line, statement, e) from e
+    return len(statements)
+
+
+def run_files(
+    paths: list[str],
+    server: str = DEFAULT_SERVER,
+    user: str = DEFAULT_USER,
+    parallel: int = DEFAULT_PARALLELISM,
+    on_success: Callable[[str], None] | None = None,
+) -> None:
+    """Run SQL files concurrently.
+
+    Parameters
+    ----------
+    paths : list of str
+        The SQL files.
+    server : str, optional
+        The coordinator's base URL. Defaults to `DEFAULT_SERVER`.
+    user : str, optional
+        The user to run statements as. Defaults to `DEFAULT_USER`.
+    parallel : int, optional
+        Maximum number of files to run at once. Defaults to
+        `DEFAULT_PARALLELISM`.
+    on_success : callable, optional
+        Called with each file's path when all of its statements have
+        run, from the calling thread. Files that complete before another
+        file fails are still reported.
+
+    Raises
+    ------
+    StatementError
+        If a statement fails. Files that have not started are skipped
+        and running files stop before their next statement.
+    """
+    failed = threading.Event()
+
+    def run(path: str) -> bool:
+        start = time.monotonic()
+        count = run_file(path, server, user, failed)
+        if count is None:
+            return False
+        elapsed = time.monotonic() - start
+        print(f"{LOG_PREFIX} {path}: {count} statement(s) in {elapsed:.1f}s")
+        return True
+
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+        futures = {executor.submit(run, path): path for path in paths}
+        for future in as_completed(futures):
+            if not future.exception() and future.result() and on_success:
+                on_success(futures[future])
+    for future in futures:
+        exc = future.exception()
+        if exc is not None:
+            raise exc
+
+
+def main(
+    argv: list[str] | None = None, on_success: Callable[[str], None] | None = None
+) -> int:
+    """Run bootstrap SQL files.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command-line arguments. Defaults to `sys.argv[1:]`.
+    on_success : callable, optional
+        Called with each file's path when all of its statements have
+        run. See `run_files()`.
+
+    Returns
+    -------
+    int
+        0 if every statement succeeded, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="+", help="SQL files to run")
+    parser.add_argument("--server", default=DEFAULT_SERVER)
+    parser.add_argument("--user", default=DEFAULT_USER)
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLELISM,
+        help="Maximum number of files to run at once (default: 4)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        run_files(args.files, args.server, args.user, args.parallel, on_success)
+    except StatementError as e:
+        print(f"{LOG_PREFIX} Statement failed at {e}")
+        print(f"{LOG_PREFIX} Failing statement:\n{e.statement}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Minimal Trino HTTP client for cluster containers.
+
+Speaks the Trino client REST protocol (`/v1/info` and `/v1/statement`)
+with the standard library, so startup scripts can check readiness and
+run SQL without launching a `trino-cli` JVM for every statement.
+"""
+
+import json
+import time
+import urllib.error
+import urllib.request
+
+DEFAULT_SERVER = "http://localhost:8080"
+DEFAULT_USER = "admin"
+REQUEST_TIMEOUT = 30
+# Trino asks clients to retry these while a query is in progress
+RETRY_STATUS_CODES = (502, 503, 504)
+PAGE_RETRIES = 10
+
+
+class TrinoError(Exception):
+    """Raised when Trino fails a statement or returns an error.
+
+    Parameters
+    ----------
+    message : str
+        The error message.
+    error_name : str, optional
+        Trino's error name, e.g. "SCHEMA_ALREADY_EXISTS".
+    """
+
+    def __init__(self, message: str, error_name: str = "") -> None:
+        super().__init__(message)
+        self.error_name = error_name
+
+
+class TrinoClient:
+    """Run statements against a Trino coordinator over HTTP.
+
+    The client holds one Trino session: catalog, schema, and session
+    property changes made by a statement (e.g. `USE` or `SET SESSION`)
+    apply to the statements that follow it. Use one client per thread.
+
+    Parameters
+    ----------
+    server : str, optional
+        The coordinator's base URL. Defaults to `DEFAULT_SERVER`.
+    user : str, optional
+        The user to run statements as. Defaults to `DEFAULT_USER`.
+    source : str, optional
+        The `X-Trino-Source` reported to Trino.
+
+    Methods
+    -------
+    info()
+        Returns the coordinator's `/v1/info` response.
+    execute(sql)
+        Runs a statement and returns its rows.
+    """
+
+    def __init__(
+        self,
+        server: str = DEFAULT_SERVER,
+        user: str = DEFAULT_USER,
+        source: str = "minitrino",
+    ) -> None:
+        self.server = server.rstrip("/")
+        self.user = user
+        self.source = source
+        self.catalog = ""
+        self.schema = ""
+        self.session: dict[str, str] = {}
+
+    def info(self) -> dict:
+        """Return the coordinator's `/v1/info` response.
+
+        Returns
+        -------
+        dict
+            Server info, including `starting`.
+        """
+        return self._request(urllib.request.Request(f"{self.server}/v1/info"))
+
+    def execute(self, sql: str) -> list[list]:
+        """Run a statement and return its rows.
+
+        Parameters
+        ----------
+        sql : str
+            The statement, without a trailing semicolon.
+
+        Returns
+        -------
+        list of list
+            The statement's rows.
+
+        Raises
+        ------
+        TrinoError
+            If the statement fails.
+        """
+        request = urllib.request.Request(
+            f"{self.server}/v1/statement",
+            data=sql.encode(),
+            headers=self._headers(),
+            method="POST",
+        )
+        result = self._request(request)
+        rows: list[list] = []
+        while True:
+            error = result.get("error")
+            if error:
+                raise TrinoError(
+                    error.get("message", "Query failed"), error.get("errorName", "")
+                )
+            rows.extend(result.get("data") or [])
+            next_uri = result.get("nextUri")
+            if not next_uri:
+                return rows
+            result = self._request(
+                urllib.request.Request(next_uri, headers=self._headers())
+            )
+
+    def _headers(self) -> dict:
+        """Return the client protocol headers for the current session."""
+        headers = {"X-Trino-User": self.user, "X-Trino-Source": self.source}
+        if self.catalog:
+            headers["X-Trino-Catalog"] = self.catalog
+        if self.schema:
+            headers["X-Trino-Schema"] = self.schema
+        if self.session:
+            headers["X-Trino-Session"] = ",".join(
+                f"{k}={v}" for k, v in self.session.items()
+            )
+        return headers
+
+    def _update_session(self, headers) -> None:
+        """Apply session changes returned by Trino."""
+        self.catalog = headers.get("X-Trino-Set-Catalog", self.catalog)
+        self.schema = headers.get("X-Trino-Set-Schema", self.schema)
+        for prop in headers.get_all("X-Trino-Set-Session") or []:
+            name, _, value = prop.partition("=")
+            self.session[name.strip()] = value.strip()
+        for name in headers.get_all("X-Trino-Clear-Session") or []:
+            self.session.pop(name.strip(), None)
+
+    def _request(self, request: urllib.request.Request) -> dict:
+        """Send a request and return its JSON response.
+
+        GET requests are retried up to `PAGE_RETRIES` times while Trino
+        responds with `RETRY_STATUS_CODES`.
+        """
+        delay, attempts = 0.05, 0
+        while True:
+            try:
+                with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as resp:
+                    self._update_session(resp.headers)
+                    return json.load(resp)
+            except urllib.error.HTTPError as e:
+                attempts += 1
+                if (
+                    request.get_method() != "GET"
+                    or e.code not in RETRY_STATUS_CODES
+                    or attempts > PAGE_RETRIES
+                ):
+                    body = e.read().decode(errors="replace").strip()
+                    raise TrinoError(
+                        f"HTTP {e.code} from {request.full_url}: {body}"
+                    ) from e
+            time.sleep(delay)
+            delay = min(delay * 2, 1)
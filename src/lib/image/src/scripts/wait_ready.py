@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Wait for a Trino coordinator to be ready for queries.
+
+Polls the coordinator over HTTP with exponential backoff until it has
+finished starting and runs a query, then reports the time it took. Exits
+non-zero if the coordinator is not ready before the timeout.
+
+The probe does not depend on which catalogs the user can see, since
+access control (e.g. BIAC) may hide catalogs until the `after_start`
+bootstraps have run.
+"""
+
+import argparse
+import sys
+import time
+import urllib.error
+
+from trino_client import DEFAULT_SERVER, DEFAULT_USER, TrinoClient, TrinoError
+
+LOG_PREFIX = "[wait_ready]"
+PROBE_SQL = "SELECT 1"
+INITIAL_DELAY = 0.1
+MAX_DELAY = 2.0
+
+
+def check_ready(client: TrinoClient) -> str:
+    """Return why the coordinator is not ready yet.
+
+    Parameters
+    ----------
+    client : TrinoClient
+        Client for the coordinator.
+
+    Returns
+    -------
+    str
+        The reason the coordinator is not ready, or an empty string if
+        it is.
+    """
+    try:
+        if client.info().get("starting", True):
+            return "coordinator is starting"
+        client.execute(PROBE_SQL)
+    except (urllib.error.URLError, OSError, ValueError, TrinoError) as e:
+        return str(e)
+    return ""
+
+
+def wait_ready(client: TrinoClient, timeout: float) -> None:
+    """Poll the coordinator until it is ready.
+
+    Parameters
+    ----------
+    client : TrinoClient
+        Client for the coordinator.
+    timeout : float
+        Seconds to wait before giving up.
+
+    Raises
+    ------
+    TimeoutError
+        If the coordinator is not ready within `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    delay = INITIAL_DELAY
+    while True:
+        reason = check_ready(client)
+        if not reason:
+            return
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(f"Not ready after {timeout:g}s: {reason}")
+        time.sleep(delay)
+        delay = min(delay * 2, MAX_DELAY)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the readiness probe.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command-line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns
+    -------
+    int
+        0 if the coordinator is ready, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--server", default=DEFAULT_SERVER)
+    parser.add_argument("--user", default=DEFAULT_USER)
+    parser.add_argument(
+        "--timeout", type=float, default=90, help="Seconds to wait (default: 90)"
+    )
+    parser.add_argument(
+        "--since",
+        type=float,
+        default=None,
+        help="Epoch time the server was launched, to report time-to-ready",
+    )
+    args = parser.parse_args(argv)
+
+    client = TrinoClient(args.server, args.user, source="minitrino-wait-ready")
+    start = time.time()
+    try:
+        wait_ready(client, args.timeout)
+    except TimeoutError as e:
+        print(f"{LOG_PREFIX} {e}")
+        return 1
+    now = time.time()
+    status = f"Ready for queries in {now - start:.1f}s"
+    if args.since:
+        status += f" ({now - args.since:.1f}s after launch)"
+    print(f"{LOG_PREFIX} {status}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
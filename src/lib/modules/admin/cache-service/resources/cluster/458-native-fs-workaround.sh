@@ -1,5 +1,7 @@
 #!/usr/bin/env bash
 
+# bootstrap: uses=catalogs
+
 # A breaking filesystem change was introduced in release 458. This script can be
 # removed once 458 is outside the bounds of support.
 # https://docs.starburst.io/458-e/object-storage/file-system-s3.html
@@ -0,0 +1,18 @@
+-- Hive cache schema (for table scan redirections)
+CREATE SCHEMA IF NOT EXISTS hive_mv_tsr.cache WITH (LOCATION = 's3a://minitrino/cache/');
+
+-- Materialized view schemas
+CREATE SCHEMA IF NOT EXISTS hive_mv_tsr.mv_storage WITH (LOCATION = 's3a://minitrino/mv/mv_storage/');
+CREATE SCHEMA IF NOT EXISTS hive_mv_tsr.mvs WITH (LOCATION = 's3a://minitrino/mv/mvs/');
+
+CREATE OR REPLACE MATERIALIZED VIEW hive_mv_tsr.mvs.example
+WITH (
+  partitioned_by = ARRAY['orderdate'],
+  max_import_duration = '1m',
+  refresh_interval = '5m',
+  grace_period = '10m'
+)
+AS
+(SELECT orderkey, orderdate FROM tpch.tiny.orders LIMIT 500)
+UNION ALL
+(SELECT orderkey, orderdate FROM tpch.tiny.orders LIMIT 500);
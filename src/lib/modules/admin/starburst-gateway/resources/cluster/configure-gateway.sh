@@ -1,5 +1,7 @@
 #!/usr/bin/env bash
 
+# bootstrap: uses=none
+
 before_start() {
     :
 }
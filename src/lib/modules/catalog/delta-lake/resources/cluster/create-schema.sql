@@ -0,0 +1,2 @@
+CREATE SCHEMA IF NOT EXISTS delta.minitrino
+WITH (location = 's3a://minitrino/minitrino_delta_lake/minitrino/');
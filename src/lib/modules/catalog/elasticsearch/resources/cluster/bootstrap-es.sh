@@ -1,5 +1,7 @@
 #!/usr/bin/env bash
 
+# bootstrap: uses=none
+
 set -euxo pipefail
 
 PYTHON_SCRIPT='import json
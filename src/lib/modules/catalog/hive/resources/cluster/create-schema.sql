@@ -0,0 +1,2 @@
+CREATE SCHEMA IF NOT EXISTS hive.minitrino
+WITH (location = 's3a://minitrino/minitrino_hive/minitrino/');
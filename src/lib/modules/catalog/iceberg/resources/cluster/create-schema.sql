@@ -0,0 +1,2 @@
+CREATE SCHEMA IF NOT EXISTS iceberg.minitrino
+WITH (location = 's3a://minitrino/minitrino_iceberg/minitrino/');
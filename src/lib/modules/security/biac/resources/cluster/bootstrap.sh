@@ -1,6 +1,7 @@
 #!/usr/bin/env bash
 
-## Filename prefixed with 00 to ensure this runs first
+# Security properties are appended to catalogs before other modules edit them
+# bootstrap: before=* uses=catalogs
 
 set -euxo pipefail
 
@@ -1,5 +1,7 @@
 #!/usr/bin/env bash
 
+# bootstrap: uses=cacerts,log-properties
+
 set -euxo pipefail
 
 fetch_oauth_cert() {
@@ -1,5 +1,7 @@
 #!/usr/bin/env bash
 
+# bootstrap: uses=none
+
 set -euxo pipefail
 
 before_start() {
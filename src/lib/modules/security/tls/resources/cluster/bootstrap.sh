@@ -1,5 +1,7 @@
 #!/usr/bin/env bash
 
+# bootstrap: uses=cacerts
+
 set -euxo pipefail
 
 before_start() {
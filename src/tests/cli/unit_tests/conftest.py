@@ -2,7 +2,31 @@
 
 This file makes fixtures from fixtures.py available to all unit tests without needing
 explicit imports.
+
+Tests marked `benchmark` compare wall-clock timings, which vary with
+host load, and are skipped unless `MINITRINO_BENCHMARK` is set.
 """
 
+import os
+
+import pytest
+
 # Import all fixtures to make them available to tests
 from tests.cli.unit_tests.fixtures import *  # noqa: F401, F403
+
+
+def pytest_configure(config):
+    """Register the `benchmark` marker."""
+    config.addinivalue_line(
+        "markers", "benchmark: timing test, run with MINITRINO_BENCHMARK=1"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless `MINITRINO_BENCHMARK` is set."""
+    if os.environ.get("MINITRINO_BENCHMARK"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; set MINITRINO_BENCHMARK=1 to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,79 @@
+"""Unit tests for the host artifact cache.
+
+Tests the ArtifactCache class's cache layout, download verification,
+and reuse of cached tarballs.
+"""
+
+import hashlib
+import os
+from unittest.mock import Mock
+
+import pytest
+from minitrino.core.cluster.artifacts import ArtifactCache
+from minitrino.core.errors import MinitrinoError
+
+LIB_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../lib"))
+TARBALL = b"server tarball"
+
+
+class TestArtifactCache:
+    """Test suite for ArtifactCache."""
+
+    def create_cache(self, tmp_path, error=None):
+        """Create an ArtifactCache with a stubbed download."""
+        mock_ctx = Mock()
+        mock_ctx.lib_dir = LIB_DIR
+        mock_ctx.minitrino_user_dir = str(tmp_path)
+        mock_ctx.env = {"CLUSTER_DIST": "starburst", "CLUSTER_VER": "476-e.1"}
+        mock_ctx.docker_client.info.return_value = {"Architecture": "aarch64"}
+        cache = ArtifactCache(mock_ctx)
+        downloader = cache._downloader()
+
+        def download(url, path, log):
+            if error:
+                raise error
+            with open(path, "wb") as f:
+                f.write(TARBALL)
+
+        downloader.download_tarball = Mock(side_effect=download)
+        return cache, downloader
+
+    def test_directory(self, tmp_path):
+        """Test that artifacts are keyed by dist, version, and arch."""
+        cache, _ = self.create_cache(tmp_path)
+
+        assert cache.directory() == str(
+            tmp_path / "artifacts" / "starburst" / "476-e.1" / "aarch64"
+        )
+
+    def test_prefetch(self, tmp_path):
+        """Test that a verified tarball is cached and reused."""
+        cache, downloader = self.create_cache(tmp_path)
+
+        cache.prefetch()
+        cache.prefetch()
+
+        tar_name = "starburst-enterprise-476-e.1.aarch64.tar.gz"
+        url = downloader.download_tarball.call_args.args[0]
+        assert url.endswith(f"/476e/476-e.1/{tar_name}")
+        downloader.download_tarball.assert_called_once()
+        assert downloader.download_tarball.call_args.kwargs["log"] == (
+            cache._ctx.logger.debug
+        )
+        tar_path = os.path.join(cache.directory(), tar_name)
+        with open(f"{tar_path}.sha256") as f:
+            assert f.read().split() == [hashlib.sha256(TARBALL).hexdigest(), tar_name]
+        assert sorted(os.listdir(cache.directory())) == [
+            tar_name,
+            f"{tar_name}.sha256",
+        ]
+
+    def test_prefetch_failure(self, tmp_path):
+        """Test that a failed download is not recorded in the cache."""
+        error = RuntimeError("Checksum mismatch for url")
+        cache, _ = self.create_cache(tmp_path, error)
+
+        with pytest.raises(MinitrinoError, match="Checksum mismatch"):
+            cache.prefetch()
+
+        assert os.listdir(cache.directory()) == []
@@ -0,0 +1,81 @@
+"""Unit tests for host-side config rendering.
+
+Tests the ClusterConfigRenderer class against the library's
+`gen_config.py` script.
+"""
+
+import os
+from unittest.mock import Mock
+
+from minitrino.core.cluster.configs import ClusterConfigRenderer
+
+LIB_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../lib"))
+ENVIRONMENT = {
+    "COORDINATOR": "true",
+    "WORKERS": "1",
+    "MINITRINO_MODULES": "ldap,oauth2",
+    "CONFIG_PROPERTIES": "query.max-memory=1GB",
+    "JVM_CONFIG": None,
+    "LDAP_CONFIG_PROPERTIES": (
+        "query.max-memory=2GB\nhttp-server.authentication.type=PASSWORD"
+    ),
+    "OAUTH2_CONFIG_PROPERTIES": "http-server.authentication.type=OAUTH2",
+    "WORKER_CONFIG_PROPERTIES": "task.concurrency=4",
+}
+
+
+class TestClusterConfigRenderer:
+    """Test suite for ClusterConfigRenderer."""
+
+    def create_renderer(self):
+        """Create a ClusterConfigRenderer for the repository's library."""
+        mock_ctx = Mock()
+        mock_ctx.lib_dir = LIB_DIR
+        mock_ctx.env = {"CLUSTER_DIST": "trino", "CLUSTER_VER": "476"}
+        return ClusterConfigRenderer(mock_ctx)
+
+    def test_render_coordinator(self):
+        """Test that overrides are merged over the image's base config."""
+        renderer = self.create_renderer()
+
+        cfgs = renderer.render(ENVIRONMENT)["config.properties"]
+
+        values = {c[1]: c[2] for c in cfgs if c[0] == "key_value"}
+        assert values["coordinator"] == "true"
+        assert values["http-server.http.port"] == "8080"
+        assert values["query.max-memory"] == "1GB"
+        assert values["node-scheduler.include-coordinator"] == "false"
+        assert values["http-server.authentication.type"] == "PASSWORD,OAUTH2"
+
+    def test_render_worker(self):
+        """Test that workers render from the worker overrides."""
+        renderer = self.create_renderer()
+
+        cfgs = renderer.render(ENVIRONMENT, worker=True)["config.properties"]
+
+        values = {c[1]: c[2] for c in cfgs if c[0] == "key_value"}
+        assert values["coordinator"] == "false"
+        assert values["task.concurrency"] == "4"
+        assert "query.max-memory" not in values
+
+    def test_conflicts(self):
+        """Test that repeated keys are reported with the value used."""
+        renderer = self.create_renderer()
+
+        conflicts = renderer.conflicts(ENVIRONMENT)
+
+        assert conflicts["jvm.config"] == {}
+        assert conflicts["config.properties"] == {
+            "query.max-memory": (
+                [
+                    ("CONFIG_PROPERTIES", ("key_value", "query.max-memory", "1GB")),
+                    (
+                        "LDAP_CONFIG_PROPERTIES",
+                        ("key_value", "query.max-memory", "2GB"),
+                    ),
+                ],
+                # Keys missing from the base config keep their first value
+                ("key_value", "query.max-memory", "1GB"),
+            )
+        }
+        assert renderer.conflicts(ENVIRONMENT, worker=True)["config.properties"] == {}
@@ -0,0 +1,471 @@
+"""Unit tests for cluster operations.
+
+Tests the ClusterOperations class worker reconciliation.
+"""
+
+import io
+import os
+import tarfile
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from docker.errors import NotFound
+from minitrino.core.cluster.ops import CATALOG_SQL_DIR, ClusterOperations
+from minitrino.core.errors import MinitrinoError, UserError
+
+
+class TestReconcileWorkers:
+    """Test suite for ClusterOperations.reconcile_workers."""
+
+    def create_ops(self, archive_chunks):
+        """Create ClusterOperations with a mocked coordinator and workers."""
+        mock_ctx = Mock()
+        mock_ctx.cluster_name = "test"
+        mock_ctx.env = {
+            "CLUSTER_VER": "476",
+            "CLUSTER_DIST": "trino",
+            "SERVICE_USER": "trino",
+        }
+        coordinator = Mock()
+        coordinator.name = "minitrino-test"
+        coordinator.attrs = {"Config": {"Env": []}, "HostConfig": {}}
+        coordinator.get_archive.return_value = (iter(archive_chunks), {})
+
+        mock_cluster = Mock()
+        mock_cluster.resource.resources.return_value.containers.return_value = []
+        mock_cluster.resource.fq_container_name.side_effect = lambda name: (
+            f"{name}-test"
+        )
+        mock_cluster.resource.compose_project_name.return_value = "minitrino-test"
+
+        def container(name):
+            if name == "minitrino-test":
+                return coordinator
+            raise NotFound(name)
+
+        mock_cluster.resource.container.side_effect = container
+        return ClusterOperations(mock_ctx, mock_cluster), mock_ctx, coordinator
+
+    def test_archive_fetched_once(self):
+        """Test that the coordinator archive is fetched once for all workers."""
+        ops, mock_ctx, coordinator = self.create_ops([b"abc", b"def"])
+        received = []
+
+        def put_archive(path, data):
+            received.append((path, data.read(), data.name))
+            return True
+
+        mock_ctx.docker_client.containers.run.return_value.put_archive = put_archive
+
+        ops.reconcile_workers(3)
+
+        coordinator.get_archive.assert_called_once_with("/tmp/trino.tar.gz")
+        assert [(p, d) for p, d, _ in received] == [("/tmp", b"abcdef")] * 3
+        assert not os.path.exists(received[0][2])
+
+    def test_archive_removed_on_failure(self):
+        """Test that the local archive is removed if a worker fails."""
+        ops, mock_ctx, _ = self.create_ops([b"abc"])
+        paths = []
+
+        def put_archive(path, data):
+            paths.append(data.name)
+            raise Exception("put failed")
+
+        mock_ctx.docker_client.containers.run.return_value.put_archive = put_archive
+
+        with pytest.raises(MinitrinoError, match="Worker provisioning failed"):
+            ops.reconcile_workers(2)
+
+        assert paths
+        assert not any(os.path.exists(p) for p in paths)
+
+    def test_pipeline_stage_order(self):
+        """Test that each worker is created, attached, then configured."""
+        ops, mock_ctx, _ = self.create_ops([b"abc"])
+        events = []
+        lock = threading.Lock()
+
+        def record(event):
+            with lock:
+                events.append(event)
+
+        def run(image, name, **kwargs):
+            record(("create", name))
+            worker = Mock()
+            worker.name = name
+            worker.put_archive = lambda *_: record(("copy", name))
+            return worker
+
+        mock_ctx.docker_client.containers.run.side_effect = run
+        shared_network = mock_ctx.docker_client.networks.get.return_value
+        shared_network.connect.side_effect = lambda c: record(("attach", c.name))
+
+        ops.reconcile_workers(5, parallelism=2)
+
+        mock_ctx.docker_client.networks.get.assert_called_once_with("cluster_shared")
+        for i in range(1, 6):
+            name = f"minitrino-worker-{i}-test"
+            stages = [stage for stage, n in events if n == name]
+            assert stages == ["create", "attach", "copy"]
+        timings = [
+            c.args[0]
+            for c in mock_ctx.logger.debug.call_args_list
+            if "Stage timings" in str(c.args[0])
+        ]
+        assert len(timings) == 1
+        assert "parallelism: 2" in timings[0]
+
+    def test_parallelism_from_env(self):
+        """Test that PROVISION_PARALLELISM is used when no value is given."""
+        ops, mock_ctx, _ = self.create_ops([])
+        mock_ctx.env["PROVISION_PARALLELISM"] = "6"
+
+        assert ops._worker_parallelism(32) == 6
+        assert ops._worker_parallelism(32, parallelism=3) == 3
+        assert ops._worker_parallelism(2) == 2
+
+    def test_parallelism_invalid_env(self):
+        """Test that an invalid PROVISION_PARALLELISM raises UserError."""
+        ops, mock_ctx, _ = self.create_ops([])
+        for value in ["0", "-1", "many"]:
+            mock_ctx.env["PROVISION_PARALLELISM"] = value
+            with pytest.raises(UserError):
+                ops._worker_parallelism(8)
+
+    def test_parallelism_default(self):
+        """Test that default parallelism follows host and daemon CPUs."""
+        ops, mock_ctx, _ = self.create_ops([])
+        mock_ctx.docker_client.info.return_value = {"NCPU": 12}
+
+        with patch("minitrino.core.cluster.ops.os.cpu_count", return_value=16):
+            assert ops._worker_parallelism(32) == 12
+            assert ops._worker_parallelism(8) == 8
+        with patch("minitrino.core.cluster.ops.os.cpu_count", return_value=2):
+            assert ops._worker_parallelism(32) == 4
+        with patch("minitrino.core.cluster.ops.os.cpu_count", return_value=128):
+            mock_ctx.docker_client.info.return_value = {"NCPU": 64}
+            assert ops._worker_parallelism(64) == 32
+            mock_ctx.docker_client.info.return_value = {}
+            assert ops._worker_parallelism(64) == 32
+            mock_ctx.docker_client.info.side_effect = Exception("no daemon")
+            assert ops._worker_parallelism(64) == 32
+
+
+class TestWorkerConfigCache:
+    """Test suite for the cached worker config image."""
+
+    def create_ops(self, image_exists=True, workers=None):
+        """Create ClusterOperations with caching enabled."""
+        mock_ctx = Mock()
+        mock_ctx.cluster_name = "test"
+        mock_ctx.env = {
+            "CLUSTER_VER": "476",
+            "CLUSTER_DIST": "trino",
+            "SERVICE_USER": "trino",
+            "WORKER_CONFIG_CACHE": "true",
+        }
+        mock_ctx.modules.data = {}
+        coordinator = Mock()
+        coordinator.name = "minitrino-test"
+        coordinator.attrs = {
+            "Image": "sha256:abc",
+            "Config": {"Env": ["WORKERS=2", "MINITRINO_MODULES="]},
+            "HostConfig": {},
+        }
+
+        mock_cluster = Mock()
+        mock_cluster.resource.resources.return_value.containers.return_value = (
+            workers or []
+        )
+        mock_cluster.resource.fq_container_name.side_effect = lambda name: (
+            f"{name}-test"
+        )
+        mock_cluster.resource.compose_project_name.return_value = "minitrino-test"
+
+        def container(name):
+            if name == "minitrino-test":
+                return coordinator
+            raise NotFound(name)
+
+        mock_cluster.resource.container.side_effect = container
+        if not image_exists:
+            mock_ctx.docker_client.images.get.side_effect = NotFound("image")
+        return ClusterOperations(mock_ctx, mock_cluster), mock_ctx, coordinator
+
+    def test_key_ignores_worker_count(self):
+        """Test that the config key does not depend on `WORKERS`."""
+        ops, _, coordinator = self.create_ops()
+        key = ops._worker_config_key(coordinator)
+        coordinator.attrs["Config"]["Env"] = ["WORKERS=8", "MINITRINO_MODULES="]
+        assert ops._worker_config_key(coordinator) == key
+        coordinator.attrs["Config"]["Env"].append("CONFIG_PROPERTIES=a=b")
+        assert ops._worker_config_key(coordinator) != key
+
+    def test_key_tracks_module_files(self, tmp_path):
+        """Test that editing a module's files changes the config key."""
+        ops, mock_ctx, coordinator = self.create_ops()
+        mock_ctx.modules.data = {"hive": {"module_dir": str(tmp_path)}}
+        coordinator.attrs["Config"]["Env"] = ["MINITRINO_MODULES=hive"]
+        (tmp_path / "hive.properties").write_text("a=b\n")
+        key = ops._worker_config_key(coordinator)
+        (tmp_path / "hive.properties").write_text("a=bc\n")
+        assert ops._worker_config_key(coordinator) != key
+
+    def test_cached_image_disabled(self):
+        """Test that no image is used unless caching is enabled."""
+        ops, mock_ctx, _ = self.create_ops()
+        mock_ctx.env["WORKER_CONFIG_CACHE"] = "false"
+        assert ops.cached_worker_image() == ""
+        mock_ctx.docker_client.images.get.assert_not_called()
+
+    def test_cached_image_requires_matching_workers(self):
+        """Test that existing workers must run the cached image."""
+        worker = Mock()
+        worker.name = "minitrino-worker-1-test"
+        worker.labels = {"org.minitrino.root": "true"}
+        worker.attrs = {"Config": {"Image": "minitrino/cluster:476-trino"}}
+        ops, _, coordinator = self.create_ops(workers=[worker])
+        assert ops.cached_worker_image() == ""
+
+        worker.attrs["Config"]["Image"] = ops._worker_config_image(coordinator)
+        assert ops.cached_worker_image() == worker.attrs["Config"]["Image"]
+
+    def test_reconcile_with_cached_image(self):
+        """Test that workers start from the cached image without a copy."""
+        ops, mock_ctx, coordinator = self.create_ops()
+        tag = ops._worker_config_image(coordinator)
+
+        ops.reconcile_workers(2)
+
+        coordinator.get_archive.assert_not_called()
+        mock_ctx.cmd_executor.execute.assert_not_called()
+        images = [c.args[0] for c in mock_ctx.docker_client.containers.run.mock_calls]
+        assert images == [tag, tag]
+
+    def test_reconcile_with_known_cached_image(self):
+        """Test that a cached image passed by the caller is not looked up."""
+        ops, mock_ctx, _ = self.create_ops()
+        ops.cached_worker_image = Mock()
+
+        ops.reconcile_workers(2, cached_image="minitrino/cluster:476-trino-worker")
+
+        ops.cached_worker_image.assert_not_called()
+        images = [c.args[0] for c in mock_ctx.docker_client.containers.run.mock_calls]
+        assert images == ["minitrino/cluster:476-trino-worker"] * 2
+
+    def test_reconcile_builds_cached_image(self):
+        """Test that a missing cached image is built from the archive."""
+        ops, mock_ctx, coordinator = self.create_ops(image_exists=False)
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w") as tar:
+            info = tarfile.TarInfo("trino.tar.gz")
+            info.size = 3
+            tar.addfile(info, io.BytesIO(b"abc"))
+        coordinator.get_archive.return_value = (iter([buf.getvalue()]), {})
+        mock_ctx.docker_client.containers.run.return_value.put_archive = lambda *_: True
+        contexts = []
+
+        def build(fileobj, **kwargs):
+            with tarfile.open(fileobj=fileobj) as tar:
+                contexts.append(
+                    {m.name: tar.extractfile(m).read() for m in tar.getmembers()}
+                )
+
+        mock_ctx.docker_client.images.build.side_effect = build
+
+        ops.reconcile_workers(2)
+
+        kwargs = mock_ctx.docker_client.images.build.call_args.kwargs
+        assert kwargs["tag"] == ops._worker_config_image(coordinator)
+        assert contexts[0]["trino.tar.gz"] == b"abc"
+        assert b"FROM minitrino/cluster:476-trino" in contexts[0]["Dockerfile"]
+
+
+class TestPushConfig:
+    """Test suite for ClusterOperations.push_config."""
+
+    def test_files_staged_and_containers_restarted(self, tmp_path):
+        """Test that files are staged in all nodes before restarting."""
+        source = tmp_path / "postgres.properties"
+        source.write_text("connector.name=postgresql\n")
+        mock_ctx = Mock()
+        mock_ctx.env = {"SERVICE_USER": "trino"}
+        coordinator, worker = Mock(), Mock()
+        coordinator.name = "minitrino-test"
+        worker.name = "minitrino-worker-1-test"
+        mock_cluster = Mock()
+        mock_cluster.resource.container.return_value = coordinator
+        ops = ClusterOperations(mock_ctx, mock_cluster)
+        ops._worker_containers = Mock(return_value=[worker])
+        ops.restart_containers = Mock()
+
+        ops.push_config({"/mnt/etc/catalog/postgres.properties": str(source)})
+
+        for node in (coordinator, worker):
+            path, data = node.put_archive.call_args.args
+            assert path == "/tmp/etc"
+            with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+                member = tar.getmember("catalog/postgres.properties")
+                assert (member.uid, member.gid) == (0, 0)
+        commands = [c.args[0][0] for c in mock_ctx.cmd_executor.execute.call_args_list]
+        assert commands.count("mkdir -p /tmp/etc") == 2
+        assert sum("push-config-status.txt" in c for c in commands) == 2
+        ops.restart_containers.assert_called_once_with(
+            ["minitrino-test", "minitrino-worker-1-test"]
+        )
+
+
+class TestRestart:
+    """Test suite for ClusterOperations.restart."""
+
+    def test_rebootstrap_clears_markers(self):
+        """Test that bootstrap markers are cleared in running containers."""
+        running, stopped = Mock(), Mock()
+        running.name, running.status = "minitrino-test", "running"
+        stopped.name, stopped.status = "minitrino-worker-1-test", "exited"
+        mock_ctx = Mock()
+        mock_cluster = Mock()
+        mock_cluster.resource.resources.return_value.containers.return_value = [
+            running,
+            stopped,
+        ]
+        ops = ClusterOperations(mock_ctx, mock_cluster)
+        ops.restart_containers = Mock()
+
+        ops.restart()
+        mock_ctx.cmd_executor.execute.assert_not_called()
+
+        ops.restart(rebootstrap=True)
+        mock_ctx.cmd_executor.execute.assert_called_once_with(
+            ["rm -f /etc/${CLUSTER_DIST}/.minitrino/bootstrap_checksums.json"],
+            container=running,
+        )
+        ops.restart_containers.assert_called_with(
+            ["minitrino-test", "minitrino-worker-1-test"]
+        )
+
+
+class TestDynamicCatalogs:
+    """Test suite for ClusterOperations catalog updates."""
+
+    def create_ops(self, coordinator=None):
+        """Create ClusterOperations with a mocked coordinator."""
+        mock_ctx = Mock()
+        mock_ctx.env = {"SERVICE_USER": "trino"}
+        mock_cluster = Mock()
+        if coordinator is None:
+            mock_cluster.resource.container.side_effect = NotFound("minitrino")
+        else:
+            mock_cluster.resource.container.return_value = coordinator
+        ops = ClusterOperations(mock_ctx, mock_cluster)
+        ops._worker_containers = Mock(return_value=[])
+        return ops, mock_ctx
+
+    def test_dynamic_catalogs(self):
+        """Test that dynamic management is read from the node config."""
+        ops, _ = self.create_ops()
+        assert not ops.dynamic_catalogs()
+
+        ops, mock_ctx = self.create_ops(Mock(status="running"))
+        mock_ctx.cmd_executor.execute.return_value = [Mock(exit_code=0)]
+        assert ops.dynamic_catalogs()
+        mock_ctx.cmd_executor.execute.return_value = [Mock(exit_code=1)]
+        assert not ops.dynamic_catalogs()
+
+    def update(self, tmp_path, catalogs, dropped, exit_code=0, output=""):
+        """Update catalogs and return the SQL files pushed to the coordinator."""
+        coordinator = Mock(status="running")
+        ops, mock_ctx = self.create_ops(coordinator)
+        mock_ctx.cmd_executor.execute.return_value = [
+            Mock(exit_code=exit_code, output=output)
+        ]
+
+        ops.update_catalogs(catalogs, dropped)
+
+        path, archive = coordinator.put_archive.call_args.args
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            files = {
+                os.path.join(path, m.name): tar.extractfile(m).read().decode()
+                for m in tar.getmembers()
+            }
+        return files, mock_ctx
+
+    def test_update_catalogs(self, tmp_path):
+        """Test that each catalog is replaced or dropped by its own file."""
+        source = tmp_path / "postgres.properties"
+        source.write_text(
+            "# Postgres\n"
+            "connector.name=postgresql\n"
+            "connection-url=jdbc:postgresql://postgres:5432/minitrino\n"
+            "connection-password=it's\n"
+        )
+
+        files, mock_ctx = self.update(tmp_path, {"postgres": str(source)}, ["mysql"])
+
+        # The new definition is validated before the old one is dropped
+        using = (
+            'USING "postgresql" WITH '
+            "(\"connection-url\" = 'jdbc:postgresql://postgres:5432/minitrino', "
+            "\"connection-password\" = 'it''s')"
+        )
+
+        assert files == {
+            f"{CATALOG_SQL_DIR}/mysql.sql": 'DROP CATALOG IF EXISTS "mysql";\n',
+            f"{CATALOG_SQL_DIR}/postgres.sql": (
+                'DROP CATALOG IF EXISTS "minitrino_validate_postgres";\n'
+                f'CREATE CATALOG "minitrino_validate_postgres" {using};\n'
+                'DROP CATALOG "minitrino_validate_postgres";\n'
+                'DROP CATALOG IF EXISTS "postgres";\n'
+                f'CREATE CATALOG "postgres" {using};\n'
+            ),
+        }
+        command = mock_ctx.cmd_executor.execute.call_args.args[0][0]
+        assert "run_sql.py --parallel 1" in command
+        assert "trino-cli" not in command
+
+    def test_update_catalogs_failure(self, tmp_path):
+        """Test that the catalog that failed is reported by name."""
+        sources = {}
+        for name in ("a", "b", "c"):
+            sources[name] = tmp_path / f"{name}.properties"
+            sources[name].write_text("connector.name=memory\n")
+        output = (
+            f"[run_sql] Statement failed at {CATALOG_SQL_DIR}/b.sql:2: Invalid property"
+        )
+
+        ops, mock_ctx = self.create_ops(Mock(status="running"))
+        mock_ctx.cmd_executor.execute.return_value = [Mock(exit_code=1, output=output)]
+
+        with pytest.raises(MinitrinoError, match="Failed to create catalog 'b'"):
+            ops.update_catalogs({k: str(v) for k, v in sources.items()}, [])
+
+        # Catalogs before the failure were updated; later ones are untouched
+        mock_ctx.logger.info.assert_called_once_with("Created catalog 'a'.")
+
+    def test_catalog_without_connector(self, tmp_path):
+        """Test that a catalog file without a connector raises UserError."""
+        source = tmp_path / "broken.properties"
+        source.write_text("a=b\n")
+        ops, _ = self.create_ops(Mock())
+
+        with pytest.raises(UserError, match="does not set 'connector.name'"):
+            ops.update_catalogs({"broken": str(source)}, [])
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "connection-url: jdbc:postgresql://postgres:5432/minitrino",
+            "connection-url=jdbc:postgresql://\\",
+            "connection-url",
+        ],
+    )
+    def test_catalog_unsupported_syntax(self, tmp_path, line):
+        """Test that properties syntax other than `key=value` is rejected."""
+        source = tmp_path / "postgres.properties"
+        source.write_text(f"connector.name=postgresql\n{line}\npostgres:5432\n")
+        ops, _ = self.create_ops(Mock())
+
+        with pytest.raises(UserError, match="Unsupported syntax on line 2"):
+            ops.update_catalogs({"postgres": str(source)}, [])
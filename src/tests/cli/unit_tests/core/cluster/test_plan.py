@@ -0,0 +1,350 @@
+"""Unit tests for incremental provisioning plans.
+
+Tests the ProvisionPlanner class's service hashing, classification, and
+recorded state.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from minitrino.core.cluster.plan import ProvisionPlan, ProvisionPlanner
+from minitrino.core.errors import MinitrinoError
+
+
+def container(service, container_id, status="running"):
+    """Return a mock Compose container for a service."""
+    c = Mock()
+    c.id = container_id
+    c.status = status
+    c.labels = {
+        "com.docker.compose.project": "minitrino-test",
+        "com.docker.compose.service": service,
+    }
+    return c
+
+
+class TestProvisionPlanner:
+    """Test suite for ProvisionPlanner."""
+
+    @pytest.fixture(autouse=True)
+    def state_dir(self, tmp_path):
+        """Keep provisioning state under a temporary user directory."""
+        self.user_dir = tmp_path / ".minitrino"
+        self.user_dir.mkdir()
+        return self.user_dir / ".provisionstate" / "test.json"
+
+    def create_planner(self, services, containers):
+        """Create a ProvisionPlanner with fixed services and containers."""
+        mock_ctx = Mock()
+        mock_ctx.cluster_name = "test"
+        mock_ctx.minitrino_user_dir = str(self.user_dir)
+        mock_cluster = Mock()
+        mock_cluster.resource.compose_project_name.return_value = "minitrino-test"
+        mock_cluster.resource.resources.return_value.containers.return_value = (
+            containers
+        )
+        planner = ProvisionPlanner(mock_ctx, mock_cluster)
+        planner._effective_services = Mock(return_value=services)
+        return planner
+
+    def test_fresh_cluster(self):
+        """Test that all services are created without containers."""
+        planner = self.create_planner({"minitrino": {}, "postgres": {}}, [])
+
+        plan = planner.plan([], {})
+
+        assert plan.create == ["minitrino", "postgres"]
+        assert plan.full
+
+    def test_unchanged_after_record(self):
+        """Test that recorded services are left unchanged."""
+        services = {"minitrino": {"image": "a"}, "postgres": {"image": "b"}}
+        containers = [container("minitrino", "c1"), container("postgres", "c2")]
+        planner = self.create_planner(services, containers)
+
+        planner.record(planner.plan([], {}))
+        plan = planner.plan([], {})
+
+        assert plan.unchanged == ["minitrino", "postgres"]
+        assert plan.changed == []
+
+    def test_changed_and_new_services(self):
+        """Test that changed, stopped, and new services are brought up."""
+        services = {"minitrino": {"image": "a"}, "postgres": {"image": "b"}}
+        containers = [container("minitrino", "c1"), container("postgres", "c2")]
+        planner = self.create_planner(services, containers)
+        planner.record(planner.plan([], {}))
+
+        services["postgres"] = {"image": "b", "environment": {"A": "1"}}
+        services["mysql"] = {"image": "c"}
+        plan = planner.plan([], {})
+        assert plan.create == ["mysql"]
+        assert plan.recreate == ["postgres"]
+        assert plan.unchanged == ["minitrino"]
+
+        containers[0].status = "exited"
+        assert "minitrino" in planner.plan([], {}).recreate
+
+    def test_replaced_container(self):
+        """Test that a container replaced outside Minitrino is recreated."""
+        containers = [container("minitrino", "c1")]
+        planner = self.create_planner({"minitrino": {}}, containers)
+        planner.record(planner.plan([], {}))
+
+        containers[0].id = "c2"
+
+        assert planner.plan([], {}).recreate == ["minitrino"]
+
+    def test_rebuild(self):
+        """Test that services built from the library image are recreated."""
+        services = {"minitrino": {"build": {"context": "."}}, "postgres": {}}
+        containers = [container("minitrino", "c1"), container("postgres", "c2")]
+        planner = self.create_planner(services, containers)
+        planner.record(planner.plan([], {}))
+
+        plan = planner.plan([], {}, rebuild=True)
+
+        assert plan.recreate == ["minitrino"]
+        assert plan.unchanged == ["postgres"]
+
+    def test_hash_tracks_mounted_files(self, tmp_path):
+        """Test that editing a bind-mounted file changes the hash."""
+        resources = tmp_path / "resources"
+        resources.mkdir()
+        (resources / "postgres.properties").write_text("a=b\n")
+        planner = self.create_planner({}, [])
+        definition = {
+            "volumes": [
+                {"type": "bind", "source": str(resources), "target": "/mnt/etc"},
+                {"type": "volume", "source": "postgres-data", "target": "/data"},
+            ]
+        }
+
+        digest = planner._service_hash(definition)
+        assert planner._service_hash(definition) == digest
+        (resources / "postgres.properties").write_text("a=bc\n")
+        assert planner._service_hash(definition) != digest
+
+    def test_record_skipped_without_user_dir(self, state_dir):
+        """Test that no state is written without the user directory."""
+        self.user_dir.rmdir()
+        planner = self.create_planner({"minitrino": {}}, [])
+
+        planner.record(ProvisionPlan(hashes={"minitrino": "abc"}))
+
+        assert not state_dir.exists()
+
+    def test_record_only_running_services(self, state_dir):
+        """Test that only services with containers are recorded."""
+        planner = self.create_planner({}, [container("minitrino", "c1")])
+
+        planner.record(ProvisionPlan(hashes={"minitrino": "abc", "postgres": "d"}))
+
+        state = json.loads(state_dir.read_text())
+        assert state == {
+            "services": {
+                "minitrino": {
+                    "hash": "abc",
+                    "container": "c1",
+                    "base": "",
+                    "mounts": {},
+                }
+            },
+            "modules": [],
+        }
+
+    def test_record_rehashes_mounts(self, tmp_path):
+        """Test that files written by containers are not seen as changes."""
+        tls = tmp_path / "tls"
+        tls.mkdir()
+        mount = {"type": "bind", "source": str(tls), "target": "/mnt/etc/tls"}
+        services = {"minitrino": {"image": "a", "volumes": [mount]}}
+        planner = self.create_planner(services, [container("minitrino", "c1")])
+        plan = planner.plan([], {}, push=True)
+
+        # The coordinator's bootstrap writes into the mounted directory
+        (tls / "keystore.jks").write_bytes(b"keystore")
+        planner.record(plan)
+        plan = planner.plan([], {}, push=True)
+
+        assert plan.unchanged == ["minitrino"]
+        assert plan.push == {}
+
+    def test_compose_config_failure(self):
+        """Test that a failed `docker compose config` raises an error."""
+        planner = ProvisionPlanner(Mock(), Mock())
+        result = Mock(returncode=1, stdout="", stderr="invalid compose file")
+        with (
+            patch("minitrino.core.cluster.plan.subprocess.run", return_value=result),
+            pytest.raises(MinitrinoError, match="invalid compose file"),
+        ):
+            planner._effective_services(["docker", "compose"], {})
+
+    def test_compose_config_parsed(self):
+        """Test that services are parsed from `docker compose config`."""
+        planner = ProvisionPlanner(Mock(), Mock())
+        stdout = (
+            "services:\n  minitrino:\n    image: a\n    build:\n"
+            "      additional_contexts:\n        artifacts: /cache\n"
+        )
+        result = Mock(returncode=0, stdout=stdout, stderr="")
+        with patch(
+            "minitrino.core.cluster.plan.subprocess.run", return_value=result
+        ) as run:
+            services = planner._effective_services(["docker", "compose"], {"A": "1"})
+
+        # The artifact cache location does not change the service's hash
+        assert services == {
+            "minitrino": {"image": "a", "build": {"additional_contexts": {}}}
+        }
+        assert run.call_args.args[0] == ["docker", "compose", "config"]
+        assert run.call_args.kwargs["env"]["A"] == "1"
+
+
+class TestHotAttach:
+    """Test suite for updating a running coordinator in place."""
+
+    @pytest.fixture(autouse=True)
+    def state_dir(self, tmp_path):
+        """Keep provisioning state under a temporary user directory."""
+        self.user_dir = tmp_path / ".minitrino"
+        self.user_dir.mkdir()
+        return self.user_dir / ".provisionstate" / "test.json"
+
+    @pytest.fixture
+    def catalog(self, tmp_path):
+        """Return a `/mnt/etc` bind mount for a catalog file."""
+        source = tmp_path / "postgres.properties"
+        source.write_text("connector.name=postgresql\n")
+        return {
+            "type": "bind",
+            "source": str(source),
+            "target": "/mnt/etc/catalog/postgres.properties",
+        }
+
+    def create_planner(self, services, container_id="c1"):
+        """Create a ProvisionPlanner with a running coordinator."""
+        return TestProvisionPlanner.create_planner(
+            self, services, [container("minitrino", container_id)]
+        )
+
+    def coordinator(self, modules, volumes):
+        """Return a coordinator service definition."""
+        return {
+            "image": "a",
+            "environment": {"MINITRINO_MODULES": modules},
+            "labels": {"com.starburst.tests.module": modules},
+            "volumes": volumes,
+        }
+
+    def test_added_mount_is_pushed(self, catalog):
+        """Test that a new catalog mount is pushed, not recreated."""
+        services = {"minitrino": self.coordinator("", [])}
+        planner = self.create_planner(services)
+        planner.record(planner.plan([], {}, push=True))
+
+        services["minitrino"] = self.coordinator("postgres", [catalog])
+        plan = planner.plan([], {}, push=True)
+
+        assert plan.hot == ["minitrino"]
+        assert plan.push == {catalog["target"]: catalog["source"]}
+        assert not plan.full
+        assert planner.plan([], {}).recreate == ["minitrino"]
+
+    def test_changed_mount_is_pushed(self, catalog):
+        """Test that only mounts with changed contents are pushed."""
+        services = {"minitrino": self.coordinator("postgres", [catalog])}
+        planner = self.create_planner(services)
+        planner.record(planner.plan([], {}, push=True))
+
+        with open(catalog["source"], "a") as f:
+            f.write("connection-url=jdbc:postgresql://postgres:5432/db\n")
+        plan = planner.plan([], {}, push=True)
+
+        assert plan.push == {catalog["target"]: catalog["source"]}
+
+    def test_removed_mount_recreates(self, catalog):
+        """Test that removing a catalog mount recreates the coordinator."""
+        services = {"minitrino": self.coordinator("postgres", [catalog])}
+        planner = self.create_planner(services)
+        planner.record(planner.plan([], {}, push=True))
+
+        services["minitrino"] = self.coordinator("", [])
+
+        assert planner.plan([], {}, push=True).recreate == ["minitrino"]
+
+    def test_other_change_recreates(self, catalog):
+        """Test that changes outside `/mnt/etc` recreate the coordinator."""
+        services = {"minitrino": self.coordinator("", [])}
+        planner = self.create_planner(services)
+        planner.record(planner.plan([], {}, push=True))
+
+        services["minitrino"] = self.coordinator("postgres", [catalog])
+        services["minitrino"]["environment"]["A"] = "1"
+
+        assert planner.plan([], {}, push=True).recreate == ["minitrino"]
+
+    def test_recorded_modules(self):
+        """Test that modules are recorded until the coordinator changes."""
+        planner = self.create_planner({"minitrino": {}})
+        planner.record(planner.plan([], {}), ["postgres"])
+
+        assert planner.recorded_modules() == ["postgres"]
+
+        replaced = self.create_planner({"minitrino": {}}, container_id="c2")
+        assert replaced.recorded_modules() == []
+
+    def test_catalogs_updated_dynamically(self, catalog):
+        """Test that catalog files are applied without a restart."""
+        services = {"minitrino": self.coordinator("", [])}
+        planner = self.create_planner(services)
+        planner.record(planner.plan([], {}))
+        dynamic = Mock(return_value=True)
+
+        services["minitrino"] = self.coordinator("postgres", [catalog])
+        plan = planner.plan([], {}, push=True, dynamic_catalogs=dynamic)
+
+        assert plan.updated == ["minitrino"]
+        assert plan.catalogs == {"postgres": catalog["source"]}
+        assert plan.hot == [] and plan.push == {}
+        assert not plan.full
+
+        planner.record(plan)
+        services["minitrino"] = self.coordinator("", [])
+        plan = planner.plan([], {}, dynamic_catalogs=dynamic)
+        assert plan.updated == ["minitrino"]
+        assert plan.dropped == ["postgres"]
+
+    def test_catalogs_without_dynamic_management(self, catalog):
+        """Test that catalog files are pushed without dynamic management."""
+        services = {"minitrino": self.coordinator("", [])}
+        planner = self.create_planner(services)
+        planner.record(planner.plan([], {}))
+        dynamic = Mock(return_value=False)
+
+        services["minitrino"] = self.coordinator("postgres", [catalog])
+        plan = planner.plan([], {}, push=True, dynamic_catalogs=dynamic)
+
+        assert plan.hot == ["minitrino"]
+        assert plan.updated == []
+        dynamic.assert_called_once()
+
+    def test_non_catalog_files_not_updated_dynamically(self, tmp_path):
+        """Test that files outside `/mnt/etc/catalog` are not dynamic."""
+        source = tmp_path / "rules.json"
+        source.write_text("{}")
+        mount = {
+            "type": "bind",
+            "source": str(source),
+            "target": "/mnt/etc/rules.json",
+        }
+        services = {"minitrino": self.coordinator("", [])}
+        planner = self.create_planner(services)
+        planner.record(planner.plan([], {}))
+        dynamic = Mock(return_value=True)
+
+        services["minitrino"] = self.coordinator("file-access-control", [mount])
+
+        assert planner.plan([], {}, dynamic_catalogs=dynamic).recreate == ["minitrino"]
+        dynamic.assert_not_called()
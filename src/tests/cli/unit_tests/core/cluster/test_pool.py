@@ -0,0 +1,139 @@
+"""Unit tests for the warm cluster pool.
+
+Tests the ClusterPool class's filling, claiming, and eviction of pooled
+clusters.
+"""
+
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+from minitrino.core.cluster.pool import ClusterPool
+from minitrino.core.errors import MinitrinoError, UserError
+
+
+class TestClusterPool:
+    """Test suite for ClusterPool."""
+
+    def create_pool(self, tmp_path, env=None, running=True):
+        """Create a ClusterPool that records started and removed clusters."""
+        mock_ctx = Mock()
+        mock_ctx.minitrino_user_dir = str(tmp_path)
+        mock_ctx.env = {"CLUSTER_VER": "476", **(env or {})}
+        pool = ClusterPool(mock_ctx)
+        pool.started, pool.removed = [], []
+        pool._start = lambda name, dist, workers: pool.started.append(name)
+        pool._teardown = pool.removed.append
+        pool._running = Mock(return_value=running)
+        return pool
+
+    def state(self, tmp_path):
+        """Return the pool's state file contents."""
+        return json.loads((tmp_path / ".clusterpool.json").read_text())
+
+    def test_fill(self, tmp_path):
+        """Test that the pool is filled up to its size."""
+        pool = self.create_pool(tmp_path, {"POOL_SIZE": "3"})
+
+        started = pool.fill()
+
+        assert len(started) == 3
+        assert all(name.startswith("pool-trino-476-") for name in started)
+        assert all(m["ready"] for m in self.state(tmp_path).values())
+        assert pool.fill() == []
+
+    def test_fill_larger_than_pool_size(self, tmp_path):
+        """Test that filling beyond `POOL_SIZE` does not churn the pool."""
+        pool = self.create_pool(tmp_path, {"POOL_SIZE": "2"})
+
+        assert len(pool.fill(size=4)) == 4
+        assert pool.fill(size=4) == []
+        assert pool.removed == []
+        assert len(self.state(tmp_path)) == 4
+
+    def test_fill_failure(self, tmp_path):
+        """Test that clusters that fail to start are removed."""
+        pool = self.create_pool(tmp_path)
+
+        def start(name, dist, workers):
+            if pool.started:
+                raise RuntimeError("boom")
+            pool.started.append(name)
+
+        pool._start = start
+
+        with pytest.raises(MinitrinoError, match="Failed to start pooled"):
+            pool.fill(size=2)
+
+        assert list(self.state(tmp_path)) == pool.started
+
+    def test_claim(self, tmp_path):
+        """Test that idle clusters are claimed oldest first, once."""
+        pool = self.create_pool(tmp_path)
+        pool.fill(size=2)
+        with pool._members() as members:
+            next(iter(members.values()))["created"] -= 1
+        oldest = min(self.state(tmp_path).items(), key=lambda m: m[1]["created"])
+
+        first = pool.claim()
+        second = pool.claim()
+
+        assert first == oldest[0]
+        assert second not in ("", first)
+        assert pool.claim() == ""
+        assert pool.claim(workers=1) == ""
+        assert {m["state"] for m in pool.status()} == {"claimed"}
+
+    def test_claim_skips_stopped(self, tmp_path):
+        """Test that stopped clusters are not claimed."""
+        pool = self.create_pool(tmp_path, running=False)
+        pool.fill(size=1)
+
+        assert pool.claim() == ""
+
+    def test_evict_expired(self, tmp_path):
+        """Test that idle clusters older than the TTL are evicted."""
+        pool = self.create_pool(tmp_path, {"POOL_TTL": "60"})
+        pool.fill(size=1)
+        with pool._members() as members:
+            for member in members.values():
+                member["created"] = time.time() - 120
+
+        assert pool.status()[0]["state"] == "expired"
+        assert pool.claim() == ""
+        assert pool.evict() == pool.started
+        assert self.state(tmp_path) == {}
+
+    def test_evict_surplus(self, tmp_path):
+        """Test that the oldest idle clusters beyond the size are evicted."""
+        pool = self.create_pool(tmp_path, {"POOL_SIZE": "3"})
+        pool.fill()
+        with pool._members() as members:
+            for i, member in enumerate(members.values()):
+                member["created"] -= i
+        oldest = min(self.state(tmp_path).items(), key=lambda m: m[1]["created"])
+
+        assert pool.evict() == []
+        pool._ctx.env["POOL_SIZE"] = "2"
+        assert pool.evict() == [oldest[0]]
+
+    def test_evict_claimed(self, tmp_path):
+        """Test that running claimed clusters are kept unless requested."""
+        pool = self.create_pool(tmp_path)
+        pool.fill(size=1)
+        name = pool.claim()
+
+        assert pool.evict(evict_all=True) == []
+        pool._running.return_value = False
+        assert pool.evict() == [name]
+
+    def test_invalid_settings(self, tmp_path):
+        """Test that invalid pool settings raise UserError."""
+        pool = self.create_pool(tmp_path, {"POOL_SIZE": "zero"})
+        with pytest.raises(UserError, match="Invalid POOL_SIZE value"):
+            pool.fill()
+
+        pool = self.create_pool(tmp_path, {"IMAGE": "presto"})
+        with pytest.raises(UserError, match="Invalid image type"):
+            pool.claim()
@@ -3,6 +3,8 @@
 Tests the ClusterPortManager class for dynamic port assignment.
 """
 
+import json
+import os
 from unittest.mock import Mock, patch
 
 import pytest
@@ -141,18 +143,18 @@ class TestClusterPortManager:
 
             assert result is True
 
-    def test_is_docker_port_in_use_no_containers(self):
+    def test_docker_host_ports_no_containers(self):
         """Test Docker port check with no containers."""
         mock_ctx = self.create_mock_context()
         mock_ctx.docker_client.containers.list.return_value = []
         mock_cluster = self.create_mock_cluster()
 
         manager = ClusterPortManager(mock_ctx, mock_cluster)
-        result = manager._is_docker_port_in_use(8080)
+        result = manager._docker_host_ports()
 
-        assert result is False
+        assert result == (set(), set())
 
-    def test_is_docker_port_in_use_with_containers(self):
+    def test_docker_host_ports_with_containers(self):
         """Test Docker port check with containers using the port."""
         mock_container = Mock()
         mock_container.attrs = {
@@ -164,11 +166,11 @@ class TestClusterPortManager:
         mock_cluster = self.create_mock_cluster()
 
         manager = ClusterPortManager(mock_ctx, mock_cluster)
-        result = manager._is_docker_port_in_use(8080)
+        result, _ = manager._docker_host_ports()
 
-        assert result is True
+        assert 8080 in result
 
-    def test_is_docker_port_in_use_different_port(self):
+    def test_docker_host_ports_different_port(self):
         """Test Docker port check with containers using different port."""
         mock_container = Mock()
         mock_container.attrs = {
@@ -180,11 +182,11 @@ class TestClusterPortManager:
         mock_cluster = self.create_mock_cluster()
 
         manager = ClusterPortManager(mock_ctx, mock_cluster)
-        result = manager._is_docker_port_in_use(8080)
+        result, _ = manager._docker_host_ports()
 
-        assert result is False
+        assert 8080 not in result
 
-    def test_is_docker_port_in_use_null_binding(self):
+    def test_docker_host_ports_null_binding(self):
         """Test Docker port check with null port binding."""
         mock_container = Mock()
         mock_container.attrs = {
@@ -198,12 +200,12 @@ class TestClusterPortManager:
         mock_cluster = self.create_mock_cluster()
 
         manager = ClusterPortManager(mock_ctx, mock_cluster)
-        result = manager._is_docker_port_in_use(8080)
+        result, _ = manager._docker_host_ports()
 
-        assert result is False
+        assert 8080 not in result
 
     @patch.object(ClusterPortManager, "_is_port_in_use")
-    @patch.object(ClusterPortManager, "_is_docker_port_in_use")
+    @patch.object(ClusterPortManager, "_docker_host_ports")
     def test_find_next_available_port_first_available(
         self, mock_docker_check, mock_port_check
     ):
@@ -213,7 +215,7 @@ class TestClusterPortManager:
 
         # Default port 8080 is free
         mock_port_check.return_value = False
-        mock_docker_check.return_value = False
+        mock_docker_check.return_value = (set(), set())
 
         manager = ClusterPortManager(mock_ctx, mock_cluster)
 
@@ -256,3 +258,135 @@ class TestClusterPortManager:
         # Should only process the __PORT_TEST mapping
         assert mock_assign.call_count == 2  # minitrino + __PORT_TEST
         mock_assign.assert_any_call("test", "__PORT_TEST", 9090)
+
+
+class TestPortAllocation:
+    """Test suite for host port allocation and reservations."""
+
+    def create_manager(self, cluster_name="test", docker_ports=(), listening=()):
+        """Create a ClusterPortManager with fixed used ports."""
+        mock_ctx = Mock()
+        mock_ctx.cluster_name = cluster_name
+        mock_ctx.env = {}
+        container = Mock()
+        container.attrs = {
+            "NetworkSettings": {
+                "Ports": {f"{p}/tcp": [{"HostPort": str(p)}] for p in docker_ports}
+            }
+        }
+        mock_ctx.docker_client.containers.list.return_value = [container]
+        services = {
+            "postgres": ("postgres", {"ports": ["${__PORT_POSTGRES}:5432"]}),
+            "mysql": ("mysql", {"ports": ["${__PORT_MYSQL}:5432"]}),
+        }
+        mock_ctx.modules.module_services.side_effect = lambda modules: [
+            services[m] for m in modules
+        ]
+        manager = ClusterPortManager(mock_ctx, Mock())
+        manager._listening_ports = Mock(return_value=set(listening))
+        return manager, mock_ctx
+
+    def test_single_container_listing(self):
+        """Test that used ports are collected once per call."""
+        manager, mock_ctx = self.create_manager(
+            docker_ports=[8080, 8081], listening=[5432]
+        )
+
+        manager.set_external_ports(["postgres", "mysql"])
+
+        mock_ctx.docker_client.containers.list.assert_called_once()
+        assert mock_ctx.env["__PORT_MINITRINO"] == "8082"
+        assert mock_ctx.env["__PORT_POSTGRES"] == "5433"
+        assert mock_ctx.env["__PORT_MYSQL"] == "5434"
+
+    def test_reassign_keeps_own_port(self):
+        """Test that a variable's current value is not treated as taken."""
+        manager, mock_ctx = self.create_manager()
+        mock_ctx.env["__PORT_MINITRINO"] = "8080"
+        mock_ctx.env["__PORT_OTHER"] = "5432"
+
+        manager.set_external_ports(["postgres"])
+
+        assert mock_ctx.env["__PORT_MINITRINO"] == "8080"
+        assert mock_ctx.env["__PORT_POSTGRES"] == "5433"
+
+    def test_bind_probe_without_proc(self):
+        """Test that candidates are bind-probed without socket tables."""
+        manager, mock_ctx = self.create_manager()
+        manager._listening_ports = Mock(return_value=None)
+        with patch.object(
+            manager, "_is_port_in_use", side_effect=lambda p: p == 8080
+        ) as probe:
+            manager.set_external_ports()
+
+        assert mock_ctx.env["__PORT_MINITRINO"] == "8081"
+        assert probe.call_count == 2
+
+    def test_listening_ports_from_proc(self, tmp_path):
+        """Test parsing listening ports from kernel socket tables."""
+        table = tmp_path / "tcp"
+        table.write_text(
+            "  sl  local_address rem_address   st\n"
+            "   0: 0100007F:1F90 00000000:0000 0A\n"
+            "   1: 0100007F:1F91 0100007F:D431 01\n"
+        )
+        manager = ClusterPortManager(Mock(), Mock())
+        with patch(
+            "minitrino.core.cluster.ports.PROC_NET_TCP", (str(table), "/missing")
+        ):
+            assert manager._listening_ports() == {8080}
+        with patch("minitrino.core.cluster.ports.PROC_NET_TCP", ("/missing",)):
+            assert manager._listening_ports() is None
+
+    def test_concurrent_clusters_do_not_collide(self):
+        """Test that ports reserved by another cluster are skipped."""
+        first, first_ctx = self.create_manager("first")
+        second, second_ctx = self.create_manager("second")
+
+        first.set_external_ports(["postgres"])
+        second.set_external_ports(["postgres"])
+
+        assert first_ctx.env["__PORT_MINITRINO"] == "8080"
+        assert second_ctx.env["__PORT_MINITRINO"] == "8081"
+        assert second_ctx.env["__PORT_POSTGRES"] == "5433"
+
+        # Re-provisioning a cluster reuses its own reservations
+        first.set_external_ports(["postgres"])
+        assert first_ctx.env["__PORT_MINITRINO"] == "8080"
+
+    def test_on_disk_reservations(self, tmp_path):
+        """Test that live on-disk reservations from other processes apply."""
+        reservations = {
+            "8080": {"cluster": "other", "pid": os.getpid(), "expires": 1e12},
+            "8081": {"cluster": "other", "pid": os.getpid(), "expires": 0},
+        }
+        (tmp_path / ".portreservations.json").write_text(json.dumps(reservations))
+        manager, mock_ctx = self.create_manager()
+
+        manager.set_external_ports()
+
+        assert mock_ctx.env["__PORT_MINITRINO"] == "8081"
+        saved = json.loads((tmp_path / ".portreservations.json").read_text())
+        assert set(saved) == {"8080", "8081"}
+        assert saved["8081"]["cluster"] == "test"
+
+    def test_reprovision_reuses_published_ports(self):
+        """Test that ports published by the cluster itself stay assignable."""
+        manager, mock_ctx = self.create_manager(listening=[8080, 5432])
+        manager._cluster.resource.compose_project_name.return_value = "minitrino-test"
+        own = Mock()
+        own.labels = {"com.docker.compose.project": "minitrino-test"}
+        own.attrs = {
+            "NetworkSettings": {
+                "Ports": {
+                    "8080/tcp": [{"HostPort": "8080"}],
+                    "5432/tcp": [{"HostPort": "5432"}],
+                }
+            }
+        }
+        mock_ctx.docker_client.containers.list.return_value = [own]
+
+        manager.set_external_ports(["postgres"])
+
+        assert mock_ctx.env["__PORT_MINITRINO"] == "8080"
+        assert mock_ctx.env["__PORT_POSTGRES"] == "5432"
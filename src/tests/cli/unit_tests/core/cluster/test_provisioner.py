@@ -0,0 +1,366 @@
+"""Unit tests for cluster provisioning.
+
+Tests the ClusterProvisioner class's ordering of the primary and
+dependent clusters and its Docker Compose commands.
+"""
+
+import json
+import os
+import threading
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from minitrino.core.cluster.plan import ProvisionPlan
+from minitrino.core.cluster.provisioner import ClusterProvisioner
+from minitrino.core.errors import UserError
+from minitrino.settings import PRIMARY_CLUSTER
+
+
+def create_provisioner():
+    """Create a ClusterProvisioner for the `default` cluster."""
+    mock_ctx = Mock()
+    mock_ctx.cluster_name = "default"
+    return ClusterProvisioner(mock_ctx, Mock())
+
+
+def dep(name, depends_on=None):
+    """Return a dependent cluster definition."""
+    cluster = {"name": f"default-dep-{name}", "modules": [], "workers": 0, "env": {}}
+    if depends_on is not None:
+        cluster["dependsOn"] = depends_on
+    return cluster
+
+
+class TestClusterDependencies:
+    """Test suite for ClusterProvisioner._cluster_dependencies."""
+
+    def test_defaults_to_primary(self):
+        """Test that dependent clusters depend on the primary by default."""
+        provisioner = create_provisioner()
+        deps = provisioner._cluster_dependencies([dep("a"), dep("b", [])])
+        assert deps == {
+            PRIMARY_CLUSTER: set(),
+            "default-dep-a": {PRIMARY_CLUSTER},
+            "default-dep-b": set(),
+        }
+
+    def test_named_dependency(self):
+        """Test that dependent clusters can depend on each other."""
+        provisioner = create_provisioner()
+        deps = provisioner._cluster_dependencies([dep("a", []), dep("b", ["a"])])
+        assert deps["default-dep-b"] == {"default-dep-a"}
+
+    def test_build_depends_on_primary(self):
+        """Test that all clusters wait for the primary when building."""
+        provisioner = create_provisioner()
+        provisioner.build = True
+        deps = provisioner._cluster_dependencies([dep("a", [])])
+        assert deps["default-dep-a"] == {PRIMARY_CLUSTER}
+
+    def test_unknown_dependency(self):
+        """Test that an unknown dependency raises UserError."""
+        provisioner = create_provisioner()
+        with pytest.raises(UserError, match="unknown cluster 'missing'"):
+            provisioner._cluster_dependencies([dep("a", ["missing"])])
+
+    def test_circular_dependency(self):
+        """Test that circular dependencies raise UserError."""
+        provisioner = create_provisioner()
+        with pytest.raises(UserError, match="Circular dependency"):
+            provisioner._cluster_dependencies([dep("a", ["b"]), dep("b", ["a"])])
+
+
+class TestProvisionClusters:
+    """Test suite for ClusterProvisioner._provision_clusters."""
+
+    def setup_runners(self, provisioner, runners):
+        """Replace cluster runners with the provided callables."""
+        provisioner._runner = runners[PRIMARY_CLUSTER]
+
+        def fork(name):
+            forked = Mock()
+            forked._runner = lambda cluster: runners[name]()
+            return forked
+
+        provisioner._fork = fork
+
+    def test_independent_clusters_run_concurrently(self):
+        """Test that clusters without dependencies overlap."""
+        provisioner = create_provisioner()
+        barrier = threading.Barrier(3, timeout=5)
+        self.setup_runners(
+            provisioner,
+            {
+                PRIMARY_CLUSTER: barrier.wait,
+                "default-dep-a": barrier.wait,
+                "default-dep-b": barrier.wait,
+            },
+        )
+
+        provisioner._provision_clusters([dep("a", []), dep("b", [])])
+
+    def test_dependencies_run_in_order(self):
+        """Test that clusters start after their dependencies finish."""
+        provisioner = create_provisioner()
+        order = []
+        lock = threading.Lock()
+
+        def runner(name):
+            def _run():
+                with lock:
+                    order.append(name)
+
+            return _run
+
+        self.setup_runners(
+            provisioner,
+            {
+                PRIMARY_CLUSTER: runner(PRIMARY_CLUSTER),
+                "default-dep-a": runner("a"),
+                "default-dep-b": runner("b"),
+            },
+        )
+
+        provisioner._provision_clusters([dep("b", ["a"]), dep("a")])
+
+        assert order == [PRIMARY_CLUSTER, "a", "b"]
+
+    def test_failure_stops_new_clusters(self):
+        """Test that no clusters start after a failure."""
+        provisioner = create_provisioner()
+        started = []
+
+        def fail():
+            raise RuntimeError("primary failed")
+
+        self.setup_runners(
+            provisioner,
+            {
+                PRIMARY_CLUSTER: fail,
+                "default-dep-a": lambda: started.append("a"),
+            },
+        )
+
+        with pytest.raises(RuntimeError, match="primary failed"):
+            provisioner._provision_clusters([dep("a")])
+
+        assert started == []
+
+
+class TestProvisionWorkersWhenSafe:
+    """Test suite for ClusterProvisioner._provision_workers_when_safe."""
+
+    def run(self, provisioner):
+        """Run the worker thread and return once it exits."""
+        thread = threading.Thread(target=provisioner._provision_workers_when_safe)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    def test_compose_failure(self):
+        """Test that workers are skipped if Compose fails before startup."""
+        provisioner = create_provisioner()
+        provisioner._compose_failed.set()
+
+        self.run(provisioner)
+
+        provisioner._ctx.cluster.ops.reconcile_workers.assert_not_called()
+
+    def test_aborted_before_worker_safe(self):
+        """Test that workers are skipped if the coordinator fails to start."""
+        provisioner = create_provisioner()
+        provisioner._ctx.cluster.ops.cached_worker_image.return_value = ""
+        provisioner._coordinator_started_event.set()
+        provisioner._provision_aborted.set()
+
+        self.run(provisioner)
+
+        provisioner._ctx.cluster.ops.reconcile_workers.assert_not_called()
+
+    def test_worker_safe(self):
+        """Test that workers are provisioned once the coordinator is ready."""
+        provisioner = create_provisioner()
+        provisioner._ctx.logger = MagicMock()
+        provisioner.workers = 2
+        provisioner._ctx.cluster.ops.cached_worker_image.return_value = ""
+        provisioner._coordinator_started_event.set()
+        provisioner._worker_safe_event.set()
+
+        self.run(provisioner)
+
+        provisioner._ctx.cluster.ops.reconcile_workers.assert_called_once_with(
+            2, 0, cached_image=""
+        )
+
+
+class TestBuildComposeCommand:
+    """Test suite for ClusterProvisioner._build_compose_command."""
+
+    def build(self, plan, build=False):
+        """Return the compose arguments after the `-f` flags."""
+        provisioner = create_provisioner()
+        provisioner.build = build
+        provisioner._resolve_compose_bin = lambda: ("docker", ["compose"])
+        cmd = provisioner._build_compose_command(["a.yaml"], plan)
+        return cmd[4:]
+
+    def test_full_plan(self):
+        """Test that all services are recreated without unchanged ones."""
+        plan = ProvisionPlan(create=["minitrino"], recreate=["postgres"])
+        assert self.build(plan) == ["up", "-d", "--force-recreate"]
+        assert self.build(None, build=True)[-1] == "--build"
+
+    def test_partial_plan(self):
+        """Test that only changed services are brought up."""
+        plan = ProvisionPlan(
+            create=["mysql"], recreate=["minitrino"], unchanged=["postgres"]
+        )
+        assert self.build(plan) == [
+            "up",
+            "-d",
+            "--force-recreate",
+            "--no-deps",
+            "minitrino",
+            "mysql",
+        ]
+
+    def test_unchanged_plan(self):
+        """Test that no services are recreated when nothing changed."""
+        plan = ProvisionPlan(unchanged=["minitrino"])
+        assert self.build(plan) == ["up", "-d", "--no-recreate"]
+
+
+class TestImageSrcChecksum:
+    """Test suite for ClusterProvisioner._get_image_src_checksum."""
+
+    @pytest.fixture
+    def provisioner(self, tmp_path):
+        """Create a provisioner with a small image source tree."""
+        image_dir = tmp_path / "lib" / "image"
+        (image_dir / "src").mkdir(parents=True)
+        (image_dir / "Dockerfile").write_text("FROM ubuntu\n")
+        (image_dir / "src" / "run.sh").write_text("echo hi\n")
+        provisioner = create_provisioner()
+        provisioner._ctx.lib_dir = str(tmp_path / "lib")
+        provisioner._ctx.minitrino_user_dir = str(tmp_path / ".minitrino")
+        return provisioner
+
+    def test_unchanged_files_not_reread(self, provisioner, monkeypatch):
+        """Test that cached digests are reused for unchanged files."""
+        checksum = provisioner._get_image_src_checksum()
+        manifest = provisioner._read_checksum_manifest()
+        assert len(manifest) == 2
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was re-read")
+
+        monkeypatch.setattr("builtins.open", fail)
+        monkeypatch.setattr(provisioner, "_read_checksum_manifest", lambda: manifest)
+        assert provisioner._get_image_src_checksum() == checksum
+
+    def test_modified_file_rehashed(self, provisioner, tmp_path):
+        """Test that modified and renamed files change the checksum."""
+        checksum = provisioner._get_image_src_checksum()
+        run_sh = tmp_path / "lib" / "image" / "src" / "run.sh"
+
+        run_sh.write_text("echo bye\n")
+        modified = provisioner._get_image_src_checksum()
+        assert modified != checksum
+
+        run_sh.rename(run_sh.with_name("start.sh"))
+        assert provisioner._get_image_src_checksum() not in (checksum, modified)
+        assert str(run_sh) not in provisioner._read_checksum_manifest()
+
+
+class TestBuildCache:
+    """Test suite for ClusterProvisioner build cache keys."""
+
+    def create_provisioner(self, tmp_path, ver="476", driver="docker-container"):
+        """Create a provisioner for a cluster version and builder driver."""
+        provisioner = create_provisioner()
+        provisioner._ctx.env = {"CLUSTER_VER": ver, "CLUSTER_DIST": "trino"}
+        provisioner._ctx.minitrino_user_dir = str(tmp_path)
+        provisioner._ctx.env["JAVA_VER"] = provisioner._java_version()
+        provisioner._buildx_driver = lambda: driver
+        return provisioner
+
+    def test_java_version(self, tmp_path):
+        """Test that cluster versions map to their Java version."""
+        versions = {"443": "21.0.5", "447": "22.0.2", "476-e.1": "24.0.2"}
+        for ver, java_ver in versions.items():
+            provisioner = self.create_provisioner(tmp_path, ver)
+            assert provisioner._java_version() == java_ver
+
+    def test_java_version_unsupported(self, tmp_path):
+        """Test that versions older than every Java mapping are rejected."""
+        provisioner = self.create_provisioner(tmp_path)
+        provisioner._ctx.env["CLUSTER_VER"] = "435"
+        with pytest.raises(UserError, match="435"):
+            provisioner._java_version()
+
+    def cache_build(self, tmp_path, ver):
+        """Return the build section of a version's cache Compose file."""
+        provisioner = self.create_provisioner(tmp_path, ver)
+        with open(provisioner._build_cache_file()) as f:
+            return json.load(f)["services"]["minitrino"]["build"]
+
+    def test_cache_shared_by_java_version(self, tmp_path):
+        """Test that versions using the same Java import each other's cache."""
+        build = self.cache_build(tmp_path, "475")
+        cache_dir = build["cache_to"][0].split(",")[1].removeprefix("dest=")
+        os.makedirs(cache_dir)
+        (tmp_path / cache_dir / "index.json").touch()
+
+        build = self.cache_build(tmp_path, "476")
+        assert build["cache_to"][0].endswith("476-trino,mode=max")
+        assert build["cache_from"][1] == f"type=local,src={cache_dir}"
+
+        assert len(self.cache_build(tmp_path, "463")["cache_from"]) == 1
+
+    def test_cache_pruned(self, tmp_path):
+        """Test that caches other than the current one are pruned over the cap."""
+        for ver in ["463", "475"]:
+            build = self.cache_build(tmp_path, ver)
+            cache_dir = build["cache_to"][0].split(",")[1].removeprefix("dest=")
+            os.makedirs(cache_dir)
+            (tmp_path / cache_dir / "index.json").write_text("{}")
+
+        assert len(self.cache_build(tmp_path, "476")["cache_from"]) == 2
+
+        provisioner = self.create_provisioner(tmp_path, "476")
+        provisioner._ctx.env["BUILD_CACHE_SIZE"] = "0"
+        build_file = provisioner._build_cache_file()
+        caches = sorted(p.name for p in (tmp_path / ".buildcache").glob("*/*"))
+        assert caches == ["476-trino.compose.json"]
+        assert build_file.endswith("476-trino.compose.json")
+
+        provisioner._ctx.env["BUILD_CACHE_SIZE"] = "big"
+        with pytest.raises(UserError, match="BUILD_CACHE_SIZE"):
+            provisioner._build_cache_file()
+
+    def test_artifact_dir_only_for_builds(self, tmp_path):
+        """Test that the artifact cache is only resolved for builds."""
+        provisioner = self.create_provisioner(tmp_path)
+        provisioner._artifact_cache = Mock()
+        provisioner._artifact_cache.directory.return_value = "/cache"
+
+        provisioner.build = False
+        provisioner._set_env_vars()
+        assert "__ARTIFACT_DIR" not in provisioner._ctx.env
+        provisioner._artifact_cache.directory.assert_not_called()
+
+        provisioner.build = True
+        provisioner._set_env_vars()
+        assert provisioner._ctx.env["__ARTIFACT_DIR"] == "/cache"
+
+    def test_compose_command(self, tmp_path):
+        """Test that the cache file is only added for exporting builders."""
+        provisioner = self.create_provisioner(tmp_path)
+        provisioner.build = True
+        provisioner._resolve_compose_bin = lambda: ("docker", ["compose"])
+        cmd = provisioner._build_compose_command(["a.yaml"])
+        assert cmd[4:7] == ["-f", provisioner._build_cache_file(), "up"]
+
+        provisioner._buildx_driver = lambda: "docker"
+        cmd = provisioner._build_compose_command(["a.yaml"])
+        assert cmd[4] == "up"
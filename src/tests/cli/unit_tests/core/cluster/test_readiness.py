@@ -0,0 +1,116 @@
+"""Unit tests for coordinator readiness detection.
+
+Tests the CoordinatorLogWatcher class against mocked log streams.
+"""
+
+import threading
+from unittest.mock import Mock
+
+from minitrino.core.cluster.readiness import CoordinatorLogWatcher
+
+
+def create_container(chunks):
+    """Create a mock container whose log stream yields `chunks`."""
+    container = Mock()
+    container.id = "abc123def4567890"
+    container.logs.return_value = iter(chunks)
+    return container
+
+
+def run_watcher(container):
+    """Run a watcher to completion and return it with its event."""
+    worker_safe = threading.Event()
+    watcher = CoordinatorLogWatcher(container, worker_safe).start()
+    assert watcher.stopped_event.wait(5)
+    return watcher, worker_safe
+
+
+class TestCoordinatorLogWatcher:
+    """Test suite for CoordinatorLogWatcher."""
+
+    def test_markers_detected(self):
+        """Test that both markers set their events."""
+        container = create_container(
+            [
+                b"+ gen_config.py\n",
+                b"---- PRE START BOOTSTRAPS COMPLETED ----\n",
+                b"SERVER STARTED\n",
+                b"---- CLUSTER IS READY ----\n",
+            ]
+        )
+
+        watcher, worker_safe = run_watcher(container)
+
+        assert worker_safe.is_set()
+        assert watcher.ready_event.is_set()
+        container.logs.assert_called_once_with(stream=True, follow=True)
+
+    def test_marker_split_across_chunks(self):
+        """Test that markers spanning chunk boundaries are detected."""
+        container = create_container(
+            [b"---- PRE START BOOTS", b"TRAPS COMPLETED ----\n---- CLUSTER I", b"S"]
+            + [b" READY ----\n"]
+        )
+
+        watcher, worker_safe = run_watcher(container)
+
+        assert worker_safe.is_set()
+        assert watcher.ready_event.is_set()
+
+    def test_worker_safe_only(self):
+        """Test that the ready event stays unset until its marker."""
+        container = create_container([b"---- PRE START BOOTSTRAPS COMPLETED ----\n"])
+
+        watcher, worker_safe = run_watcher(container)
+
+        assert worker_safe.is_set()
+        assert not watcher.ready_event.is_set()
+
+    def test_stream_stops_after_ready(self):
+        """Test that the stream is not consumed past the ready marker."""
+        consumed = []
+
+        def chunks():
+            for chunk in (b"---- CLUSTER IS READY ----\n", b"later\n"):
+                consumed.append(chunk)
+                yield chunk
+
+        container = create_container([])
+        container.logs.return_value = chunks()
+
+        watcher, worker_safe = run_watcher(container)
+
+        assert watcher.ready_event.is_set()
+        assert worker_safe.is_set()
+        assert consumed == [b"---- CLUSTER IS READY ----\n"]
+
+    def test_stream_error(self):
+        """Test that stream errors stop the watcher without raising."""
+        container = create_container([])
+        container.logs.side_effect = Exception("connection reset")
+
+        watcher, worker_safe = run_watcher(container)
+
+        assert not worker_safe.is_set()
+        assert not watcher.ready_event.is_set()
+
+    def test_stop_closes_stream(self):
+        """Test that stopping the watcher closes the log stream."""
+        watcher = CoordinatorLogWatcher(create_container([]), threading.Event())
+        watcher._stream = Mock()
+
+        watcher.stop()
+
+        watcher._stream.close.assert_called_once()
+        assert watcher.stopped_event.is_set()
+
+    def test_since(self):
+        """Test that the log stream can start after a restart."""
+        container = create_container([b"---- CLUSTER IS READY ----\n"])
+        watcher = CoordinatorLogWatcher(container, threading.Event(), since=1700000000)
+        watcher.start()
+        assert watcher.stopped_event.wait(5)
+
+        container.logs.assert_called_once_with(
+            stream=True, follow=True, since=1700000000
+        )
@@ -8,6 +8,8 @@ from unittest.mock import Mock, patch
 import pytest
 from minitrino.core.cluster.resource import ClusterResourceManager
 from minitrino.core.docker.wrappers import MinitrinoContainer
+from minitrino.core.errors import MinitrinoError
+from minitrino.settings import RESOURCE_SNAPSHOT_TTL
 
 
 class TestClusterResourceManager:
@@ -333,3 +335,97 @@ class TestClusterResourceManager:
         # After setting to True, it should remain True
         manager._logged_cluster_resource_msg = True
         assert manager._logged_cluster_resource_msg is True
+
+
+class TestResourceSnapshot:
+    """Test suite for the shared resource snapshot."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a manager whose Docker client lists one of each type."""
+        mock_ctx = Mock()
+        mock_ctx.cluster_name = "dev"
+        mock_ctx.all_clusters = False
+        labels = {
+            "org.minitrino.root": "true",
+            "com.docker.compose.project": "minitrino-dev",
+        }
+        for kind in ("containers", "volumes", "images", "networks"):
+            obj = Mock()
+            obj.labels = labels
+            obj.attrs = {"Labels": labels}
+            obj.id = f"{kind}-id"
+            obj.tags = []
+            getattr(mock_ctx.docker_client, kind).list.return_value = [obj]
+        return ClusterResourceManager(mock_ctx)
+
+    def _list_calls(self, manager):
+        client = manager._ctx.docker_client
+        return {
+            kind: getattr(client, kind).list.call_count
+            for kind in ("containers", "volumes", "images", "networks")
+        }
+
+    def test_snapshot_reused(self, manager):
+        """Test that repeated lookups share one set of list calls."""
+        manager.resources()
+        manager.resources()
+        manager.cluster_containers()
+
+        assert self._list_calls(manager) == {
+            "containers": 1,
+            "volumes": 1,
+            "images": 1,
+            "networks": 1,
+        }
+
+    def test_only_requested_kinds_listed(self, manager):
+        """Test that only requested resource types are listed."""
+        resources = manager.resources(kinds=["containers"])
+
+        assert len(resources.containers()) == 1
+        assert resources.images() == []
+        assert self._list_calls(manager) == {
+            "containers": 1,
+            "volumes": 0,
+            "images": 0,
+            "networks": 0,
+        }
+
+    def test_invalidate(self, manager):
+        """Test that invalidated types are listed again."""
+        manager.resources()
+        manager.invalidate("containers")
+        manager.resources()
+
+        calls = self._list_calls(manager)
+        assert calls["containers"] == 2
+        assert calls["images"] == 1
+
+        manager.invalidate()
+        manager.resources()
+        assert self._list_calls(manager)["images"] == 2
+
+    def test_snapshot_expires(self, manager):
+        """Test that the snapshot is refreshed after its TTL."""
+        with patch("minitrino.core.cluster.resource.time.monotonic") as mock_time:
+            mock_time.return_value = 100.0
+            manager.resources(kinds=["containers"])
+            mock_time.return_value = 100.0 + RESOURCE_SNAPSHOT_TTL + 1
+            manager.resources(kinds=["containers"])
+
+        assert self._list_calls(manager)["containers"] == 2
+
+    def test_wrapped_with_current_cluster(self, manager):
+        """Test that snapshotted objects use the active cluster name."""
+        manager.resources(kinds=["volumes"])
+        manager._ctx.cluster_name = "other"
+
+        volumes = manager.unfiltered_resources(kinds=["volumes"])["volumes"]
+
+        assert volumes[0]._cluster_name == "other"
+
+    def test_invalid_kind(self, manager):
+        """Test that unknown resource types raise."""
+        with pytest.raises(MinitrinoError, match="Invalid resource type"):
+            manager.resources(kinds=["pods"])
@@ -3,12 +3,16 @@
 Tests the ClusterValidator class for configuration validation.
 """
 
+import os
 from unittest.mock import Mock
 
 import pytest
+from minitrino.core.cluster.configs import ClusterConfigRenderer
 from minitrino.core.cluster.validator import ClusterValidator
 from minitrino.core.errors import UserError
 
+LIB_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../../lib"))
+
 
 class TestClusterValidator:
     """Test suite for ClusterValidator class."""
@@ -204,3 +208,40 @@ class TestClusterValidator:
         # Should handle circular dependencies gracefully
         result = validator.check_dependent_clusters(["module_a", "module_b"])
         assert isinstance(result, list)
+
+    def test_check_dup_config_renders_on_host(self):
+        """Test that conflicting overrides are reported without containers."""
+        mock_ctx = self.create_mock_context()
+        mock_ctx.lib_dir = LIB_DIR
+        mock_cluster = self.create_mock_cluster()
+        mock_cluster.configs = ClusterConfigRenderer(mock_ctx)
+        validator = ClusterValidator(mock_ctx, mock_cluster)
+
+        validator.check_dup_config(
+            environment={
+                "WORKERS": "1",
+                "MINITRINO_MODULES": "ldap",
+                "JVM_CONFIG": "-Xmx2G",
+                "LDAP_JVM_CONFIG": "-Xmx4G",
+                "WORKER_CONFIG_PROPERTIES": "task.concurrency=4\ntask.concurrency=8",
+            }
+        )
+
+        warnings = [c.args[0] for c in mock_ctx.logger.warn.call_args_list]
+        assert len(warnings) == 2
+        assert "in 'jvm.config' file:" in warnings[0]
+        assert "- LDAP_JVM_CONFIG: -Xmx=4G" in warnings[0]
+        assert "Using: -Xmx=2G" in warnings[0]
+        assert "in 'config.properties' file for workers:" in warnings[1]
+        mock_ctx.cmd_executor.execute.assert_not_called()
+
+    def test_check_dup_config_without_environment(self):
+        """Test that nothing is checked without configs or an environment."""
+        mock_ctx = self.create_mock_context()
+        mock_cluster = self.create_mock_cluster()
+        validator = ClusterValidator(mock_ctx, mock_cluster)
+
+        validator.check_dup_config()
+
+        mock_cluster.configs.render.assert_not_called()
+        mock_ctx.logger.warn.assert_not_called()
@@ -6,7 +6,15 @@ Tests Docker daemon socket resolution with mocking.
 import os
 from unittest.mock import Mock, patch
 
-from minitrino.core.docker.socket import resolve_docker_socket
+import pytest
+from minitrino import utils
+from minitrino.core.docker.socket import (
+    clear_docker_socket_cache,
+    docker_clients,
+    get_docker_context_name,
+    resolve_docker_socket,
+)
+from minitrino.core.errors import MinitrinoError, UserError
 
 
 class TestResolveDockerSocket:
@@ -125,3 +133,114 @@ class TestResolveDockerSocket:
             socket = resolve_docker_socket(ctx=mock_ctx, env=custom_env)
 
         assert socket is not None
+
+
+class TestDockerContextCache:
+    """Test suite for Docker context and client caching."""
+
+    @pytest.fixture
+    def docker_config(self, tmp_path):
+        """Create a Docker config directory and return its environment."""
+        config_dir = tmp_path / "docker"
+        (config_dir / "contexts" / "meta").mkdir(parents=True)
+        (config_dir / "config.json").write_text('{"currentContext": "default"}')
+        return {"DOCKER_CONFIG": str(config_dir)}
+
+    @pytest.fixture
+    def mock_ctx(self):
+        """Create a context whose executor returns a Docker context."""
+        mock_ctx = Mock()
+        mock_result = Mock()
+        mock_result.output = (
+            '[{"Name": "orbstack", '
+            '"Endpoints": {"docker": {"Host": "unix:///orbstack.sock"}}}]'
+        )
+        mock_ctx.cmd_executor.execute.return_value = [mock_result]
+        return mock_ctx
+
+    def test_resolve_cached(self, mock_ctx, docker_config):
+        """Test that the Docker context is only inspected once."""
+        assert resolve_docker_socket(mock_ctx, docker_config) == "unix:///orbstack.sock"
+        assert resolve_docker_socket(mock_ctx, docker_config) == "unix:///orbstack.sock"
+        assert get_docker_context_name(mock_ctx, docker_config) == "orbstack"
+
+        mock_ctx.cmd_executor.execute.assert_called_once()
+
+    def test_cache_invalidated_on_config_change(self, mock_ctx, docker_config):
+        """Test that modifying the Docker config invalidates the cache."""
+        resolve_docker_socket(mock_ctx, docker_config)
+        config_file = os.path.join(docker_config["DOCKER_CONFIG"], "config.json")
+        st = os.stat(config_file)
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        resolve_docker_socket(mock_ctx, docker_config)
+
+        assert mock_ctx.cmd_executor.execute.call_count == 2
+
+    def test_cache_invalidated_on_context_switch(self, mock_ctx, docker_config):
+        """Test that DOCKER_CONTEXT is part of the cache key."""
+        resolve_docker_socket(mock_ctx, docker_config)
+        resolve_docker_socket(mock_ctx, {**docker_config, "DOCKER_CONTEXT": "other"})
+
+        assert mock_ctx.cmd_executor.execute.call_count == 2
+
+    def test_disk_cache(self, mock_ctx, docker_config):
+        """Test that a new process reuses the on-disk cache."""
+        resolve_docker_socket(mock_ctx, docker_config)
+        clear_docker_socket_cache()
+
+        assert resolve_docker_socket(mock_ctx, docker_config) == "unix:///orbstack.sock"
+        mock_ctx.cmd_executor.execute.assert_called_once()
+
+    def test_failure_not_cached(self, mock_ctx, docker_config):
+        """Test that failed lookups are retried."""
+        mock_ctx.cmd_executor.execute.side_effect = [Exception("boom"), None]
+        with pytest.raises(MinitrinoError):
+            resolve_docker_socket(mock_ctx, docker_config)
+        mock_ctx.cmd_executor.execute.side_effect = None
+
+        assert resolve_docker_socket(mock_ctx, docker_config) == "unix:///orbstack.sock"
+
+    @patch("docker.APIClient")
+    @patch("docker.DockerClient")
+    def test_docker_clients_reused(self, mock_docker_client, mock_api_client):
+        """Test that clients are created once per socket."""
+        first = docker_clients("unix:///orbstack.sock")
+        second = docker_clients("unix:///orbstack.sock")
+        docker_clients("unix:///other.sock")
+
+        assert first is second
+        assert mock_docker_client.call_count == 2
+        mock_docker_client.assert_any_call(base_url="unix:///orbstack.sock")
+
+
+class TestCheckDaemon:
+    """Test suite for utils.check_daemon."""
+
+    def test_reuses_client(self):
+        """Test that the provided client is pinged directly."""
+        client = Mock()
+        with patch("minitrino.utils.docker_clients") as mock_clients:
+            utils.check_daemon(client)
+
+        client.ping.assert_called_once()
+        mock_clients.assert_not_called()
+
+    def test_falls_back_to_shared_client(self):
+        """Test that an unusable client falls back to the shared client."""
+        shared = Mock()
+        with (
+            patch("minitrino.utils.resolve_docker_socket", return_value="unix:///s"),
+            patch("minitrino.utils.docker_clients", return_value=(shared, Mock())),
+        ):
+            utils.check_daemon(object())
+
+        shared.ping.assert_called_once()
+
+    def test_ping_failure(self):
+        """Test that ping failures raise a UserError."""
+        client = Mock()
+        client.ping.side_effect = Exception("connection refused")
+
+        with pytest.raises(UserError, match="Is the Docker daemon running"):
+            utils.check_daemon(client)
@@ -0,0 +1,127 @@
+"""Unit tests for Docker Compose YAML loading."""
+
+import glob
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+import yaml
+from minitrino.core import compose
+from minitrino.core.compose import (
+    HAS_LIBYAML,
+    clear_yaml_cache,
+    load_yaml,
+    parse_yaml,
+)
+
+LIB_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "lib")
+)
+
+
+class TestLoadYaml:
+    """Test suite for load_yaml."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Clear memoized YAML files between tests."""
+        clear_yaml_cache()
+        yield
+        clear_yaml_cache()
+
+    def test_load_yaml(self, tmp_path):
+        """Test loading a YAML file."""
+        path = tmp_path / "test.yaml"
+        path.write_text("services:\n  minitrino:\n    image: test\n")
+
+        assert load_yaml(str(path)) == {"services": {"minitrino": {"image": "test"}}}
+
+    def test_load_empty_yaml(self, tmp_path):
+        """Test that empty files load as an empty dict."""
+        path = tmp_path / "empty.yaml"
+        path.write_text("")
+
+        assert load_yaml(str(path)) == {}
+
+    def test_load_yaml_memoized(self, tmp_path):
+        """Test that unchanged files are only parsed once."""
+        path = tmp_path / "test.yaml"
+        path.write_text("a: 1\n")
+
+        with patch.object(compose, "parse_yaml", side_effect=parse_yaml) as mock:
+            first = load_yaml(str(path))
+            second = load_yaml(str(path))
+
+        mock.assert_called_once()
+        assert first is second
+
+    def test_load_yaml_invalidated_on_change(self, tmp_path):
+        """Test that modified files are re-parsed."""
+        path = tmp_path / "test.yaml"
+        path.write_text("a: 1\n")
+        assert load_yaml(str(path)) == {"a": 1}
+
+        path.write_text("a: 22\n")
+
+        assert load_yaml(str(path)) == {"a": 22}
+
+    def test_load_missing_file(self, tmp_path):
+        """Test that missing files raise."""
+        with pytest.raises(FileNotFoundError):
+            load_yaml(str(tmp_path / "missing.yaml"))
+
+    def test_uses_libyaml_when_available(self, tmp_path):
+        """Test that files are parsed with libyaml when PyYAML has it."""
+        path = tmp_path / "test.yaml"
+        path.write_text("a: 1\n")
+        expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+        with patch.object(compose.yaml, "load", return_value={"a": 1}) as mock:
+            load_yaml(str(path))
+
+        assert mock.call_args.kwargs["Loader"] is expected
+        assert hasattr(yaml, "CSafeLoader") == HAS_LIBYAML
+
+
+@pytest.mark.skipif(not HAS_LIBYAML, reason="PyYAML built without libyaml")
+class TestLibyaml:
+    """Test suite comparing libyaml to pure-Python PyYAML."""
+
+    def compose_files(self) -> list[str]:
+        """Return the contents of the library's Compose files."""
+        files = glob.glob(os.path.join(LIB_DIR, "**", "*.yaml"), recursive=True)
+        assert files, f"No Compose files found in {LIB_DIR}"
+        contents = []
+        for path in files:
+            with open(path) as f:
+                contents.append(f.read())
+        return contents
+
+    def test_same_result(self):
+        """Test that libyaml parses the library's Compose files identically."""
+        for content in self.compose_files():
+            assert parse_yaml(content, yaml.CSafeLoader) == parse_yaml(
+                content, yaml.FullLoader
+            )
+
+    @pytest.mark.benchmark
+    def test_parse_time(self):
+        """Benchmark libyaml against pure-Python PyYAML."""
+        contents = self.compose_files()
+
+        def _time(loader: type) -> float:
+            start = time.perf_counter()
+            for _ in range(3):
+                for content in contents:
+                    parse_yaml(content, loader)
+            return time.perf_counter() - start
+
+        c_time = _time(yaml.CSafeLoader)
+        py_time = _time(yaml.FullLoader)
+        print(
+            f"\nParsed {len(contents)} Compose files x3: libyaml "
+            f"{c_time * 1000:.1f} ms, pure-Python {py_time * 1000:.1f} ms "
+            f"({py_time / c_time:.1f}x)"
+        )
+        assert c_time < py_time
@@ -40,12 +40,12 @@ class TestMinitrinoContext:
         assert ctx.api_client is None
 
     @patch("minitrino.core.context.EnvironmentVariables")
-    @patch("minitrino.core.context.Modules")
-    @patch("minitrino.core.context.CommandExecutor")
-    @patch("minitrino.core.context.Cluster")
+    @patch("minitrino.core.modules.Modules")
+    @patch("minitrino.core.exec.cmd.CommandExecutor")
+    @patch("minitrino.core.cluster.cluster.Cluster")
     @patch("minitrino.core.context.resolve_docker_socket")
-    @patch("minitrino.core.context.docker.DockerClient")
-    @patch("minitrino.core.context.docker.APIClient")
+    @patch("docker.DockerClient")
+    @patch("docker.APIClient")
     @patch("minitrino.core.context.utils")
     def test_initialize_normal(
         self,
@@ -382,7 +382,7 @@ class TestMinitrinoContext:
         # Should not log warning since it silently catches the exception
         ctx.logger.warn.assert_not_called()
 
-    @patch("minitrino.core.context.Cluster")
+    @patch("minitrino.core.cluster.cluster.Cluster")
     def test_set_cluster_attrs(self, mock_cluster_class):
         """Test setting cluster attributes."""
         ctx = MinitrinoContext()
@@ -448,8 +448,8 @@ class TestMinitrinoContext:
         assert ctx.all_clusters is True
 
     @patch("minitrino.core.context.resolve_docker_socket")
-    @patch("minitrino.core.context.docker.DockerClient")
-    @patch("minitrino.core.context.docker.APIClient")
+    @patch("docker.DockerClient")
+    @patch("docker.APIClient")
     def test_set_docker_clients_success(
         self, mock_api_client, mock_docker_client, mock_resolve_socket
     ):
@@ -486,11 +486,11 @@ class TestMinitrinoContext:
         assert ctx.api_client is not None
 
     @patch("minitrino.core.context.EnvironmentVariables")
-    @patch("minitrino.core.context.Modules")
-    @patch("minitrino.core.context.CommandExecutor")
-    @patch("minitrino.core.context.Cluster")
+    @patch("minitrino.core.modules.Modules")
+    @patch("minitrino.core.exec.cmd.CommandExecutor")
+    @patch("minitrino.core.cluster.cluster.Cluster")
     @patch("minitrino.core.context.resolve_docker_socket")
-    @patch("minitrino.core.context.docker")
+    @patch("docker.DockerClient")
     @patch("minitrino.core.context.utils")
     def test_initialize_with_log_level(
         self,
@@ -553,3 +553,45 @@ class TestMinitrinoContext:
 
             assert ctx.logger == mock_logger
             mock_get_logger.assert_called_once_with("minitrino")
+
+    def test_fork(self):
+        """Test that a forked context isolates cluster and environment."""
+        from minitrino.core.envvars import EnvironmentVariables
+        from minitrino.core.modules import Modules
+
+        ctx = MinitrinoContext()
+        ctx.env = EnvironmentVariables.__new__(EnvironmentVariables)
+        ctx.env._ctx = ctx
+        ctx.env.update({"CLUSTER_NAME": "default", "CLUSTER_DIST": "trino"})
+        ctx.modules = Modules.__new__(Modules)
+        ctx.modules._ctx = ctx
+        ctx.modules.data = {"hive": {}}
+        ctx.cmd_executor = MagicMock()
+        ctx.docker_client = MagicMock()
+        ctx._initialized = True
+
+        forked = ctx.fork("default-dep-remote")
+
+        assert forked.cluster_name == "default-dep-remote"
+        assert forked.env["CLUSTER_NAME"] == "default-dep-remote"
+        assert forked.env["COMPOSE_PROJECT_NAME"] == "minitrino-default-dep-remote"
+        assert forked.env._ctx is forked
+        assert forked.modules._ctx is forked
+        assert forked.modules.data is ctx.modules.data
+        assert forked.cluster._ctx is forked
+        assert forked.cluster.resource.fq_container_name("minitrino") == (
+            "minitrino-default-dep-remote"
+        )
+        assert forked.docker_client is ctx.docker_client
+        assert forked.cmd_executor is ctx.cmd_executor
+        assert forked.provisioned_clusters is ctx.provisioned_clusters
+
+        forked.env["WORKERS"] = "2"
+        assert "WORKERS" not in ctx.env
+        assert ctx.cluster_name == "default"
+        assert ctx.env["CLUSTER_NAME"] == "default"
+
+    def test_fork_uninitialized(self):
+        """Test that an uninitialized context cannot be forked."""
+        with pytest.raises(MinitrinoError):
+            MinitrinoContext().fork("other")
@@ -1,8 +1,10 @@
 """Unit tests for the Modules class."""
 
+import shutil
 from unittest.mock import MagicMock, patch
 
 import pytest
+from minitrino.core.compose import load_yaml
 from minitrino.core.errors import MinitrinoError, UserError
 from minitrino.core.modules import Modules
 
@@ -381,3 +383,124 @@ class TestModules:
         with pytest.raises(UserError) as exc_info:
             modules._load_modules()
         assert "Missing Docker Compose file" in str(exc_info.value)
+
+
+class TestModuleCache:
+    """Test suite for the on-disk module catalog cache."""
+
+    @pytest.fixture
+    def lib_ctx(self, tmp_path):
+        """Create a mock context pointing to a minimal library."""
+        lib_dir = tmp_path / "lib"
+        lib_dir.mkdir()
+        (lib_dir / "version").write_text("9.9.9")
+        for section in ["admin", "catalog", "security"]:
+            (lib_dir / "modules" / section).mkdir(parents=True)
+        for name in ["faker", "postgres"]:
+            module_dir = lib_dir / "modules" / "catalog" / name
+            module_dir.mkdir()
+            (module_dir / f"{name}.yaml").write_text(
+                f"services:\n  {name}:\n    image: {name}\n"
+            )
+            (module_dir / "metadata.json").write_text(
+                f'{{"description": "{name} module"}}'
+            )
+
+        ctx = MagicMock()
+        ctx.lib_dir = str(lib_dir)
+        ctx.minitrino_user_dir = str(tmp_path / ".minitrino")
+        return ctx
+
+    def test_cache_written(self, lib_ctx, tmp_path):
+        """Test that loading modules writes a per-version cache file."""
+        Modules(lib_ctx)
+
+        cache_file = tmp_path / ".minitrino" / ".modulecache" / "9.9.9.pickle"
+        assert cache_file.is_file()
+
+    def test_cache_hit_skips_parsing(self, lib_ctx):
+        """Test that unchanged modules are loaded from the cache."""
+        first = Modules(lib_ctx)
+
+        with patch.object(Modules, "_parse_module") as mock_parse:
+            second = Modules(lib_ctx)
+
+        mock_parse.assert_not_called()
+        assert second.data == first.data
+        assert second.data["faker"]["label"] == (
+            "org.minitrino.module.catalog.faker=true"
+        )
+
+    def test_changed_module_reparsed(self, lib_ctx):
+        """Test that only modules with changed files are re-parsed."""
+        Modules(lib_ctx)
+        metadata = f"{lib_ctx.lib_dir}/modules/catalog/postgres/metadata.json"
+        with open(metadata, "w") as f:
+            f.write('{"description": "changed description"}')
+
+        with patch.object(
+            Modules, "_parse_module", autospec=True, side_effect=Modules._parse_module
+        ) as mock_parse:
+            modules = Modules(lib_ctx)
+
+        parsed = [c.args[1] for c in mock_parse.call_args_list]
+        assert parsed == ["postgres"]
+        assert modules.data["postgres"]["description"] == "changed description"
+
+    def test_removed_module_dropped(self, lib_ctx):
+        """Test that modules removed from the library are not cached."""
+        Modules(lib_ctx)
+        shutil.rmtree(f"{lib_ctx.lib_dir}/modules/catalog/faker")
+
+        modules = Modules(lib_ctx)
+
+        assert "faker" not in modules.data
+        assert "postgres" in modules.data
+
+    def test_corrupt_cache_ignored(self, lib_ctx, tmp_path):
+        """Test that an unreadable cache falls back to parsing."""
+        cache_dir = tmp_path / ".minitrino" / ".modulecache"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "9.9.9.pickle").write_bytes(b"not a pickle")
+
+        modules = Modules(lib_ctx)
+
+        assert set(modules.data) == {"faker", "postgres"}
+
+    def test_yaml_not_parsed_on_load(self, lib_ctx):
+        """Test that module Compose YAML is not parsed during loading."""
+        with patch("minitrino.core.modules.load_yaml") as mock_load:
+            modules = Modules(lib_ctx)
+
+        mock_load.assert_not_called()
+        assert "yaml_dict" not in modules.data["faker"]
+
+    def test_module_yaml_parsed_once(self, lib_ctx):
+        """Test that module Compose YAML is parsed once on first access."""
+        modules = Modules(lib_ctx)
+
+        with patch(
+            "minitrino.core.modules.load_yaml", side_effect=load_yaml
+        ) as mock_load:
+            first = modules.module_yaml("faker")
+            second = modules.module_yaml("faker")
+
+        mock_load.assert_called_once()
+        assert first is second
+        assert first == {"services": {"faker": {"image": "faker"}}}
+
+    def test_module_services_parses_lazily(self, lib_ctx):
+        """Test that module_services parses only the requested modules."""
+        modules = Modules(lib_ctx)
+
+        services = modules.module_services(["postgres"])
+
+        assert services[0][0] == "postgres"
+        assert "yaml_dict" in modules.data["postgres"]
+        assert "yaml_dict" not in modules.data["faker"]
+
+    def test_module_yaml_unknown_module(self, lib_ctx):
+        """Test that unknown modules return an empty dict."""
+        modules = Modules(lib_ctx)
+
+        assert modules.module_yaml("missing") == {}
@@ -4,7 +4,9 @@ This module provides reusable fixtures for testing various Minitrino components.
 Fixtures are organized by category and can be composed for complex test scenarios.
 """
 
+import http.server
 import json
+import threading
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -71,6 +73,34 @@ def mock_env():
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def isolated_docker_socket_cache(tmp_path):
+    """Isolate the Docker context and client caches for each test."""
+    from minitrino.core.docker.socket import clear_docker_socket_cache
+
+    clear_docker_socket_cache()
+    with patch(
+        "minitrino.core.docker.socket._context_cache_file",
+        return_value=str(tmp_path / ".dockercontext.json"),
+    ):
+        yield
+    clear_docker_socket_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_port_reservations(tmp_path):
+    """Isolate in-process and on-disk port reservations for each test."""
+    from minitrino.core.cluster import ports
+
+    ports._reserved_ports.clear()
+    with patch(
+        "minitrino.core.cluster.ports._reservation_file",
+        return_value=str(tmp_path / ".portreservations.json"),
+    ):
+        yield
+    ports._reserved_ports.clear()
+
+
 @pytest.fixture
 def mock_docker_api():
     """Provide a mock Docker API client."""
@@ -260,6 +290,119 @@ def mock_compose_cmd():
         yield mock_exec
 
 
+# =============================================================================
+# Trino HTTP Fixtures
+# =============================================================================
+
+
+class FakeTrino:
+    """State of a fake Trino coordinator served over HTTP.
+
+    Statements that contain a key of `errors` fail with its message.
+    Queries on `system.metadata.catalogs` return `catalogs`, and other
+    statements return `results[sql]` or no rows, and their final page
+    carries `set_headers[sql]`. Every results page after the first is
+    preceded by `unavailable` 503 responses.
+    """
+
+    def __init__(self):
+        self.url = ""
+        self.starting = False
+        self.catalogs = ["system"]
+        self.errors: dict[str, str] = {}
+        self.results: dict[str, list] = {}
+        self.set_headers: dict[str, dict] = {}
+        self.unavailable = 0
+        self.queries: list[str] = []
+        self.headers: list[dict] = []
+        self.pages: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def respond(self, sql: str) -> dict:
+        """Return the final results page for a statement."""
+        for fragment, message in self.errors.items():
+            if fragment in sql:
+                return {"error": {"message": message, "errorName": "USER_ERROR"}}
+        if "system.metadata.catalogs" in sql:
+            data = [[c] for c in self.catalogs]
+        else:
+            data = self.results.get(sql, [])
+        return {"data": data, "stats": {"state": "FINISHED"}}
+
+
+class FakeTrinoHandler(http.server.BaseHTTPRequestHandler):
+    """Serve the Trino client REST protocol from a FakeTrino."""
+
+    def do_GET(self):
+        """Serve `/v1/info` and statement results pages."""
+        trino = self.server.trino
+        if self.path == "/v1/info":
+            self.send_json(200, {"starting": trino.starting})
+            return
+        query_id = self.path.split("/")[3]
+        with trino.lock:
+            page = trino.pages[query_id]
+            unavailable = page["unavailable"] > 0
+            if unavailable:
+                page["unavailable"] -= 1
+        if unavailable:
+            self.send_json(503, {})
+            return
+        body = {k: v for k, v in page.items() if k not in ("unavailable", "headers")}
+        self.send_json(200, body, page["headers"])
+
+    def do_POST(self):
+        """Queue a statement and return its first results page."""
+        trino = self.server.trino
+        sql = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        with trino.lock:
+            trino.queries.append(sql)
+            trino.headers.append(dict(self.headers))
+            query_id = str(len(trino.queries))
+        page = {"id": query_id, **trino.respond(sql)}
+        page["unavailable"] = trino.unavailable
+        page["headers"] = trino.set_headers.get(sql, {})
+        with trino.lock:
+            trino.pages[query_id] = page
+        self.send_json(
+            200,
+            {
+                "id": query_id,
+                "nextUri": f"{trino.url}/v1/statement/{query_id}/1",
+                "stats": {"state": "QUEUED"},
+            },
+        )
+
+    def send_json(self, status, body, headers=None):
+        """Send a JSON response."""
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        """Silence request logging."""
+
+
+@pytest.fixture
+def fake_trino():
+    """Run a fake Trino coordinator on a local port."""
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FakeTrinoHandler)
+    httpd.trino = FakeTrino()
+    httpd.trino.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield httpd.trino
+    httpd.shutdown()
+    httpd.server_close()
+
+
 # =============================================================================
 # Logging Fixtures
 # =============================================================================
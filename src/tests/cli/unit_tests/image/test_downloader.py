@@ -1,8 +1,14 @@
 """Unit tests for the downloader script."""
 
+import hashlib
+import http.server
+import io
+import json
 import os
 import sys
-from unittest.mock import MagicMock, mock_open, patch
+import tarfile
+import threading
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -13,12 +19,13 @@ SCRIPTS_DIR = os.path.abspath(os.path.join(HERE, "../../../../lib/image/src/scri
 sys.path.insert(0, SCRIPTS_DIR)
 
 from downloader import (  # noqa: E402
+    cached_tarball,
     download_tarball,
+    extract_tarball,
     get_arch,
     main,
     resolve_tarball_info,
-    unpack_and_copy,
-    unpack_tarball,
+    stream_tarball,
 )
 
 
@@ -137,182 +144,282 @@ class TestResolveTarballInfo:
         assert "Invalid cluster distribution" in str(exc_info.value)
 
 
+class TarballHandler(http.server.BaseHTTPRequestHandler):
+    """Serve a tarball and its checksum, honoring range requests."""
+
+    payload = b""
+    checksum = ""
+    ranged = True
+    fail_once: set = set()
+    requests: list = []
+
+    def do_GET(self):
+        """Serve `/file.tar.gz` and `/file.tar.gz.sha256`."""
+        header = self.headers.get("Range")
+        self.requests.append((self.path, header))
+        if self.path == "/file.tar.gz.sha256" and self.checksum:
+            body = f"{self.checksum}  file.tar.gz\n".encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path != "/file.tar.gz":
+            self.send_error(404)
+        elif header and self.ranged:
+            start, end = (int(b) for b in header.removeprefix("bytes=").split("-"))
+            body = self.payload[start : end + 1]
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{end}/{len(self.payload)}"
+            )
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if header in self.fail_once:
+                # Drop the connection halfway through the segment
+                self.fail_once.discard(header)
+                self.wfile.write(body[: len(body) // 2])
+                self.close_connection = True
+                return
+            self.wfile.write(body)
+        else:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(self.payload)))
+            self.end_headers()
+            if header in self.fail_once:
+                self.fail_once.discard(header)
+                self.wfile.write(self.payload[: len(self.payload) // 2])
+                self.close_connection = True
+                return
+            self.wfile.write(self.payload)
+
+    def log_message(self, *args):
+        """Silence request logging."""
+
+
+@pytest.fixture
+def server(request, monkeypatch):
+    """Serve the test class's `PAYLOAD` and return its URL and handler."""
+    payload = request.cls.PAYLOAD
+    handler = type(
+        "Handler",
+        (TarballHandler,),
+        {
+            "payload": payload,
+            "checksum": hashlib.sha256(payload).hexdigest(),
+            "fail_once": set(),
+            "requests": [],
+        },
+    )
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr("downloader.MIN_SEGMENT_SIZE", 256 * 1024)
+    monkeypatch.setattr("downloader.time.sleep", lambda _: None)
+    monkeypatch.setattr("builtins.print", MagicMock())
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/file.tar.gz"
+    yield url, handler
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_tarball(unpack_dir="trino-server-476"):
+    """Return a gzipped server tarball with bins and plugins."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name in (
+            "bin/launcher",
+            "bin/darwin-amd64/launcher",
+            "bin/linux-amd64/launcher",
+            "bin/linux-arm64/launcher",
+            "lib/trino-main.jar",
+            "plugin/hive/hive.jar",
+            "plugin/mongodb/mongodb.jar",
+        ):
+            data = name.encode()
+            info = tarfile.TarInfo(f"{unpack_dir}/{name}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
 class TestDownloadTarball:
     """Test suite for download_tarball function."""
 
-    @patch("urllib.request.urlopen")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("time.time")
-    @patch("builtins.print")
-    def test_download_with_content_length(
-        self, mock_print, mock_time, mock_file, mock_urlopen
-    ):
-        """Test downloading tarball with Content-Length header."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.getheader.return_value = "1024"  # 1KB
-        mock_response.read.side_effect = [b"x" * 512, b"x" * 512, b""]  # Two chunks
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+    PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
 
-        # Mock time for progress updates
-        mock_time.side_effect = [0, 3, 6]  # Trigger print on second iteration
-
-        download_tarball("http://example.com/file.tar.gz", "/tmp/file.tar.gz")
+    def segment_requests(self, handler):
+        """Return the range requests made for the tarball."""
+        return [
+            header
+            for path, header in handler.requests
+            if path == "/file.tar.gz" and header != "bytes=0-0"
+        ]
 
-        # Verify file was opened for writing
-        mock_file.assert_called_once_with("/tmp/file.tar.gz", "wb")
+    def test_parallel_download(self, server, tmp_path):
+        """Test that the tarball is downloaded in verified segments."""
+        url, handler = server
+        tar_path = tmp_path / "file.tar.gz"
 
-        # Verify data was written
-        mock_file().write.assert_called()
-        assert mock_file().write.call_count == 2
+        log = MagicMock()
+        download_tarball(url, str(tar_path), log=log)
 
-        # Verify progress messages
-        mock_print.assert_any_call(
-            "[downloader] Downloading http://example.com/file.tar.gz ..."
-        )
-        mock_print.assert_any_call(
-            "[downloader] Downloading tarball... 100.0% complete"
+        assert tar_path.read_bytes() == self.PAYLOAD
+        assert sorted(self.segment_requests(handler)) == [
+            "bytes=0-262143",
+            "bytes=262144-524287",
+            "bytes=524288-786431",
+            "bytes=786432-1048575",
+        ]
+        assert os.listdir(tmp_path) == ["file.tar.gz"]
+        log.assert_any_call(f"[downloader] Downloading {url} ...")
+        log.assert_any_call("[downloader] Downloading tarball... 100.0% complete")
+        log.assert_any_call("[downloader] Verified sha256 checksum")
+
+    def test_retry_failed_segment(self, server, tmp_path):
+        """Test that a dropped connection resumes its segment."""
+        url, handler = server
+        handler.fail_once.add("bytes=262144-524287")
+        tar_path = tmp_path / "file.tar.gz"
+
+        download_tarball(url, str(tar_path))
+
+        assert tar_path.read_bytes() == self.PAYLOAD
+        assert "bytes=393216-524287" in self.segment_requests(handler)
+
+    def test_resume_partial_download(self, server, tmp_path):
+        """Test that an interrupted download only fetches missing bytes."""
+        url, handler = server
+        tar_path = tmp_path / "file.tar.gz"
+        size = len(self.PAYLOAD)
+        half = size // 2
+        (tmp_path / "file.tar.gz.part").write_bytes(
+            self.PAYLOAD[:half] + b"\0" * (size - half)
         )
+        state = {"url": url, "size": size, "segments": [[0, half, size]]}
+        (tmp_path / "file.tar.gz.part.json").write_text(json.dumps(state))
 
-    @patch("urllib.request.urlopen")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("time.time")
-    @patch("builtins.print")
-    def test_download_without_content_length(
-        self, mock_print, mock_time, mock_file, mock_urlopen
-    ):
-        """Test downloading tarball without Content-Length header."""
-        mock_response = MagicMock()
-        mock_response.getheader.return_value = None
-        mock_response.read.side_effect = [b"x" * 8192, b""]
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        download_tarball(url, str(tar_path))
 
-        mock_time.side_effect = [0, 3]
+        assert tar_path.read_bytes() == self.PAYLOAD
+        assert self.segment_requests(handler) == [f"bytes={half}-{size - 1}"]
+        assert os.listdir(tmp_path) == ["file.tar.gz"]
 
-        download_tarball("http://example.com/file.tar.gz", "/tmp/file.tar.gz")
+    def test_no_range_support(self, server, tmp_path):
+        """Test that servers without range support use one connection."""
+        url, handler = server
+        handler.ranged = False
+        tar_path = tmp_path / "file.tar.gz"
 
-        mock_file().write.assert_called_once_with(b"x" * 8192)
+        download_tarball(url, str(tar_path))
 
+        assert tar_path.read_bytes() == self.PAYLOAD
+        assert self.segment_requests(handler) == [None]
 
-class TestUnpackTarball:
-    """Test suite for unpack_tarball function."""
+    def test_checksum_mismatch(self, server, tmp_path):
+        """Test that a download not matching its checksum is discarded."""
+        url, handler = server
+        handler.checksum = "0" * 64
 
-    @patch("tarfile.open")
-    @patch("builtins.print")
-    def test_unpack_tarball(self, mock_print, mock_tarfile):
-        """Test unpacking a tarball."""
-        mock_tar = MagicMock()
-        mock_tarfile.return_value.__enter__.return_value = mock_tar
-
-        unpack_tarball("/tmp/file.tar.gz", "/dest/dir")
-
-        mock_tarfile.assert_called_once_with("/tmp/file.tar.gz", "r:gz")
-        mock_tar.extractall.assert_called_once_with(path="/dest/dir")
-        mock_print.assert_any_call("[downloader] Extracting /tmp/file.tar.gz ...")
-        mock_print.assert_any_call("[downloader] Extracted to /dest/dir")
-
-
-class TestUnpackAndCopy:
-    """Test suite for unpack_and_copy function."""
-
-    @patch("os.makedirs")
-    @patch("os.listdir")
-    @patch("os.path.isdir")
-    @patch("os.path.exists")
-    @patch("shutil.rmtree")
-    @patch("shutil.copytree")
-    @patch("shutil.copy2")
-    @patch("os.remove")
-    @patch("builtins.print")
-    def test_unpack_and_copy_trino(
-        self,
-        mock_print,
-        mock_remove,
-        mock_copy2,
-        mock_copytree,
-        mock_rmtree,
-        mock_exists,
-        mock_isdir,
-        mock_listdir,
-        mock_makedirs,
-    ):
-        """Test unpacking and copying Trino files."""
-        # Setup directory structure
-        mock_listdir.side_effect = [
-            ["bin", "lib", "plugin"],  # unpack_dir contents
-            ["launcher", "darwin-amd64", "linux-amd64", "linux-arm64"],  # bin contents
-        ]
-
-        # Setup path checks
-        mock_isdir.side_effect = [
-            True,  # bin is dir
-            True,  # lib is dir
-            True,  # plugin is dir
-            True,  # darwin-amd64 is dir
-            True,  # linux-amd64 is dir
-            True,  # linux-arm64 is dir
-            False,  # src linux-amd64 doesn't exist
-        ]
+        with pytest.raises(RuntimeError, match="Checksum mismatch"):
+            download_tarball(url, str(tmp_path / "file.tar.gz"))
 
-        mock_exists.side_effect = [True, True, True, True, True]  # Dirs exist checks
+        assert os.listdir(tmp_path) == []
 
-        unpack_and_copy("trino", "/tmp/trino-server-443", "amd64")
 
-        # Verify destination directory was created
-        mock_makedirs.assert_called_once_with("/usr/lib/trino", exist_ok=True)
+class TestExtractTarball:
+    """Test suite for extract_tarball and stream_tarball functions."""
 
-        # Verify files were copied
-        assert mock_copytree.call_count >= 2
+    PAYLOAD = make_tarball()
 
-        # Verify unwanted binaries were removed
-        mock_rmtree.assert_any_call(
-            "/usr/lib/trino/bin/darwin-amd64", ignore_errors=True
+    def extracted(self, dest_dir):
+        """Return the files extracted into a directory."""
+        return sorted(
+            os.path.relpath(os.path.join(root, f), dest_dir)
+            for root, _, files in os.walk(dest_dir)
+            for f in files
         )
-        mock_rmtree.assert_any_call(
-            "/usr/lib/trino/bin/linux-arm64", ignore_errors=True
+
+    @patch("builtins.print")
+    def test_extract_filters_members(self, mock_print, tmp_path):
+        """Test that foreign bins and pruned plugins are not extracted."""
+        dest_dir = tmp_path / "trino"
+
+        extract_tarball(
+            io.BytesIO(self.PAYLOAD),
+            "trino-server-476",
+            str(dest_dir),
+            "amd64",
+            {"hive"},
         )
 
-    @patch("downloader.os.makedirs")
-    @patch("downloader.os.listdir")
-    @patch("downloader.os.path.isdir")
-    @patch("downloader.shutil.copy2")
-    def test_unpack_and_copy_single_file(
-        self, mock_copy2, mock_isdir, mock_listdir, mock_makedirs
-    ):
-        """Test copying single file."""
-        mock_listdir.side_effect = [
-            ["config.properties"],  # unpack_dir contents
-            [],  # bin contents (empty)
+        assert self.extracted(dest_dir) == [
+            "bin/launcher",
+            "bin/linux-amd64/launcher",
+            "lib/trino-main.jar",
+            "plugin/hive/hive.jar",
         ]
-        mock_isdir.side_effect = [
-            False,
-            False,
-        ]  # config.properties is not a dir, bin check
+        assert (
+            dest_dir / "plugin/hive/hive.jar"
+        ).read_bytes() == b"plugin/hive/hive.jar"
+        mock_print.assert_any_call("[downloader] Skipping bin: darwin-amd64")
+        mock_print.assert_any_call("[downloader] Skipping plugin: mongodb")
 
-        unpack_and_copy("trino", "/tmp/unpack", "amd64")
+    @patch("builtins.print")
+    def test_extract_all_plugins(self, mock_print, tmp_path):
+        """Test that all plugins are extracted when none are pruned."""
+        dest_dir = tmp_path / "trino"
 
-        mock_copy2.assert_called_once_with(
-            "/tmp/unpack/config.properties", "/usr/lib/trino/config.properties"
+        extract_tarball(
+            io.BytesIO(self.PAYLOAD), "trino-server-476", str(dest_dir), "arm64", None
         )
 
+        assert "plugin/mongodb/mongodb.jar" in self.extracted(dest_dir)
+        assert "bin/linux-arm64/launcher" in self.extracted(dest_dir)
+
+    def test_stream_tarball(self, server, tmp_path):
+        """Test that a download is extracted as it streams and verified."""
+        url, handler = server
+        dest_dir = tmp_path / "trino"
+
+        stream_tarball(url, "trino-server-476", str(dest_dir), "amd64", {"hive"})
+
+        assert "plugin/hive/hive.jar" in self.extracted(dest_dir)
+        assert "plugin/mongodb/mongodb.jar" not in self.extracted(dest_dir)
+        assert not list(tmp_path.glob("*.tar.gz*"))
+
+    def test_stream_tarball_retry(self, server, tmp_path):
+        """Test that an interrupted streamed download is restarted."""
+        url, handler = server
+        handler.fail_once.add(None)
+        dest_dir = tmp_path / "trino"
+
+        stream_tarball(url, "trino-server-476", str(dest_dir), "amd64", {"hive"})
+
+        assert "plugin/hive/hive.jar" in self.extracted(dest_dir)
+        assert [path for path, _ in handler.requests].count("/file.tar.gz") == 2
+
+    def test_stream_tarball_checksum_mismatch(self, server, tmp_path):
+        """Test that a streamed download not matching its checksum is removed."""
+        url, handler = server
+        handler.checksum = "0" * 64
+        dest_dir = tmp_path / "trino"
+
+        with pytest.raises(RuntimeError, match="Checksum mismatch"):
+            stream_tarball(url, "trino-server-476", str(dest_dir), "amd64", None)
+
+        assert not dest_dir.exists()
+
 
 class TestMain:
     """Test suite for main function."""
 
+    @patch("downloader.cached_tarball", return_value="")
     @patch("downloader.resolve_tarball_info")
-    @patch("downloader.download_tarball")
-    @patch("downloader.unpack_tarball")
-    @patch("downloader.unpack_and_copy")
-    @patch("downloader.os.chdir")
-    def test_main(
-        self,
-        mock_chdir,
-        mock_unpack_copy,
-        mock_unpack,
-        mock_download,
-        mock_resolve,
-    ):
-        """Test main function orchestration."""
+    @patch("downloader.stream_tarball")
+    @patch.dict(os.environ, {"KEEP_PLUGINS": "mongodb"})
+    @patch("builtins.print")
+    def test_main(self, mock_print, mock_stream, mock_resolve, mock_cached):
+        """Test that an uncached tarball is streamed into place."""
         mock_resolve.return_value = (
             "http://example.com/file.tar.gz",
             "file.tar.gz",
@@ -323,35 +430,51 @@ class TestMain:
         main("443", "trino")
 
         mock_resolve.assert_called_once_with("trino", "443")
-        mock_download.assert_called_once_with(
-            "http://example.com/file.tar.gz", "/tmp/file.tar.gz"
-        )
-        mock_chdir.assert_called_once_with("/tmp")
-        mock_unpack.assert_called_once_with("/tmp/file.tar.gz", "/tmp")
-        mock_unpack_copy.assert_called_once_with("trino", "unpack_dir", "amd64")
-
-    @patch("sys.argv", ["downloader.py"])
-    @patch("downloader.os.environ", {"CLUSTER_DIST": "trino", "CLUSTER_VERSION": "443"})
-    @patch("downloader.unpack_and_copy")
-    @patch("downloader.unpack_tarball")
-    @patch("downloader.download_tarball")
-    @patch("downloader.resolve_tarball_info")
-    @patch("downloader.os.chdir")
-    def test_main_cli(
-        self, mock_chdir, mock_resolve, mock_download, mock_unpack, mock_copy
-    ):
-        """Test main function with CLI execution."""
-        mock_resolve.return_value = (
+        url, unpack_dir, dest_dir, arch_bin, keep = mock_stream.call_args.args
+        assert (url, unpack_dir, dest_dir, arch_bin) == (
             "http://example.com/file.tar.gz",
-            "file.tar.gz",
             "unpack_dir",
+            "/usr/lib/trino",
             "amd64",
         )
+        assert {"mongodb", "hive"} <= keep
+
+
+class TestCachedTarball:
+    """Test suite for cached_tarball function."""
+
+    def test_cached_tarball(self, tmp_path):
+        """Test that only tarballs matching their checksum are used."""
+        tar_path = tmp_path / "file.tar.gz"
+        assert cached_tarball("file.tar.gz", str(tmp_path)) == ""
+
+        tar_path.write_bytes(b"tarball")
+        assert cached_tarball("file.tar.gz", str(tmp_path)) == ""
+
+        checksum = hashlib.sha256(b"tarball").hexdigest()
+        (tmp_path / "file.tar.gz.sha256").write_text(f"{checksum}  file.tar.gz\n")
+        assert cached_tarball("file.tar.gz", str(tmp_path)) == str(tar_path)
+
+        tar_path.write_bytes(b"truncated")
+        assert cached_tarball("file.tar.gz", str(tmp_path)) == ""
+
+    @patch("downloader.cached_tarball")
+    @patch("downloader.resolve_tarball_info")
+    @patch("downloader.stream_tarball")
+    @patch("downloader.extract_tarball")
+    @patch("builtins.print")
+    def test_main_uses_cache(
+        self, mock_print, mock_extract, mock_stream, mock_resolve, mock_cached, tmp_path
+    ):
+        """Test that a cached tarball is extracted without downloading."""
+        tar_path = tmp_path / "file.tar.gz"
+        tar_path.write_bytes(b"tarball")
+        mock_resolve.return_value = ("url", "file.tar.gz", "unpack_dir", "amd64")
+        mock_cached.return_value = str(tar_path)
 
-        # main() requires version and dist arguments from env vars
         main("443", "trino")
 
-        mock_resolve.assert_called_once_with("trino", "443")
-        mock_download.assert_called_once()
-        mock_unpack.assert_called_once()
-        mock_copy.assert_called_once()
+        mock_stream.assert_not_called()
+        fileobj, *args = mock_extract.call_args.args
+        assert fileobj.name == str(tar_path)
+        assert args[:3] == ["unpack_dir", "/usr/lib/trino", "amd64"]
@@ -14,7 +14,9 @@ sys.path.insert(0, SCRIPTS_DIR)
 from gen_config import (  # noqa: E402
     WORKER_CONFIG_PROPS,
     collect_configs,
+    config_sources,
     extract_jvm_flag_key,
+    find_conflicts,
     generate_coordinator_config,
     generate_worker_config,
     get_java_version,
@@ -24,6 +26,8 @@ from gen_config import (  # noqa: E402
     merge_configs,
     merge_password_authenticators,
     read_existing_config,
+    render_coordinator_config,
+    render_worker_config,
     split_config,
     write_config_file,
 )
@@ -660,3 +664,77 @@ class TestSecurityManagerFiltering:
         result_keys = [entry[1] for entry in result if entry[0] == "key_value"]
         assert "-Djava.security.manager" not in result_keys
         assert "-Xmx" in result_keys
+
+
+class TestRenderFromEnv:
+    """Test rendering and conflict detection from an explicit environment."""
+
+    ENV = {
+        "CLUSTER_VER": "476",
+        "CONFIG_PROPERTIES": "query.max-memory=1GB",
+        "JVM_CONFIG": "-Xmx4G",
+        "LDAP_CONFIG_PROPERTIES": (
+            "query.max-memory=2GB\nhttp-server.authentication.type=PASSWORD"
+        ),
+        "OAUTH2_CONFIG_PROPERTIES": "http-server.authentication.type=OAUTH2",
+        "OAUTH2_JVM_CONFIG": "-Xmx8G\n-Djava.security.manager=allow",
+        "WORKER_CONFIG_PROPERTIES": "task.concurrency=4",
+    }
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_config_sources(self):
+        """Test that fragments are returned per env var in merge order."""
+        cfg_sources, jvm_sources = config_sources(["ldap", "oauth2"], env=self.ENV)
+
+        assert [var for var, _ in cfg_sources] == [
+            "CONFIG_PROPERTIES",
+            "LDAP_CONFIG_PROPERTIES",
+            "OAUTH2_CONFIG_PROPERTIES",
+        ]
+        assert [var for var, _ in jvm_sources] == ["JVM_CONFIG", "OAUTH2_JVM_CONFIG"]
+
+        cfg_sources, _ = config_sources(["ldap"], worker=True, env=self.ENV)
+        assert cfg_sources == [
+            ("WORKER_CONFIG_PROPERTIES", [("key_value", "task.concurrency", "4")])
+        ]
+
+    def test_find_conflicts(self):
+        """Test that repeated keys are found, except combined properties."""
+        cfg_sources, jvm_sources = config_sources(["ldap", "oauth2"], env=self.ENV)
+
+        assert find_conflicts(cfg_sources) == {
+            "query.max-memory": [
+                ("CONFIG_PROPERTIES", ("key_value", "query.max-memory", "1GB")),
+                ("LDAP_CONFIG_PROPERTIES", ("key_value", "query.max-memory", "2GB")),
+            ]
+        }
+        assert list(find_conflicts(jvm_sources, is_jvm=True)) == ["-Xmx"]
+
+    @patch.dict("os.environ", {"CLUSTER_VER": "400"}, clear=True)
+    def test_render_coordinator_config(self):
+        """Test that configs render from `env` rather than `os.environ`."""
+        base = split_config("coordinator=true\nquery.max-memory=512MB")
+
+        cfgs, jvm_cfgs = render_coordinator_config(
+            base, [], ["ldap", "oauth2"], 2, env=self.ENV
+        )
+
+        assert cfgs == [
+            ("key_value", "coordinator", "true"),
+            ("key_value", "query.max-memory", "2GB"),
+            ("key_value", "node-scheduler.include-coordinator", "false"),
+            ("key_value", "http-server.authentication.type", "PASSWORD,OAUTH2"),
+        ]
+        # CLUSTER_VER from `env` selects Java 24, which drops the
+        # Security Manager option
+        assert jvm_cfgs == [("key_value", "-Xmx", "4G")]
+
+    def test_render_worker_config(self):
+        """Test that worker configs use the worker overrides."""
+        cfgs, _ = render_worker_config(
+            split_config(WORKER_CONFIG_PROPS), [], ["ldap"], env=self.ENV
+        )
+
+        assert ("key_value", "task.concurrency", "4") in cfgs
+        assert ("key_value", "coordinator", "false") in cfgs
+        assert not any(c[1] == "query.max-memory" for c in cfgs)
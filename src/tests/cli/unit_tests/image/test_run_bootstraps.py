@@ -0,0 +1,247 @@
+"""Unit tests for the run_bootstraps script."""
+
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add the scripts directory to the path dynamically
+SCRIPT_PATH = os.path.realpath(__file__)
+HERE = os.path.dirname(SCRIPT_PATH)
+SCRIPTS_DIR = os.path.abspath(os.path.join(HERE, "../../../../lib/image/src/scripts"))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from run_bootstraps import (  # noqa: E402
+    BootstrapError,
+    discover_hooks,
+    fix_permissions,
+    main,
+    parse_directives,
+    resolve_order,
+    run_hooks,
+)
+from run_sql import StatementError  # noqa: E402
+
+
+def write_hook(bootstrap_dir, name, body, header=""):
+    """Write a bootstrap script with a `before_start` function."""
+    path = bootstrap_dir / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"#!/usr/bin/env bash\n{header}\nset -euxo pipefail\n\n"
+        f"before_start() {{\n{body}\n}}\n"
+    )
+    return path
+
+
+def test_parse_directives(tmp_path):
+    """Test that directives are read from the script header only."""
+    path = tmp_path / "bootstrap.sh"
+    path.write_text(
+        "#!/usr/bin/env bash\n"
+        "# Some comment\n"
+        "# bootstrap: before=* uses=catalogs\n"
+        "\n"
+        "# bootstrap: uses=cacerts,log-properties\n"
+        "set -euxo pipefail\n"
+        "# bootstrap: after=ignored\n"
+    )
+
+    assert parse_directives(str(path)) == {
+        "before": ["*"],
+        "uses": ["catalogs", "cacerts", "log-properties"],
+    }
+
+    path.write_text("# bootstrap: first=true\n")
+    with pytest.raises(BootstrapError, match="first=true"):
+        parse_directives(str(path))
+
+
+def test_resolve_order(tmp_path):
+    """Test module ordering, `before=*`, and cycle detection."""
+    write_hook(tmp_path, "biac/bootstrap.sh", ":", "# bootstrap: before=*")
+    write_hook(tmp_path, "hive/a.sh", ":", "# bootstrap: uses=none")
+    write_hook(tmp_path, "hive/b.sh", ":", "# bootstrap: uses=none")
+    write_hook(tmp_path, "tls/bootstrap.sh", ":", "# bootstrap: after=hive")
+    hooks = {hook.name: hook for hook in discover_hooks(str(tmp_path))}
+
+    deps = resolve_order(list(hooks.values()))
+
+    names = {h.name: {d.name for d in deps[h]} for h in hooks.values()}
+    assert names == {
+        "biac/bootstrap.sh": set(),
+        "hive/a.sh": {"biac/bootstrap.sh"},
+        "hive/b.sh": {"biac/bootstrap.sh", "hive/a.sh"},
+        "tls/bootstrap.sh": {"biac/bootstrap.sh", "hive/a.sh", "hive/b.sh"},
+    }
+
+    write_hook(tmp_path, "hive/a.sh", ":", "# bootstrap: after=tls")
+    with pytest.raises(BootstrapError, match="cycle"):
+        resolve_order(discover_hooks(str(tmp_path)))
+
+
+class TestRunHooks:
+    """Test suite for running hooks."""
+
+    def test_parallel(self, tmp_path):
+        """Test that hooks without shared resources run concurrently."""
+        bootstrap_dir = tmp_path / "bootstrap"
+        # Each hook waits for the other to start, so they must overlap
+        for me, other in (("a", "b"), ("b", "a")):
+            write_hook(
+                bootstrap_dir,
+                f"{me}/bootstrap.sh",
+                f"touch {tmp_path}/{me}\n"
+                f"for _ in $(seq 50); do [ -e {tmp_path}/{other} ] && return; "
+                "sleep 0.1; done\nexit 1",
+                "# bootstrap: uses=none",
+            )
+
+        run_hooks(discover_hooks(str(bootstrap_dir)), "before_start")
+
+    def test_constraints(self, tmp_path, capsys):
+        """Test that ordering and shared resources serialize hooks."""
+        bootstrap_dir = tmp_path / "bootstrap"
+        log = tmp_path / "log"
+        body = f"echo start $0 >> {log}\nsleep 0.2\necho end $0 >> {log}"
+        write_hook(bootstrap_dir, "hive/fs.sh", body, "# bootstrap: uses=catalogs")
+        write_hook(bootstrap_dir, "iceberg/fs.sh", body, "# bootstrap: uses=catalogs")
+        write_hook(bootstrap_dir, "zz-biac.sh", body, "# bootstrap: before=*")
+
+        run_hooks(discover_hooks(str(bootstrap_dir)), "before_start")
+
+        lines = log.read_text().splitlines()
+        assert lines[:2] == [
+            f"start {bootstrap_dir}/zz-biac.sh",
+            f"end {bootstrap_dir}/zz-biac.sh",
+        ]
+        # The catalog hooks never overlap
+        assert [line.split()[0] for line in lines] == ["start", "end"] * 3
+        out = capsys.readouterr().out
+        assert "[hive/fs.sh] + echo start" in out
+        assert "[run_bootstraps] zz-biac.sh before_start finished in" in out
+
+    def test_failure(self, tmp_path):
+        """Test that a failed hook stops hooks that have not started."""
+        write_hook(tmp_path, "a/bootstrap.sh", "false", "# bootstrap: before=b")
+        write_hook(tmp_path, "b/bootstrap.sh", f"touch {tmp_path}/ran")
+
+        with pytest.raises(BootstrapError, match="a/bootstrap.sh before_start failed"):
+            run_hooks(discover_hooks(str(tmp_path)), "before_start")
+
+        assert not (tmp_path / "ran").exists()
+
+
+class TestMain:
+    """Test suite for the bootstrap entrypoint."""
+
+    @pytest.fixture(autouse=True)
+    def env(self, monkeypatch):
+        """Run without fixing permissions or running SQL."""
+        monkeypatch.delenv("SERVICE_USER", raising=False)
+        monkeypatch.delenv("COORDINATOR", raising=False)
+
+    def run(self, tmp_path, *args):
+        """Run the entrypoint against `tmp_path/bootstrap`."""
+        return main(
+            [
+                *args,
+                "--bootstrap-dir",
+                str(tmp_path / "bootstrap"),
+                "--marker-file",
+                str(tmp_path / "markers.json"),
+            ]
+        )
+
+    def test_missing_function(self, tmp_path, capsys):
+        """Test that hooks without the requested function are skipped."""
+        write_hook(tmp_path / "bootstrap", "a/bootstrap.sh", "exit 1")
+
+        assert self.run(tmp_path, "after_start") == 0
+        assert "Ran 1 after_start hook(s)" in capsys.readouterr().out
+
+        assert self.run(tmp_path, "before_start") == 1
+        assert "a/bootstrap.sh before_start failed with exit code 1" in (
+            capsys.readouterr().out
+        )
+
+    def test_markers(self, tmp_path, capsys, monkeypatch):
+        """Test that completed hooks are skipped until their inputs change."""
+        count = tmp_path / "count"
+        hook = write_hook(
+            tmp_path / "bootstrap", "a/bootstrap.sh", f"echo x >> {count}", "# x"
+        )
+
+        def runs():
+            return len(count.read_text().splitlines())
+
+        assert self.run(tmp_path, "before_start") == 0
+        assert self.run(tmp_path, "before_start") == 0
+        assert runs() == 1
+        assert "a/bootstrap.sh before_start already completed" in (
+            capsys.readouterr().out
+        )
+
+        monkeypatch.setenv("MINITRINO_TEST_VALUE", "changed")
+        assert self.run(tmp_path, "before_start") == 0
+        assert runs() == 2
+
+        hook.write_text(hook.read_text().replace("# x", "# y"))
+        assert self.run(tmp_path, "before_start") == 0
+        assert runs() == 3
+
+        assert self.run(tmp_path, "before_start", "--rebootstrap") == 0
+        assert runs() == 4
+
+    def test_sql_markers(self, tmp_path, monkeypatch):
+        """Test that SQL files are marked as each one completes."""
+        monkeypatch.setenv("COORDINATOR", "true")
+        bootstrap_dir = tmp_path / "bootstrap"
+        (bootstrap_dir / "hive").mkdir(parents=True)
+        good = bootstrap_dir / "hive" / "good.sql"
+        bad = bootstrap_dir / "hive" / "bad.sql"
+        good.write_text("SELECT 1")
+        bad.write_text("SELECT x")
+
+        def run_file(path, server, user, failed):
+            if path == str(bad):
+                raise StatementError(path, 1, "SELECT x", ValueError("boom"))
+            return 1
+
+        with patch("run_sql.run_file", side_effect=run_file) as mock_run_file:
+            assert self.run(tmp_path, "after_start") == 1
+            assert self.run(tmp_path, "after_start") == 1
+
+        # The file that completed is not run again
+        runs = [c.args[0] for c in mock_run_file.call_args_list]
+        assert sorted(runs[:2]) == [str(bad), str(good)]
+        assert runs[2:] == [str(bad)]
+
+        with patch("run_sql.run_file", return_value=1) as mock_run_file:
+            assert self.run(tmp_path, "after_start") == 0
+            assert self.run(tmp_path, "after_start") == 0
+
+        mock_run_file.assert_called_once()
+        assert mock_run_file.call_args.args[0] == str(bad)
+
+
+def test_fix_permissions(tmp_path):
+    """Test that only paths with the wrong mode are changed."""
+    root = tmp_path / "etc"
+    root.mkdir()
+    ok, wrong = root / "ok.properties", root / "wrong.properties"
+    ok.write_text("")
+    wrong.write_text("")
+    os.chmod(root, 0o775)
+    os.chmod(ok, 0o664)
+    os.chmod(wrong, 0o604)
+    ok_ctime = ok.stat().st_ctime_ns
+
+    changed = fix_permissions(str(root), os.getuid(), os.getgid())
+
+    assert changed == 1
+    assert stat.S_IMODE(wrong.stat().st_mode) == 0o664
+    assert ok.stat().st_ctime_ns == ok_ctime
+    assert fix_permissions(str(root), os.getuid(), os.getgid()) == 0
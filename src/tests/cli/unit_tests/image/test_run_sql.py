@@ -0,0 +1,93 @@
+"""Unit tests for the run_sql script."""
+
+import os
+import sys
+from unittest.mock import call, patch
+
+# Add the scripts directory to the path dynamically
+SCRIPT_PATH = os.path.realpath(__file__)
+HERE = os.path.dirname(SCRIPT_PATH)
+SCRIPTS_DIR = os.path.abspath(os.path.join(HERE, "../../../../lib/image/src/scripts"))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from run_sql import main, split_statements  # noqa: E402
+
+
+def test_split_statements():
+    """Test that only top-level semicolons separate statements."""
+    sql = (
+        "-- Comment; not a statement\n"
+        "CREATE SCHEMA s WITH (location = 'a;b');\n"
+        "\n"
+        "/* block; comment */ SELECT 'it''s; fine'\n"
+        'FROM "t;1";\n'
+        ";  -- empty\n"
+        "SELECT 2"
+    )
+
+    assert split_statements(sql) == [
+        (1, "-- Comment; not a statement\nCREATE SCHEMA s WITH (location = 'a;b')"),
+        (4, "/* block; comment */ SELECT 'it''s; fine'\nFROM \"t;1\""),
+        (6, "-- empty\nSELECT 2"),
+    ]
+
+
+class TestMain:
+    """Test suite for running SQL files."""
+
+    def write(self, tmp_path, name, sql):
+        """Write a SQL file and return its path."""
+        path = tmp_path / name
+        path.write_text(sql)
+        return str(path)
+
+    def test_run_files(self, fake_trino, tmp_path):
+        """Test that each file's statements share one session."""
+        fake_trino.set_headers["USE hive.minitrino"] = {
+            "X-Trino-Set-Catalog": "hive",
+            "X-Trino-Set-Schema": "minitrino",
+        }
+        schema = self.write(
+            tmp_path, "schema.sql", "USE hive.minitrino;\nCREATE TABLE t (x int);\n"
+        )
+        tables = self.write(tmp_path, "tables.sql", "SELECT 1;")
+
+        with patch("builtins.print") as mock_print:
+            assert main(["--server", fake_trino.url, schema, tables]) == 0
+
+        assert sorted(fake_trino.queries) == [
+            "CREATE TABLE t (x int)",
+            "SELECT 1",
+            "USE hive.minitrino",
+        ]
+        headers = fake_trino.headers[fake_trino.queries.index("CREATE TABLE t (x int)")]
+        assert headers["X-Trino-Schema"] == "minitrino"
+        messages = [c.args[0] for c in mock_print.call_args_list]
+        assert any(
+            m.startswith(f"[run_sql] {schema}: 2 statement(s)") for m in messages
+        )
+
+    def test_fail_fast(self, fake_trino, tmp_path):
+        """Test that the failing statement is reported and the rest skipped."""
+        fake_trino.errors["missing"] = "Schema 'missing' does not exist"
+        path = self.write(
+            tmp_path,
+            "bootstrap.sql",
+            "SELECT 1;\nCREATE TABLE missing.t\nAS SELECT 1;\nSELECT 2;",
+        )
+
+        with patch("builtins.print") as mock_print:
+            assert main(["--server", fake_trino.url, path]) == 1
+
+        assert fake_trino.queries == ["SELECT 1", "CREATE TABLE missing.t\nAS SELECT 1"]
+        mock_print.assert_has_calls(
+            [
+                call(
+                    f"[run_sql] Statement failed at {path}:2: "
+                    "Schema 'missing' does not exist"
+                ),
+                call(
+                    "[run_sql] Failing statement:\nCREATE TABLE missing.t\nAS SELECT 1"
+                ),
+            ]
+        )
@@ -0,0 +1,42 @@
+"""Unit tests for the trino_client script."""
+
+import os
+import sys
+
+import pytest
+
+# Add the scripts directory to the path dynamically
+SCRIPT_PATH = os.path.realpath(__file__)
+HERE = os.path.dirname(SCRIPT_PATH)
+SCRIPTS_DIR = os.path.abspath(os.path.join(HERE, "../../../../lib/image/src/scripts"))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from trino_client import TrinoClient, TrinoError  # noqa: E402
+
+
+class TestTrinoClient:
+    """Test suite for TrinoClient."""
+
+    def test_info(self, fake_trino):
+        """Test that server info is returned."""
+        fake_trino.starting = True
+        assert TrinoClient(fake_trino.url).info() == {"starting": True}
+
+    def test_execute(self, fake_trino):
+        """Test that results pages are followed and rows returned."""
+        fake_trino.results["SELECT 1"] = [[1]]
+        fake_trino.unavailable = 2
+        client = TrinoClient(fake_trino.url, "bob", source="test")
+
+        assert client.execute("SELECT 1") == [[1]]
+        assert fake_trino.headers[0]["X-Trino-User"] == "bob"
+        assert fake_trino.headers[0]["X-Trino-Source"] == "test"
+
+    def test_execute_error(self, fake_trino):
+        """Test that failed statements raise TrinoError."""
+        fake_trino.errors["missing"] = "Table 'missing' does not exist"
+
+        with pytest.raises(TrinoError, match="does not exist") as exc_info:
+            TrinoClient(fake_trino.url).execute("SELECT * FROM missing")
+
+        assert exc_info.value.error_name == "USER_ERROR"
@@ -0,0 +1,67 @@
+"""Unit tests for the wait_ready script."""
+
+import os
+import sys
+from unittest.mock import patch
+
+# Add the scripts directory to the path dynamically
+SCRIPT_PATH = os.path.realpath(__file__)
+HERE = os.path.dirname(SCRIPT_PATH)
+SCRIPTS_DIR = os.path.abspath(os.path.join(HERE, "../../../../lib/image/src/scripts"))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from trino_client import TrinoClient  # noqa: E402
+from wait_ready import main, wait_ready  # noqa: E402
+
+
+class TestWaitReady:
+    """Test suite for wait_ready and main functions."""
+
+    def test_waits_for_startup_and_query(self, fake_trino):
+        """Test that the probe backs off until a query succeeds."""
+        fake_trino.starting = True
+        fake_trino.errors["SELECT 1"] = "Server is still initializing"
+        delays = []
+
+        def sleep(delay):
+            delays.append(delay)
+            if len(delays) == 1:
+                fake_trino.starting = False
+            elif len(delays) == 2:
+                fake_trino.errors.clear()
+
+        with patch("wait_ready.time.sleep", side_effect=sleep):
+            wait_ready(TrinoClient(fake_trino.url), timeout=30)
+
+        assert delays == [0.1, 0.2]
+        assert fake_trino.queries == ["SELECT 1", "SELECT 1"]
+
+    def test_ready_with_filtered_catalogs(self, fake_trino):
+        """Test that catalogs hidden by access control do not block."""
+        fake_trino.catalogs = []
+
+        with patch("wait_ready.time.sleep") as sleep:
+            wait_ready(TrinoClient(fake_trino.url), timeout=30)
+
+        sleep.assert_not_called()
+
+    def test_main_ready(self, fake_trino):
+        """Test that time-to-ready is reported."""
+        with patch("builtins.print") as mock_print:
+            assert main(["--server", fake_trino.url, "--since", "1"]) == 0
+
+        message = mock_print.call_args.args[0]
+        assert message.startswith("[wait_ready] Ready for queries in ")
+        assert message.endswith("s after launch)")
+
+    def test_main_timeout(self, fake_trino):
+        """Test that the probe fails if the cluster is not ready in time."""
+        fake_trino.starting = True
+        args = ["--server", fake_trino.url]
+
+        with patch("builtins.print") as mock_print:
+            assert main([*args, "--timeout", "0.2"]) == 1
+
+        mock_print.assert_called_once_with(
+            "[wait_ready] Not ready after 0.2s: coordinator is starting"
+        )
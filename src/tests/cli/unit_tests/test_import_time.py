@@ -0,0 +1,96 @@
+"""Cold-start import tests for the Minitrino CLI.
+
+`minitrino --help` imports the CLI entrypoint and every command module.
+These tests import the same set in a fresh interpreter and fail if
+Docker, HTTP, YAML, schema, or table rendering libraries are loaded. The
+cumulative import time budget, measured with `python -X importtime`, is
+an opt-in benchmark.
+"""
+
+import os
+import subprocess
+import sys
+
+import minitrino.cmd
+import pytest
+
+# Cumulative import time budget for the CLI and all commands. Loading
+# the deferred libraries eagerly costs several times this.
+IMPORT_BUDGET_US = 250_000
+
+DEFERRED_MODULES = [
+    "dateutil",
+    "docker",
+    "humanize",
+    "jsonschema",
+    "requests",
+    "tabulate",
+    "urllib3",
+    "yaml",
+]
+
+CMD_DIR = os.path.dirname(minitrino.cmd.__file__)
+CMD_MODULES = sorted(
+    f"minitrino.cmd.{f[:-3]}"
+    for f in os.listdir(CMD_DIR)
+    if f.endswith(".py") and not f.startswith("__")
+)
+
+
+def _import_cli(importtime: bool = False) -> tuple[dict[str, int], set[str]]:
+    """Import the CLI and all commands in a fresh interpreter.
+
+    Parameters
+    ----------
+    importtime : bool, optional
+        If True, records import times with `-X importtime`.
+
+    Returns
+    -------
+    tuple[dict[str, int], set[str]]
+        Cumulative import time in microseconds keyed by top-level
+        module, and the set of all loaded module names.
+    """
+    code = "\n".join(
+        ["import sys", "import minitrino.cli"]
+        + [f"import {mod}" for mod in CMD_MODULES]
+        + ["print('\\n'.join(sys.modules))"]
+    )
+    result = subprocess.run(
+        [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            timings[name.strip()] = int(cumulative)
+    return timings, set(result.stdout.split())
+
+
+def test_deferred_modules_not_imported():
+    """Test that heavy dependencies are not loaded on CLI import."""
+    _, loaded = _import_cli()
+    eager = [
+        mod
+        for mod in DEFERRED_MODULES
+        if any(name == mod or name.startswith(f"{mod}.") for name in loaded)
+    ]
+    assert not eager, f"Modules imported at CLI startup: {eager}"
+
+
+@pytest.mark.benchmark
+def test_import_time_budget():
+    """Test that CLI cold start stays within the import budget."""
+    timings, _ = _import_cli(importtime=True)
+    total = sum(us for name, us in timings.items() if name.startswith("minitrino"))
+    assert total, "No minitrino imports recorded"
+    assert total < IMPORT_BUDGET_US, (
+        f"CLI import took {total / 1000:.1f} ms, budget is "
+        f"{IMPORT_BUDGET_US / 1000:.1f} ms: "
+        + ", ".join(f"{n}={us / 1000:.1f}ms" for n, us in sorted(timings.items()))
+    )
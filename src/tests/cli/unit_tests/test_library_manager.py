@@ -107,7 +107,7 @@ class TestAutoInstallOrUpdate:
 class TestLibraryReleases:
     """Tests for library release management."""
 
-    @patch("minitrino.core.library.requests.get")
+    @patch("requests.get")
     def test_list_releases_success(self, mock_get, library_manager):
         """Test successful listing of releases from GitHub."""
         mock_response = MagicMock()
@@ -123,7 +123,7 @@ class TestLibraryReleases:
         assert releases == ["0.9.0", "1.0.0", "1.1.0"]
         mock_get.assert_called_once()
 
-    @patch("minitrino.core.library.requests.get")
+    @patch("requests.get")
     def test_list_releases_pagination(self, mock_get, library_manager):
         """Test that list_releases handles pagination correctly."""
         mock_response = MagicMock()
@@ -194,7 +194,7 @@ class TestFileOperations:
         mock_cleanup.assert_called_once_with(expected_tarball, f"minitrino-{version}")
 
     @patch("builtins.open")
-    @patch("minitrino.core.library.requests.get")
+    @patch("requests.get")
     def test_download_file_success(self, mock_get, mock_open, library_manager):
         """Test successful file download."""
         mock_response = MagicMock()